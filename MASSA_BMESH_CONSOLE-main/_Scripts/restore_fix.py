@@ -8,6 +8,7 @@ def send_restore():
     code_str = """
 try:
     import bpy
+    import json
     # Force ensure it exists
     if not any("PRIM_07" in o.name for o in bpy.data.objects):
         if hasattr(bpy.ops.massa, "gen_prim_07_louver"):
@@ -32,10 +33,11 @@ try:
             # ATOMIC MODIFICATION TEST
             # Simulate what iterate_parameters does
             if "MASSA_PARAMS" in obj:
-                params_dict = dict(obj["MASSA_PARAMS"])
-                params_dict["blade_count"] = 12
-                params_dict["blade_angle"] = 0.0
-                obj["MASSA_PARAMS"] = params_dict
+                # Versioned JSON blob: {"v": 2, "params": {non-default values}}
+                blob = json.loads(obj["MASSA_PARAMS"])
+                blob["params"]["blade_count"] = 12
+                blob["params"]["blade_angle"] = 0.0
+                obj["MASSA_PARAMS"] = json.dumps(blob)
                 print("Updated MASSA_PARAMS (12 blades, 0 deg)")
                 
                 if hasattr(bpy.ops.massa, "resurrect_selected"):
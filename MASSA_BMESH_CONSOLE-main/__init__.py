@@ -1,5 +1,4 @@
 import bpy
-import importlib
 
 bl_info = {
     "name": "Massa Container",
@@ -21,56 +20,21 @@ from .modules import advanced_analytics # 4.5 ANALYTICS
 from .ui import ui_massa_panel, ui_massa_pie, gizmo_massa  # 5. INTERFACE
 
 # --- MANUAL OVERRIDE / HOT RELOAD LOGIC ---
-if "massa_console" in locals():
+# [ARCHITECT FIX] Selective: only modules whose source changed (mtime + hash)
+# and the modules depending on them are reloaded, in dependency order
+# (massa_properties before the mixin users, engine before operators, ...).
+# For edits while the add-on stays enabled use massa.hot_reload instead.
+from .modules import massa_reload
+
+if "addon_keymaps" in locals():
     print("Massa: Detected existing instance. Reloading...")
     try:
-        # 1. UTILS & SHARED DNA (Must reload first!)
-        importlib.reload(mat_utils)
-        from .modules import massa_properties
-
-        importlib.reload(massa_properties)  # <--- CRITICAL: Reload the Mixin Base
-
-        # 2. ENGINE SUB-SYSTEMS (Leaf nodes of the Engine)
-        from .modules import (
-            massa_polish,
-            massa_surface,
-            massa_sockets,
-            seam_solvers,
-            advanced_analytics,
-            massa_collision,
-        )
-
-        importlib.reload(massa_polish)
-        importlib.reload(massa_surface)
-        importlib.reload(massa_sockets)
-        importlib.reload(seam_solvers)
-        importlib.reload(advanced_analytics)
-        importlib.reload(massa_collision)
-
-        # 3. CORE SYSTEMS
-        importlib.reload(massa_console)  # The Brain
-        importlib.reload(massa_engine)  # The Engine (aggregates sub-systems)
-        importlib.reload(massa_base)  # The Muscle (inherits props + uses engine)
-        importlib.reload(massa_tools)
-        importlib.reload(massa_console_op)
-        importlib.reload(massa_point_tool)
-        importlib.reload(massa_shooter)
-
-        # 4. CONTENT & UI
-        importlib.reload(cartridges)
-
-        # RELOAD INDIVIDUAL CARTRIDGES
-        if hasattr(cartridges, "MODULES"):
-            for mod in cartridges.MODULES:
-                importlib.reload(mod)
-
-        importlib.reload(ui_massa_panel)  # The Face
-        importlib.reload(ui_massa_pie)
-        importlib.reload(gizmo_massa)
-
-        print("Massa: Reload Complete.")
+        reloaded = massa_reload.reload_changed(__name__)
+        print(f"Massa: Reload Complete ({len(reloaded)} modules).")
     except Exception as e:
         print(f"Massa: Reload Error: {e}")
+else:
+    massa_reload.track(__name__)
 
 
 addon_keymaps = []
@@ -85,16 +49,25 @@ def register():
 
     massa_collision.register()
 
+    # Register Socket Index (Snap Assembly)
+    from .modules import massa_socket_index
+
+    massa_socket_index.register()
+
     # 2. Register Operators
     bpy.utils.register_class(massa_base.Massa_OT_Base)
     bpy.utils.register_class(massa_base.MASSA_OT_ReRun_Active)
     bpy.utils.register_class(massa_tools.MASSA_OT_Condemn)
     bpy.utils.register_class(massa_tools.MASSA_OT_Resurrect_Wrapper)
+    bpy.utils.register_class(massa_tools.MASSA_OT_Launch_Cartridge)
+    bpy.utils.register_class(massa_tools.MASSA_OT_Hot_Reload)
+    bpy.utils.register_class(massa_tools.MASSA_OT_Regenerate_All)
+    bpy.utils.register_class(massa_tools.MASSA_OT_SnapSockets)
     bpy.utils.register_class(massa_point_tool.MASSA_OT_PickCoordinate)
     bpy.utils.register_class(massa_shooter.MASSA_OT_ShootDispatcher)
     bpy.utils.register_class(massa_shooter.MASSA_OT_SpawnTarget)
 
-    # 3. Register Cartridges
+    # 3. Register Cartridges (lazy: imported + registered on first use)
     cartridges.register()
 
     # 4. Register UI
@@ -122,6 +95,14 @@ def unregister():
 
     massa_collision.unregister()
 
+    from .modules import massa_socket_index
+
+    massa_socket_index.unregister()
+
+    from .modules import massa_parts
+
+    massa_parts.clear_cache()
+
     # 1. Unregister Keymaps
     for km, kmi in addon_keymaps:
         km.keymap_items.remove(kmi)
@@ -145,6 +126,10 @@ def unregister():
     bpy.utils.unregister_class(massa_point_tool.MASSA_OT_PickCoordinate)
     bpy.utils.unregister_class(massa_tools.MASSA_OT_Condemn)
     bpy.utils.unregister_class(massa_tools.MASSA_OT_Resurrect_Wrapper)
+    bpy.utils.unregister_class(massa_tools.MASSA_OT_Launch_Cartridge)
+    bpy.utils.unregister_class(massa_tools.MASSA_OT_Regenerate_All)
+    bpy.utils.unregister_class(massa_tools.MASSA_OT_Hot_Reload)
+    bpy.utils.unregister_class(massa_tools.MASSA_OT_SnapSockets)
     bpy.utils.unregister_class(massa_base.Massa_OT_Base)
     bpy.utils.unregister_class(massa_base.MASSA_OT_ReRun_Active)
 
@@ -1,318 +1,243 @@
 import bpy
+import os
+import sys
+import importlib
+from .. import massa_manifest
 
 # -------------------------------------------------------------------
-# 1. CARTRIDGE IMPORTS
+# 1. CARTRIDGE LIST
 # -------------------------------------------------------------------
 # The Architecture relies on these modules being standalone.
 # They should ONLY import from '...operators.massa_base' and standard libraries.
-
-# --- LEGACY SUITE (prim_con_*) ---
-from . import prim_con_board
-from . import prim_con_block
-from . import prim_con_bracket
-from . import prim_con_flooring
-from . import prim_con_beam
-from . import prim_con_pipe
-from . import prim_con_truss
-from . import prim_con_rebar
-from . import prim_con_sheet
-from . import prim_con_window
-from . import prim_con_doorway
-from . import prim_con_porch_decking
-from . import prim_con_cabinet
-from . import prim_con_house_generator
-
-# --- CORE PRIMITIVES (cart_prim_*) ---
-from . import cart_prim_rock_boulder
-from . import cart_plank
-from . import cart_prim_01_beam
-from . import cart_prim_02_pipe
-from . import cart_prim_03_corrugated
-from . import cart_prim_04_panel
-from . import cart_prim_05_catenary
-from . import cart_prim_06_gusset
-from . import cart_prim_07_louver
-from . import cart_prim_08_bolt
-from . import cart_prim_09_chain
-from . import cart_prim_10_arch
-from . import cart_prim_11_helix
-from . import cart_prim_12_truss
-from . import cart_prim_13_shard
-from . import cart_prim_14_y_joint
-from . import cart_prim_15_scale
-from . import cart_prim_16_lathe
-from . import cart_prim_17_canvas
-from . import cart_prim_18_tank
-from . import cart_prim_19_tray
-from . import cart_prim_20_bundle
-from . import cart_prim_21_column
-from . import cart_prim_22_duct
-from . import cart_prim_23_cable_tray
-from . import cart_prim_24_gutter
-from . import cart_crate
-from . import cart_scaffolding
-from . import cart_prim_landscape
-
-# --- ARCHITECTURE SUITE (cart_arch_*) ---
-from . import cart_arch_01_stairs_linear
-from . import cart_arch_02_stairs_spiral
-from . import cart_arch_03_stairs_industrial
-from . import cart_arc_01_wall
-from . import cart_arc_02_stairs
-from . import cart_arc_03_window
-from . import cart_arc_04_doorway
-from . import cart_arc_05_column
-
-# --- INDUSTRIAL SUITE (cart_ind_*) ---
-from . import cart_ind_01_truss
-from . import cart_ind_02_duct
-from . import cart_ind_03_catwalk
-from . import cart_ind_04_ladder
-from . import cart_ind_05_silo
-
-# --- URBAN SUITE (cart_urb_*) ---
-from . import cart_urb_01_sidewalk
-from . import cart_urb_02_railing
-from . import cart_urb_03_streetlight
-from . import cart_urb_04_barrier
-from . import cart_urb_05_fence
-
-# --- PROPS & LANDSCAPE SUITE (cart_prp_*, cart_lnd_*) ---
-from . import cart_prp_01_container
-from . import cart_prp_02_rack
-from . import cart_prp_03_greeble
-from . import cart_lnd_01_planter
-from . import cart_lnd_02_boulder
-
-# --- ASSEMBLIES & PARTS ---
-from . import cart_building_assembly_1
-from . import cart_building_assembly_2
-from . import cart_building_assembly_3
-from . import cart_walkway
-from . import cart_cables
-from . import cart_parts_handrail
-from . import cart_arch_tiny_home
-from . import cart_arch_mobile_home
-from . import cart_asm_06_transit
-from . import cart_asm_07_vending
-from . import cart_asm_08_signage
-from . import cart_asm_09_checkpoint
-from . import cart_asm_10_tower
-from . import cart_asm_11_spiral_staircase
-from . import cart_asm_12_fire_escape
-from . import cart_asm_13_cloister
-from . import cart_asm_14_loading_dock
-from . import cart_asm_15_elevator_shaft
-from . import cart_asm_16_quantum_server
-from . import cart_asm_17_iris_door
-from . import cart_asm_18_radar_array
-from . import cart_asm_19_cryo_pod
-from . import cart_asm_20_robotic_arm
-
-
-# -------------------------------------------------------------------
-# 2. REGISTRY AGGREGATION
-# -------------------------------------------------------------------
-
-# List of Module Objects (Used by UI Panel to read CARTRIDGE_META)
-MODULES = [
-    # Legacy
-    prim_con_board,
-    prim_con_block,
-    prim_con_bracket,
-    prim_con_flooring,
-    prim_con_beam,
-    prim_con_pipe,
-    prim_con_truss,
-    prim_con_rebar,
-    prim_con_sheet,
-    prim_con_window,
-    prim_con_doorway,
-    prim_con_porch_decking,
-    prim_con_cabinet,
-    prim_con_house_generator,
-    # Core
-    cart_prim_rock_boulder,
-    cart_plank,
-    cart_prim_01_beam,
-    cart_prim_02_pipe,
-    cart_prim_03_corrugated,
-    cart_prim_04_panel,
-    cart_prim_05_catenary,
-    cart_prim_06_gusset,
-    cart_prim_07_louver,
-    cart_prim_08_bolt,
-    cart_prim_09_chain,
-    cart_prim_10_arch,
-    cart_prim_11_helix,
-    cart_prim_12_truss,
-    cart_prim_13_shard,
-    cart_prim_14_y_joint,
-    cart_prim_15_scale,
-    cart_prim_16_lathe,
-    cart_prim_17_canvas,
-    cart_prim_18_tank,
-    cart_prim_19_tray,
-    cart_prim_20_bundle,
-    cart_prim_21_column,
-    cart_prim_22_duct,
-    cart_prim_23_cable_tray,
-    cart_prim_24_gutter,
-    cart_crate,
-    cart_scaffolding,
-    cart_prim_landscape,
-    # Arch
-    cart_arch_01_stairs_linear,
-    cart_arch_02_stairs_spiral,
-    cart_arch_03_stairs_industrial,
-    cart_arc_01_wall,
-    cart_arc_02_stairs,
-    cart_arc_03_window,
-    cart_arc_04_doorway,
-    cart_arc_05_column,
-    # Ind
-    cart_ind_01_truss,
-    cart_ind_02_duct,
-    cart_ind_03_catwalk,
-    cart_ind_04_ladder,
-    cart_ind_05_silo,
-    # Urb
-    cart_urb_01_sidewalk,
-    cart_urb_02_railing,
-    cart_urb_03_streetlight,
-    cart_urb_04_barrier,
-    cart_urb_05_fence,
-    # Props/Land
-    cart_prp_01_container,
-    cart_prp_02_rack,
-    cart_prp_03_greeble,
-    cart_lnd_01_planter,
-    cart_lnd_02_boulder,
-    # Assemblies & Parts
-    cart_building_assembly_1,
-    cart_building_assembly_2,
-    cart_building_assembly_3,
-    cart_walkway,
-    cart_cables,
-    cart_parts_handrail,
-    cart_arch_tiny_home,
-    cart_arch_mobile_home,
-    cart_asm_06_transit,
-    cart_asm_07_vending,
-    cart_asm_08_signage,
-    cart_asm_09_checkpoint,
-    cart_asm_10_tower,
-    cart_asm_11_spiral_staircase,
-    cart_asm_12_fire_escape,
-    cart_asm_13_cloister,
-    cart_asm_14_loading_dock,
-    cart_asm_15_elevator_shaft,
-    cart_asm_16_quantum_server,
-    cart_asm_17_iris_door,
-    cart_asm_18_radar_array,
-    cart_asm_19_cryo_pod,
-    cart_asm_20_robotic_arm,
-]
-
-# List of Operator Classes (Used for Registration)
-CLASSES = [
+# [ARCHITECT NEW] Cartridges are no longer imported at enable. The UI reads
+# the prebuilt manifest (cartridge_manifest.json, rebuilt by massa_manifest
+# whenever a listed file changes); a cartridge is imported and registered
+# the first time it is launched, shot or re-run.
+# Order matters: it drives the UI lists and the staged-cartridge enum.
+CARTRIDGE_MODULES = (
     # Legacy
-    prim_con_board.MASSA_OT_prim_con_board,
-    prim_con_block.MASSA_OT_prim_con_block,
-    prim_con_bracket.MASSA_OT_prim_con_bracket,
-    prim_con_flooring.MASSA_OT_prim_con_flooring,
-    prim_con_beam.MASSA_OT_prim_con_beam,
-    prim_con_pipe.MASSA_OT_prim_con_pipe,
-    prim_con_truss.MASSA_OT_prim_con_truss,
-    prim_con_rebar.MASSA_OT_prim_con_rebar,
-    prim_con_sheet.MASSA_OT_prim_con_sheet,
-    prim_con_window.MASSA_OT_prim_con_window,
-    prim_con_doorway.MASSA_OT_prim_con_doorway,
-    prim_con_porch_decking.MASSA_OT_prim_con_porch_decking,
-    prim_con_cabinet.MASSA_OT_prim_con_cabinet,
-    prim_con_house_generator.MASSA_OT_prim_con_house_generator,
+    "prim_con_board",
+    "prim_con_block",
+    "prim_con_bracket",
+    "prim_con_flooring",
+    "prim_con_beam",
+    "prim_con_pipe",
+    "prim_con_truss",
+    "prim_con_rebar",
+    "prim_con_sheet",
+    "prim_con_window",
+    "prim_con_doorway",
+    "prim_con_porch_decking",
+    "prim_con_cabinet",
+    "prim_con_house_generator",
     # Core
-    cart_prim_rock_boulder.MASSA_OT_PrimRockBoulder,
-    cart_plank.MASSA_OT_Plank,
-    cart_prim_01_beam.MASSA_OT_PrimBeam,
-    cart_prim_02_pipe.MASSA_OT_PrimPipe,
-    cart_prim_03_corrugated.MASSA_OT_PrimCorrugated,
-    cart_prim_04_panel.MASSA_OT_PrimPanel,
-    cart_prim_05_catenary.MASSA_OT_PrimCatenary,
-    cart_prim_06_gusset.MASSA_OT_PrimGusset,
-    cart_prim_07_louver.MASSA_OT_PrimLouver,
-    cart_prim_08_bolt.MASSA_OT_PrimBolt,
-    cart_prim_09_chain.MASSA_OT_PrimChain,
-    cart_prim_10_arch.MASSA_OT_PrimArch,
-    cart_prim_11_helix.MASSA_OT_PrimHelix,
-    cart_prim_12_truss.MASSA_OT_PrimTruss,
-    cart_prim_13_shard.MASSA_OT_PrimShard,
-    cart_prim_14_y_joint.MASSA_OT_PrimYJoint,
-    cart_prim_15_scale.MASSA_OT_PrimScale,
-    cart_prim_16_lathe.MASSA_OT_PrimLathe,
-    cart_prim_17_canvas.MASSA_OT_PrimCanvas,
-    cart_prim_18_tank.MASSA_OT_PrimTank,
-    cart_prim_19_tray.MASSA_OT_PrimTray,
-    cart_prim_20_bundle.MASSA_OT_PrimBundle,
-    cart_prim_21_column.MASSA_OT_PrimColumn,
-    cart_prim_22_duct.MASSA_OT_PrimDuct,
-    cart_prim_23_cable_tray.MASSA_OT_PrimCableTray,
-    cart_prim_24_gutter.MASSA_OT_PrimGutter,
-    cart_crate.MASSA_OT_Crate,
-    cart_scaffolding.MASSA_OT_Scaffolding,
-    cart_prim_landscape.MASSA_OT_PrimLandscape,
+    "cart_prim_rock_boulder",
+    "cart_plank",
+    "cart_prim_01_beam",
+    "cart_prim_02_pipe",
+    "cart_prim_03_corrugated",
+    "cart_prim_04_panel",
+    "cart_prim_05_catenary",
+    "cart_prim_06_gusset",
+    "cart_prim_07_louver",
+    "cart_prim_08_bolt",
+    "cart_prim_09_chain",
+    "cart_prim_10_arch",
+    "cart_prim_11_helix",
+    "cart_prim_12_truss",
+    "cart_prim_13_shard",
+    "cart_prim_14_y_joint",
+    "cart_prim_15_scale",
+    "cart_prim_16_lathe",
+    "cart_prim_17_canvas",
+    "cart_prim_18_tank",
+    "cart_prim_19_tray",
+    "cart_prim_20_bundle",
+    "cart_prim_21_column",
+    "cart_prim_22_duct",
+    "cart_prim_23_cable_tray",
+    "cart_prim_24_gutter",
+    "cart_crate",
+    "cart_scaffolding",
+    "cart_prim_landscape",
     # Arch
-    cart_arch_01_stairs_linear.MASSA_OT_ArchStairsLinear,
-    cart_arch_02_stairs_spiral.MASSA_OT_ArchStairsSpiral,
-    cart_arch_03_stairs_industrial.MASSA_OT_ArchStairsIndustrial,
-    cart_arc_01_wall.MASSA_OT_ArcWall,
-    cart_arc_02_stairs.MASSA_OT_ArcStairs,
-    cart_arc_03_window.MASSA_OT_ArcWindow,
-    cart_arc_04_doorway.MASSA_OT_ArcDoorway,
-    cart_arc_05_column.MASSA_OT_ArcColumn,
+    "cart_arch_01_stairs_linear",
+    "cart_arch_02_stairs_spiral",
+    "cart_arch_03_stairs_industrial",
+    "cart_arc_01_wall",
+    "cart_arc_02_stairs",
+    "cart_arc_03_window",
+    "cart_arc_04_doorway",
+    "cart_arc_05_column",
     # Ind
-    cart_ind_01_truss.MASSA_OT_IndTruss,
-    cart_ind_02_duct.MASSA_OT_IndDuct,
-    cart_ind_03_catwalk.MASSA_OT_IndCatwalk,
-    cart_ind_04_ladder.MASSA_OT_IndLadder,
-    cart_ind_05_silo.MASSA_OT_IndSilo,
+    "cart_ind_01_truss",
+    "cart_ind_02_duct",
+    "cart_ind_03_catwalk",
+    "cart_ind_04_ladder",
+    "cart_ind_05_silo",
     # Urb
-    cart_urb_01_sidewalk.MASSA_OT_UrbSidewalk,
-    cart_urb_02_railing.MASSA_OT_UrbRailing,
-    cart_urb_03_streetlight.MASSA_OT_UrbStreetlight,
-    cart_urb_04_barrier.MASSA_OT_UrbBarrier,
-    cart_urb_05_fence.MASSA_OT_UrbFence,
+    "cart_urb_01_sidewalk",
+    "cart_urb_02_railing",
+    "cart_urb_03_streetlight",
+    "cart_urb_04_barrier",
+    "cart_urb_05_fence",
     # Props/Land
-    cart_prp_01_container.MASSA_OT_PrpContainer,
-    cart_prp_02_rack.MASSA_OT_PrpRack,
-    cart_prp_03_greeble.MASSA_OT_PrpGreeble,
-    cart_lnd_01_planter.MASSA_OT_LndPlanter,
-    cart_lnd_02_boulder.MASSA_OT_LndBoulder,
+    "cart_prp_01_container",
+    "cart_prp_02_rack",
+    "cart_prp_03_greeble",
+    "cart_lnd_01_planter",
+    "cart_lnd_02_boulder",
     # Assemblies & Parts
-    cart_building_assembly_1.MASSA_OT_BuildingAssembly1,
-    cart_building_assembly_2.MASSA_OT_Canopy,
-    cart_building_assembly_3.MASSA_OT_BuildingAssembly3,
-    cart_walkway.MASSA_OT_Walkway,
-    cart_cables.MASSA_OT_Cables,
-    cart_parts_handrail.MASSA_OT_PartsHandrail,
-    cart_arch_tiny_home.MASSA_OT_ArchTinyHome,
-    cart_arch_mobile_home.MASSA_OT_ArchMobileHome,
-    cart_asm_06_transit.MASSA_OT_AsmTransit,
-    cart_asm_07_vending.MASSA_OT_AsmVending,
-    cart_asm_08_signage.MASSA_OT_AsmSignage,
-    cart_asm_09_checkpoint.MASSA_OT_AsmCheckpoint,
-    cart_asm_10_tower.MASSA_OT_AsmTower,
-    cart_asm_11_spiral_staircase.MASSA_OT_AsmSpiralStaircase,
-    cart_asm_12_fire_escape.MASSA_OT_AsmFireEscape,
-    cart_asm_13_cloister.MASSA_OT_AsmCloister,
-    cart_asm_14_loading_dock.MASSA_OT_AsmLoadingDock,
-    cart_asm_15_elevator_shaft.MASSA_OT_AsmElevatorShaft,
-    cart_asm_16_quantum_server.MASSA_OT_AsmQuantumServer,
-    cart_asm_17_iris_door.MASSA_OT_AsmIrisDoor,
-    cart_asm_18_radar_array.MASSA_OT_AsmRadarArray,
-    cart_asm_19_cryo_pod.MASSA_OT_AsmCryoPod,
-    cart_asm_20_robotic_arm.MASSA_OT_AsmRoboticArm,
-]
+    "cart_building_assembly_1",
+    "cart_building_assembly_2",
+    "cart_building_assembly_3",
+    "cart_walkway",
+    "cart_cables",
+    "cart_parts_handrail",
+    "cart_arch_tiny_home",
+    "cart_arch_mobile_home",
+    "cart_asm_06_transit",
+    "cart_asm_07_vending",
+    "cart_asm_08_signage",
+    "cart_asm_09_checkpoint",
+    "cart_asm_10_tower",
+    "cart_asm_11_spiral_staircase",
+    "cart_asm_12_fire_escape",
+    "cart_asm_13_cloister",
+    "cart_asm_14_loading_dock",
+    "cart_asm_15_elevator_shaft",
+    "cart_asm_16_quantum_server",
+    "cart_asm_17_iris_door",
+    "cart_asm_18_radar_array",
+    "cart_asm_19_cryo_pod",
+    "cart_asm_20_robotic_arm",
+)
+
+# -------------------------------------------------------------------
+# 2. MANIFEST & LAZY REGISTRY
+# -------------------------------------------------------------------
+
+MANIFEST = massa_manifest.load_manifest(os.path.dirname(__file__), CARTRIDGE_MODULES)
+_BY_ID = {entry["id"]: entry for entry in MANIFEST}
+_BY_OP = {entry["operator"]: entry for entry in MANIFEST}
+
+_LOADED = {}  # cart_id -> module (imported AND registered)
+_ACTIVE = False  # Between register() and unregister()
+
+
+def entries(category=None):
+    """Manifest entries in UI order, optionally filtered by category."""
+    if category is None:
+        return MANIFEST
+    return [entry for entry in MANIFEST if entry["category"] == category]
+
+
+def get_entry(cart_id):
+    return _BY_ID.get(cart_id)
+
+
+def is_loaded(cart_id):
+    return cart_id in _LOADED
+
+
+def _normalize_op_id(op_id):
+    """'massa.gen_x' or 'MASSA_OT_gen_x' -> 'massa.gen_x'."""
+    if "_OT_" in op_id:
+        category, name = op_id.split("_OT_", 1)
+        return f"{category.lower()}.{name}"
+    return op_id
+
+
+def load(cart_id):
+    """
+    Imports and registers one cartridge (operator + console PropertyGroup).
+    Returns the module, or None if the cartridge is unknown or broken.
+    """
+    mod = _LOADED.get(cart_id)
+    if mod is not None:
+        return mod
+    entry = _BY_ID.get(cart_id)
+    if entry is None:
+        return None
+
+    try:
+        mod = importlib.import_module(f".{entry['module']}", __name__)
+    except Exception as e:
+        print(f"Massa Error: Could not import cartridge {entry['module']}: {e}")
+        return None
+
+    if not _ACTIVE:
+        return mod  # Imported for inspection only; register() has not run
+
+    cls = getattr(mod, entry["class"], None)
+    if cls is None:
+        print(f"Massa Error: {entry['module']} has no class {entry['class']} (stale manifest?)")
+        return None
+    try:
+        bpy.utils.register_class(cls)
+    except ValueError:
+        pass  # Already registered
+    except RuntimeError as e:
+        print(f"Massa Error: Could not register {cls.__name__}: {e}")
+        return None
+
+    from ..massa_cartridge_props import register_cartridge_props
+
+    register_cartridge_props(cart_id, cls)
+    _LOADED[cart_id] = mod
+    return mod
+
+
+def ensure_operator(op_id):
+    """
+    Makes sure the operator behind op_id (as stored in massa_op_id) is
+    registered. Non-cartridge operators pass through untouched.
+    """
+    entry = _BY_OP.get(_normalize_op_id(op_id))
+    if entry is None:
+        return True
+    return load(entry["id"]) is not None
+
+
+def operator_class(cart_id):
+    """Operator class of a LOADED cartridge (None otherwise, never imports)."""
+    mod = _LOADED.get(cart_id)
+    if mod is None:
+        return None
+    return getattr(mod, _BY_ID[cart_id]["class"], None)
+
+
+def class_for_operator(op_id):
+    """Operator class behind op_id, loading its cartridge (None: unknown or failed)."""
+    entry = _BY_OP.get(_normalize_op_id(op_id))
+    if entry is None or load(entry["id"]) is None:
+        return None
+    return operator_class(entry["id"])
+
+
+def _load_all():
+    pairs = [(entry, load(entry["id"])) for entry in MANIFEST]
+    return [(entry, mod) for entry, mod in pairs if mod is not None]
+
+
+def imported_modules():
+    """Cartridge modules already in sys.modules (hot reload targets)."""
+    mods = []
+    for entry in MANIFEST:
+        mod = sys.modules.get(f"{__name__}.{entry['module']}")
+        if mod is not None:
+            mods.append(mod)
+    return mods
+
+
+def __getattr__(name):
+    # Compatibility for code that walks every cartridge: forces a full load
+    if name == "MODULES":
+        return [mod for _entry, mod in _load_all()]
+    if name == "CLASSES":
+        return [getattr(mod, entry["class"]) for entry, mod in _load_all()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # -------------------------------------------------------------------
 # 3. REGISTRATION HANDLERS
@@ -320,20 +245,19 @@ CLASSES = [
 
 
 def register():
-    # print("Massa: Registering Cartridges...")
-    for cls in CLASSES:
-        try:
-            bpy.utils.register_class(cls)
-        except ValueError:
-            pass  # Already registered
-        except RuntimeError as e:
-            print(f"Massa Error: Could not register {cls.__name__}: {e}")
+    global _ACTIVE
+    _ACTIVE = True
 
 
 def unregister():
-    # print("Massa: Unregistering Cartridges...")
-    for cls in reversed(CLASSES):
+    global _ACTIVE
+    _ACTIVE = False
+    for cart_id in reversed(list(_LOADED)):
+        cls = operator_class(cart_id)
+        if cls is None:
+            continue
         try:
             bpy.utils.unregister_class(cls)
         except RuntimeError:
             pass
+    _LOADED.clear()
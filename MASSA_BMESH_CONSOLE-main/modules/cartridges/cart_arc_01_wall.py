@@ -127,7 +127,7 @@ class MASSA_OT_ArcWall(Massa_OT_Base):
             f_sock.material_index = 9 # Socket Anchor
 
         # 7. Manual UVs
-        scale_u = getattr(self, "uv_scale_0", 1.0)
+        scale_u = self.get_slot_value(0, "uv_scale", 1.0)
         scale_v = scale_u
 
         bm.faces.ensure_lookup_table()
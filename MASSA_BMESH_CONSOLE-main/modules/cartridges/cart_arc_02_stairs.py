@@ -200,7 +200,7 @@ class MASSA_OT_ArcStairs(Massa_OT_Base):
         f_sock_top.material_index = 9
 
         # 6. Manual UVs
-        scale_u = getattr(self, "uv_scale_0", 1.0)
+        scale_u = self.get_slot_value(0, "uv_scale", 1.0)
 
         for f in bm.faces:
             if f.material_index == 9: continue
@@ -107,7 +107,7 @@ class MASSA_OT_ArcWindow(Massa_OT_Base):
 
             elif mat_idx == 0: # Frame
                 # Box mapping
-                scale = getattr(self, "uv_scale_0", 1.0)
+                scale = self.get_slot_value(0, "uv_scale", 1.0)
                 n = f.normal
                 for l in f.loops:
                     # Simple box projection
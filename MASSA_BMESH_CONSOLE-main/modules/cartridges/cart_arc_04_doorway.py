@@ -270,7 +270,7 @@ class MASSA_OT_ArcDoorway(Massa_OT_Base):
         # ---------------------------------------------------------
         # 7. Final UVs
         # ---------------------------------------------------------
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
 
         for f in bm.faces:
             uv_layer = bm.loops.layers.uv.verify()
@@ -144,7 +144,7 @@ class MASSA_OT_ArcColumn(Massa_OT_Base):
 
         # 8. Manual UVs
         # Cylinder Mapping
-        scale_u = getattr(self, "uv_scale_0", 1.0)
+        scale_u = self.get_slot_value(0, "uv_scale", 1.0)
         scale_v = scale_u
 
         for f in bm.faces:
@@ -2,6 +2,7 @@ import bpy
 import bmesh
 import math
 import random
+import numpy as np
 from mathutils import Vector, Matrix, Quaternion
 from bpy.props import (
     FloatProperty,
@@ -216,71 +217,48 @@ class MASSA_OT_Cables(Massa_OT_Base):
             return
 
         segments = 6  # Low poly cables
-        prev_verts = []
+        n_pts = len(points)
 
         # Helper to get rotation frame
         def get_rot(i):
-            if i >= len(points) - 1:
+            if i >= n_pts - 1:
                 tangent = (points[i] - points[i - 1]).normalized()
             else:
                 tangent = (points[i + 1] - points[i]).normalized()
             return tangent.to_track_quat("Z", "Y")
 
-        # 1. Create First Ring
-        start_mat = Matrix.Translation(points[0]) @ get_rot(0).to_matrix().to_4x4()
-
-        angle_step = (math.pi * 2) / segments
-        for i in range(segments):
-            a = i * angle_step
-            # Local circle on XY plane
-            local = Vector((math.cos(a) * radius, math.sin(a) * radius, 0))
-            world = start_mat @ local
-            prev_verts.append(bm.verts.new(world))
-
-        # Face Loop
-        for i in range(1, len(points)):
-            current_mat = (
-                Matrix.Translation(points[i]) @ get_rot(i).to_matrix().to_4x4()
-            )
-            current_verts = []
-
-            # Create new ring
-            for s in range(segments):
-                a = s * angle_step
-                local = Vector((math.cos(a) * radius, math.sin(a) * radius, 0))
-                world = current_mat @ local
-                current_verts.append(bm.verts.new(world))
-
-            # Bridge
-            for s in range(segments):
-                v1 = prev_verts[s]
-                v2 = prev_verts[(s + 1) % segments]
-                v3 = current_verts[(s + 1) % segments]
-                v4 = current_verts[s]
-
-                f = bm.faces.new((v1, v2, v3, v4))
-                f.material_index = slot_idx
-                f.smooth = True
-
-                # UVs: U = Angle, V = Length along curve
-                # Simple approximation
-                u_min = s / segments
-                u_max = (s + 1) / segments
-                v_min = (i - 1) / len(points) * self.uv_scale
-                v_max = i / len(points) * self.uv_scale
-
-                for loop in f.loops:
-                    v = loop.vert
-                    if v == v1:
-                        loop[uv_layer].uv = (u_min, v_min)
-                    elif v == v2:
-                        loop[uv_layer].uv = (u_max, v_min)
-                    elif v == v3:
-                        loop[uv_layer].uv = (u_max, v_max)
-                    elif v == v4:
-                        loop[uv_layer].uv = (u_min, v_max)
-
-            prev_verts = current_verts
+        # 1. Rings: local circle on XY plane, rotated into each point's frame
+        # [ARCHITECT NEW] Arrays + emit_mesh instead of per-vertex/per-loop Python
+        a = np.arange(segments) * ((math.pi * 2) / segments)
+        local = np.stack((np.cos(a) * radius, np.sin(a) * radius, np.zeros(segments)), axis=-1)
+        rots = np.array([get_rot(i).to_matrix() for i in range(n_pts)])  # (P, 3, 3)
+        pos = np.array([p[:] for p in points])
+        verts = pos[:, None, :] + np.einsum("pij,sj->psi", rots, local)
+
+        # 2. Bridge consecutive rings
+        s_idx = np.arange(segments)
+        s_next = (s_idx + 1) % segments
+        base = np.arange(n_pts - 1)[:, None] * segments
+        faces = np.stack((
+            base + s_idx,
+            base + s_next,
+            base + segments + s_next,
+            base + segments + s_idx,
+        ), axis=-1).reshape(-1, 4)
+
+        # UVs: U = Angle, V = Length along curve (simple approximation)
+        u_min = np.broadcast_to(s_idx / segments, (n_pts - 1, segments))
+        u_max = np.broadcast_to((s_idx + 1) / segments, (n_pts - 1, segments))
+        v_min = np.broadcast_to((np.arange(n_pts - 1) / n_pts * self.uv_scale)[:, None], u_min.shape)
+        v_max = np.broadcast_to((np.arange(1, n_pts) / n_pts * self.uv_scale)[:, None], u_min.shape)
+        uvs = np.stack((
+            np.stack((u_min, v_min), axis=-1),
+            np.stack((u_max, v_min), axis=-1),
+            np.stack((u_max, v_max), axis=-1),
+            np.stack((u_min, v_max), axis=-1),
+        ), axis=2).reshape(-1, 2)
+
+        self.emit_mesh(bm, verts.reshape(-1, 3), faces, material_index=slot_idx, smooth=True, uvs=uvs)
 
         # Cap Ends? Cables usually open or plugged. Let's leave open for speed.
 
@@ -119,7 +119,7 @@ class MASSA_OT_IndTruss(Massa_OT_Base):
 
         # 6. Manual UVs
         # Box Mapping for everything (struts are square)
-        scale = getattr(self, "uv_scale_0", 1.0) # Check if property exists? Or just fallback 1.0
+        scale = self.get_slot_value(0, "uv_scale", 1.0) # Check if property exists? Or just fallback 1.0
         # If property not defined in class, use 1.0
         
         for f in bm.faces:
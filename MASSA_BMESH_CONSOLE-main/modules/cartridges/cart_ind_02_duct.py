@@ -151,7 +151,7 @@ class MASSA_OT_IndDuct(Massa_OT_Base):
         f_sock_r.material_index = 9
 
         # 5. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
         for f in bm.faces:
             mat_idx = f.material_index
             if mat_idx == 9: continue
@@ -139,7 +139,7 @@ class MASSA_OT_IndCatwalk(Massa_OT_Base):
         pass
 
         # 7. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
 
         for f in bm.faces:
             mat_idx = f.material_index
@@ -176,7 +176,7 @@ class MASSA_OT_IndLadder(Massa_OT_Base):
         # Top and Bottom of Rails
 
         # 6. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
         for f in bm.faces:
             n = f.normal
             mat_idx = f.material_index
@@ -160,7 +160,7 @@ class MASSA_OT_LndBoulder(Massa_OT_Base):
         # 7. Manual UVs
         # Triplanar / Box map or Spherical
         # Let's use simple Box mapping
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
 
         for f in bm.faces:
             mat_idx = f.material_index
@@ -15,6 +15,7 @@ CARTRIDGE_META = {
         "ALLOW_FUSE": False,
         "ALLOW_SOLIDIFY": False,
         "ALLOW_CHAMFER": False,
+        "ALLOW_INSTANCES": True,  # Identical links -> one prototype
     },
 }
 
@@ -103,10 +104,11 @@ class MASSA_OT_PrimChain(Massa_OT_Base):
         # First link center is at 0. Bottom tip is at -(safe_length/2).
         z_offset = safe_length / 2.0
 
-        uv_layer = bm.loops.layers.uv.verify()
-
-        # 2. GENERATION LOOP
-        for i_link in range(self.link_count):
+        # 2. LINK TEMPLATE
+        # Every link is identical up to a rigid transform: build one at the
+        # origin, then stamp all copies in bulk (UVs + edge slots included).
+        def build_link(lb):
+            uv_layer = lb.loops.layers.uv.verify()
             # --- A. GENERATE PATH POINTS ---
             # Path: Left Straight -> Top Arc -> Right Straight -> Bottom Arc
             raw_path = []  # (Pos, Norm)
@@ -166,16 +168,6 @@ class MASSA_OT_PrimChain(Massa_OT_Base):
             v_mult = sv / total_len
 
             # --- C. GENERATE MESH RINGS ---
-            # Matrices for Link Transform
-            mat_x = Matrix.Rotation(math.radians(90), 4, "X")
-            mat_z = Matrix.Identity(4)
-            if i_link % 2 != 0:
-                mat_z = Matrix.Rotation(math.radians(90), 4, "Z")
-
-            vec_trans = Vector((0, 0, z_offset - (i_link * pitch)))
-
-            final_mat = Matrix.Translation(vec_trans) @ mat_z @ mat_x
-
             grid_verts = []  # [ring][radial] -> (BMVert, u_raw, v_dist_raw)
 
             for pt_pos, pt_norm, pt_dist in path_data:
@@ -187,21 +179,19 @@ class MASSA_OT_PrimChain(Massa_OT_Base):
 
                     off_vec = (pt_norm * cos_t * r) + (Vector((0, 0, 1)) * sin_t * r)
                     local_pos = pt_pos + off_vec
-                    world_pos = final_mat @ local_pos
-
-                    v = bm.verts.new(world_pos)
+                    v = lb.verts.new(local_pos)
                     u_coord = theta / (2 * math.pi)
 
                     ring.append((v, u_coord, pt_dist))
                 grid_verts.append(ring)
 
             # --- D. CREATE FACES & SEAMS & EDGE SLOTS ---
-            bm.verts.ensure_lookup_table()
+            lb.verts.ensure_lookup_table()
             
             # Create Edge Slot Layer
-            edge_slots = bm.edges.layers.int.get("MASSA_EDGE_SLOTS")
+            edge_slots = lb.edges.layers.int.get("MASSA_EDGE_SLOTS")
             if not edge_slots:
-                edge_slots = bm.edges.layers.int.new("MASSA_EDGE_SLOTS")
+                edge_slots = lb.edges.layers.int.new("MASSA_EDGE_SLOTS")
 
             num_rings = len(grid_verts)
             num_rad = self.segments_radial
@@ -251,7 +241,7 @@ class MASSA_OT_PrimChain(Massa_OT_Base):
                     d4 = ring_curr[next_j]
 
                     try:
-                        f = bm.faces.new((d1[0], d2[0], d3[0], d4[0]))
+                        f = lb.faces.new((d1[0], d2[0], d3[0], d4[0]))
                         f.material_index = 0
                         f.smooth = True
 
@@ -291,7 +281,7 @@ class MASSA_OT_PrimChain(Massa_OT_Base):
                         
                         # LONGITUDINAL EDGES (Along the path)
                         # The edge connecting d1-d2 corresponds to radial index j
-                        e_long = bm.edges.get([d1[0], d2[0]])
+                        e_long = lb.edges.get([d1[0], d2[0]])
                         if e_long:
                             # Slot #3 GUIDE: Top and Bottom Axis
                             if j == idx_top or j == idx_bottom:
@@ -309,7 +299,7 @@ class MASSA_OT_PrimChain(Massa_OT_Base):
                         # Let's handle the closing seam specifically.
                         # If this is the last segment (is_v_seam), then the edge d2-d3 is the loop closing the chain link.
                         if is_v_seam:
-                            e_cross = bm.edges.get([d2[0], d3[0]])
+                            e_cross = lb.edges.get([d2[0], d3[0]])
                             if e_cross:
                                 e_cross[edge_slots] = 1 # PERIMETER (Seam)
                                 e_cross.seam = True
@@ -317,6 +307,23 @@ class MASSA_OT_PrimChain(Massa_OT_Base):
                     except ValueError:
                         pass  # Face exists
 
-        # 3. GLOBAL CLEANUP
+        tpl = self.part_template(
+            (r, bend_r, straight_l, self.segments_radial, self.segments_bend, self.uv_scale, self.fit_uvs),
+            build_link,
+        )
+
+        # 3. LINK TRANSFORMS
+        # Odd links turn 90 degrees about Z so they interlock.
+        mat_x = Matrix.Rotation(math.radians(90), 4, "X")
+        mat_z_odd = Matrix.Rotation(math.radians(90), 4, "Z")
+        matrices = []
+        for i_link in range(self.link_count):
+            mat_z = mat_z_odd if i_link % 2 != 0 else Matrix.Identity(4)
+            vec_trans = Vector((0, 0, z_offset - (i_link * pitch)))
+            matrices.append(Matrix.Translation(vec_trans) @ mat_z @ mat_x)
+
+        self.stamp_parts(bm, tpl, matrices)
+
+        # 4. GLOBAL CLEANUP
         bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
 
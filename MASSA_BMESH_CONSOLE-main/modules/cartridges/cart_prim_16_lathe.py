@@ -1,6 +1,7 @@
 import bpy
 import bmesh
 import math
+import numpy as np
 from mathutils import Vector, Matrix
 from bpy.props import FloatProperty, IntProperty, BoolProperty
 from ...operators.massa_base import Massa_OT_Base
@@ -124,197 +125,100 @@ class MASSA_OT_PrimLathe(Massa_OT_Base):
         s_u = 1.0 if self.fit_uvs else (self.uv_scale * circumference)
         s_v = 1.0 if self.fit_uvs else (self.uv_scale * total_len)
 
-        # 3. SPIN GENERATION (Manual Rings)
+        # 3. SPIN GENERATION (Array Rings)
         # ----------------------------------------------------------------------
+        # [ARCHITECT NEW] Built as arrays and emitted in one pass (see emit_mesh)
         segs = self.segments
-        angle_step = (2 * math.pi) / segs
-
-        ring_verts = []
-        uv_layer = bm.loops.layers.uv.verify()
-
-        # A. Create Rings
-        for p_vec, p_v_coord in profile_data:
-            current_ring = []
-            r = p_vec.x
-            z = p_vec.z
-
-            for i in range(segs + 1):
-                if i == segs:
-                    current_ring.append(current_ring[0])
-                    continue
-
-                theta = i * angle_step
-                x = math.cos(theta) * r
-                y = math.sin(theta) * r
-
-                v = bm.verts.new((x, y, z))
-                current_ring.append(v)
-
-            ring_verts.append(current_ring)
-
-        bm.verts.ensure_lookup_table()
-
-        # B. Skin Profile Walls (Quads)
-        for r_idx in range(len(ring_verts) - 1):
-            ring_bot = ring_verts[r_idx]
-            ring_top = ring_verts[r_idx + 1]
-
-            v_bot = profile_data[r_idx][1]
-            v_top = profile_data[r_idx + 1][1]
-
-            for s in range(segs):
-                v1 = ring_bot[s]
-                v2 = ring_bot[s + 1]
-                v3 = ring_top[s + 1]
-                v4 = ring_top[s]
-
-                try:
-                    f = bm.faces.new((v1, v2, v3, v4))
-                    f.material_index = 0  # Main Ceramic Surface
-                    f.smooth = self.smooth_shade
-
-                    u1 = s / segs
-                    u2 = (s + 1) / segs
-
-                    for l in f.loops:
-                        if l.vert == v1:
-                            l[uv_layer].uv = (u1 * s_u, v_bot * s_v)
-                        elif l.vert == v2:
-                            l[uv_layer].uv = (u2 * s_u, v_bot * s_v)
-                        elif l.vert == v3:
-                            l[uv_layer].uv = (u2 * s_u, v_top * s_v)
-                        elif l.vert == v4:
-                            l[uv_layer].uv = (u1 * s_u, v_top * s_v)
-                except:
-                    pass
-
-        # 4. CAP CENTERS (Triangle Fans)
+        n_rings = len(profile_data)
+        last = n_rings - 1
+
+        theta = np.arange(segs) * ((2 * math.pi) / segs)
+        prof_r = np.array([p.x for p, _v in profile_data])
+        prof_z = np.array([p.z for p, _v in profile_data])
+        prof_v = np.array([v for _p, v in profile_data])
+
+        ring_co = np.empty((n_rings, segs, 3))
+        ring_co[..., 0] = prof_r[:, None] * np.cos(theta)
+        ring_co[..., 1] = prof_r[:, None] * np.sin(theta)
+        ring_co[..., 2] = prof_z[:, None]
+
+        c_bot = n_rings * segs  # Bottom Cap Center
+        c_top = c_bot + 1  # Inner Floor Center
+        verts = np.vstack((ring_co.reshape(-1, 3), [(0.0, 0.0, 0.0), (0.0, 0.0, safe_t)]))
+
+        ring = np.arange(n_rings)[:, None] * segs  # Ring start index (column)
+        s_idx = np.arange(segs)
+        s_next = (s_idx + 1) % segs
+        u1 = s_idx / segs
+        u2 = (s_idx + 1) / segs  # Unwrapped: last column ends at 1.0, not 0.0
+        u_mid = (u1 + u2) / 2
+
+        # A. Profile Walls (Quads) -> Slot 0
+        walls = np.stack((
+            ring[:-1] + s_idx,
+            ring[:-1] + s_next,
+            ring[1:] + s_next,
+            ring[1:] + s_idx,
+        ), axis=-1).reshape(-1, 4)
+
+        v_bot = np.broadcast_to(prof_v[:-1, None], (last, segs))
+        v_top = np.broadcast_to(prof_v[1:, None], (last, segs))
+        uu1 = np.broadcast_to(u1, (last, segs))
+        uu2 = np.broadcast_to(u2, (last, segs))
+        wall_uv = np.stack((
+            np.stack((uu1, v_bot), axis=-1),
+            np.stack((uu2, v_bot), axis=-1),
+            np.stack((uu2, v_top), axis=-1),
+            np.stack((uu1, v_top), axis=-1),
+        ), axis=2).reshape(-1, 2)
+
+        # B. Bottom Cap (Outer, normal DOWN) -> Slot 1 "Base Anchor"
+        bot = np.stack((np.full(segs, c_bot), s_next, s_idx), axis=-1)
+        v_outer = np.full(segs, prof_v[0])
+        bot_uv = np.stack((
+            np.stack((u_mid, np.zeros(segs)), axis=-1),
+            np.stack((u2, v_outer), axis=-1),
+            np.stack((u1, v_outer), axis=-1),
+        ), axis=1).reshape(-1, 2)
+
+        # C. Top Cap (Inner Floor, normal UP) -> Slot 0
+        top = np.stack((np.full(segs, c_top), ring[last] + s_idx, ring[last] + s_next), axis=-1)
+        v_ring = np.full(segs, prof_v[-1])
+        top_uv = np.stack((
+            np.stack((u_mid, np.full(segs, total_len)), axis=-1),
+            np.stack((u1, v_ring), axis=-1),
+            np.stack((u2, v_ring), axis=-1),
+        ), axis=1).reshape(-1, 2)
+
+        uvs = np.vstack((wall_uv, bot_uv, top_uv)) * (s_u, s_v)
+        mats = np.concatenate((np.zeros(len(walls)), np.ones(segs), np.zeros(segs))).astype(np.int32)
+
+        # 4. SEAMS & EDGE SLOTS
         # ----------------------------------------------------------------------
-        v_center_bot = bm.verts.new((0, 0, 0))  # Bottom Cap Center
-        v_center_top = bm.verts.new((0, 0, safe_t))  # Inner Floor Center
-
-        last_ring_idx = len(ring_verts) - 1
-
-        for s in range(segs):
-            u1 = s / segs
-            u2 = (s + 1) / segs
-            u_mid = (u1 + u2) / 2
-
-            # --- Bottom Cap (Outer) ---
-            # Normal points DOWN. This is the "Base Anchor".
-            v1 = ring_verts[0][s]
-            v2 = ring_verts[0][s + 1]
-
-            try:
-                f = bm.faces.new((v_center_bot, v2, v1))
-                f.material_index = 1  # SLOT 1: Base Anchor
-                f.smooth = self.smooth_shade
-
-                v_outer = profile_data[0][1]  # Radius of base
-
-                # UVs: Center is 0, Edge matches wall start
-                for l in f.loops:
-                    if l.vert == v_center_bot:
-                        l[uv_layer].uv = (u_mid * s_u, 0.0)
-                    elif l.vert == v2:
-                        l[uv_layer].uv = (u2 * s_u, v_outer * s_v)
-                    elif l.vert == v1:
-                        l[uv_layer].uv = (u1 * s_u, v_outer * s_v)
-            except:
-                pass
-
-            # --- Top Cap (Inner Floor) ---
-            # Normal points UP. This is just the inside surface.
-            v1 = ring_verts[last_ring_idx][s]
-            v2 = ring_verts[last_ring_idx][s + 1]
-
-            try:
-                f = bm.faces.new((v_center_top, v1, v2))
-                f.material_index = 0  # Main Ceramic Surface
-                f.smooth = self.smooth_shade
-
-                v_ring = profile_data[-1][1]
-                v_center = total_len
-
-                for l in f.loops:
-                    if l.vert == v_center_top:
-                        l[uv_layer].uv = (u_mid * s_u, v_center * s_v)
-                    elif l.vert == v1:
-                        l[uv_layer].uv = (u1 * s_u, v_ring * s_v)
-                    elif l.vert == v2:
-                        l[uv_layer].uv = (u2 * s_u, v_ring * s_v)
-            except:
-                pass
-
-        # 5. MARK SEAMS & EDGE SLOTS
-        # ----------------------------------------------------------------------
-        edge_slots = bm.edges.layers.int.new("MASSA_EDGE_SLOTS")
-
-        # --- A. Slot 1: Perimeters ---
-        # Target Rings (Indices map to 'nodes' list):
-        # 0: Base Outer
-        # 2: Rim Outer
-        # 3: Rim Inner
-        # 5: Base Inner
-        target_rings = [0, 2, 3, 5]
-        
-
-        for r_idx in target_rings:
-            if r_idx < len(ring_verts):
-                ring = ring_verts[r_idx]
-                for i in range(len(ring) - 1):
-                    v1 = ring[i]
-                    v2 = ring[i + 1]
-                    e = bm.edges.get([v1, v2])
-                    if e:
-                        e[edge_slots] = 1
-
-        # --- A2. Slot 3: Horizontal Seam (Mid Loops) ---
-        target_rings_3 = [1, 4]  # 1: Mid Outer, 4: Mid Inner
-        
-        for r_idx in target_rings_3:
-            if r_idx < len(ring_verts):
-                ring = ring_verts[r_idx]
-                for i in range(len(ring) - 1):
-                    v1 = ring[i]
-                    v2 = ring[i + 1]
-                    e = bm.edges.get([v1, v2])
-                    if e:
-                        e[edge_slots] = 3
-
-        # --- B. Slot 3: Vertical Seam Guide (Index 0) ---
-        seam_idx = 0
-        
-        # 1. Main Walls (Verticals)
-        for r in range(len(ring_verts) - 1):
-            v_bot = ring_verts[r][seam_idx]
-            v_top = ring_verts[r+1][seam_idx]
-            e = bm.edges.get([v_bot, v_top])
-            if e:
-                e[edge_slots] = 3
-                
-        # 2. Caps (Center Connectors)
-        # Bottom Cap: center -> ring 0
-        # SKIPPED: Guide stops at base loop (Ring 0) intersection per user request
-        # e_bot = bm.edges.get([v_center_bot, ring_verts[0][seam_idx]])
-        # if e_bot:
-        #     e_bot[edge_slots] = 3
-            
-        # Top Cap: center -> last ring
-        # SKIPPED: Guide stops at inner floor loop per user request
-        # e_top = bm.edges.get([v_center_top, ring_verts[-1][seam_idx]])
-        # if e_top:
-        #     e_top[edge_slots] = 3
-
-        # ----------------------------------------------------------------------
-        # Existing Seam Logic
-        for e in bm.edges:
-            if len(e.link_faces) >= 2:
-                # 1. Material Boundaries (Base Anchor vs Surface)
-                mats = {f.material_index for f in e.link_faces}
-                if len(mats) > 1:
-                    e.seam = True
-
-        # 6. FINAL CLEANUP
+        def ring_edges(r_idx, slot):
+            return np.stack((ring[r_idx] + s_idx, ring[r_idx] + s_next, np.full(segs, slot)), axis=-1)
+
+        # Slot 1: Perimeters (0: Base Outer, 2: Rim Outer, 3: Rim Inner, 5: Base Inner)
+        # Slot 3: Horizontal Seam (1: Mid Outer, 4: Mid Inner)
+        slot_rows = [ring_edges(r, 1) for r in (0, 2, 3, 5)]
+        slot_rows += [ring_edges(r, 3) for r in (1, 4)]
+        # Slot 3: Vertical Seam Guide (Index 0). Stops at the cap loops, so the
+        # center connectors are left unmarked.
+        rungs = ring[:, 0]
+        slot_rows.append(np.stack((rungs[:-1], rungs[1:], np.full(last, 3)), axis=-1))
+
+        # Material boundary (Base Anchor vs Surface) is the base outer loop
+        seams = ring_edges(0, 0)[:, :2]
+
+        self.emit_mesh(
+            bm, verts, [walls, np.vstack((bot, top))],
+            material_index=mats,
+            smooth=self.smooth_shade,
+            uvs=uvs,
+            edge_slots=np.vstack(slot_rows),
+            seams=seams,
+        )
+
+        # 5. FINAL CLEANUP
         # ----------------------------------------------------------------------
         bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
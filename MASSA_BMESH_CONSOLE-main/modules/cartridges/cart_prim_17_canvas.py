@@ -1,9 +1,11 @@
 import bpy
 import bmesh
 import math
+import numpy as np
 from mathutils import Vector, Matrix
 from bpy.props import FloatProperty, IntProperty, BoolProperty, FloatVectorProperty
 from ...operators.massa_base import Massa_OT_Base
+from ...modules import massa_emit
 
 CARTRIDGE_META = {
     "name": "PRIM_17: Sagging Canvas",
@@ -87,21 +89,7 @@ class MASSA_OT_PrimCanvas(Massa_OT_Base):
         res_x = self.res
         res_y = self.res
 
-        # 1. CREATE GRID
-        # ----------------------------------------------------------------------
-        # bmesh.ops.create_grid creates a grid centered at 0,0 ranging -0.5 to 0.5
-        ret = bmesh.ops.create_grid(
-            bm,
-            x_segments=res_x,
-            y_segments=res_y,
-            size=1.0,  # Base unit size, we scale later
-        )
-        verts = ret["verts"]
-
-        # Scale to dimensions
-        bmesh.ops.scale(bm, vec=(w, d, 1.0), verts=verts)
-
-        # 2. DEFINE PIN LOCATIONS
+        # 1. DEFINE PIN LOCATIONS
         # ----------------------------------------------------------------------
         # Coordinates relative to center (0,0)
         hw, hd = w / 2, d / 2
@@ -121,53 +109,54 @@ class MASSA_OT_PrimCanvas(Massa_OT_Base):
             pins.append(Vector((-hw, hd, 0)))
             pins.append(Vector((hw, hd, 0)))
 
-        # 3. APPLY UVs (Topological)
+        # 2. CREATE GRID (Arrays)
         # ----------------------------------------------------------------------
-        # We calculate UVs *before* deformation so the texture follows the grid logic
-        uv_layer = bm.loops.layers.uv.verify()
-
-        s_u = 1.0 if self.fit_uvs else (self.uv_scale * w / 2.0)
-        s_v = 1.0 if self.fit_uvs else (self.uv_scale * d / 2.0)
+        # [ARCHITECT NEW] res_x * res_y quads spanning exactly w * d, centered at 0,0.
+        # Vertex (ix, iy) lives at iy * (res_x + 1) + ix.
+        gx, gy = np.meshgrid(np.linspace(-hw, hw, res_x + 1), np.linspace(-hd, hd, res_y + 1))
+        co = np.stack((gx.ravel(), gy.ravel(), np.zeros(gx.size)), axis=-1)
 
-        bm.faces.ensure_lookup_table()
-        for f in bm.faces:
-            f.material_index = 0
-            f.smooth = True
-            for l in f.loops:
-                # Map range -w/2..w/2 to 0..1
-                u = (l.vert.co.x + hw) / w
-                v = (l.vert.co.y + hd) / d
+        faces = massa_emit.grid_quads(res_x, res_y)
 
-                # Apply scaling logic
-                if not self.fit_uvs:
-                    # Center the scaling
-                    u = (u - 0.5) * self.uv_scale + 0.5
-                    v = (v - 0.5) * self.uv_scale + 0.5
-
-                l[uv_layer].uv = (u, v)
+        # 3. APPLY UVs (Topological)
+        # ----------------------------------------------------------------------
+        # We calculate UVs *before* deformation so the texture follows the grid logic
+        # Map range -w/2..w/2 to 0..1
+        uv = (co[:, :2] + (hw, hd)) / (w, d)
+        if not self.fit_uvs:
+            # Center the scaling
+            uv = (uv - 0.5) * self.uv_scale + 0.5
+        uvs = uv[faces.ravel()]
 
         # 4. APPLY SAG DEFORMATION
         # ----------------------------------------------------------------------
         # Algorithm: Z -= Sag * (min_dist_to_any_pin / max_possible_dist)^Power
-
         max_dist_ref = math.hypot(w, d)  # Diagonal
 
-        for v in verts:
-            min_d = 100000.0
-
-            # Find distance to closest active pin
-            for p in pins:
-                dist = (v.co - p).length
-                if dist < min_d:
-                    min_d = dist
+        pin_co = np.array([p[:] for p in pins])
+        min_d = np.linalg.norm(co[:, None, :] - pin_co[None, :, :], axis=-1).min(axis=1)
 
-            # Normalize influence
-            ratio = min_d / max_dist_ref
+        # Apply Curve (Power 1.8 gives a nice heavy cloth hang)
+        co[:, 2] -= self.sag_amount * np.power(min_d / max_dist_ref, 1.8) * 5.0
 
-            # Apply Curve (Power 1.8 gives a nice heavy cloth hang)
-            # We offset Z downwards
-            drop = self.sag_amount * math.pow(ratio, 1.8) * 5.0
-            v.co.z -= drop
+        # 4b. EDGE SLOTS (Fabric)
+        # ----------------------------------------------------------------------
+        # Slot #1: Perimeter Loop (Boundary of the grid)
+        rim = massa_emit.grid_perimeter(res_x, res_y)
+        slot_rows = [np.column_stack((rim, np.full(len(rim), 1)))]
+
+        # Slot #5: Middle Fold, the centerline along Y=0 (X-Axis). Only exists on even res.
+        if res_y % 2 == 0:
+            mid = (res_y // 2) * (res_x + 1) + np.arange(res_x + 1)
+            slot_rows.append(np.column_stack((mid[:-1], mid[1:], np.full(res_x, 5))))
+
+        self.emit_mesh(
+            bm, co, faces,
+            material_index=0,
+            smooth=True,
+            uvs=uvs,
+            edge_slots=np.vstack(slot_rows),
+        )
 
         # 5. GENERATE GROMMETS (Hardware)
         # ----------------------------------------------------------------------
@@ -209,42 +198,6 @@ class MASSA_OT_PrimCanvas(Massa_OT_Base):
                     f.material_index = 1  # Hardware
                     f.smooth = True
 
-        # 6. MARK SEAMS
-        # ----------------------------------------------------------------------
-        # 6. MARK SEAMS & SLOT ASSIGNMENTS
-        # ----------------------------------------------------------------------
-        # Create Edge Slot Layer
-        edge_slots = bm.edges.layers.int.get("MASSA_EDGE_SLOTS")
-        if not edge_slots:
-            edge_slots = bm.edges.layers.int.new("MASSA_EDGE_SLOTS")
-
-        for e in bm.edges:
-            # Check for loose edges
-            if not e.link_faces:
-                continue
-
-            # Identify Material (Use first face as safe check)
-            mat = e.link_faces[0].material_index
-            
-            # --- SLOT LOGIC (FABRIC ONLY) ---
-            if mat == 0:
-                # Slot #1: Perimeter Loop (Boundary of the grid)
-                if e.is_boundary:
-                    e[edge_slots] = 1
-                
-                # Slot #5: Middle Fold (Crossing middle of canvas). 
-                # Defined as the centerline along Y=0 (X-Axis)
-                v1, v2 = e.verts
-                if abs(v1.co.y) < 0.001 and abs(v2.co.y) < 0.001:
-                    e[edge_slots] = 5
-
-            # --- EXISTING SEAM LOGIC ---
-            if len(e.link_faces) >= 2:
-                # Material Boundaries (Grommets vs Fabric)
-                mats = {f.material_index for f in e.link_faces}
-                if len(mats) > 1:
-                    e.seam = True
-
-        # 7. CLEANUP
+        # 6. CLEANUP
         # ----------------------------------------------------------------------
         bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
@@ -1,9 +1,7 @@
-import bmesh
-import random
-import mathutils
-from mathutils import Vector
-from bpy.props import FloatProperty, IntProperty, EnumProperty
+import numpy as np
+from bpy.props import BoolProperty, FloatProperty, IntProperty, EnumProperty
 from ...operators.massa_base import Massa_OT_Base
+from ...modules import massa_emit, massa_heightfield, massa_terrain
 
 CARTRIDGE_META = {
     "name": "Landscape",
@@ -87,6 +85,14 @@ class MASSA_OT_PrimLandscape(Massa_OT_Base):
     rock_slope: FloatProperty(name="Rock Slope", default=0.7, min=0.0, max=1.57, description="Angle in radians for rock slope")
     peak_factor: FloatProperty(name="Peak Factor", default=0.8, min=0.0, max=1.0, description="Height percentage defining peaks")
 
+    # --- TILING (Large Worlds) ---
+    use_tiles: BoolProperty(name="Tiled Output", default=False, description="Generate a grid of tile objects with LODs instead of one mesh")
+    tiles_x: IntProperty(name="Tiles X", default=4, min=1, max=64)
+    tiles_y: IntProperty(name="Tiles Y", default=4, min=1, max=64)
+    tile_res: IntProperty(name="Tile Resolution", default=128, min=4, max=1024, description="Quads per tile side at LOD0")
+    tile_lod_levels: IntProperty(name="LOD Levels", default=3, min=1, max=6, description="Each level halves the tile resolution")
+    tile_workers: IntProperty(name="Workers", default=4, min=1, max=32, description="Worker processes for tiles missing from the disk cache")
+
     def get_slot_meta(self):
         return {
             0: {"name": "Ground", "uv": "BOX", "phys": "GENERIC"},
@@ -141,165 +147,62 @@ class MASSA_OT_PrimLandscape(Massa_OT_Base):
         box.prop(self, "rock_slope")
         box.prop(self, "peak_factor")
 
+        box = layout.box()
+        box.prop(self, "use_tiles")
+        if self.use_tiles:
+            row = box.row()
+            row.prop(self, "tiles_x", text="Tiles X")
+            row.prop(self, "tiles_y", text="Tiles Y")
+            box.prop(self, "tile_res")
+            box.prop(self, "tile_lod_levels")
+            box.prop(self, "tile_workers")
+
+    def execute(self, context):
+        # [ARCHITECT NEW] Tiled output bypasses the single-mesh pipeline:
+        # every tile is its own object, cached on disk and rebuilt only on change
+        if not self.use_tiles:
+            return super().execute(context)
+
+        self._inject_cartridge_defaults()
+        stats = massa_terrain.generate_tiles(self, context)
+        self.report(
+            {"INFO"},
+            f"Terrain: {stats['built']} tiles rebuilt, {stats['kept']} unchanged, "
+            f"{stats['computed']} computed",
+        )
+        return {"FINISHED"}
+
     def build_shape(self, bm):
-        # 1. Native Grid Generation
+        # 1. Grid Lattice
         # ----------------------------------------------------------------------
+        # [ARCHITECT NEW] The grid is regular, so the whole terrain is a 2D
+        # height array: noise, falloff and slot logic run on arrays and the
+        # mesh is emitted in one shot (see massa_heightfield / emit_mesh).
         res_x = max(2, self.subdivision_x)
         res_y = max(2, self.subdivision_y)
         size_x = self.mesh_size_x
         size_y = self.mesh_size_y
-        
-        bmesh.ops.create_grid(
-            bm, 
-            x_segments=res_x, 
-            y_segments=res_y, 
-            size=max(size_x, size_y) / 2.0 # create_grid size is radius-like? No, it's diameter.
-        )
-        
-        # Scale to match non-square aspect ratio if needed
-        scale_vec = Vector((size_x / max(size_x, size_y), size_y / max(size_x, size_y), 1.0))
-        # Wait, create_grid uses 'size' as total width.
-        # If size_x=10, size_y=5. create_grid(size=10).
-        # We need to scale Y by 0.5.
-        
-        if abs(size_x - size_y) > 0.001:
-            scale_x = size_x
-            scale_y = size_y
-            # We generated a square of max(size_x, size_y)
-            base_s = max(size_x, size_y)
-            s_vec = Vector((scale_x / base_s, scale_y / base_s, 1.0))
-            bmesh.ops.scale(bm, vec=s_vec, verts=bm.verts)
 
-        # 2. Noise Engine
-        # ----------------------------------------------------------------------
-        rng = random.Random(self.random_seed)
-        seed_offset = Vector((
-            rng.uniform(-1000, 1000) + self.noise_offset_x, 
-            rng.uniform(-1000, 1000) + self.noise_offset_y, 
-            rng.uniform(-1000, 1000) + self.noise_offset_z
-        ))
+        xs = np.linspace(-size_x / 2.0, size_x / 2.0, res_x + 1)
+        ys = np.linspace(-size_y / 2.0, size_y / 2.0, res_y + 1)
+        gx, gy = np.meshgrid(xs, ys)
 
-        # Capture props for speed
-        n_size = max(0.001, self.noise_size)
-        n_height = self.height
-        n_type = self.noise_type
-        n_lacun = self.lacunarity
-        n_gain = self.gain
-        n_dist = self.distortion
-        n_offset = self.offset
-        n_detail = self.noise_detail
-        
-        # 2a. Resolve Noise Function & Params (OPTIMIZATION)
+        # 2. Noise Engine (Array Octaves) + 3. Falloff
         # ----------------------------------------------------------------------
-        noise_func = None
-        noise_kwargs = {}
-        
-        # Standard Params
-        # Note: Some functions take 'octaves', others don't.
-        # We differentiate here to avoid repeated "if" checks in loop.
-        
-        if n_type == 'hetero_terrain':
-            noise_func = mathutils.noise.hetero_terrain
-            # args: position, H, lacunarity, octaves, offset
-            noise_args_fixed = (n_gain, n_lacun, n_detail, n_offset)
-            
-        elif n_type == 'fBm':
-            noise_func = mathutils.noise.fractal
-            # args: position, H, lacunarity, octaves, noise_basis
-            noise_args_fixed = (n_gain, n_lacun, n_detail, mathutils.noise.types.STDPERLIN)
-            
-        elif n_type == 'hybrid_multi_fractal':
-            noise_func = mathutils.noise.hybrid_multi_fractal
-            # args: position, H, lacunarity, octaves, offset, gain
-            noise_args_fixed = (n_gain, n_lacun, n_detail, n_offset, 1.0)
-            
-        elif n_type == 'ridged_multi_fractal':
-            noise_func = mathutils.noise.ridged_multi_fractal
-            # args: position, H, lacunarity, octaves, offset, gain
-            noise_args_fixed = (n_gain, n_lacun, n_detail, n_offset, 1.0)
-            
-        elif n_type == 'vl_noise_turbulence':
-            noise_func = mathutils.noise.turbulence
-            # args: position, octaves, hard, noise_basis
-            noise_args_fixed = (n_detail, False, mathutils.noise.types.STDPERLIN)
-        
-        # 2b. Execution Loop (Fast)
-        # ----------------------------------------------------------------------
-        
-        # Pre-calc constants
-        has_dist = (n_dist != 1.0)
-        
-        for v in bm.verts:
-            p = v.co + seed_offset
-            p *= n_size
-            
-            z_val = 0.0
-            
-            if noise_func:
-                try:
-                    z_val = noise_func(p, *noise_args_fixed)
-                except:
-                    z_val = 0.0
-            
-            elif n_type == 'vl_noise_voronoi':
-                # Voronoi logic
-                try:
-                    z_val = mathutils.noise.voronoi(p)[0]
-                except:
-                    z_val = 0.0
-            else:
-                # Default Perlin
-                try:
-                     z_val = mathutils.noise.noise(p)
-                except:
-                     z_val = 0.0
+        params = massa_heightfield.params_from_op(self)
+        gz = massa_heightfield.heights(params, gx, gy)
 
-            # Distortion
-            if has_dist:
-                 z_val *= n_dist
-            
-            # Apply Height
-            v.co.z += (z_val * n_height) + self.height_offset
-            
-            # 3. Falloff (Optional)
-            if self.falloff_x > 0 or self.falloff_y > 0:
-                # Distance from center normalized
-                dx = abs(v.co.x) / (size_x / 2.0)
-                dy = abs(v.co.y) / (size_y / 2.0)
-                
-                fx = max(0, 1.0 - (dx * self.falloff_x)) if self.falloff_x > 0 else 1.0
-                fy = max(0, 1.0 - (dy * self.falloff_y)) if self.falloff_y > 0 else 1.0
-                
-                v.co.z *= (fx * fy)
-
-        # 4. Slot Logic (Recalculate Normals Required First)
+        # 4. Slot Logic (Slope From Quad Normals, Height From Corner Average)
         # ----------------------------------------------------------------------
-        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
-        
-        tag_layer = bm.faces.layers.int.new("MAT_TAG")
-        edge_slots = bm.edges.layers.int.new("MASSA_EDGE_SLOTS")
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        
-        z_up = Vector((0,0,1))
-        
-        for f in bm.faces:
-            angle = f.normal.angle(z_up)
-            z_avg = sum([v.co.z for v in f.verts]) / len(f.verts)
-            
-            slot = 0 # Ground
-            
-            if z_avg < self.water_level:
-                slot = 8 # Water
-            elif angle > self.rock_slope:
-                slot = 1 # Cliffs
-            elif z_avg > (self.height * self.peak_factor) + self.height_offset:
-                slot = 2 # Peaks
-            elif z_avg < (self.water_level + 0.15):
-                slot = 3 # Shore
-                
-            f[tag_layer] = slot
-            
-        for e in bm.edges:
-            if e.is_boundary:
-                e[edge_slots] = 1 # Perimeter
+        slots = massa_heightfield.classify(params, gz, size_x / res_x, size_y / res_y).ravel()
+
+        rim = massa_emit.grid_perimeter(res_x, res_y)
+        self.emit_mesh(
+            bm,
+            np.stack((gx, gy, gz), axis=-1).reshape(-1, 3),
+            massa_emit.grid_quads(res_x, res_y),
+            material_index=slots,
+            smooth=False,
+            face_ints={"MAT_TAG": slots},
+            edge_slots=np.column_stack((rim, np.full(len(rim), 1))),  # Perimeter
+        )
@@ -2,7 +2,9 @@ import bpy
 import bmesh
 import random
 import mathutils
+import numpy as np
 from mathutils import Vector
+from mathutils.kdtree import KDTree
 from bpy.props import FloatProperty, IntProperty, BoolProperty, EnumProperty, FloatVectorProperty
 from ...operators.massa_base import Massa_OT_Base
 
@@ -244,6 +246,13 @@ class MASSA_OT_PrimRockBoulder(Massa_OT_Base):
             bound_rad = self.radius * max(self.scale_x, self.scale_y, self.scale_z)
             e_type = getattr(self, "erosion_type", "PLANAR")
 
+            # [ARCHITECT NEW] Scoop chips resolve their region through a KD-tree
+            # built once over the hull; displacement runs on arrays and is
+            # written back once after the last chip.
+            scoop = None
+            if e_type == 'SPHERICAL' and bm.verts:
+                scoop = _ScoopField(bm.verts)
+
             for i in range(active_chips):
                 if not bm.verts: break
 
@@ -261,56 +270,10 @@ class MASSA_OT_PrimRockBoulder(Massa_OT_Base):
                 origin_co = vec_dir * dist
                 
                 if e_type == 'SPHERICAL':
-                    # Scoop Mode: Find verts near origin_co and push them IN
-                    # Radius of the scoop
+                    # Scoop Mode: Gaussian-style falloff displacement INWARDS along
+                    # the vertex normal (1 at the scoop center, 0 at its rim)
                     scoop_rad = bound_rad * self.chip_scale * 0.5
-                    
-                    # Simple distance check (can be slow for high poly, but manageable for rocks)
-                    # Optimization: Only check verts in octant? No, iterate all is fine for <10k verts
-                    
-                    # We want to create a "Concave" impression.
-                    # We push verts towards the center of the scoop sphere if they are inside it?
-                    # Or we project them onto the BACK of the scoop sphere?
-                    
-                    # Improved Scoop: Push verts towards origin_co
-                    for v in bm.verts:
-                        d_vec = v.co - origin_co
-                        d_len = d_vec.length
-                        if d_len < scoop_rad:
-                            # It's inside the scoop crater
-                            # Push it "down" into the crater.
-                            # We want the surface to become the bottom hemisphere of the scoop sphere.
-                            # Target surface is at distance 'scoop_rad' from origin_co? No, that's convex.
-                            # We want it to look like a bite was taken out.
-                            # So we want the surface to conform to the sphere surface, but "inside" the mesh.
-                            
-                            # Actually, boolean diff is best, but slow.
-                            # Fake it: Push vert ALONG the vector from origin_co to v.co?
-                            # If we push it away, we make a bubble.
-                            # If we push it towards origin_co, we make a spike.
-                            
-                            # Correct "Inv-Spherical" shape:
-                            # We want to project v.co onto the surface of the sphere defined by (origin_co, scoop_rad).
-                            # THIS MAKES A CONVEX BUMP usually.
-                            
-                            # To make a HOLE, we effectively want to flatten the area?
-                            # Simple Planar Flattening is easiest: project onto plane.
-                            # But that's PLANAR mode.
-                            
-                            # Let's try "Crater": Push vertices radially INWARDS from the rock center?
-                            # No, push them towards the Scoop Center?
-                            
-                            # Let's use `bmesh.ops.pointmerge`? No.
-                            # Let's just use Gaussian Falloff displacement INWARDS along normal.
-                            force = (1.0 - (d_len / scoop_rad)) # 1 at center, 0 at rim
-                            # Displace inwards (negative normal)
-                            v.co -= v.normal * force * scoop_rad * 0.8
-                            
-                            # Mark as Inner Core
-                            # Find face? It's vertex based. We need to mark faces.
-                            for f in v.link_faces:
-                                f.material_index = 1
-                                f.smooth = (self.rock_type == 'RIVER')
+                    scoop.carve(origin_co, scoop_rad, depth=0.8)
 
                 else:
                     # PLANAR Mode (Bisect)
@@ -335,6 +298,12 @@ class MASSA_OT_PrimRockBoulder(Massa_OT_Base):
                     except:
                         pass
 
+            if scoop is not None:
+                # Mark scooped faces as Inner Core
+                for f in scoop.apply():
+                    f.material_index = 1
+                    f.smooth = (self.rock_type == 'RIVER')
+
         # E. CLEANUP
         # ----------------------------------------------------------------------
         bmesh.ops.dissolve_degenerate(bm, dist=0.0001, edges=bm.edges[:])
@@ -394,3 +363,49 @@ class MASSA_OT_PrimRockBoulder(Massa_OT_Base):
                 else:
                     # Smooth interface
                     e[slot_layer] = 3 # Guide/Flow (Organic)
+
+
+class _ScoopField:
+    """
+    Vertex positions/normals of the hull as arrays plus a KD-tree over the
+    starting positions. Chips move verts inward, so each query widens its
+    radius by the furthest any vertex has travelled so far; the exact test then
+    runs on current positions. Result matches a full scan per chip.
+    Normals are not refreshed between chips (same as BMesh without normal_update).
+    """
+
+    def __init__(self, verts):
+        self.verts = list(verts)
+        self.co = np.array([v.co[:] for v in self.verts], dtype=np.float64)
+        self.normals = np.array([v.normal[:] for v in self.verts], dtype=np.float64)
+        self.kd = KDTree(len(self.verts))
+        for i, v in enumerate(self.verts):
+            self.kd.insert(v.co, i)
+        self.kd.balance()
+        self.travel = np.zeros(len(self.verts))
+        self.slack = 0.0
+
+    def carve(self, origin, radius, depth=0.8):
+        hits = self.kd.find_range(origin, radius + self.slack)
+        if not hits:
+            return
+        idx = np.fromiter((h[1] for h in hits), dtype=np.int64, count=len(hits))
+        d_len = np.linalg.norm(self.co[idx] - np.asarray(origin[:]), axis=1)
+        inside = d_len < radius
+        idx, d_len = idx[inside], d_len[inside]
+        if not len(idx):
+            return
+
+        push = (1.0 - (d_len / radius)) * radius * depth
+        self.co[idx] -= self.normals[idx] * push[:, None]
+        self.travel[idx] += push
+        self.slack = max(self.slack, float(self.travel[idx].max()))
+
+    def apply(self):
+        """Writes moved positions back; returns the faces around carved verts."""
+        faces = set()
+        for i in np.flatnonzero(self.travel > 0.0):
+            v = self.verts[i]
+            v.co = self.co[i]
+            faces.update(v.link_faces)
+        return faces
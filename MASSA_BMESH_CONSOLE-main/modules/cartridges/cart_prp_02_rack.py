@@ -162,7 +162,7 @@ class MASSA_OT_PrpRack(Massa_OT_Base):
             f_sock_r.material_index = 9
 
         # 6. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
         for f in bm.faces:
             mat_idx = f.material_index
             if mat_idx == 9: continue
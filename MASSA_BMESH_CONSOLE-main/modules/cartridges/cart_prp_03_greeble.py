@@ -171,7 +171,7 @@ class MASSA_OT_PrpGreeble(Massa_OT_Base):
         # Origin is back.
 
         # 7. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
         for f in bm.faces:
             mat_idx = f.material_index
             if mat_idx == 9: continue
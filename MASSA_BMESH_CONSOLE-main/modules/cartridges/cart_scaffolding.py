@@ -23,6 +23,7 @@ CARTRIDGE_META = {
         "ALLOW_SOLIDIFY": False,
         "FIX_DEGENERATE": True,
         "LOCK_PIVOT": False,
+        "ALLOW_INSTANCES": True,  # Struts/planks -> one prototype per size
     },
 }
 
@@ -95,6 +96,28 @@ class MASSA_OT_Scaffolding(Massa_OT_Base, MassaPropertiesMixin):
         if not edge_slots:
             edge_slots = bm.edges.layers.int.new("MASSA_EDGE_SLOTS")
 
+        # --- Part Templates ---
+        # Struts and planks repeat with identical dimensions (posts, rungs, braces,
+        # every plank on every floor). Each unique part is built once at the origin
+        # and all copies are stamped in bulk at the end of the build.
+        stamp_jobs = {}  # key -> (template, [matrices])
+
+        def _queue(key, builder, matrix):
+            if key not in stamp_jobs:
+                stamp_jobs[key] = (self.part_template(key, builder), [])
+            stamp_jobs[key][1].append(matrix)
+
+        # --- Helper: Edge Role Interpreter (per template) ---
+        # Parts are disjoint and stamped rigidly, so face angles measured on
+        # the template equal those of every copy.
+        def _tag_perimeter(tb):
+            t_slots = tb.edges.layers.int.get("MASSA_EDGE_SLOTS") or tb.edges.layers.int.new("MASSA_EDGE_SLOTS")
+            bmesh.ops.recalc_face_normals(tb, faces=tb.faces)
+            for e in tb.edges:
+                # Angle Check for Cylinder Caps
+                if e.calc_face_angle(0) > 1.5: # Sharp edges (Caps/Box edges)
+                    e[t_slots] = 1 # Perimeter
+
         # --- Helper: Create Strut ---
         def make_strut(v_start, v_end, radius, mat_idx=0):
             # 1. Vector Math
@@ -104,102 +127,103 @@ class MASSA_OT_Scaffolding(Massa_OT_Base, MassaPropertiesMixin):
             
             center = (v_start + v_end) * 0.5
             rot = Vector((0,0,1)).rotation_difference(vec)
-            
-            # 2. Geometry
-            res = bmesh.ops.create_cone(
-                bm, 
-                cap_ends=True, 
-                cap_tris=False, 
-                segments=8, 
-                radius1=radius, 
-                radius2=radius, 
-                depth=length
-            )
-            new_verts = res['verts']
-            
-            # 3. Material (Early Assignment)
-            new_faces = {f for v in new_verts for f in v.link_faces}
-            for f in new_faces:
-                f.material_index = mat_idx
-                
-            # 4. Transform (BEFORE Subdivision)
-            mat_loc = Matrix.Translation(center)
-            mat_rot = rot.to_matrix().to_4x4()
-            mat_final = mat_loc @ mat_rot
-            bmesh.ops.transform(bm, verts=new_verts, matrix=mat_final)
-            
-            # 5. Segmentation (Manual Count)
-            if self.strut_cuts > 0:
-                new_edges = {e for v in new_verts for e in v.link_edges}
-                v_edges = [e for e in new_edges if e.calc_length() > length * 0.9]
+
+            def build(tb):
+                # 2. Geometry (Z-aligned at origin)
+                bmesh.ops.create_cone(
+                    tb, 
+                    cap_ends=True, 
+                    cap_tris=False, 
+                    segments=8, 
+                    radius1=radius, 
+                    radius2=radius, 
+                    depth=length
+                )
                 
-                if v_edges:
-                    ret_sub = bmesh.ops.subdivide_edges(
-                        bm,
-                        edges=v_edges,
-                        cuts=self.strut_cuts,
-                        use_grid_fill=True
-                    )
+                # 3. Material (Early Assignment)
+                for f in tb.faces:
+                    f.material_index = mat_idx
                     
-                    # Mark Seams on Loops
-                    for ele in ret_sub['geom_inner']:
-                        if isinstance(ele, bmesh.types.BMEdge):
-                            ele[edge_slots] = 1
+                # 4. Segmentation (Manual Count)
+                if self.strut_cuts > 0:
+                    t_slots = tb.edges.layers.int.get("MASSA_EDGE_SLOTS") or tb.edges.layers.int.new("MASSA_EDGE_SLOTS")
+                    v_edges = [e for e in tb.edges if e.calc_length() > length * 0.9]
+                    
+                    if v_edges:
+                        ret_sub = bmesh.ops.subdivide_edges(
+                            tb,
+                            edges=v_edges,
+                            cuts=self.strut_cuts,
+                            use_grid_fill=True
+                        )
+                        
+                        # Mark Seams on Loops
+                        for ele in ret_sub['geom_inner']:
+                            if isinstance(ele, bmesh.types.BMEdge):
+                                ele[t_slots] = 1
+
+                _tag_perimeter(tb)
+
+            # 5. Transform (Rotate to span, then move to midpoint)
+            mat_final = Matrix.Translation(center) @ rot.to_matrix().to_4x4()
+            _queue(("strut", round(length, 6), radius, mat_idx, self.strut_cuts), build, mat_final)
 
         # --- Helper: Create Plank ---
         def make_plank(center, size, mat_idx=1):
-            res = bmesh.ops.create_cube(bm, size=1.0)
-            verts = res['verts']
-            
-            # 1. Scale & Move
-            bmesh.ops.scale(bm, vec=size, verts=verts)
-            bmesh.ops.translate(bm, vec=center, verts=verts)
-            
-            # 2. Material
-            new_faces = {f for v in verts for f in v.link_faces}
-            for f in new_faces:
-                f.material_index = mat_idx
+            def build(tb):
+                res = bmesh.ops.create_cube(tb, size=1.0)
+                verts = res['verts']
+                t_slots = tb.edges.layers.int.get("MASSA_EDGE_SLOTS") or tb.edges.layers.int.new("MASSA_EDGE_SLOTS")
                 
-            # 3. Smart Seams & Segmentation
-            # Find Longest Axis
-            max_len = max(size.x, size.y, size.z)
-            axis_idx = 0
-            if size.y == max_len: axis_idx = 1
-            if size.z == max_len: axis_idx = 2
-            
-            p_edges = {e for v in verts for e in v.link_edges}
-            
-            # A. Segmentation
-            if self.plank_cuts > 0:
-                # Find edges parallel to Long Axis
-                # Since created axis-aligned, checking vector component is reliable enough
-                long_edges = []
+                # 1. Scale (origin-centred; placement happens at stamp time)
+                bmesh.ops.scale(tb, vec=size, verts=verts)
+                
+                # 2. Material
+                for f in tb.faces:
+                    f.material_index = mat_idx
+                    
+                # 3. Smart Seams & Segmentation
+                # Find Longest Axis
+                max_len = max(size.x, size.y, size.z)
+                axis_idx = 0
+                if size.y == max_len: axis_idx = 1
+                if size.z == max_len: axis_idx = 2
+                
+                p_edges = set(tb.edges)
+                
+                # A. Segmentation
+                if self.plank_cuts > 0:
+                    # Find edges parallel to Long Axis
+                    # Since created axis-aligned, checking vector component is reliable enough
+                    long_edges = []
+                    for e in p_edges:
+                        v_e = (e.verts[1].co - e.verts[0].co)
+                        if abs(v_e[axis_idx]) > max_len * 0.9:
+                            long_edges.append(e)
+                    
+                    if long_edges:
+                        ret_sub = bmesh.ops.subdivide_edges(
+                            tb, 
+                            edges=long_edges, 
+                            cuts=self.plank_cuts, 
+                            use_grid_fill=True
+                        )
+                        # Add inner cuts to potential seam list
+                        for ele in ret_sub['geom_inner']:
+                            if isinstance(ele, bmesh.types.BMEdge):
+                                p_edges.add(ele)
+                
+                # B. Seams (Mark All Perpendicular Edges)
+                # This isolates Ends and Segments
                 for e in p_edges:
                     v_e = (e.verts[1].co - e.verts[0].co)
-                    if abs(v_e[axis_idx]) > max_len * 0.9:
-                        long_edges.append(e)
-                
-                if long_edges:
-                    ret_sub = bmesh.ops.subdivide_edges(
-                        bm, 
-                        edges=long_edges, 
-                        cuts=self.plank_cuts, 
-                        use_grid_fill=True
-                    )
-                    # Add new geometry to p_edges set for seam logic
-                    # Simplify: Just re-gather all edges connected to these faces
-                    # Or relying on 'geom_inner' for the cuts
-                    for ele in ret_sub['geom_inner']:
-                        if isinstance(ele, bmesh.types.BMEdge):
-                            p_edges.add(ele) # Add inner cuts to potential seam list
-            
-            # B. Seams (Mark All Perpendicular Edges)
-            # This isolates Ends and Segments
-            for e in p_edges:
-                v_e = (e.verts[1].co - e.verts[0].co)
-                # If length along main axis is small -> It's a cross edge -> Seam
-                if abs(v_e[axis_idx]) < max_len * 0.1: # Threshold for "perpendicular"
-                     e[edge_slots] = 1
+                    # If length along main axis is small -> It's a cross edge -> Seam
+                    if abs(v_e[axis_idx]) < max_len * 0.1: # Threshold for "perpendicular"
+                         e[t_slots] = 1
+
+                _tag_perimeter(tb)
+
+            _queue(("plank", tuple(round(c, 6) for c in size), mat_idx, self.plank_cuts), build, Matrix.Translation(center))
 
         # ======================================================================
         # BUILD LOOP
@@ -311,15 +335,8 @@ class MASSA_OT_Scaffolding(Massa_OT_Base, MassaPropertiesMixin):
                 make_strut(p, p - Vector((0,0,0.2)), r, 4) # Stem
                 # Wheel TODO
 
-        # 6. EDGE ROLE INTERPRETER
-        edge_slots = bm.edges.layers.int.get("MASSA_EDGE_SLOTS")
-        if not edge_slots:
-            edge_slots = bm.edges.layers.int.new("MASSA_EDGE_SLOTS")
-            
-        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
-        
-        for e in bm.edges:
-            # Angle Check for Cylinder Caps
-            angle = e.calc_face_angle(0)
-            if angle > 1.5: # Sharp edges (Caps/Box edges)
-                e[edge_slots] = 1 # Perimeter
+        # Flush: one build per unique part, bulk copies for the rest.
+        # Edge roles already live in the templates (see _tag_perimeter), so
+        # nothing edits bm afterwards and INSTANCES output matches realized.
+        for tpl, matrices in stamp_jobs.values():
+            self.stamp_parts(bm, tpl, matrices)
@@ -144,7 +144,7 @@ class MASSA_OT_UrbSidewalk(Massa_OT_Base):
                 f.material_index = 9 # Socket Anchor
 
         # 6. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
 
         for f in bm.faces:
             mat_idx = f.material_index
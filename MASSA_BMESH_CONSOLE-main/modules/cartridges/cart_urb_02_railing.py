@@ -167,7 +167,7 @@ class MASSA_OT_UrbRailing(Massa_OT_Base):
                 f.material_index = 9
 
         # 7. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
         for f in bm.faces:
             if f.material_index == 9: continue
             n = f.normal
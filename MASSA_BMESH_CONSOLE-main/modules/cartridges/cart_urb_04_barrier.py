@@ -110,7 +110,7 @@ class MASSA_OT_UrbBarrier(Massa_OT_Base):
                 f.material_index = 9 # Socket
 
         # 6. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
         for f in bm.faces:
             mat_idx = f.material_index
             if mat_idx == 9: continue
@@ -49,26 +49,26 @@ class MASSA_OT_UrbFence(Massa_OT_Base):
         # 2. Frame (Cylinders)
         # 4 Pipes: Top, Bottom, Left, Right
 
-        # Top Rail (Length L)
-        # Create Cylinder
-        res_TR = bmesh.ops.create_cone(bm, cap_ends=True, radius1=pr, radius2=pr, depth=l, segments=8)
-        # Rotate 90 Y (Cylinder is Z by default).
-        bmesh.ops.rotate(bm, cent=Vector((0,0,0)), matrix=Matrix.Rotation(math.radians(90), 3, 'Y'), verts=res_TR['verts'])
-        # Translate to (0, 0, h - pr)
-        bmesh.ops.translate(bm, vec=Vector((0, 0, h - pr)), verts=res_TR['verts'])
-
-        # Bottom Rail
-        res_BR = bmesh.ops.create_cone(bm, cap_ends=True, radius1=pr, radius2=pr, depth=l, segments=8)
-        bmesh.ops.rotate(bm, cent=Vector((0,0,0)), matrix=Matrix.Rotation(math.radians(90), 3, 'Y'), verts=res_BR['verts'])
-        bmesh.ops.translate(bm, vec=Vector((0, 0, pr)), verts=res_BR['verts'])
-
-        # Left Post (Height H)
-        res_PL = bmesh.ops.create_cone(bm, cap_ends=True, radius1=pr, radius2=pr, depth=h, segments=8)
-        bmesh.ops.translate(bm, vec=Vector((-l/2 + pr, 0, h/2)), verts=res_PL['verts'])
-
-        # Right Post
-        res_PR = bmesh.ops.create_cone(bm, cap_ends=True, radius1=pr, radius2=pr, depth=h, segments=8)
-        bmesh.ops.translate(bm, vec=Vector((l/2 - pr, 0, h/2)), verts=res_PR['verts'])
+        # Rails and posts are two pairs of identical pipes: one template each.
+        def pipe(depth):
+            return lambda tb: bmesh.ops.create_cone(
+                tb, cap_ends=True, radius1=pr, radius2=pr, depth=depth, segments=8
+            )
+
+        # Top / Bottom Rails (Length L, cylinder is Z by default -> rotate 90 Y)
+        rail = self.part_template(("rail", pr, l), pipe(l))
+        rot_y = Matrix.Rotation(math.radians(90), 4, 'Y')
+        self.stamp_parts(bm, rail, [
+            Matrix.Translation(Vector((0, 0, h - pr))) @ rot_y,
+            Matrix.Translation(Vector((0, 0, pr))) @ rot_y,
+        ])
+
+        # Left / Right Posts (Height H)
+        post = self.part_template(("post", pr, h), pipe(h))
+        self.stamp_parts(bm, post, [
+            Matrix.Translation(Vector((-l/2 + pr, 0, h/2))),
+            Matrix.Translation(Vector((l/2 - pr, 0, h/2))),
+        ])
 
         # Assign Frame Material
         for f in bm.faces:
@@ -104,7 +104,7 @@ class MASSA_OT_UrbFence(Massa_OT_Base):
                     f.material_index = 9
 
         # 5. Manual UVs
-        scale = getattr(self, "uv_scale_0", 1.0)
+        scale = self.get_slot_value(0, "uv_scale", 1.0)
 
         for f in bm.faces:
             mat_idx = f.material_index
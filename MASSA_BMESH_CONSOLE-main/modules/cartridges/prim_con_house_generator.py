@@ -164,14 +164,10 @@ class MASSA_OT_prim_con_house_generator(Massa_OT_Base):
         }
         
     def _make_rot_box(self, bm, size, pos, angle_z=0.0, angle_x=0.0, tag=0, tag_layer=None, angle_y=0.0):
-        """Helper: Create Rotated Box"""
-        r = bmesh.ops.create_cube(bm, size=1.0)
-        new_verts = r["verts"]
+        """Helper: Create Rotated Box (stamped from a shared unit-cube template)"""
+        tpl = self.part_template("unit_box", lambda tb: bmesh.ops.create_cube(tb, size=1.0))
 
-        # Scale
-        bmesh.ops.scale(bm, vec=size, verts=new_verts)
-
-        # Rotation
+        # Scale -> Rotate (Z, X, Y) -> Translate, composed into one matrix
         mat = Matrix()
         if angle_z != 0:
             mat = mat @ Matrix.Rotation(angle_z, 4, 'Z')
@@ -180,17 +176,13 @@ class MASSA_OT_prim_con_house_generator(Massa_OT_Base):
         if angle_y != 0:
             mat = mat @ Matrix.Rotation(angle_y, 4, 'Y')
 
-        if angle_z != 0 or angle_x != 0 or angle_y != 0:
-            bmesh.ops.rotate(bm, verts=new_verts, cent=Vector((0,0,0)), matrix=mat)
-
-        # Translate
-        bmesh.ops.translate(bm, verts=new_verts, vec=pos)
+        mat_scale = Matrix.Diagonal((size[0], size[1], size[2], 1.0))
+        new_verts, new_faces = self.stamp_part(bm, tpl, Matrix.Translation(pos) @ mat @ mat_scale)
 
         # Tag
         if tag_layer:
-            for v in new_verts:
-                for f in v.link_faces:
-                    f[tag_layer] = tag
+            for f in new_faces:
+                f[tag_layer] = tag
         
         return new_verts
 
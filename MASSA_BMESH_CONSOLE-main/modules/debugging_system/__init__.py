@@ -4,5 +4,8 @@
 from .launcher import (
     launch_cartridge_audit,
     launch_console_audit,
-    launch_session
+    launch_startup_profile,
+    launch_session,
+    get_worker_pool,
+    shutdown_worker_pool
 )
@@ -2,37 +2,71 @@ import pkgutil
 import importlib
 import inspect
 
-def run_all_auditors(obj, op_class=None):
+from .mesh_snapshot import MeshSnapshot
+
+# [ARCHITECT NEW] Discovered once per process: (name, audit_mesh, wants_op_class, wants_snapshot)
+_AUDITORS = None
+
+
+def discover_auditors(refresh=False):
     """
-    Dynamically finds all scripts in this 'auditors' folder,
-    imports them, and looks for a function called 'audit_mesh(obj, op_class=None)'.
+    Finds all scripts in this 'auditors' folder that define
+    'audit_mesh(obj, op_class=None, snapshot=None)'. Cached; refresh=True
+    rescans (after adding or reloading an auditor).
     """
-    errors = []
-    package_path = __path__
-    prefix = __name__ + "."
+    global _AUDITORS
+    if _AUDITORS is not None and not refresh:
+        return _AUDITORS
 
-    # 1. Iterate over all files in the /auditors/ folder
-    for _, name, _ in pkgutil.iter_modules(package_path):
+    found = []
+    prefix = __name__ + "."
+    for _, name, _ in pkgutil.iter_modules(__path__):
         try:
-            # 2. Import the module (e.g., massa_ui_auditor)
             module = importlib.import_module(prefix + name)
+            if refresh:
+                module = importlib.reload(module)
+        except Exception as e:
+            found.append((name, e, False, False))
+            continue
+        func = getattr(module, "audit_mesh", None)
+        if func is None or not inspect.isfunction(func):
+            continue
+        # We handle both signatures for backward compatibility
+        params = inspect.signature(func).parameters
+        found.append((name, func, "op_class" in params, "snapshot" in params))
+    _AUDITORS = found
+    return found
 
-            # 3. Check for the standardized entry point 'audit_mesh(obj)'
-            if hasattr(module, 'audit_mesh') and inspect.isfunction(module.audit_mesh):
-                
-                # 4. Run the Audit
-                # Expectation: audit_mesh(obj, op_class) -> list of error strings
-                # We handle both signatures for backward compatibility
-                sig = inspect.signature(module.audit_mesh)
-                if 'op_class' in sig.parameters:
-                    result = module.audit_mesh(obj, op_class=op_class)
-                else:
-                    result = module.audit_mesh(obj)
-                
+
+def run_all_auditors(obj, op_class=None, snapshot=None):
+    """
+    Runs every discovered auditor on obj. All of them share one
+    MeshSnapshot (built here unless the caller passes its own).
+    Expectation: audit_mesh(...) -> list of error strings
+    """
+    errors = []
+    owned = snapshot is None and obj is not None and getattr(obj, "type", None) == 'MESH'
+    if owned:
+        snapshot = MeshSnapshot(obj)
+
+    try:
+        for name, func, wants_op, wants_snapshot in discover_auditors():
+            if isinstance(func, Exception):
+                errors.append(f"Auditor '{name}' crashed: {str(func)}")
+                continue
+            kwargs = {}
+            if wants_op:
+                kwargs["op_class"] = op_class
+            if wants_snapshot:
+                kwargs["snapshot"] = snapshot
+            try:
+                result = func(obj, **kwargs)
                 if result and isinstance(result, list):
                     errors.extend(result)
-            
-        except Exception as e:
-            errors.append(f"Auditor '{name}' crashed: {str(e)}")
+            except Exception as e:
+                errors.append(f"Auditor '{name}' crashed: {str(e)}")
+    finally:
+        if owned:
+            snapshot.free()
 
-    return errors
\ No newline at end of file
+    return errors
@@ -1,9 +1,12 @@
 import bmesh
 import mathutils
 
+from .mesh_snapshot import MeshSnapshot
+
 class Massa_Auditor:
     def __init__(self, bm: bmesh.types.BMesh):
-        self.bm = bm
+        # [ARCHITECT NEW] Also accepts a MeshSnapshot (uses its shared BMesh)
+        self.bm = bm.bm if isinstance(bm, MeshSnapshot) else bm
         self.report = {"status": "PASS", "flags": [], "dimensions": {}, "slots": {}}
 
     def run_full_scan(self, meta_flags=None):
@@ -1,6 +1,8 @@
 import bmesh
 import mathutils
 
+from .mesh_snapshot import MeshSnapshot
+
 # Safe Import for BVH (Prevents crashes on some Blender installs)
 try:
     from mathutils.bvhtree import BVHTree
@@ -10,7 +12,9 @@ except ImportError:
 
 class Massa_Surface_Auditor:
     def __init__(self, bm: bmesh.types.BMesh):
-        self.bm = bm
+        # [ARCHITECT NEW] Also accepts a MeshSnapshot: reuses its areas, UVs and BVH
+        self.snapshot = bm if isinstance(bm, MeshSnapshot) else None
+        self.bm = self.snapshot.bm if self.snapshot else bm
         self.report = {
             "status": "PASS",
             "flags": [],
@@ -80,15 +84,18 @@ class Massa_Surface_Auditor:
             self.report["status"] = "FAIL"
 
     def _check_degenerate_faces(self):
-        zero = [f for f in self.bm.faces if f.calc_area() < 0.000001]
+        if self.snapshot:
+            zero = int((self.snapshot.face_areas < 0.000001).sum())
+        else:
+            zero = len([f for f in self.bm.faces if f.calc_area() < 0.000001])
         if zero:
-            self.report["flags"].append(f"CRITICAL_ZERO_AREA_FACES_{len(zero)}")
+            self.report["flags"].append(f"CRITICAL_ZERO_AREA_FACES_{zero}")
             self.report["status"] = "FAIL"
 
     def _check_self_intersections(self):
         if not HAS_BVH or len(self.bm.faces) < 4: return
         try:
-            tree = BVHTree.FromBMesh(self.bm, epsilon=0.0001)
+            tree = self.snapshot.bvh if self.snapshot else BVHTree.FromBMesh(self.bm, epsilon=0.0001)
             overlaps = tree.overlap(tree)
             real = 0
             for i1, i2 in overlaps:
@@ -125,6 +132,14 @@ class Massa_Surface_Auditor:
         """
         Detects faces that have Area in 3D but Zero Area in UV (Lazy Planar Projection on Sides).
         """
+        if self.snapshot:
+            snap = self.snapshot
+            collapsed = int(((snap.face_areas > 0.0001) & (snap.uv_areas < 0.000001)).sum())
+            if collapsed > 0:
+                self.report["flags"].append(f"CRITICAL_COLLAPSED_UVS_{collapsed}")
+                self.report["status"] = "FAIL"
+            return
+
         uv_layer = self.bm.loops.layers.uv.verify()
         collapsed = 0
         
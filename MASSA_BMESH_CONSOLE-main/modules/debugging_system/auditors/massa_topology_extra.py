@@ -1,31 +1,28 @@
+import numpy as np
 
-import bmesh
+from .mesh_snapshot import MeshSnapshot
 
-def audit_mesh(obj, op_class=None):
+def audit_mesh(obj, op_class=None, snapshot=None):
     """
     Extra Topology Checks:
     1. Loose Vertices (Vertices not linked to any edges)
     2. Wire Edges (Edges with 0 faces)
     """
     errors = []
-    
+
     if obj.type != 'MESH':
         return []
 
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-    
+    snap = snapshot or MeshSnapshot(obj)
+
     # 1. Loose Vertices
-    loose_verts = [v for v in bm.verts if not v.link_edges]
+    loose_verts = int(np.count_nonzero(snap.vert_edge_count == 0))
     if loose_verts:
-        errors.append(f"CRITICAL_LOOSE_VERTS_{len(loose_verts)}")
-        
+        errors.append(f"CRITICAL_LOOSE_VERTS_{loose_verts}")
+
     # 2. Wire Edges
-    wire_edges = [e for e in bm.edges if not e.link_faces]
+    wire_edges = int(np.count_nonzero(snap.edge_face_count == 0))
     if wire_edges:
-        errors.append(f"CRITICAL_WIRE_EDGES_{len(wire_edges)}")
-        
-    bm.free()
+        errors.append(f"CRITICAL_WIRE_EDGES_{wire_edges}")
+
     return errors
@@ -0,0 +1,162 @@
+import bmesh
+import numpy as np
+from functools import cached_property
+
+# Safe Import for BVH (Prevents crashes on some Blender installs)
+try:
+    from mathutils.bvhtree import BVHTree
+    HAS_BVH = True
+except ImportError:
+    HAS_BVH = False
+
+
+def _read(collection, attr, count, width=1, dtype=np.float32):
+    arr = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(attr, arr)
+    return arr.reshape(-1, width) if width > 1 else arr
+
+
+class MeshSnapshot:
+    """
+    One analyzed copy of an object's mesh, built once per audit and handed
+    to every auditor: bulk numpy arrays read straight from the Mesh, plus a
+    BMesh and a BVH tree that are only built when an auditor asks for them.
+    Face, edge and vertex indices match obj.data and the BMesh.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.mesh = obj.data
+        self._bm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.free()
+
+    def free(self):
+        if self._bm is not None:
+            self._bm.free()
+            self._bm = None
+
+    # --- COUNTS ---
+    @cached_property
+    def num_verts(self):
+        return len(self.mesh.vertices)
+
+    @cached_property
+    def num_edges(self):
+        return len(self.mesh.edges)
+
+    @cached_property
+    def num_faces(self):
+        return len(self.mesh.polygons)
+
+    @cached_property
+    def num_loops(self):
+        return len(self.mesh.loops)
+
+    # --- BULK ARRAYS ---
+    @cached_property
+    def co(self):
+        return _read(self.mesh.vertices, "co", self.num_verts, 3)
+
+    @cached_property
+    def edge_verts(self):
+        return _read(self.mesh.edges, "vertices", self.num_edges, 2, np.int32)
+
+    @cached_property
+    def face_areas(self):
+        return _read(self.mesh.polygons, "area", self.num_faces)
+
+    @cached_property
+    def face_normals(self):
+        return _read(self.mesh.polygons, "normal", self.num_faces, 3)
+
+    @cached_property
+    def face_centers(self):
+        return _read(self.mesh.polygons, "center", self.num_faces, 3)
+
+    @cached_property
+    def loop_start(self):
+        return _read(self.mesh.polygons, "loop_start", self.num_faces, dtype=np.int32)
+
+    @cached_property
+    def loop_total(self):
+        return _read(self.mesh.polygons, "loop_total", self.num_faces, dtype=np.int32)
+
+    @cached_property
+    def loop_verts(self):
+        return _read(self.mesh.loops, "vertex_index", self.num_loops, dtype=np.int32)
+
+    @cached_property
+    def loop_edges(self):
+        return _read(self.mesh.loops, "edge_index", self.num_loops, dtype=np.int32)
+
+    @cached_property
+    def loop_next(self):
+        """Index of the next loop around the same face."""
+        nxt = np.arange(1, self.num_loops + 1, dtype=np.int32)
+        if self.num_faces:
+            last = self.loop_start + self.loop_total - 1
+            nxt[last] = self.loop_start
+        return nxt
+
+    @cached_property
+    def loop_uvs(self):
+        """(num_loops, 2) UVs of the active layer; zeros without one (like uv.verify())."""
+        layer = self.mesh.uv_layers.active
+        if layer is None:
+            return np.zeros((self.num_loops, 2), dtype=np.float32)
+        return _read(layer.data, "uv", self.num_loops, 2)
+
+    @cached_property
+    def has_uvs(self):
+        return self.mesh.uv_layers.active is not None
+
+    # --- DERIVED ---
+    @cached_property
+    def edge_lengths(self):
+        if not self.num_edges:
+            return np.zeros(0, dtype=np.float32)
+        a, b = self.co[self.edge_verts[:, 0]], self.co[self.edge_verts[:, 1]]
+        return np.linalg.norm(a - b, axis=1)
+
+    @cached_property
+    def edge_face_count(self):
+        return np.bincount(self.loop_edges, minlength=self.num_edges)
+
+    @cached_property
+    def vert_edge_count(self):
+        return np.bincount(self.edge_verts.ravel(), minlength=self.num_verts)
+
+    @cached_property
+    def uv_areas(self):
+        """Per-face UV area (shoelace over each face's loops)."""
+        if not self.num_faces:
+            return np.zeros(0, dtype=np.float64)
+        uv = self.loop_uvs.astype(np.float64)
+        nxt = uv[self.loop_next]
+        cross = uv[:, 0] * nxt[:, 1] - nxt[:, 0] * uv[:, 1]
+        return np.abs(np.add.reduceat(cross, self.loop_start)) * 0.5
+
+    # --- BLENDER STRUCTURES (lazy) ---
+    @property
+    def bm(self):
+        if self._bm is None:
+            bm = bmesh.new()
+            bm.from_mesh(self.mesh)
+            bm.verts.ensure_lookup_table()
+            bm.edges.ensure_lookup_table()
+            bm.faces.ensure_lookup_table()
+            self._bm = bm
+        return self._bm
+
+    @cached_property
+    def bvh(self):
+        """BVH tree of the faces (None when mathutils.bvhtree is unavailable)."""
+        if not HAS_BVH:
+            return None
+        return BVHTree.FromBMesh(self.bm, epsilon=0.0001)
@@ -0,0 +1,147 @@
+import os
+import sys
+import json
+import time
+import argparse
+import xml.etree.ElementTree as ET
+
+# --- PARALLEL BATCH AUDIT ---
+# Host side: audits every cartridge of the add-on on a pool of warm
+# background Blenders and writes one JSON and/or JUnit report.
+#   python modules/debugging_system/batch_audit.py --workers 4 \
+#       --json audit.json --junit audit.xml [--only prim_] [--blender PATH]
+# Cartridges come from the manifest behind cartridges.MODULES (same list,
+# read without bpy); each one runs as a CARTRIDGE job (runner.py): lazy load,
+# real operator, run_checks + auditors, with timings. Jobs are handed out
+# dynamically, so slow cartridges do not stall a fixed shard.
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+modules_dir = os.path.dirname(current_dir)
+for path in (current_dir, modules_dir):
+    if path not in sys.path:
+        sys.path.append(path)
+
+import worker_pool
+import massa_manifest
+
+CART_DIR = os.path.join(modules_dir, "cartridges")
+SUITE_NAME = "massa.cartridges"
+
+
+def discover(cart_dir=CART_DIR, only=None):
+    """Manifest entries of every listed cartridge (optionally id prefixes in only)."""
+    entries = massa_manifest.load_manifest(cart_dir, massa_manifest.listed_modules(cart_dir))
+    if only:
+        entries = [e for e in entries if e["id"].startswith(tuple(only))]
+    return entries
+
+
+def make_job(entry):
+    return {"cartridge": entry["module"], "mode": "CARTRIDGE", "payload": {"cart_id": entry["id"]}}
+
+
+def run_batch(entries, pool):
+    """Audits entries on pool; returns the aggregated report dict."""
+    start = time.perf_counter()
+    results = pool.map([make_job(e) for e in entries])
+    wall = time.perf_counter() - start
+
+    rows = []
+    for entry, result in zip(entries, results):
+        result = dict(result or {})
+        status = result.get("status", "SYSTEM_FAILURE")
+        rows.append({
+            "id": entry["id"],
+            "module": entry["module"],
+            "category": entry.get("category", ""),
+            "status": status,
+            "errors": result.get("errors", []) or ([result["message"]] if result.get("message") else []),
+            "log": result.get("log", ""),
+            "verts": result.get("verts", 0),
+            "faces": result.get("faces", 0),
+            "load_ms": result.get("load_ms", 0.0),
+            "gen_ms": result.get("gen_ms", 0.0),
+            "audit_ms": result.get("audit_ms", 0.0),
+        })
+
+    summary = {
+        "total": len(rows),
+        "passed": sum(1 for r in rows if r["status"] == "PASS"),
+        "failed": sum(1 for r in rows if r["status"] == "FAIL"),
+        "errors": sum(1 for r in rows if r["status"] not in {"PASS", "FAIL"}),
+        "wall_s": round(wall, 3),
+        "cpu_s": round(sum(r["load_ms"] + r["gen_ms"] + r["audit_ms"] for r in rows) / 1000, 3),
+        "workers": getattr(pool, "size", 1),
+        "worker_restarts": getattr(pool, "restarts", 0),
+    }
+    return {"summary": summary, "results": rows}
+
+
+def junit_xml(report):
+    """JUnit XML (one testcase per cartridge: FAIL -> failure, anything else -> error)."""
+    summary = report["summary"]
+    suite = ET.Element("testsuite", {
+        "name": SUITE_NAME,
+        "tests": str(summary["total"]),
+        "failures": str(summary["failed"]),
+        "errors": str(summary["errors"]),
+        "time": f"{summary['wall_s']:.3f}",
+    })
+    for row in report["results"]:
+        seconds = (row["load_ms"] + row["gen_ms"] + row["audit_ms"]) / 1000
+        case = ET.SubElement(suite, "testcase", {
+            "classname": f"{SUITE_NAME}.{row['category'].lower() or 'other'}",
+            "name": row["id"],
+            "time": f"{seconds:.3f}",
+        })
+        if row["status"] == "PASS":
+            continue
+        tag = "failure" if row["status"] == "FAIL" else "error"
+        message = row["errors"][0] if row["errors"] else row["status"]
+        node = ET.SubElement(case, tag, {"message": str(message)[:200], "type": row["status"]})
+        node.text = "\n".join(str(e) for e in row["errors"]) + ("\n" + row["log"] if row["log"] else "")
+    return ET.tostring(suite, encoding="unicode")
+
+
+def write_reports(report, json_path=None, junit_path=None):
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=1)
+    if junit_path:
+        with open(junit_path, "w", encoding="utf-8") as fh:
+            fh.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            fh.write(junit_xml(report))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit every Massa cartridge in parallel")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--blender", default=None, help="Blender executable (default: config.BLENDER_PATH)")
+    parser.add_argument("--only", nargs="*", help="Cartridge id prefixes to audit")
+    parser.add_argument("--json", dest="json_path", default=None)
+    parser.add_argument("--junit", dest="junit_path", default=None)
+    parser.add_argument("--timeout", type=float, default=worker_pool.DEFAULT_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    blender = args.blender
+    if not blender:
+        import config
+        blender = config.BLENDER_PATH
+
+    entries = discover(only=args.only)
+    print(f"[Batch Audit] {len(entries)} cartridges on {args.workers} workers...")
+    with worker_pool.WorkerPool(blender, size=args.workers, timeout=args.timeout) as pool:
+        report = run_batch(entries, pool)
+    write_reports(report, args.json_path, args.junit_path)
+
+    s = report["summary"]
+    for row in report["results"]:
+        if row["status"] != "PASS":
+            print(f"  {row['status']:<15} {row['id']}: {row['errors'][:1]}")
+    print(f"[Batch Audit] {s['passed']}/{s['total']} passed, {s['failed']} failed, "
+          f"{s['errors']} errors in {s['wall_s']:.1f}s (audit time {s['cpu_s']:.1f}s)")
+    return 0 if s["passed"] == s["total"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import argparse
+
+# --- CARTRIDGE PERFORMANCE BENCHMARK ---
+# Host side: runs every cartridge at a few parameter presets on the warm
+# worker pool (BENCHMARK jobs, runner_bench.py), then compares per-stage
+# timings, peak memory and element counts with a checked-in baseline.
+#   python modules/debugging_system/bench.py [--only prim_] [--workers 2]
+#       [--tolerance time=1.5 memory=1.5 counts=0] [--update-baseline]
+# Exit code 1 when anything regressed past its tolerance.
+# Plain Python: preset_overrides is also used inside Blender.
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+BASELINE_PATH = os.path.join(current_dir, "bench_baseline.json")
+BASELINE_VERSION = 1
+
+PRESETS = ("default", "max_res", "polish", "surface")
+
+# Resolution-like INT properties the max_res preset turns up
+RES_HINTS = ("seg", "res", "sides", "subdiv", "steps", "rings", "count", "loops", "detail")
+RES_CAP = 64  # Stand-in for soft_max on properties without a real one
+
+# Polish stack (massa_engine._run_polish_stack) and surface maps
+# (massa_surface.generate_surface_maps); draft mode would skip both
+POLISH_FLAGS = (
+    "pol_fuse_active", "pol_solidify_active", "pol_bridge_active", "pol_holes_active",
+    "pol_symmetrize_active", "pol_taper_active", "pol_bend_active", "pol_plate_active",
+    "pol_noise_active", "pol_smooth_active", "pol_decay_active", "pol_triangulate_active",
+    "pol_chamfer_active",
+)
+SURFACE_FLAGS = (
+    "seam_active", "wear_active", "thick_active", "grav_active", "cavity_active",
+    "cover_active", "peak_active", "wear2_active", "flow2_active",
+)
+
+# Relative growth allowed before a metric counts as a regression
+DEFAULT_TOLERANCES = {"time": 1.5, "memory": 1.5, "counts": 0.0}
+# Stage timings under this are noise, whatever the ratio
+MIN_TIME_MS = 5.0
+COUNT_KEYS = ("verts", "edges", "faces", "objects")
+
+
+def preset_overrides(preset, props):
+    """
+    Operator kwargs for preset. props: iterable of dicts with identifier,
+    type, default and soft_max (from the operator's bl_rna).
+    """
+    props = {p["identifier"]: p for p in props}
+    if preset == "default":
+        return {}
+    if preset == "max_res":
+        out = {}
+        for name, p in props.items():
+            if p["type"] != "INT" or not any(h in name for h in RES_HINTS):
+                continue
+            value = min(p.get("soft_max", RES_CAP), RES_CAP)
+            if value > p["default"]:
+                out[name] = value
+        return out
+    flags = POLISH_FLAGS if preset == "polish" else SURFACE_FLAGS if preset == "surface" else None
+    if flags is None:
+        raise ValueError(f"Unknown preset '{preset}'")
+    out = {name: True for name in flags if name in props}
+    if "draft_mode" in props:
+        out["draft_mode"] = False
+    return out
+
+
+# --- BASELINE ---
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != BASELINE_VERSION:
+        print(f"Massa Bench: ignoring baseline {path} (format {data.get('version')})")
+        return {}
+    return data.get("results", {})
+
+
+def save_baseline(results, path=BASELINE_PATH, merge=True):
+    merged = load_baseline(path) if merge else {}
+    merged.update(results)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"version": BASELINE_VERSION, "results": merged}, fh, indent=1, sort_keys=True)
+        fh.write("\n")
+
+
+def _metrics(run):
+    """Flat {metric: (kind, value)} of one preset run."""
+    out = {"total_ms": ("time", run.get("total_ms", 0.0)), "peak_kb": ("memory", run.get("peak_kb", 0.0))}
+    for stage, ms in run.get("stages", {}).items():
+        out[f"stage:{stage}"] = ("time", ms)
+    for key in COUNT_KEYS:
+        if key in run:
+            out[key] = ("counts", run[key])
+    return out
+
+
+def compare(results, baseline, tolerances=None):
+    """
+    Findings for results vs baseline (both {cart_id: {preset: run}}).
+    Each finding: {cartridge, preset, metric, base, now, ratio, status} with
+    status REGRESSION, IMPROVED, NEW or MISSING; unchanged metrics are left out.
+    """
+    tol = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+    findings = []
+
+    def add(cart, preset, metric, base, now, status):
+        ratio = (now / base) if base else None
+        findings.append({
+            "cartridge": cart, "preset": preset, "metric": metric,
+            "base": base, "now": now, "ratio": ratio, "status": status,
+        })
+
+    for cart, presets in sorted(results.items()):
+        for preset, run in sorted(presets.items()):
+            base_run = baseline.get(cart, {}).get(preset)
+            if run.get("error"):
+                add(cart, preset, "error", None, run["error"], "REGRESSION")
+                continue
+            if base_run is None:
+                add(cart, preset, "*", None, None, "NEW")
+                continue
+            base_metrics = _metrics(base_run)
+            for metric, (kind, now) in _metrics(run).items():
+                if metric not in base_metrics:
+                    continue
+                base = base_metrics[metric][1]
+                limit = tol[kind]
+                if kind == "time" and max(now, base) < MIN_TIME_MS:
+                    continue
+                if kind == "counts":
+                    if abs(now - base) > base * limit:
+                        add(cart, preset, metric, base, now, "REGRESSION")
+                elif now > base * limit:
+                    add(cart, preset, metric, base, now, "REGRESSION")
+                elif base > now * limit:
+                    add(cart, preset, metric, base, now, "IMPROVED")
+
+    for cart, presets in sorted(baseline.items()):
+        for preset in sorted(presets):
+            if preset not in results.get(cart, {}) and cart in results:
+                add(cart, preset, "*", None, None, "MISSING")
+    return findings
+
+
+def regressions(findings):
+    return [f for f in findings if f["status"] == "REGRESSION"]
+
+
+def format_findings(findings):
+    lines = []
+    for f in findings:
+        where = f"{f['cartridge']}[{f['preset']}] {f['metric']}"
+        if f["ratio"] is not None:
+            lines.append(f"  {f['status']:<11}{where:<60}{f['base']:>10.1f} -> {f['now']:<10.1f}x{f['ratio']:.2f}")
+        elif f["now"] is not None:
+            lines.append(f"  {f['status']:<11}{where:<60}{f['now']}")
+        else:
+            lines.append(f"  {f['status']:<11}{where}")
+    return "\n".join(lines)
+
+
+def parse_tolerances(items):
+    out = {}
+    for item in items or ():
+        key, _, value = item.partition("=")
+        if key not in DEFAULT_TOLERANCES:
+            raise SystemExit(f"Unknown tolerance '{key}' (use {', '.join(DEFAULT_TOLERANCES)})")
+        out[key] = float(value)
+    return out
+
+
+def make_job(entry, presets, repeats):
+    return {
+        "cartridge": entry["module"], "mode": "BENCHMARK",
+        "payload": {"cart_id": entry["id"], "presets": list(presets), "repeats": repeats},
+    }
+
+
+def main(argv=None):
+    import worker_pool
+    import batch_audit
+
+    parser = argparse.ArgumentParser(description="Benchmark Massa cartridges against the stored baseline")
+    parser.add_argument("--only", nargs="*", help="Cartridge id prefixes")
+    parser.add_argument("--presets", nargs="*", default=list(PRESETS), choices=PRESETS)
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per preset (best is kept)")
+    parser.add_argument("--workers", type=int, default=1, help="More than 1 adds timing noise")
+    parser.add_argument("--tolerance", nargs="*", help="kind=ratio, e.g. time=1.5 memory=2 counts=0")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write raw results here")
+    parser.add_argument("--blender", default=None, help="Blender executable (default: config.BLENDER_PATH)")
+    args = parser.parse_args(argv)
+
+    blender = args.blender
+    if not blender:
+        import config
+        blender = config.BLENDER_PATH
+
+    entries = batch_audit.discover(only=args.only)
+    print(f"[Bench] {len(entries)} cartridges x {len(args.presets)} presets...")
+    jobs = [make_job(e, args.presets, args.repeats) for e in entries]
+    with worker_pool.WorkerPool(blender, size=args.workers) as pool:
+        replies = pool.map(jobs)
+
+    results = {}
+    for entry, reply in zip(entries, replies):
+        reply = reply or {}
+        if reply.get("status") != "SUCCESS":
+            msg = reply.get("message") or "; ".join(reply.get("errors", [])) or "no result"
+            results[entry["id"]] = {p: {"error": msg} for p in args.presets}
+        else:
+            results[entry["id"]] = reply["presets"]
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=1)
+
+    if args.update_baseline:
+        clean = {c: p for c, p in results.items() if not any("error" in r for r in p.values())}
+        save_baseline(clean, args.baseline)
+        print(f"[Bench] Baseline updated: {len(clean)}/{len(results)} cartridges -> {args.baseline}")
+        return 0
+
+    findings = compare(results, load_baseline(args.baseline), parse_tolerances(args.tolerance))
+    if findings:
+        print(format_findings(findings))
+    bad = regressions(findings)
+    print(f"[Bench] {len(bad)} regressions, "
+          f"{sum(1 for f in findings if f['status'] == 'IMPROVED')} improvements, "
+          f"{sum(1 for f in findings if f['status'] == 'NEW')} without baseline")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,11 @@ import sys
 # ==========================================================
 BLENDER_PATH = r"C:\Program Files\Blender Foundation\Blender 5.0\blender.exe"
 
+# Warm worker pool for audits (see worker_pool.py). False: one Blender per audit.
+USE_WORKER_POOL = True
+WORKER_POOL_SIZE = 2
+WORKER_JOB_TIMEOUT = 300.0
+
 if not os.path.exists(BLENDER_PATH):
     print(f"CRITICAL ERROR: Blender not found at {BLENDER_PATH}")
     sys.exit(1)
\ No newline at end of file
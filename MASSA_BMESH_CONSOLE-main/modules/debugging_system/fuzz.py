@@ -0,0 +1,416 @@
+import os
+import re
+import sys
+import json
+import random
+import argparse
+import itertools
+from collections import deque
+
+# --- PARAMETER FUZZER ---
+# Host side: fuzzes each cartridge's Int/Float/Enum/Bool properties on the
+# warm worker pool (FUZZ jobs, runner_fuzz.py).
+#   1. Boundary values per property (soft/hard limits, neighbours, default)
+#   2. Pairwise cases: every value pair of every two properties at least once
+#   3. Coverage-guided mutation: cases that reach new add-on lines, fail or
+#      build slowly become seeds; the properties they changed get more weight
+#   4. Failing cases are shrunk back towards defaults before reporting
+#   python modules/debugging_system/fuzz.py --only prim_01 --budget 300
+#       [--include-base] [--json fuzz.json] [--workers 2]
+# Plain Python (no bpy): the search itself is unit tested on the host.
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+# Properties that only steer UI, placement or the run itself
+SKIP_PREFIXES = ("ui_", "show_", "obj_", "debug_", "viz_", "expand")
+SKIP_PROPS = {"batch_mode", "target_delete_name", "rotation"}
+
+INT_CAP = 128        # Upper bound used for unbounded int ranges
+FLOAT_LIMIT = 1.0e4  # Hard limits beyond this are "unbounded" markers
+
+FAIL_STATUSES = {"CRASH", "EMPTY", "INVALID", "HANG", "FATAL"}
+SLOW_FACTOR = 4.0    # Slow: this many times the cartridge's median build
+SLOW_MIN_MS = 50.0
+SEED_BOOST = 2.0     # Weight gain of properties behind a failure or slow build
+MUTATIONS_PER_HIT = 4
+BATCH = 8            # Cases per worker job
+
+
+# --- DOMAINS ---
+
+def _skip(prop, include_base):
+    name = prop["identifier"]
+    if name in SKIP_PROPS or name.startswith(SKIP_PREFIXES):
+        return True
+    return not include_base and not prop.get("own", True)
+
+
+def _dedupe(values):
+    out = []
+    for v in values:
+        if v not in out:
+            out.append(v)
+    return out
+
+
+def boundary_values(prop):
+    """Boundary-value domain of one property (default first)."""
+    kind = prop["type"]
+    default = prop.get("default")
+    if kind == "BOOLEAN":
+        return _dedupe([bool(default), not default])
+    if kind == "ENUM":
+        return _dedupe([default] + list(prop.get("items", [])))
+
+    lo = prop.get("soft_min", prop.get("hard_min"))
+    hi = prop.get("soft_max", prop.get("hard_max"))
+    if kind == "INT":
+        lo = max(int(lo), -INT_CAP)
+        hi = min(int(hi), INT_CAP)
+        values = [default, lo, lo + 1, hi - 1, hi]
+        hard_lo, hard_hi = prop.get("hard_min", lo), prop.get("hard_max", hi)
+        values += [v for v in (hard_lo, hard_hi) if abs(v) <= INT_CAP]
+        return _dedupe([v for v in values if prop.get("hard_min", lo) <= v <= prop.get("hard_max", hi)])
+
+    lo = max(float(lo), -FLOAT_LIMIT)
+    hi = min(float(hi), FLOAT_LIMIT)
+    span = hi - lo
+    values = [default, lo, hi, lo + span * 1e-3, hi - span * 1e-3, 0.0]
+    values += [v for v in (prop.get("hard_min"), prop.get("hard_max")) if v is not None and abs(v) <= FLOAT_LIMIT]
+    hard_lo, hard_hi = prop.get("hard_min", lo), prop.get("hard_max", hi)
+    return _dedupe([round(float(v), 6) for v in values if hard_lo <= v <= hard_hi])
+
+
+def param_space(props, include_base=False):
+    """({name: [values]}, {name: default}) of the fuzzable properties."""
+    domains, defaults = {}, {}
+    for prop in props:
+        if prop["type"] not in {"BOOLEAN", "INT", "FLOAT", "ENUM"} or _skip(prop, include_base):
+            continue
+        values = boundary_values(prop)
+        if len(values) > 1:
+            domains[prop["identifier"]] = values
+            defaults[prop["identifier"]] = values[0]
+    return domains, defaults
+
+
+# --- PAIRWISE ---
+
+def pairwise(domains, rng=None):
+    """
+    Greedy all-pairs cases (full assignments): every value pair of every two
+    parameters appears in at least one case.
+    """
+    rng = rng or random.Random(0)
+    names = sorted(domains, key=lambda n: -len(domains[n]))
+    if len(names) < 2:
+        return [{names[0]: v} for v in domains[names[0]]] if names else []
+
+    uncovered = set()
+    for a, b in itertools.combinations(range(len(names)), 2):
+        for va in range(len(domains[names[a]])):
+            for vb in range(len(domains[names[b]])):
+                uncovered.add((a, va, b, vb))
+
+    cases = []
+    while uncovered:
+        # Seed with one uncovered pair, then pick each other value greedily
+        a, va, b, vb = min(uncovered)
+        picks = {a: va, b: vb}
+        order = [i for i in range(len(names)) if i not in picks]
+        rng.shuffle(order)
+        for i in order:
+            best, best_gain = 0, -1
+            for v in range(len(domains[names[i]])):
+                gain = sum(
+                    ((j, pv, i, v) if j < i else (i, v, j, pv)) in uncovered
+                    for j, pv in picks.items()
+                )
+                if gain > best_gain:
+                    best, best_gain = v, gain
+            picks[i] = best
+        for (i, vi), (j, vj) in itertools.combinations(sorted(picks.items()), 2):
+            uncovered.discard((i, vi, j, vj))
+        cases.append({names[i]: domains[names[i]][v] for i, v in picks.items()})
+    return cases
+
+
+def diff(case, defaults):
+    """Only the values that differ from the defaults (operator kwargs)."""
+    return {k: v for k, v in case.items() if defaults.get(k) != v}
+
+
+def case_key(case):
+    return json.dumps(case, sort_keys=True)
+
+
+# --- RESULTS ---
+
+def failure_signature(result):
+    """Status plus the error text with numbers stripped: same bug, same signature."""
+    error = (result.get("error") or "").splitlines()
+    head = re.sub(r"[-+]?\d[\d.e+-]*", "#", error[0] if error else "")[:120]
+    return f"{result.get('status')}:{head}"
+
+
+def is_failure(result):
+    return result.get("status") in FAIL_STATUSES
+
+
+# --- SEARCH ---
+
+class Fuzzer:
+    """
+    Hands out cases (operator kwargs) and learns from their results:
+    pairwise cases first, then weighted mutations of interesting seeds.
+    """
+
+    def __init__(self, domains, defaults, seed=0):
+        self.domains = domains
+        self.defaults = defaults
+        self.rng = random.Random(seed)
+        self.queue = deque(diff(c, defaults) for c in pairwise(domains, self.rng))
+        self.weights = {name: 1.0 for name in domains}
+        self.seeds = []
+        self.seen = set()
+        self.coverage = set()
+        self.times = []
+        self.results = []
+
+    def next_cases(self, n):
+        out = []
+        tries = 0
+        while len(out) < n and tries < n * 20:
+            tries += 1
+            case = self.queue.popleft() if self.queue else self._mutant()
+            key = case_key(case)
+            if key in self.seen:
+                continue
+            self.seen.add(key)
+            out.append(case)
+        return out
+
+    def _pick_param(self, exclude=()):
+        names = [n for n in self.domains if n not in exclude]
+        return self.rng.choices(names, weights=[self.weights[n] for n in names])[0]
+
+    def _mutant(self, base=None):
+        if base is None:
+            base = self.rng.choice(self.seeds) if self.seeds else {}
+        case = dict(base)
+        changed = []
+        for _ in range(self.rng.choice((1, 1, 2, 3))):
+            name = self._pick_param(changed)
+            changed.append(name)
+            case[name] = self.rng.choice(self.domains[name])
+        return diff(case, self.defaults)
+
+    def is_slow(self, ms):
+        if len(self.times) < 5:
+            return False
+        median = sorted(self.times)[len(self.times) // 2]
+        return ms > max(SLOW_MIN_MS, median * SLOW_FACTOR)
+
+    def record(self, case, result):
+        """Feeds one result back; returns True when the case became a seed."""
+        ms = result.get("ms", 0.0)
+        slow = result.get("status") == "OK" and self.is_slow(ms)
+        lines = set(result.get("lines", ()))
+        new_lines = lines - self.coverage
+        self.coverage |= lines
+        if result.get("status") == "OK":
+            self.times.append(ms)
+        self.results.append({"params": case, "slow": slow, **{k: v for k, v in result.items() if k != "lines"}})
+
+        hit = is_failure(result) or slow
+        if not (hit or new_lines):
+            return False
+        self.seeds.append(case)
+        if hit:
+            for name in case:
+                if name in self.weights:
+                    self.weights[name] *= SEED_BOOST
+            for _ in range(MUTATIONS_PER_HIT):
+                self.queue.appendleft(self._mutant(case))
+        return True
+
+
+def shrink(case, defaults, still_fails, max_runs=64):
+    """
+    Smallest variant of a failing case that still fails the same way:
+    drops chunks of parameters (back to defaults), then walks numeric values
+    towards their defaults. still_fails(case) -> bool runs one case.
+    """
+    current = dict(case)
+    runs = 0
+
+    def attempt(candidate):
+        nonlocal runs
+        if runs >= max_runs:
+            return False
+        runs += 1
+        return still_fails(candidate)
+
+    # 1. Remove parameter chunks (halves, quarters, ..., singles)
+    size = max(1, len(current) // 2)
+    while size >= 1 and current:
+        keys = list(current)
+        removed = False
+        for start in range(0, len(keys), size):
+            chunk = keys[start:start + size]
+            candidate = {k: v for k, v in current.items() if k not in chunk}
+            if candidate != current and attempt(candidate):
+                current = candidate
+                removed = True
+        if not removed:
+            size //= 2
+
+    # 2. Numeric values: bisect towards the default
+    for name in list(current):
+        value, default = current[name], defaults.get(name)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not isinstance(default, (int, float)):
+            continue
+        for _ in range(6):
+            mid = (value + default) / 2
+            if isinstance(value, int):
+                mid = int(mid)
+            else:
+                mid = round(mid, 6)
+            if mid == value or mid == default:
+                break
+            candidate = dict(current, **{name: mid})
+            if not attempt(candidate):
+                break
+            current, value = candidate, mid
+    return current, runs
+
+
+# --- DRIVER ---
+
+def _job(cart_id, cases, describe=False, coverage=True):
+    return {"cartridge": "", "mode": "FUZZ",
+            "payload": {"cart_id": cart_id, "cases": cases, "describe": describe, "coverage": coverage}}
+
+
+def _run_cases(pool, cart_id, batches, coverage=True):
+    """Results per case; batches that killed their worker are retried one case per job."""
+    replies = pool.map([_job(cart_id, b, coverage=coverage) for b in batches])
+    out = []
+    for batch, reply in zip(batches, replies):
+        reply = reply or {}
+        if reply.get("status") == "SUCCESS":
+            out.extend(zip(batch, reply["results"]))
+        elif len(batch) > 1:
+            out.extend(_run_cases(pool, cart_id, [[c] for c in batch], coverage))
+        else:
+            message = reply.get("message", "")
+            status = "HANG" if "no reply" in message else "FATAL"
+            out.append((batch[0], {"status": status, "error": message, "log": reply.get("log", "")}))
+    return out
+
+
+def fuzz_cartridge(pool, cart_id, budget=200, include_base=False, seed=0, top=5, log=print):
+    """Fuzzes one cartridge; returns its report dict."""
+    described = pool.run(_job(cart_id, [], describe=True, coverage=False))
+    if described.get("status") != "SUCCESS":
+        return {"cartridge": cart_id, "status": "ERROR",
+                "message": described.get("message") or "; ".join(described.get("errors", []))}
+
+    domains, defaults = param_space(described["props"], include_base)
+    fuzzer = Fuzzer(domains, defaults, seed=seed)
+    log(f"[Fuzz] {cart_id}: {len(domains)} params, {len(fuzzer.queue)} pairwise cases, budget {budget}")
+
+    per_round = BATCH * max(1, getattr(pool, "size", 1))
+    while len(fuzzer.results) < budget:
+        cases = fuzzer.next_cases(min(per_round, budget - len(fuzzer.results)))
+        if not cases:
+            break
+        batches = [cases[i:i + BATCH] for i in range(0, len(cases), BATCH)]
+        for case, result in _run_cases(pool, cart_id, batches):
+            fuzzer.record(case, result)
+
+    # Shrink one representative per distinct failure
+    failures = {}
+    for row in fuzzer.results:
+        if is_failure(row):
+            failures.setdefault(failure_signature(row), row)
+
+    shrunk = []
+    for signature, row in failures.items():
+        def still_fails(candidate, signature=signature):
+            (_, result), = _run_cases(pool, cart_id, [[candidate]], coverage=False)
+            return failure_signature(result) == signature
+        small, runs = shrink(row["params"], defaults, still_fails)
+        shrunk.append({
+            "signature": signature, "status": row["status"], "error": row.get("error", ""),
+            "params": small, "original": row["params"], "shrink_runs": runs,
+            "hits": sum(1 for r in fuzzer.results if is_failure(r) and failure_signature(r) == signature),
+        })
+
+    ok = [r for r in fuzzer.results if r.get("status") == "OK"]
+    slowest = sorted(ok, key=lambda r: r.get("ms", 0.0), reverse=True)[:top]
+    return {
+        "cartridge": cart_id,
+        "status": "FAIL" if shrunk else "PASS",
+        "cases": len(fuzzer.results),
+        "params": len(domains),
+        "lines_covered": len(fuzzer.coverage),
+        "failures": shrunk,
+        "slowest": [{"ms": r["ms"], "faces": r.get("faces", 0), "params": r["params"]} for r in slowest],
+        "hot_params": sorted(fuzzer.weights, key=fuzzer.weights.get, reverse=True)[:top],
+    }
+
+
+def format_report(report):
+    lines = [f"{report['cartridge']}: {report['status']}"]
+    if report["status"] == "ERROR":
+        lines.append(f"  ! {report.get('message', '')}")
+        return "\n".join(lines)
+    lines[0] += f" ({report['cases']} cases, {report['params']} params, {report['lines_covered']} lines)"
+    for f in report["failures"]:
+        lines.append(f"  {f['status']:<8}x{f['hits']:<4}{f['error'][:90]}")
+        lines.append(f"          minimal: {json.dumps(f['params'], sort_keys=True)}")
+    for s in report["slowest"]:
+        lines.append(f"  SLOWEST {s['ms']:>9.1f} ms {s['faces']:>8} faces  {json.dumps(s['params'], sort_keys=True)}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import worker_pool
+    import batch_audit
+
+    parser = argparse.ArgumentParser(description="Fuzz Massa cartridge parameters")
+    parser.add_argument("--only", nargs="*", help="Cartridge id prefixes")
+    parser.add_argument("--budget", type=int, default=200, help="Cases per cartridge (before shrinking)")
+    parser.add_argument("--include-base", action="store_true", help="Also fuzz the shared base properties")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds per job before a case counts as a hang")
+    parser.add_argument("--json", dest="json_path", default=None)
+    parser.add_argument("--blender", default=None, help="Blender executable (default: config.BLENDER_PATH)")
+    args = parser.parse_args(argv)
+
+    blender = args.blender
+    if not blender:
+        import config
+        blender = config.BLENDER_PATH
+
+    reports = []
+    with worker_pool.WorkerPool(blender, size=args.workers, timeout=args.timeout) as pool:
+        for entry in batch_audit.discover(only=args.only):
+            report = fuzz_cartridge(pool, entry["id"], args.budget, args.include_base, args.seed)
+            print(format_report(report))
+            reports.append(report)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(reports, fh, indent=1)
+    failed = [r for r in reports if r["status"] != "PASS"]
+    print(f"[Fuzz] {len(reports) - len(failed)}/{len(reports)} cartridges clean")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
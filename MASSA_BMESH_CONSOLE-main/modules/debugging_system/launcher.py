@@ -2,7 +2,36 @@ import subprocess
 import os
 import sys
 import json
+import atexit
+import threading
 from . import config
+from .worker_pool import WorkerPool
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_worker_pool():
+    """Shared warm pool of background Blenders (created on first use)."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = WorkerPool(
+                config.BLENDER_PATH,
+                size=getattr(config, "WORKER_POOL_SIZE", 2),
+                timeout=getattr(config, "WORKER_JOB_TIMEOUT", 300.0),
+            )
+            atexit.register(shutdown_worker_pool)
+        return _POOL
+
+
+def shutdown_worker_pool():
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
+
 
 def _run_blender_process(cmd, capture_output=True):
     """Helper to run blender process and handle output."""
@@ -43,13 +72,23 @@ def _run_blender_process(cmd, capture_output=True):
     except Exception as e:
         return {"status": "SYSTEM_FAILURE", "message": str(e)}
 
-def launch_cartridge_audit(cartridge_path, mode="AUDIT", payload=None):
+def launch_cartridge_audit(cartridge_path, mode="AUDIT", payload=None, use_pool=None):
     """
-    Spawns background Blender to execute the cartridge and run auditors.
+    Executes the cartridge and runs auditors in background Blender.
+    Uses the warm worker pool (config.USE_WORKER_POOL) unless use_pool=False,
+    which spawns a fresh process for this audit.
     """
     runner_script = os.path.join(os.path.dirname(__file__), "runner.py")
     cartridge_abs_path = os.path.abspath(cartridge_path)
 
+    if use_pool is None:
+        use_pool = getattr(config, "USE_WORKER_POOL", False)
+    if use_pool:
+        print(f"[Launcher] Running {mode} on {os.path.basename(cartridge_path)} (warm worker)...")
+        return get_worker_pool().run({
+            "cartridge": cartridge_abs_path, "mode": mode, "payload": payload or {},
+        })
+
     # Command to run Blender Headless (Background Mode)
     cmd = [
         config.BLENDER_PATH,
@@ -84,6 +123,23 @@ def launch_console_audit():
     print(f"[Launcher] Auditing Massa Console Architecture...")
     return _run_blender_process(cmd, capture_output=True)
 
+def launch_startup_profile():
+    """
+    Spawns background Blender to profile add-on startup: per-module import
+    time, per-class register_class time and per-cartridge property counts.
+    """
+    runner_script = os.path.join(os.path.dirname(__file__), "runner_profile.py")
+
+    cmd = [
+        config.BLENDER_PATH,
+        "--background",
+        "--factory-startup",
+        "--python", runner_script
+    ]
+
+    print("[Launcher] Profiling Massa Startup...")
+    return _run_blender_process(cmd, capture_output=True)
+
 def launch_session(headless=False):
     """
     Launches Blender.
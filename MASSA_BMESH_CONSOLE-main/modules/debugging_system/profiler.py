@@ -0,0 +1,208 @@
+import sys
+import time
+import contextlib
+
+# MASSA STARTUP PROFILER
+# Pure Python half of the startup/registration profiler. runner_profile.py
+# uses it inside Blender; the launcher side uses format_report to print.
+
+PROFILED_PACKAGES = ("modules", "operators", "ui")
+
+
+class ImportTimer:
+    """
+    Meta path hook timing exec_module of every module whose dotted name
+    falls under <root>.<package>. Records inclusive time (with nested
+    imports) and self time (without), in import order.
+    """
+
+    def __init__(self, root, packages=PROFILED_PACKAGES):
+        self.prefixes = tuple(f"{root}.{p}" for p in packages)
+        self.records = []
+        self._stack = []
+
+    def wants(self, name):
+        return any(name == p or name.startswith(p + ".") for p in self.prefixes)
+
+    # --- importlib finder protocol ---
+    def find_spec(self, name, path=None, target=None):
+        if not self.wants(name):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def _enter(self):
+        self._stack.append(0.0)  # Accumulates child time
+
+    def _exit(self, name, elapsed):
+        children = self._stack.pop()
+        if self._stack:
+            self._stack[-1] += elapsed
+        self.records.append({
+            "module": name,
+            "total_ms": elapsed * 1000.0,
+            "self_ms": (elapsed - children) * 1000.0,
+        })
+
+
+class _TimedLoader:
+    def __init__(self, loader, timer):
+        self._loader = loader
+        self._timer = timer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._timer._enter()
+        t0 = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer._exit(module.__name__, time.perf_counter() - t0)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+@contextlib.contextmanager
+def timed_register(utils, records):
+    """
+    Temporarily wraps utils.register_class (bpy.utils) so every class it
+    registers appends {class, ms} to records.
+    """
+    original = utils.register_class
+
+    def register_class(cls):
+        t0 = time.perf_counter()
+        try:
+            return original(cls)
+        finally:
+            records.append({"class": cls.__name__, "ms": (time.perf_counter() - t0) * 1000.0})
+
+    utils.register_class = register_class
+    try:
+        yield records
+    finally:
+        utils.register_class = original
+
+
+@contextlib.contextmanager
+def timed_calls(targets, totals):
+    """
+    Temporarily wraps owner.attr for every (label, owner, attr) in targets so
+    each call adds its inclusive ms to totals[label]. Used for per-stage
+    timings of the generation pipeline.
+    """
+    originals = []
+
+    def wrap(label, func):
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                totals[label] = totals.get(label, 0.0) + (time.perf_counter() - t0) * 1000.0
+        return timed
+
+    for label, owner, attr in targets:
+        func = getattr(owner, attr, None)
+        if func is None:
+            continue
+        # Class attributes: keep the raw function (inherited ones are only
+        # shadowed on owner, then removed again)
+        original = vars(owner).get(attr) if isinstance(owner, type) else func
+        originals.append((owner, attr, original))
+        setattr(owner, attr, wrap(label, func))
+    try:
+        yield totals
+    finally:
+        for owner, attr, original in reversed(originals):
+            if original is None:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+
+
+def count_properties(cls):
+    """(own, total) property counts. total needs a registered class (bl_rna)."""
+    own = len(getattr(cls, "__annotations__", {}) or {})
+    rna = getattr(cls, "bl_rna", None)
+    if rna is None:
+        return own, own
+    total = sum(1 for p in rna.properties if p.identifier != "rna_type")
+    return own, total
+
+
+def format_report(report, top=20):
+    """Plain text summary of a runner_profile report (slowest first)."""
+    lines = []
+    if report.get("status") != "PASS":
+        lines.append(f"Profile {report.get('status')}: {report.get('message', '')}")
+        for err in report.get("errors", []):
+            lines.append(f"  ! {err}")
+
+    phases = report.get("phases", {})
+    if phases:
+        lines.append("PHASES")
+        for name, ms in phases.items():
+            lines.append(f"  {name:<28}{ms:>10.1f} ms")
+
+    imports = sorted(report.get("imports", []), key=lambda r: r["self_ms"], reverse=True)
+    if imports:
+        lines.append(f"IMPORTS (top {top} by self time, {len(imports)} modules)")
+        for rec in imports[:top]:
+            lines.append(f"  {rec['module']:<60}{rec['self_ms']:>9.1f} ms  (incl. {rec['total_ms']:.1f})")
+
+    carts = sorted(report.get("cartridges", []), key=lambda r: r["import_ms"] + r["register_ms"], reverse=True)
+    if carts:
+        lines.append(f"CARTRIDGES (top {top} by import + register, {len(carts)} loaded)")
+        for rec in carts[:top]:
+            lines.append(
+                f"  {rec['class']:<44}{rec['import_ms']:>8.1f} ms import"
+                f"{rec['register_ms']:>8.1f} ms register"
+                f"{rec['props_own']:>5} own /{rec['props_total']:>4} props"
+            )
+    return "\n".join(lines)
+
+
+def main():
+    # Host side: python modules/debugging_system/profiler.py [--top N] [--json out.json]
+    import os
+    import json
+    import argparse
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if root not in sys.path:
+        sys.path.append(root)
+    from modules.debugging_system import launcher
+
+    parser = argparse.ArgumentParser(description="Profile Massa add-on startup in background Blender")
+    parser.add_argument("--top", type=int, default=20, help="Rows per section")
+    parser.add_argument("--json", type=str, help="Also write the raw report here")
+    args = parser.parse_args()
+
+    report = launcher.launch_startup_profile()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    print(format_report(report, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
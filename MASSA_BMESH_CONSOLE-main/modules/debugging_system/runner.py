@@ -4,6 +4,7 @@ import os
 import argparse
 import json
 import importlib
+import importlib.util
 import time
 import math
 import base64
@@ -26,7 +27,26 @@ except ImportError:
     except ImportError:
         pass
 
-def run_checks(obj):
+# [ARCHITECT FIX] The basic checks below need MeshSnapshot even when the
+# auditors package itself fails to import, so load its module on its own.
+def _load_mesh_snapshot():
+    names = ["auditors.mesh_snapshot"]
+    if __package__:
+        names.insert(0, __package__ + ".auditors.mesh_snapshot")
+    for name in names:
+        try:
+            return importlib.import_module(name).MeshSnapshot
+        except Exception:
+            pass
+    path = os.path.join(current_dir, "auditors", "mesh_snapshot.py")
+    spec = importlib.util.spec_from_file_location("massa_mesh_snapshot", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MeshSnapshot
+
+MeshSnapshot = _load_mesh_snapshot()
+
+def run_checks(obj, op_class=None):
     errors = []
     
     # --- DYNAMICALLY RUN ATTACHED AUDITORS ---
@@ -41,56 +61,53 @@ def run_checks(obj):
 
     if auditors_mod:
         # Identify the Operator Class from globals if possible
-        op_class = None
         # Look for class starting with MASSA_OT_
         for name, val in globals().items():
+            if op_class is not None:
+                break
             if name.startswith("MASSA_OT_") and isinstance(val, type):
                 op_class = val
-                break
         
         # Register Class to populate bl_rna
-        if op_class:
+        if op_class and not getattr(op_class, "is_registered", False):
             try:
                 bpy.utils.register_class(op_class)
             except Exception as e:
                 pass 
                 
-        try:
-            if hasattr(auditors_mod, 'run_all_auditors'):
-                errors.extend(auditors_mod.run_all_auditors(obj, op_class))
-        except Exception as e:
-            errors.append(f"Auditor Loader Failed: {str(e)}")
+    # [ARCHITECT NEW] One analyzed mesh (arrays, BMesh, BVH) for every check below
+    snapshot = None
+    if obj and obj.type == 'MESH':
+        snapshot = MeshSnapshot(obj)
 
-    
-    # --- CONNECT YOUR ATTACHED SCRIPTS HERE ---
-    
-    # [FALLBACK LOGIC]: If attached files aren't linked, we run a basic check
-    # to ensure the system works out of the box.
-    if not obj or obj.type != 'MESH':
-       return ["Object not valid for mesh audit"]
-
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-    bm.faces.ensure_lookup_table()
-    
-    # Check A: Zero Faces
-    zero_faces = [f.index for f in bm.faces if f.calc_area() < 0.000001]
-    if zero_faces:
-        errors.append(f"Found {len(zero_faces)} Zero-Area Faces. Indices: {zero_faces[:5]}...")
-
-    # Check B: Pinched UVs
-    uv_layer = bm.loops.layers.uv.verify()
-    pinched = []
-    for f in bm.faces:
-        uvs = [l[uv_layer].uv for l in f.loops]
-        # Shoelace formula for UV area
-        area = 0.5 * abs(sum(x0*y1 - x1*y0 for ((x0, y0), (x1, y1)) in zip(uvs, uvs[1:] + [uvs[0]])))
-        if area < 0.000001 and f.calc_area() > 0.000001:
-            pinched.append(f.index)
-    if pinched:
-        errors.append(f"Found {len(pinched)} Pinched UV Faces.")
-
-    bm.free()
+    try:
+        if auditors_mod:
+            try:
+                if hasattr(auditors_mod, 'run_all_auditors'):
+                    errors.extend(auditors_mod.run_all_auditors(obj, op_class, snapshot=snapshot))
+            except Exception as e:
+                errors.append(f"Auditor Loader Failed: {str(e)}")
+
+        # --- CONNECT YOUR ATTACHED SCRIPTS HERE ---
+
+        # [FALLBACK LOGIC]: If attached files aren't linked, we run a basic check
+        # to ensure the system works out of the box.
+        if not obj or obj.type != 'MESH':
+           return ["Object not valid for mesh audit"]
+
+        # Check A: Zero Faces
+        zero_faces = snapshot.face_areas < 0.000001
+        if zero_faces.any():
+            indices = [int(i) for i in zero_faces.nonzero()[0][:5]]
+            errors.append(f"Found {int(zero_faces.sum())} Zero-Area Faces. Indices: {indices}...")
+
+        # Check B: Pinched UVs (a missing layer reads as all-zero UVs)
+        pinched = (snapshot.uv_areas < 0.000001) & ~zero_faces
+        if pinched.any():
+            errors.append(f"Found {int(pinched.sum())} Pinched UV Faces.")
+    finally:
+        if snapshot is not None:
+            snapshot.free()
     return errors
 
 def find_generated_object(exclude=None):
@@ -355,6 +372,59 @@ def handle_skill_execution(payload):
         return {"status": "FAIL", "msg": f"Unknown skill: {skill}"}
 
 
+def audit_manifest_cartridge(payload):
+    """
+    CARTRIDGE mode: audits one cartridge of the installed add-on by manifest
+    id (payload["cart_id"]) through the lazy loader and its real operator.
+    Used by batch_audit; the add-on is set up once per worker.
+    """
+    cart_id = payload.get("cart_id", "")
+    if "massa" not in sys.modules:
+        import runner_console
+        ok, msg = runner_console.setup_massa_env()
+        if not ok:
+            return {"status": "SYSTEM_FAILURE", "cartridge": cart_id, "message": msg}
+    cartridges = importlib.import_module("massa.modules.cartridges")
+
+    entry = cartridges.get_entry(cart_id)
+    if entry is None:
+        return {"status": "FAIL", "cartridge": cart_id, "errors": [f"Unknown cartridge id '{cart_id}'"]}
+
+    start = time.perf_counter()
+    if cartridges.load(cart_id) is None:
+        return {"status": "FAIL", "cartridge": cart_id, "errors": ["Import/register failed"]}
+    op_class = cartridges.operator_class(cart_id)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    category, name = entry["operator"].split(".")
+    start = time.perf_counter()
+    try:
+        getattr(getattr(bpy.ops, category), name)('EXEC_DEFAULT')
+    except Exception as e:
+        return {"status": "FAIL", "cartridge": cart_id, "errors": [f"Operator Error: {e}"]}
+    gen_ms = (time.perf_counter() - start) * 1000
+
+    obj = bpy.context.active_object
+    if not obj or obj.type != 'MESH':
+        return {"status": "FAIL", "cartridge": cart_id, "errors": ["No Mesh Created by Cartridge"]}
+
+    start = time.perf_counter()
+    errors = run_checks(obj, op_class=op_class)
+    audit_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "status": "PASS" if not errors else "FAIL",
+        "cartridge": cart_id,
+        "object": obj.name,
+        "errors": errors,
+        "verts": len(obj.data.vertices),
+        "faces": len(obj.data.polygons),
+        "load_ms": round(load_ms, 2),
+        "gen_ms": round(gen_ms, 2),
+        "audit_ms": round(audit_ms, 2),
+    }
+
+
 def execute_audit(cartridge_path, mode="AUDIT", payload=None, is_direct=False):
     """
     Executes the audit logic.
@@ -370,6 +440,17 @@ def execute_audit(cartridge_path, mode="AUDIT", payload=None, is_direct=False):
     
     if mode == "SKILL_EXEC":
         return handle_skill_execution(payload)
+
+    if mode == "CARTRIDGE":
+        return audit_manifest_cartridge(payload)
+
+    if mode == "BENCHMARK":
+        import runner_bench
+        return runner_bench.execute_benchmark(payload)
+
+    if mode == "FUZZ":
+        import runner_fuzz
+        return runner_fuzz.execute_fuzz(payload)
     
     if mode == "VISUAL_DIFF":
         # 1. Run First Cartridge (Target A)
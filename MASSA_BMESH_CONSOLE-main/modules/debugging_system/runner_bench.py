@@ -0,0 +1,169 @@
+import bpy
+import sys
+import os
+import time
+import importlib
+import contextlib
+import tracemalloc
+import traceback
+
+# 1. Setup Path to import the pure-python helpers next to this file
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+import bench
+import profiler
+
+
+def _stage_targets(op_class):
+    """(label, owner, attr) of the pipeline stages timed per run."""
+    engine = sys.modules["massa.modules.massa_engine"]
+    surface = sys.modules["massa.modules.massa_surface"]
+    seams = sys.modules["massa.modules.seam_solvers"]
+    return [
+        ("build_shape", op_class, "build_shape"),
+        ("polish", engine, "_run_polish_stack"),
+        ("identity_layers", surface, "write_identity_layers"),
+        ("seams", seams, "solve_seams"),
+        ("surface_maps", surface, "generate_surface_maps"),
+        ("output", engine, "_generate_output"),
+    ]
+
+
+def prop_info(op_class):
+    """Plain description of op_class's scalar properties (bench presets, fuzz domains)."""
+    own = set(getattr(op_class, "__annotations__", {}) or {})
+    out = []
+    for p in op_class.bl_rna.properties:
+        if p.identifier == "rna_type" or getattr(p, "is_array", False):
+            continue
+        if p.type not in {"BOOLEAN", "INT", "FLOAT", "ENUM"}:
+            continue
+        if p.type == "ENUM" and getattr(p, "is_enum_flag", False):
+            continue
+        info = {
+            "identifier": p.identifier,
+            "type": p.type,
+            "own": p.identifier in own,
+            "default": getattr(p, "default", None),
+            "soft_max": getattr(p, "soft_max", bench.RES_CAP),
+        }
+        if p.type in {"INT", "FLOAT"}:
+            info.update(soft_min=p.soft_min, hard_min=p.hard_min, hard_max=p.hard_max)
+        elif p.type == "ENUM":
+            info["items"] = [i.identifier for i in p.enum_items]
+        out.append(info)
+    return out
+
+
+def load_operator(cart_id):
+    """(op_class, bpy.ops callable) of a manifest cartridge; sets up the add-on once per process."""
+    if "massa" not in sys.modules:
+        import runner_console
+        ok, msg = runner_console.setup_massa_env()
+        if not ok:
+            raise RuntimeError(msg)
+    cartridges = importlib.import_module("massa.modules.cartridges")
+    entry = cartridges.get_entry(cart_id)
+    if entry is None or cartridges.load(cart_id) is None:
+        raise LookupError(f"Cannot load cartridge '{cart_id}'")
+    category, name = entry["operator"].split(".")
+    return cartridges.operator_class(cart_id), getattr(getattr(bpy.ops, category), name)
+
+
+@contextlib.contextmanager
+def mesh_cache_off():
+    """Cache hits would measure a cache read, not the pipeline."""
+    mesh_cache = importlib.import_module("massa.modules.massa_mesh_cache")
+    previous = os.environ.get(mesh_cache.ENV_OFF)
+    os.environ[mesh_cache.ENV_OFF] = "1"
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(mesh_cache.ENV_OFF, None)
+        else:
+            os.environ[mesh_cache.ENV_OFF] = previous
+
+
+def clear_outputs():
+    objs = list(bpy.data.objects)
+    meshes = [m for m in bpy.data.meshes if m.users == 0 or any(o.data == m for o in objs)]
+    if objs or meshes:
+        bpy.data.batch_remove(objs + meshes)
+
+
+def _run_once(op_call, op_class, overrides):
+    """One timed generation: {total_ms, stages, peak_kb, verts, edges, faces, objects}."""
+    clear_outputs()
+    stages = {}
+    tracemalloc.start()
+    try:
+        with profiler.timed_calls(_stage_targets(op_class), stages):
+            t0 = time.perf_counter()
+            result = op_call('EXEC_DEFAULT', **overrides)
+            total_ms = (time.perf_counter() - t0) * 1000.0
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    if "FINISHED" not in result:
+        raise RuntimeError(f"Operator returned {set(result)}")
+    obj = bpy.context.active_object
+    if not obj or obj.type != 'MESH':
+        raise RuntimeError("No Mesh Created by Cartridge")
+    return {
+        "total_ms": total_ms,
+        "stages": stages,
+        "peak_kb": peak / 1024.0,
+        "verts": len(obj.data.vertices),
+        "edges": len(obj.data.edges),
+        "faces": len(obj.data.polygons),
+        "objects": len(bpy.data.objects),
+    }
+
+
+def _best(runs):
+    """Fastest run per metric: min of timings and memory, counts from the last run."""
+    best = dict(runs[-1])
+    best["total_ms"] = round(min(r["total_ms"] for r in runs), 3)
+    best["peak_kb"] = round(min(r["peak_kb"] for r in runs), 1)
+    best["stages"] = {
+        stage: round(min(r["stages"].get(stage, 0.0) for r in runs), 3)
+        for stage in runs[-1]["stages"]
+    }
+    return best
+
+
+def execute_benchmark(payload):
+    """
+    BENCHMARK mode: payload {cart_id, presets, repeats}. Runs the cartridge's
+    operator at every preset (mesh cache off), keeping the best of repeats.
+    """
+    cart_id = payload.get("cart_id", "")
+    presets = payload.get("presets") or list(bench.PRESETS)
+    repeats = max(1, int(payload.get("repeats", 3)))
+
+    try:
+        op_class, op_call = load_operator(cart_id)
+    except LookupError as e:
+        return {"status": "FAIL", "cartridge": cart_id, "errors": [str(e)]}
+    except RuntimeError as e:
+        return {"status": "SYSTEM_FAILURE", "cartridge": cart_id, "message": str(e)}
+    props = prop_info(op_class)
+
+    report = {}
+    with mesh_cache_off():
+        try:
+            for preset in presets:
+                overrides = bench.preset_overrides(preset, props)
+                try:
+                    runs = [_run_once(op_call, op_class, overrides) for _ in range(repeats)]
+                    report[preset] = _best(runs)
+                except Exception as e:
+                    report[preset] = {"error": f"{e}", "log": traceback.format_exc()[-600:]}
+        finally:
+            clear_outputs()
+
+    return {"status": "SUCCESS", "cartridge": cart_id, "presets": report}
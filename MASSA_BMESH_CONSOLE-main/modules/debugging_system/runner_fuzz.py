@@ -0,0 +1,133 @@
+import bpy
+import sys
+import os
+import math
+import time
+import zlib
+import traceback
+
+# 1. Setup Path to import the helpers next to this file
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+import runner_bench
+
+# Coverage is collected for add-on code only (cartridges, modules, utils)
+ADDON_ROOT = os.path.abspath(os.path.join(current_dir, "..", ".."))
+
+
+def _line_id(filename, lineno):
+    # crc32, not hash(): ids must match across worker processes
+    return zlib.crc32(f"{os.path.basename(filename)}:{lineno}".encode())
+
+
+class LineCoverage:
+    """sys.settrace collector of executed add-on lines (as stable ids)."""
+
+    def __init__(self, root=ADDON_ROOT):
+        self.root = root
+        self.lines = set()
+
+    def _local(self, frame, event, arg):
+        if event == "line":
+            self.lines.add(_line_id(frame.f_code.co_filename, frame.f_lineno))
+        return self._local
+
+    def _global(self, frame, event, arg):
+        if frame.f_code.co_filename.startswith(self.root):
+            return self._local
+        return None
+
+    def __enter__(self):
+        self._previous = sys.gettrace()
+        sys.settrace(self._global)
+        return self
+
+    def __exit__(self, *exc):
+        sys.settrace(self._previous)
+
+
+def _check_output():
+    """None if the active object looks like a usable mesh, else (status, message)."""
+    obj = bpy.context.active_object
+    if not obj or obj.type != 'MESH':
+        return "EMPTY", "No Mesh Created by Cartridge"
+    mesh = obj.data
+    if not mesh.vertices or not mesh.polygons:
+        return "EMPTY", f"Mesh has {len(mesh.vertices)} verts / {len(mesh.polygons)} faces"
+    coords = [0.0] * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", coords)
+    if not all(math.isfinite(c) for c in coords):
+        return "INVALID", "Non-finite vertex coordinates"
+    return None
+
+
+def _collect_lines(op_call, params):
+    """Executed add-on lines of one traced, untimed run (failures included)."""
+    runner_bench.clear_outputs()
+    tracker = LineCoverage()
+    with tracker:
+        try:
+            op_call('EXEC_DEFAULT', **params)
+        except Exception:
+            pass
+    return sorted(tracker.lines)
+
+
+def run_case(op_call, params, coverage=True):
+    """
+    One fuzz case -> {status OK/CRASH/EMPTY/INVALID, error, ms, verts, faces, lines}.
+    [ARCHITECT FIX] settrace slows add-on code several times over and not
+    uniformly, so coverage comes from a separate run and ms from a plain one.
+    """
+    lines = _collect_lines(op_call, params) if coverage else []
+    runner_bench.clear_outputs()
+    t0 = time.perf_counter()
+    try:
+        result = op_call('EXEC_DEFAULT', **params)
+    except Exception as e:
+        # bpy.ops raises for ERROR reports (Pipeline Error: ...) and bad kwargs
+        return {
+            "status": "CRASH", "error": str(e).strip(), "log": traceback.format_exc()[-600:],
+            "ms": (time.perf_counter() - t0) * 1000.0, "lines": lines,
+        }
+    ms = (time.perf_counter() - t0) * 1000.0
+
+    if "FINISHED" not in result:
+        return {"status": "CRASH", "error": f"Operator returned {set(result)}", "ms": ms, "lines": lines}
+    problem = _check_output()
+    if problem:
+        return {"status": problem[0], "error": problem[1], "ms": ms, "lines": lines}
+    obj = bpy.context.active_object
+    return {
+        "status": "OK", "ms": ms, "lines": lines,
+        "verts": len(obj.data.vertices), "faces": len(obj.data.polygons),
+    }
+
+
+def execute_fuzz(payload):
+    """
+    FUZZ mode: payload {cart_id, cases: [kwargs], describe, coverage}.
+    describe returns the operator's property description (fuzz.param_space input).
+    """
+    cart_id = payload.get("cart_id", "")
+    try:
+        op_class, op_call = runner_bench.load_operator(cart_id)
+    except LookupError as e:
+        return {"status": "FAIL", "cartridge": cart_id, "errors": [str(e)]}
+    except RuntimeError as e:
+        return {"status": "SYSTEM_FAILURE", "cartridge": cart_id, "message": str(e)}
+
+    reply = {"status": "SUCCESS", "cartridge": cart_id, "results": []}
+    if payload.get("describe"):
+        reply["props"] = runner_bench.prop_info(op_class)
+
+    coverage = payload.get("coverage", True)
+    with runner_bench.mesh_cache_off():
+        try:
+            for params in payload.get("cases", []):
+                reply["results"].append(run_case(op_call, params, coverage))
+        finally:
+            runner_bench.clear_outputs()
+    return reply
@@ -0,0 +1,96 @@
+import bpy
+import sys
+import os
+import json
+import time
+import traceback
+import importlib.util
+
+# 1. Setup Path to import the pure-python profiler next to this file
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+import profiler
+
+
+def execute_startup_profile():
+    """
+    STARTUP PROFILE
+    Phase 1: Import the add-on as 'massa' with an import timer installed.
+    Phase 2: register() with bpy.utils.register_class timed per class.
+    Phase 3: Load every cartridge (import + operator + console PropertyGroup),
+             timed per cartridge, with property counts.
+    """
+    report = {"status": "PASS", "errors": [], "phases": {}, "imports": [], "registration": [], "cartridges": []}
+    addon_root = os.path.abspath(os.path.join(current_dir, "..", ".."))
+    init_path = os.path.join(addon_root, "__init__.py")
+
+    timer = profiler.ImportTimer("massa").install()
+    try:
+        # --- PHASE 1: IMPORT ---
+        t0 = time.perf_counter()
+        spec = importlib.util.spec_from_file_location("massa", init_path)
+        massa_mod = importlib.util.module_from_spec(spec)
+        sys.modules["massa"] = massa_mod
+        spec.loader.exec_module(massa_mod)
+        report["phases"]["import"] = (time.perf_counter() - t0) * 1000.0
+
+        # --- PHASE 2: REGISTER ---
+        with profiler.timed_register(bpy.utils, report["registration"]):
+            t0 = time.perf_counter()
+            massa_mod.register()
+            report["phases"]["register"] = (time.perf_counter() - t0) * 1000.0
+
+        # --- PHASE 3: CARTRIDGES ---
+        # Equivalent to walking cartridges.CLASSES, but one cartridge at a
+        # time so import and registration cost land on the right entry.
+        cartridges = sys.modules["massa.modules.cartridges"]
+        t_all = time.perf_counter()
+        for entry in cartridges.entries():
+            mod_name = f"massa.modules.cartridges.{entry['module']}"
+            seen = len(timer.records)
+            reg = []
+            with profiler.timed_register(bpy.utils, reg):
+                t0 = time.perf_counter()
+                mod = cartridges.load(entry["id"])
+                load_ms = (time.perf_counter() - t0) * 1000.0
+
+            if mod is None:
+                report["errors"].append(f"{entry['module']}: failed to load")
+                continue
+
+            import_ms = sum(r["total_ms"] for r in timer.records[seen:] if r["module"] == mod_name)
+            reg_ms = {r["class"]: r["ms"] for r in reg}
+            cls = cartridges.operator_class(entry["id"])
+            own, total = profiler.count_properties(cls)
+            report["cartridges"].append({
+                "id": entry["id"],
+                "module": entry["module"],
+                "class": entry["class"],
+                "load_ms": load_ms,
+                "import_ms": import_ms,
+                "register_ms": reg_ms.get(entry["class"], 0.0),
+                "props_register_ms": sum(ms for name, ms in reg_ms.items() if name != entry["class"]),
+                "props_own": own,
+                "props_total": total,
+            })
+        report["phases"]["cartridges"] = (time.perf_counter() - t_all) * 1000.0
+
+    except Exception as e:
+        report["status"] = "FAIL"
+        report["errors"].append(f"Profile Error: {e}\n{traceback.format_exc()}")
+    finally:
+        timer.uninstall()
+
+    report["imports"] = timer.records
+    if report["errors"] and report["status"] == "PASS":
+        report["status"] = "WARNING"
+    return report
+
+
+if __name__ == "__main__":
+    final_report = execute_startup_profile()
+    print("---AUDIT_START---")
+    print(json.dumps(final_report, indent=4))
+    print("---AUDIT_END---")
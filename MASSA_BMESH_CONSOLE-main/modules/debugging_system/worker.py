@@ -0,0 +1,105 @@
+import bpy
+import sys
+import os
+import json
+import traceback
+
+# --- WARM AUDIT WORKER ---
+# Long-lived background Blender for worker_pool.WorkerPool:
+#   blender --background --factory-startup --python worker.py
+# Protocol (stdout is shared with cartridge prints, so replies are tagged):
+#   worker -> host: "MASSA_WORKER_READY"
+#   host -> worker: one JSON job per line {"id", "cartridge", "mode", "payload"}
+#   worker -> host: "MASSA_WORKER_RESULT <json>" ({"id", "result"})
+# Between jobs the scene is emptied with one batch_remove instead of
+# read_factory_settings, and names a cartridge exec'd into runner's globals
+# are dropped so the next job cannot pick up a stale operator class.
+
+READY = "MASSA_WORKER_READY"
+RESULT = "MASSA_WORKER_RESULT "
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+import runner
+
+# Data that jobs create; scenes, worlds and UI data stay
+RESET_COLLECTIONS = (
+    "objects", "meshes", "materials", "cameras", "lights", "images", "textures",
+    "node_groups", "curves", "armatures", "collections",
+)
+
+_RUNNER_STATE = dict(vars(runner))
+
+
+def reset_scene():
+    """Empties the scene for the next job (fast path of read_factory_settings)."""
+    obj = bpy.context.object
+    if obj and obj.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+
+    ids = []
+    for attr in RESET_COLLECTIONS:
+        ids.extend(getattr(bpy.data, attr))
+    if ids:
+        bpy.data.batch_remove(ids)
+
+    scene = bpy.context.scene
+    scene.camera = None
+    for key in list(scene.keys()):
+        del scene[key]
+
+
+def _restore_runner_globals():
+    """Restores runner's globals after a cartridge was exec'd into them (unregistering its classes)."""
+    namespace = vars(runner)
+    for name in list(namespace):
+        value = namespace[name]
+        if name in _RUNNER_STATE and _RUNNER_STATE[name] is value:
+            continue
+        if isinstance(value, type) and getattr(value, "is_registered", False):
+            try:
+                bpy.utils.unregister_class(value)
+            except RuntimeError:
+                pass
+        del namespace[name]
+    namespace.update(_RUNNER_STATE)
+
+
+def run_job(job):
+    reset_scene()
+    try:
+        return runner.execute_audit(
+            job.get("cartridge", ""), job.get("mode", "AUDIT"), job.get("payload") or {},
+            is_direct=True,
+        )
+    except Exception as e:
+        return {"status": "SYSTEM_FAILURE", "message": str(e), "log": traceback.format_exc()[-1000:]}
+    finally:
+        _restore_runner_globals()
+
+
+def reply(data):
+    sys.stdout.write(RESULT + json.dumps(data, default=str) + "\n")
+    sys.stdout.flush()
+
+
+def main():
+    print(READY, flush=True)
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError as e:
+            reply({"id": None, "result": {"status": "SYSTEM_FAILURE", "message": f"Bad job: {e}"}})
+            continue
+        if job.get("mode") == "SHUTDOWN":
+            break
+        reply({"id": job.get("id"), "result": run_job(job)})
+
+
+if __name__ == "__main__":
+    main()
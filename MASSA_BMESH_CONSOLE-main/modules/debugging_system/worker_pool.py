@@ -0,0 +1,188 @@
+import os
+import json
+import queue
+import itertools
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# --- WARM WORKER POOL (HOST SIDE) ---
+# Keeps N background Blenders running worker.py and hands them JSON jobs, so
+# an audit costs a scene reset instead of a Blender start-up. Workers that
+# crash, hang past the timeout or reach max_jobs are replaced.
+# Plain Python (no bpy, no config): usable from CI scripts and the launcher.
+
+READY = "MASSA_WORKER_READY"
+RESULT = "MASSA_WORKER_RESULT "
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+
+DEFAULT_TIMEOUT = 300.0
+STARTUP_TIMEOUT = 120.0
+DEFAULT_MAX_JOBS = 200  # Recycle to bound leaks in long sessions
+LOG_TAIL = 40
+
+
+def blender_command(blender_path):
+    return [blender_path, "--background", "--factory-startup", "--python", WORKER_SCRIPT]
+
+
+class WorkerError(Exception):
+    pass
+
+
+class _Worker:
+    """One background process plus a thread draining its stdout into a queue."""
+
+    def __init__(self, command):
+        self.command = command
+        self.jobs = 0
+        self.log = []
+        self.lines = queue.Queue()
+        self.proc = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1,
+        )
+        threading.Thread(target=self._drain, daemon=True).start()
+        try:
+            self._wait_for(lambda line: line.startswith(READY), STARTUP_TIMEOUT)
+        except WorkerError:
+            self.proc.kill()
+            raise
+
+    def _drain(self):
+        for line in self.proc.stdout:
+            self.lines.put(line.rstrip("\n"))
+        self.lines.put(None)  # EOF: process exited
+
+    def _wait_for(self, match, timeout):
+        while True:
+            try:
+                line = self.lines.get(timeout=timeout)
+            except queue.Empty:
+                raise WorkerError(f"no reply within {timeout:.0f}s")
+            if line is None:
+                raise WorkerError(f"worker exited (code {self.proc.poll()})")
+            if match(line):
+                return line
+            self.log = (self.log + [line])[-LOG_TAIL:]
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def run(self, job, timeout):
+        self.log = []
+        self.jobs += 1
+        try:
+            self.proc.stdin.write(json.dumps(job) + "\n")
+            self.proc.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise WorkerError(f"worker pipe closed ({e})")
+        while True:
+            line = self._wait_for(lambda ln: ln.startswith(RESULT), timeout)
+            reply = json.loads(line[len(RESULT):])
+            if reply.get("id") == job["id"]:
+                return reply.get("result")
+
+    def stop(self, grace=5.0):
+        if self.alive():
+            try:
+                self.proc.stdin.write(json.dumps({"mode": "SHUTDOWN"}) + "\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=grace)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+
+
+class WorkerPool:
+    """
+    pool = WorkerPool(blender_path, size=4)
+    pool.run({"cartridge": path, "mode": "AUDIT"})   -> result dict
+    pool.map(jobs)                                   -> results, in order
+    Thread-safe; workers start lazily and are restarted on failure.
+    """
+
+    def __init__(self, blender_path=None, size=2, timeout=DEFAULT_TIMEOUT,
+                 max_jobs=DEFAULT_MAX_JOBS, command=None):
+        self.command = command or blender_command(blender_path)
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self.max_jobs = max_jobs
+        self.restarts = 0
+        self._idle = queue.LifoQueue()  # Warmest worker first
+        self._slots = threading.Semaphore(self.size)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._workers = []
+        self._closed = False
+
+    def _acquire(self):
+        self._slots.acquire()
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            worker = None
+        if worker is not None and worker.alive():
+            return worker
+        if worker is not None:
+            self._discard(worker)
+        worker = _Worker(self.command)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _release(self, worker):
+        if worker.alive() and worker.jobs < self.max_jobs and not self._closed:
+            self._idle.put(worker)
+        else:
+            self._discard(worker)
+        self._slots.release()
+
+    def _discard(self, worker):
+        worker.stop()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+
+    def run(self, job):
+        """Runs one job ({cartridge, mode, payload}); failures come back as SYSTEM_FAILURE results."""
+        if self._closed:
+            raise RuntimeError("WorkerPool is closed")
+        job = dict(job, id=next(self._ids))
+        try:
+            worker = self._acquire()
+        except (OSError, WorkerError) as e:
+            self._slots.release()
+            return {"status": "SYSTEM_FAILURE", "message": f"Worker start failed: {e}"}
+        try:
+            result = worker.run(job, self.timeout)
+        except WorkerError as e:
+            # Crashed or hung: replace it (the next job gets a fresh process)
+            log = "\n".join(worker.log[-20:])
+            worker.proc.kill()
+            worker.proc.wait()
+            with self._lock:
+                self.restarts += 1
+            result = {"status": "SYSTEM_FAILURE", "message": f"Worker failed: {e}", "log": log or "No Output"}
+        self._release(worker)
+        return result
+
+    def map(self, jobs):
+        """Runs jobs across the pool; results keep the order of jobs."""
+        jobs = list(jobs)
+        with ThreadPoolExecutor(max_workers=min(self.size, max(1, len(jobs)))) as ex:
+            return list(ex.map(self.run, jobs))
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            workers = list(self._workers)
+            self._workers = []
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,173 @@
+import bpy
+from . import massa_params
+from . import massa_properties
+from . import massa_inplace
+
+# --- BATCH REGENERATION ---
+# Scenes often hold many Massa objects built from the same settings (400
+# identical fence segments). massa.regenerate_all groups them by
+# (massa_op_id, params digest), runs each unique configuration ONCE into a
+# leader object, then points the followers at the leader's Mesh (linked
+# data, like Alt+D) and copies its Massa_* modifiers and generated children.
+# Object transforms are never part of the key and are never touched; nor is
+# Redo-panel layout (active tab, folded slots).
+# Configurations whose output is per object (detached parts, auto-rig
+# joints, constrained sockets) are regenerated one object at a time.
+
+# Per-object placement: stored in MASSA_PARAMS but not part of the shape
+TRANSFORM_KEYS = ("obj_location", "obj_rotation")
+
+# [ARCHITECT FIX] Redo-panel layout (tabs, fold-outs) is stored too but never
+# read by a build. ui_use_rot is the one ui_ key that gates a pass (rotation).
+UI_PREFIX = "ui_"
+UI_SHAPE_KEYS = ("ui_use_rot",)
+UI_SLOT_FIELDS = ("expand",)
+
+
+def _is_non_shape(key):
+    if key in TRANSFORM_KEYS:
+        return True
+    if key.startswith(UI_PREFIX):
+        return key not in UI_SHAPE_KEYS
+    field, _sep, index = key.rpartition("_")
+    return field in UI_SLOT_FIELDS and index.isdigit()  # Legacy flat expand_0 ...
+
+
+def shape_params(params):
+    """Stored params without per-object placement and UI-only state."""
+    shape = {k: v for k, v in params.items() if not _is_non_shape(k)}
+    slots = shape.pop("slots", None)
+    if isinstance(slots, dict):
+        slots = {k: v for k, v in slots.items() if k not in UI_SLOT_FIELDS}
+    if slots:  # No slot diffs and no "slots" entry are the same shape
+        shape["slots"] = slots
+    return shape
+
+
+def params_digest(params):
+    """Stable hash of stored params, ignoring transform and UI-only keys."""
+    return massa_params.digest(shape_params(params))
+
+
+def group_objects(objects):
+    """
+    {(op_id, digest): [obj, ...]} for every Massa mesh object with readable
+    params. Order inside a group follows the input order (first = leader).
+    """
+    groups = {}
+    for obj in objects:
+        if obj.type != "MESH":
+            continue
+        op_id = obj.get("massa_op_id")
+        if not op_id:
+            continue
+        params = massa_params.read(obj)
+        if params is None:
+            continue
+        groups.setdefault((op_id, params_digest(params)), []).append(obj)
+    return groups
+
+
+def slot_columns(full):
+    """Full columnar slot data of expanded params (any schema)."""
+    slots = full.get("slots")
+    if isinstance(slots, dict) and all(isinstance(v, list) for v in slots.values()):
+        return slots
+    return massa_properties.legacy_slot_params(full)[0]
+
+
+def is_tiled(full):
+    """
+    True for tiled terrain: one run rebuilds every tile object itself, so a
+    group of tiles is generated once and never linked to a shared Mesh.
+    """
+    return bool(full.get("use_tiles"))
+
+
+def is_shareable(full):
+    """
+    True when every object of the configuration can use the same output:
+    no detached slot parts, no auto-rig joints and no socket constraints
+    (all three create per-object children or links).
+    """
+    if full.get("phys_auto_rig"):
+        return False
+    if full.get("sock_enable") and full.get("sock_constraint_type", "NONE") != "NONE":
+        return False
+    return not any(slot_columns(full).get("sep") or ())
+
+
+def operator_kwargs(cls, full):
+    """bpy.ops keyword arguments (class properties + slot dicts) for expanded params."""
+    defaults = massa_params.class_defaults(cls)
+    kwargs = {key: val for key, val in full.items() if key in defaults}
+    columns = slot_columns(full)
+    kwargs["slots"] = [
+        {name: col[i] for name, col in columns.items()
+         if name in massa_properties.SLOT_FIELDS and col[i] is not None}
+        for i in range(massa_properties.SLOT_COUNT)
+    ]
+    return kwargs
+
+
+def isolate_mesh(leader, group):
+    """Gives leader its own Mesh copy when objects outside group also use it."""
+    mesh = leader.data
+    inside = sum(1 for obj in group if obj.data == mesh)
+    if mesh.users > inside:
+        leader.data = mesh.copy()
+
+
+def _copy_modifier(src, obj):
+    mod = obj.modifiers.new(src.name, src.type)
+    for prop in src.bl_rna.properties:
+        if prop.is_readonly or prop.identifier in {"name", "type", "rna_type"}:
+            continue
+        try:
+            setattr(mod, prop.identifier, getattr(src, prop.identifier))
+        except (AttributeError, TypeError, ValueError):
+            pass
+    # Geometry Nodes inputs live in ID properties
+    for key in src.keys():
+        try:
+            mod[key] = src[key]
+        except (TypeError, ValueError):
+            pass
+    return mod
+
+
+def link_follower(leader, obj):
+    """
+    Makes obj show the leader's output: shared Mesh, same Massa_* modifier
+    stack, vertex group names and copies of the generated children.
+    User modifiers, user children and the transform are left alone.
+    """
+    old_mesh = obj.data
+    if old_mesh != leader.data:
+        obj.data = leader.data
+        if old_mesh is not None and old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+    obj.vertex_groups.clear()
+    for group in leader.vertex_groups:
+        obj.vertex_groups.new(name=group.name)
+
+    prefix = massa_inplace.MODIFIER_PREFIX
+    for mod in [m for m in obj.modifiers if m.name.startswith(prefix)]:
+        obj.modifiers.remove(mod)
+    for mod in leader.modifiers:
+        if mod.name.startswith(prefix):
+            _copy_modifier(mod, obj)
+
+    for child in list(obj.children):
+        if massa_inplace.is_generated_child(child):
+            massa_inplace.remove_object(child)
+    for child in leader.children:
+        if not massa_inplace.is_generated_child(child):
+            continue
+        dup = child.copy()  # Linked data
+        dup.name = child.name.replace(leader.name, obj.name)
+        for coll in child.users_collection:
+            coll.objects.link(dup)
+        dup.parent = obj
+        dup.matrix_parent_inverse = child.matrix_parent_inverse.copy()
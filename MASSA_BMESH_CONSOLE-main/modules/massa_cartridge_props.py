@@ -1,79 +1,91 @@
 import bpy
-from .cartridges import MODULES
-# We need to inspect the operator to copy properties
-# We use a deferred import or string lookup to avoid circular dependencies if possible,
-# but importing Massa_OT_Base is usually safe here as it is at the end of the chain.
-from ..operators.massa_base import Massa_OT_Base
+from bpy.props import PointerProperty
 from .massa_properties import MassaPropertiesMixin
 
 CARTRIDGE_PROP_CLASSES = {}
 
-def register_cartridge_props():
-    """
-    Dynamically creates and registers PropertyGroup classes for each cartridge.
-    These classes mirror the properties defined in the cartridge's Operator.
-    """
-    # 1. Identify properties to exclude (Base class properties)
+# Standard Blender properties to ignore
+EXCLUDE_NAMES = {"bl_idname", "bl_label", "bl_description", "bl_options", "rna_type"}
+
+
+def _base_props():
+    # We need to inspect the operator to copy properties. Deferred import:
+    # keeps this module off massa_base's dependents (selective hot reload).
+    from ..operators.massa_base import Massa_OT_Base
+
     base_props = set()
     if hasattr(Massa_OT_Base, "__annotations__"):
         base_props.update(Massa_OT_Base.__annotations__.keys())
 
     if hasattr(MassaPropertiesMixin, "__annotations__"):
         base_props.update(MassaPropertiesMixin.__annotations__.keys())
+    return base_props
 
-    # Standard Blender properties to ignore
-    exclude_names = {"bl_idname", "bl_label", "bl_description", "bl_options", "rna_type"}
-
-    for mod in MODULES:
-        meta = getattr(mod, "CARTRIDGE_META", {})
-        cart_id = meta.get("id")
-        if not cart_id:
-            continue
 
-        # Find Operator Class
-        op_class = None
-        for name, obj in mod.__dict__.items():
-            if isinstance(obj, type) and issubclass(obj, Massa_OT_Base) and obj != Massa_OT_Base:
-                op_class = obj
-                break
+def register_cartridge_props(cart_id, op_class):
+    """
+    Creates and registers the PropertyGroup mirroring one cartridge Operator,
+    then hangs it on the console as props_{cart_id}.
+    [ARCHITECT NEW] Called lazily by cartridges.load() on first use; values
+    already stored in the .blend under that name re-attach automatically.
+    """
+    if cart_id in CARTRIDGE_PROP_CLASSES:
+        return CARTRIDGE_PROP_CLASSES[cart_id]
+
+    # We sanitize the ID to make a valid class name (though ID is usually safe)
+    safe_id = cart_id.replace(".", "_").replace("-", "_")
+    cls_name = f"MASSA_PG_{safe_id}"
+
+    # Extract unique properties (base class properties are excluded)
+    base_props = _base_props()
+    cls_annotations = {}
+    if hasattr(op_class, "__annotations__"):
+        for k, v in op_class.__annotations__.items():
+            if k in base_props or k in EXCLUDE_NAMES:
+                continue
+            # Copy the annotation (property definition)
+            cls_annotations[k] = v
+
+    # Even if empty, we register it to have a consistent handle so ui code doesn't break.
+    # We must use type() to create the class dynamically
+    new_class = type(cls_name, (bpy.types.PropertyGroup,), {'__annotations__': cls_annotations})
+
+    try:
+        bpy.utils.register_class(new_class)
+    except ValueError:
+        return None
+    except Exception as e:
+        print(f"MASSA ERROR: Failed to register props for {cart_id}: {e}")
+        return None
+    CARTRIDGE_PROP_CLASSES[cart_id] = new_class
 
-        if not op_class:
-            continue
+    # Inject the PointerProperty into the (already registered) Console Props
+    from .massa_console import Massa_Console_Props
 
-        # Extract unique properties
-        # We sanitize the ID to make a valid class name (though ID is usually safe)
-        safe_id = cart_id.replace(".", "_").replace("-", "_")
-        cls_name = f"MASSA_PG_{safe_id}"
+    if getattr(Massa_Console_Props, "is_registered", False):
+        setattr(Massa_Console_Props, f"props_{safe_id}", PointerProperty(type=new_class))
+    return new_class
 
-        cls_annotations = {}
 
-        if hasattr(op_class, "__annotations__"):
-            for k, v in op_class.__annotations__.items():
-                if k in base_props or k in exclude_names:
-                    continue
-                # Copy the annotation (property definition)
-                cls_annotations[k] = v
+def unregister_cartridge_props(cart_id=None):
+    """All PropertyGroups (add-on unregister), or one cartridge's (hot reload)."""
+    if cart_id is not None:
+        cls = CARTRIDGE_PROP_CLASSES.pop(cart_id, None)
+        if cls is None:
+            return
+        from .massa_console import Massa_Console_Props
 
-        if not cls_annotations:
-            # Even if empty, we might want to register it to have a consistent handle?
-            # Yes, so ui code doesn't break.
+        safe_id = cart_id.replace(".", "_").replace("-", "_")
+        try:
+            delattr(Massa_Console_Props, f"props_{safe_id}")  # Stored values stay in the .blend
+        except (AttributeError, RuntimeError):
             pass
-
-        # Define class
-        # We must use type() to create the class dynamically
-        # Inherit from PropertyGroup
-        new_class = type(cls_name, (bpy.types.PropertyGroup,), {'__annotations__': cls_annotations})
-
-        # Register
         try:
-            bpy.utils.register_class(new_class)
-            CARTRIDGE_PROP_CLASSES[cart_id] = new_class
-        except ValueError:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
             pass
-        except Exception as e:
-            print(f"MASSA ERROR: Failed to register props for {cart_id}: {e}")
+        return
 
-def unregister_cartridge_props():
     for cls in CARTRIDGE_PROP_CLASSES.values():
         try:
             bpy.utils.unregister_class(cls)
@@ -1,185 +1,224 @@
 import bpy
 import bmesh
 import gpu
+import numpy as np
+from collections import OrderedDict
 from gpu_extras.batch import batch_for_shader
 from mathutils import Vector, Matrix
 import math
 from bpy.app.handlers import persistent
 
 # --- CACHE ---
-# structure: { obj_name: { slot_id: { "shape": "BOX", "lines": [...], "timestamp": 12345 } } }
-_collision_cache = {}
+# LRU keyed by (object session_uid, mesh session_uid, mesh revision).
+# structure: { key: { "slots": { slot_id: (points, edge_points) }, "lines": { (slot_id, shape): ndarray } } }
+# Renames do not touch session_uid, and geometry edits bump the mesh revision,
+# so stale entries simply stop matching and age out of the LRU.
+CACHE_LIMIT = 32
+_collision_cache = OrderedDict()
 
-def get_slot_geometry_lines(obj, slot_id, shape_type):
-    """
-    Returns a list of line segments (start, end, start, end...) for the given slot.
-    """
-    # 1. Check Cache
-    if obj.name in _collision_cache:
-        slot_cache = _collision_cache[obj.name].get(slot_id)
-        if slot_cache and slot_cache["shape"] == shape_type:
-            return slot_cache["lines"]
+# structure: { mesh_session_uid: revision }
+# [ARCHITECT FIX] Capped like the LRU: once over CACHE_LIMIT, revisions of meshes
+# with no cached entry left are dropped (nothing can match them anyway).
+_mesh_revisions = {}
 
-    # 2. Calculate
-    lines = _calculate_lines(obj, slot_id, shape_type)
 
-    # 3. Store
-    if obj.name not in _collision_cache:
-        _collision_cache[obj.name] = {}
-    _collision_cache[obj.name][slot_id] = {"shape": shape_type, "lines": lines}
+def _prune_revisions():
+    if len(_mesh_revisions) <= CACHE_LIMIT:
+        return
+    live = {key[1] for key in _collision_cache}
+    for mesh_uid in [uid for uid in _mesh_revisions if uid not in live]:
+        del _mesh_revisions[mesh_uid]
 
-    return lines
 
-def _calculate_lines(obj, slot_id, shape_type):
-    # This is heavy, so we do it carefully.
+def _cache_key(obj):
     mesh = obj.data
-    if not mesh: return []
+    mesh_uid = mesh.session_uid
+    return (obj.session_uid, mesh_uid, _mesh_revisions.get(mesh_uid, 0))
 
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.faces.ensure_lookup_table()
 
-    part_layer = bm.faces.layers.int.get("massa_part_id")
-    if not part_layer:
-        bm.free()
-        return []
+def _get_entry(obj):
+    key = _cache_key(obj)
+    entry = _collision_cache.get(key)
+    if entry is not None:
+        _collision_cache.move_to_end(key)
+        return entry
 
-    # Collect vertices for this slot
-    verts = set()
-    edges = set()
-    for f in bm.faces:
-        if f[part_layer] == slot_id:
-            for v in f.verts:
-                verts.add(v)
-            if shape_type == "MESH":
-                for e in f.edges:
-                    edges.add(e)
-
-    if not verts:
-        bm.free()
+    entry = {"slots": _scan_slots(obj.data), "lines": {}}
+    _collision_cache[key] = entry
+    while len(_collision_cache) > CACHE_LIMIT:
+        _collision_cache.popitem(last=False)
+    _prune_revisions()
+    return entry
+
+
+def get_slot_geometry_lines(obj, slot_id, shape_type):
+    """
+    Returns an (N, 3) float32 array of line segments (start, end, start, end...) for the given slot.
+    """
+    mesh = obj.data
+    if not mesh:
         return []
 
-    points = [v.co.copy() for v in verts]
-    # Keep BM alive for MESH processing if needed, else free now?
-    # Actually we can copy edge data now
-    mesh_lines = []
-    if shape_type == "MESH":
-        for e in edges:
-            mesh_lines.append(e.verts[0].co.copy())
-            mesh_lines.append(e.verts[1].co.copy())
+    # 1. Check Cache (one mesh scan serves every slot)
+    entry = _get_entry(obj)
+    line_key = (slot_id, shape_type)
+    if line_key in entry["lines"]:
+        return entry["lines"][line_key]
 
-    bm.free()  # Done with BMesh
+    # 2. Calculate
+    slot_geo = entry["slots"].get(slot_id)
+    if slot_geo is None:
+        lines = []
+    else:
+        lines = _calculate_lines(slot_geo[0], slot_geo[1], shape_type)
+
+    # 3. Store
+    entry["lines"][line_key] = lines
+    return lines
 
-    if not points:
+
+def _scan_slots(mesh):
+    """
+    Single bulk pass over the mesh. Splits vertex positions and edge segments
+    per 'massa_part_id' value using foreach_get instead of a BMesh per slot.
+    """
+    attr = mesh.attributes.get("massa_part_id")
+    if attr is None or attr.domain != "FACE" or not mesh.polygons:
+        return {}
+
+    n_faces = len(mesh.polygons)
+    n_loops = len(mesh.loops)
+
+    part_ids = np.empty(n_faces, dtype=np.int32)
+    attr.data.foreach_get("value", part_ids)
+    loop_totals = np.empty(n_faces, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    loop_verts = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_edges = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co.shape = (-1, 3)
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    edge_verts.shape = (-1, 2)
+
+    # Polygon loops are contiguous, so expanding face ids by loop_total yields per-loop ids
+    loop_parts = np.repeat(part_ids, loop_totals)
+
+    slots = {}
+    for slot_id in np.unique(part_ids):
+        mask = loop_parts == slot_id
+        points = co[np.unique(loop_verts[mask])]
+        edge_points = co[edge_verts[np.unique(loop_edges[mask])].ravel()]
+        slots[int(slot_id)] = (points, edge_points)
+    return slots
+
+
+def _circle(center, radius, axis_a, axis_b, segments):
+    """Line-list ring in the plane spanned by two axis indices."""
+    angles = np.linspace(0.0, 2.0 * math.pi, segments + 1)
+    ring = np.zeros((segments + 1, 3), dtype=np.float32)
+    ring[:, axis_a] = np.cos(angles) * radius
+    ring[:, axis_b] = np.sin(angles) * radius
+    ring += center
+    return np.stack((ring[:-1], ring[1:]), axis=1).reshape(-1, 3)
+
+
+def _calculate_lines(points, edge_points, shape_type):
+    if not len(points):
         return []
 
+    segments = 16
     lines = []
 
     if shape_type == "MESH":
-        lines = mesh_lines
+        lines = edge_points
 
     elif shape_type == "BOX":
         # AABB
-        min_v = Vector((min(p.x for p in points), min(p.y for p in points), min(p.z for p in points)))
-        max_v = Vector((max(p.x for p in points), max(p.y for p in points), max(p.z for p in points)))
+        min_v = points.min(axis=0)
+        max_v = points.max(axis=0)
 
         # 12 edges of a box
-        # Bottom
-        p0 = Vector((min_v.x, min_v.y, min_v.z))
-        p1 = Vector((max_v.x, min_v.y, min_v.z))
-        p2 = Vector((max_v.x, max_v.y, min_v.z))
-        p3 = Vector((min_v.x, max_v.y, min_v.z))
-        # Top
-        p4 = Vector((min_v.x, min_v.y, max_v.z))
-        p5 = Vector((max_v.x, min_v.y, max_v.z))
-        p6 = Vector((max_v.x, max_v.y, max_v.z))
-        p7 = Vector((min_v.x, max_v.y, max_v.z))
-
-        lines = [
-            p0, p1, p1, p2, p2, p3, p3, p0, # Bottom Loop
-            p4, p5, p5, p6, p6, p7, p7, p4, # Top Loop
-            p0, p4, p1, p5, p2, p6, p3, p7  # Pillars
+        corners = np.array(
+            [
+                [min_v[0], min_v[1], min_v[2]],
+                [max_v[0], min_v[1], min_v[2]],
+                [max_v[0], max_v[1], min_v[2]],
+                [min_v[0], max_v[1], min_v[2]],
+                [min_v[0], min_v[1], max_v[2]],
+                [max_v[0], min_v[1], max_v[2]],
+                [max_v[0], max_v[1], max_v[2]],
+                [min_v[0], max_v[1], max_v[2]],
+            ],
+            dtype=np.float32,
+        )
+        order = [
+            0, 1, 1, 2, 2, 3, 3, 0,  # Bottom Loop
+            4, 5, 5, 6, 6, 7, 7, 4,  # Top Loop
+            0, 4, 1, 5, 2, 6, 3, 7,  # Pillars
         ]
+        lines = corners[order]
 
     elif shape_type == "HULL":
         # Convex Hull
         bm_hull = bmesh.new()
         for p in points:
-            bm_hull.verts.new(p)
+            bm_hull.verts.new(Vector(p))
 
+        hull_lines = []
         try:
             bmesh.ops.convex_hull(bm_hull, input=bm_hull.verts)
             bm_hull.edges.ensure_lookup_table()
             for e in bm_hull.edges:
-                lines.append(e.verts[0].co.copy())
-                lines.append(e.verts[1].co.copy())
+                hull_lines.append(e.verts[0].co[:])
+                hull_lines.append(e.verts[1].co[:])
         except Exception:
             pass
         bm_hull.free()
+        lines = np.array(hull_lines, dtype=np.float32).reshape(-1, 3)
 
     elif shape_type == "SPHERE":
         # Bounding Sphere (Center + Radius)
-        min_v = Vector((min(p.x for p in points), min(p.y for p in points), min(p.z for p in points)))
-        max_v = Vector((max(p.x for p in points), max(p.y for p in points), max(p.z for p in points)))
-        center = (min_v + max_v) * 0.5
-        radius = 0.0
-        for p in points:
-            d = (p - center).length
-            if d > radius: radius = d
-
-        segments = 16
-        for axis in range(3):
-            for i in range(segments):
-                angle1 = (i / segments) * 2 * math.pi
-                angle2 = ((i + 1) / segments) * 2 * math.pi
-
-                v1 = Vector((0,0,0))
-                v2 = Vector((0,0,0))
-
-                if axis == 0: # XY
-                    v1.x, v1.y = math.cos(angle1) * radius, math.sin(angle1) * radius
-                    v2.x, v2.y = math.cos(angle2) * radius, math.sin(angle2) * radius
-                elif axis == 1: # XZ
-                    v1.x, v1.z = math.cos(angle1) * radius, math.sin(angle1) * radius
-                    v2.x, v2.z = math.cos(angle2) * radius, math.sin(angle2) * radius
-                else: # YZ
-                    v1.y, v1.z = math.cos(angle1) * radius, math.sin(angle1) * radius
-                    v2.y, v2.z = math.cos(angle2) * radius, math.sin(angle2) * radius
-
-                lines.append(center + v1)
-                lines.append(center + v2)
+        center = (points.min(axis=0) + points.max(axis=0)) * 0.5
+        radius = float(np.sqrt(((points - center) ** 2).sum(axis=1)).max())
+
+        lines = np.concatenate(
+            [
+                _circle(center, radius, 0, 1, segments),  # XY
+                _circle(center, radius, 0, 2, segments),  # XZ
+                _circle(center, radius, 1, 2, segments),  # YZ
+            ]
+        )
 
     elif shape_type == "CAPSULE":
         # Vertical Capsule (Z-Axis)
-        min_z = min(p.z for p in points)
-        max_z = max(p.z for p in points)
+        base_z = float(points[:, 2].min())
+        top_z = float(points[:, 2].max())
 
         # Radius in XY plane
-        center_xy = Vector(((min(p.x for p in points) + max(p.x for p in points))*0.5, (min(p.y for p in points) + max(p.y for p in points))*0.5, 0))
-        radius = 0.0
-        for p in points:
-            d = (Vector((p.x, p.y, 0)) - center_xy).length
-            if d > radius: radius = d
-
-        base_z = min_z
-        top_z = max_z
-        center = Vector((center_xy.x, center_xy.y, base_z))
-
-        for z in [base_z, top_z]:
-            c = Vector((center_xy.x, center_xy.y, z))
-            for i in range(segments):
-                angle1 = (i / segments) * 2 * math.pi
-                angle2 = ((i + 1) / segments) * 2 * math.pi
-                v1 = Vector((math.cos(angle1) * radius, math.sin(angle1) * radius, 0))
-                v2 = Vector((math.cos(angle2) * radius, math.sin(angle2) * radius, 0))
-                lines.append(c + v1)
-                lines.append(c + v2)
+        center_xy = (points[:, :2].min(axis=0) + points[:, :2].max(axis=0)) * 0.5
+        radius = float(np.sqrt(((points[:, :2] - center_xy) ** 2).sum(axis=1)).max())
 
+        parts = []
+        for z in (base_z, top_z):
+            c = np.array((center_xy[0], center_xy[1], z), dtype=np.float32)
+            parts.append(_circle(c, radius, 0, 1, segments))
+
+        pillars = []
         for i in range(4):
-            angle = (i/4) * 2 * math.pi
-            v = Vector((math.cos(angle) * radius, math.sin(angle) * radius, 0))
-            lines.append(Vector((center.x + v.x, center.y + v.y, base_z)))
-            lines.append(Vector((center.x + v.x, center.y + v.y, top_z)))
+            angle = (i / 4) * 2 * math.pi
+            x = center_xy[0] + math.cos(angle) * radius
+            y = center_xy[1] + math.sin(angle) * radius
+            pillars.append((x, y, base_z))
+            pillars.append((x, y, top_z))
+        parts.append(np.array(pillars, dtype=np.float32))
+
+        lines = np.concatenate(parts)
 
     return lines
 
@@ -201,16 +240,19 @@ def draw():
     if not obj or obj.type != 'MESH': return
 
     # Check Toggles
+    from .massa_properties import slot_value
     slots_to_draw = []
     for i in range(10):
-        if getattr(console, f"show_coll_{i}", False):
-            shape = getattr(console, f"collision_shape_{i}", "BOX")
+        if slot_value(console, i, "show_coll", False):
+            shape = slot_value(console, i, "collision_shape", "BOX")
             slots_to_draw.append((i, shape))
 
     if not slots_to_draw: return
 
     # Draw
-    matrix = obj.matrix_world
+    matrix = np.array(obj.matrix_world, dtype=np.float32)
+    rot = matrix[:3, :3].T
+    loc = matrix[:3, 3]
 
     _shader.bind()
     gpu.state.line_width_set(2)
@@ -219,8 +261,8 @@ def draw():
 
     for i, shape in slots_to_draw:
         lines = get_slot_geometry_lines(obj, i, shape)
-        if lines:
-            world_lines = [matrix @ p for p in lines]
+        if len(lines):
+            world_lines = lines @ rot + loc
 
             # Distinct Colors for Slots
             colors = [
@@ -248,9 +290,22 @@ def draw():
 @persistent
 def depsgraph_update_post(scene, depsgraph):
     for update in depsgraph.updates:
-        if update.id.name in _collision_cache:
-            if update.is_updated_geometry:
-                 del _collision_cache[update.id.name]
+        if not update.is_updated_geometry:
+            continue
+        id_data = getattr(update.id, "original", update.id)
+        if isinstance(id_data, bpy.types.Object):
+            if id_data.type != "MESH" or id_data.data is None:
+                continue
+            id_data = id_data.data
+        if not isinstance(id_data, bpy.types.Mesh):
+            continue
+
+        # Bump the revision so cached keys stop matching, and drop the dead entries now
+        mesh_uid = id_data.session_uid
+        _mesh_revisions[mesh_uid] = _mesh_revisions.get(mesh_uid, 0) + 1
+        for key in [k for k in _collision_cache if k[1] == mesh_uid]:
+            del _collision_cache[key]
+    _prune_revisions()
 
 def register():
     global _handler
@@ -268,3 +323,6 @@ def unregister():
 
     if depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
+
+    _collision_cache.clear()
+    _mesh_revisions.clear()
@@ -1,19 +1,33 @@
 import bpy
+import itertools
 from bpy.props import PointerProperty, EnumProperty, IntProperty, BoolProperty, FloatVectorProperty
-from .massa_properties import MassaPropertiesMixin
+from bpy.app.handlers import persistent
+from .massa_properties import MassaPropertiesMixin, MASSA_PG_SlotConfig, SLOT_COUNT, ensure_slots
+
+_CARTRIDGE_ITEMS = []
+
 
 def get_cartridge_items(self, context):
-    try:
-        from .cartridges import MODULES
-    except ImportError:
-        return []
-
-    items = []
-    for i, mod in enumerate(MODULES):
-        meta = mod.CARTRIDGE_META
-        # Identifier, Name, Description, Icon, ID
-        items.append((meta["id"], meta["name"], meta.get("description", ""), meta.get("icon", "MESH_CUBE"), i))
-    return items
+    # [ARCHITECT NEW] Read from the manifest: listing must not import cartridges.
+    # Cached at module level (Blender also needs the strings kept alive).
+    if not _CARTRIDGE_ITEMS:
+        try:
+            from .cartridges import MANIFEST
+        except ImportError:
+            return []
+
+        for i, meta in enumerate(MANIFEST):
+            # Identifier, Name, Description, Icon, ID
+            _CARTRIDGE_ITEMS.append((meta["id"], meta["name"], meta.get("description", ""), meta.get("icon", "MESH_CUBE"), i))
+    return _CARTRIDGE_ITEMS
+
+
+def update_staged_cartridge(self, context):
+    # Load on staging so its parameters can be drawn and shot right away
+    from . import cartridges
+
+    cartridges.load(self.massa_staged_cartridge)
+
 
 class Massa_Console_Props(bpy.types.PropertyGroup, MassaPropertiesMixin):
     """
@@ -114,29 +128,89 @@ class Massa_Console_Props(bpy.types.PropertyGroup, MassaPropertiesMixin):
         name="Staged Cartridge",
         items=get_cartridge_items,
         description="Cartridge to generate in Point & Shoot mode",
+        update=update_staged_cartridge,
     )
 
 
-def register():
-    # Dynamic Property Generation
-    from .massa_cartridge_props import register_cartridge_props, CARTRIDGE_PROP_CLASSES
-    register_cartridge_props()
+# --- SYNC REVISION ---
+# Runtime revision per scene, bumped whenever the Console may have changed:
+# UI edits (msgbus), operator write-backs, undo/redo and file load (reset).
+# Operators remember the revision they last mirrored and skip the
+# Console -> Operator sync while it still matches. Values come from one
+# session-wide counter, so a remembered revision never matches another state.
+_REVISIONS = {}  # scene.as_pointer() -> revision
+_REV_COUNTER = itertools.count(1)
+_MSGBUS_OWNER = object()
+
+
+def console_revision(scene):
+    """Current revision of the scene's Console (0 = unknown, always sync)."""
+    return _REVISIONS.get(scene.as_pointer(), 0)
+
+
+def bump_console_revision(scene):
+    rev = next(_REV_COUNTER)
+    _REVISIONS[scene.as_pointer()] = rev
+    return rev
 
-    # Inject PointerProperties into Console Props
-    # This allows persistent storage of per-cartridge parameters
-    for cart_id, cls in CARTRIDGE_PROP_CLASSES.items():
-        safe_id = cart_id.replace(".", "_").replace("-", "_")
-        prop_name = f"props_{safe_id}"
-        Massa_Console_Props.__annotations__[prop_name] = PointerProperty(type=cls)
 
+def _on_console_edit(*_args):
+    scene = getattr(bpy.context, "scene", None)
+    if scene is not None:
+        bump_console_revision(scene)
+
+
+def _subscribe_console_edits():
+    # Subscriptions do not survive file loads: re-done from init_console_slots
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
+    for struct in (Massa_Console_Props, MASSA_PG_SlotConfig):
+        bpy.msgbus.subscribe_rna(key=struct, owner=_MSGBUS_OWNER, args=(), notify=_on_console_edit)
+
+
+@persistent
+def reset_console_revisions(_dummy=None):
+    """Undo/redo swap Console data without any notification."""
+    _REVISIONS.clear()
+
+
+@persistent
+def init_console_slots(_dummy=None):
+    """Populates (and migrates legacy flat slot props of) every scene console."""
+    _REVISIONS.clear()
+    _subscribe_console_edits()
+    for scene in bpy.data.scenes:
+        console = getattr(scene, "massa_console", None)
+        if console is not None and len(console.slots) < SLOT_COUNT:
+            ensure_slots(console)
+
+
+def register():
+    # Slot items first: the console and every operator hold a collection of them
+    bpy.utils.register_class(MASSA_PG_SlotConfig)
+
+    # Per-cartridge PointerProperties (props_{cart_id}) are attached lazily by
+    # massa_cartridge_props.register_cartridge_props when a cartridge loads.
     bpy.utils.register_class(Massa_Console_Props)
     bpy.types.Scene.massa_console = PointerProperty(type=Massa_Console_Props)
 
+    bpy.app.handlers.load_post.append(init_console_slots)
+    bpy.app.handlers.undo_post.append(reset_console_revisions)
+    bpy.app.handlers.redo_post.append(reset_console_revisions)
+    bpy.app.timers.register(init_console_slots, first_interval=0.1)  # Startup file
+
 
 def unregister():
+    if init_console_slots in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(init_console_slots)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_console_revisions in handlers:
+            handlers.remove(reset_console_revisions)
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
+    _REVISIONS.clear()
     if hasattr(bpy.types.Scene, "massa_console"):
         del bpy.types.Scene.massa_console
     bpy.utils.unregister_class(Massa_Console_Props)
 
     from .massa_cartridge_props import unregister_cartridge_props
     unregister_cartridge_props()
+    bpy.utils.unregister_class(MASSA_PG_SlotConfig)
@@ -0,0 +1,91 @@
+import bpy
+
+# Rigid Body World collection names (matches Blender's own defaults)
+RBW_COLLECTION = "RigidBodyWorld"
+RBC_COLLECTION = "RigidBodyConstraints"
+
+
+def ensure_rigidbody_world(context):
+    """
+    Returns the scene's Rigid Body World, creating it (and its collections) once.
+    """
+    scene = context.scene
+    rbw = scene.rigidbody_world
+    if rbw is None:
+        # No data API exists for world creation; a single scoped operator call is unavoidable.
+        with context.temp_override(scene=scene):
+            bpy.ops.rigidbody.world_add()
+        rbw = scene.rigidbody_world
+
+    if rbw.collection is None:
+        rbw.collection = bpy.data.collections.get(RBW_COLLECTION) or bpy.data.collections.new(RBW_COLLECTION)
+    if rbw.constraints is None:
+        rbw.constraints = bpy.data.collections.get(RBC_COLLECTION) or bpy.data.collections.new(RBC_COLLECTION)
+    return rbw
+
+
+class ConstraintBatch:
+    """
+    PHASE 4: BATCHED CONSTRAINT BUILDER
+    Collects rigid-body constraint requests and attaches them in one pass:
+    the world is created once, every empty is linked into the world's
+    constraint collection, a single depsgraph update lets Blender allocate
+    the constraint settings, then all settings are written through RBNA.
+    No selection or active-object changes are made, so it is safe headless.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.pending = []
+
+    def add(self, empty, con_type, object1=None, object2=None, breaking_threshold=None):
+        self.pending.append((empty, con_type, object1, object2, breaking_threshold))
+
+    def commit(self):
+        if not self.pending:
+            return []
+
+        rbw = ensure_rigidbody_world(self.context)
+        rbc_coll = rbw.constraints
+
+        # 1. Link all constraint empties (Blender creates the settings on evaluation)
+        for empty, *_ in self.pending:
+            if empty.name not in rbc_coll.objects:
+                rbc_coll.objects.link(empty)
+        self.context.view_layer.update()
+
+        # 2. Configure via data API
+        created = []
+        for empty, con_type, object1, object2, threshold in self.pending:
+            rbc = empty.rigid_body_constraint
+            if rbc is None:
+                rbc = self._fallback_add(empty, con_type)
+            if rbc is None:
+                print(f"Massa Constraint Error: {empty.name} has no rigid body constraint")
+                continue
+            try:
+                rbc.type = con_type
+                rbc.object1 = object1
+                rbc.object2 = object2
+                if threshold is not None:
+                    rbc.use_breaking = True
+                    rbc.breaking_threshold = threshold
+                created.append(empty)
+            except Exception as e:
+                print(f"Massa Constraint Error ({empty.name}): {e}")
+
+        self.pending.clear()
+        return created
+
+    def _fallback_add(self, empty, con_type):
+        # Older builds may not allocate settings for linked objects; scope the
+        # operator to this empty without touching the user's selection.
+        try:
+            with self.context.temp_override(
+                object=empty, active_object=empty, selected_objects=[empty]
+            ):
+                bpy.ops.rigidbody.constraint_add(type=con_type)
+        except Exception as e:
+            print(f"Massa Constraint Fallback Error ({empty.name}): {e}")
+            return None
+        return empty.rigid_body_constraint
@@ -0,0 +1,184 @@
+import bpy
+import numpy as np
+
+# Temporary int layers used to find appended elements (names must differ per domain)
+EMIT_VERT_MARKER = "massa_emit_v"
+EMIT_FACE_MARKER = "massa_emit_f"
+
+
+def _face_layout(faces):
+    """
+    Flattens one (F, K) index array, or a list of them with different K
+    (e.g. quads + triangle fans), into (loop_verts, loop_starts, sizes).
+    """
+    blocks = [faces] if isinstance(faces, np.ndarray) else list(faces)
+    blocks = [np.asarray(b, dtype=np.int32).reshape(len(b), -1) for b in blocks if len(b)]
+    if not blocks:
+        empty = np.zeros(0, dtype=np.int32)
+        return empty, empty, empty
+
+    sizes = np.concatenate([np.full(len(b), b.shape[1], dtype=np.int32) for b in blocks])
+    loops = np.concatenate([b.ravel() for b in blocks])
+    starts = np.zeros(len(sizes), dtype=np.int32)
+    np.cumsum(sizes[:-1], out=starts[1:])
+    return loops, starts, sizes
+
+
+def _match_edges(edge_verts, n_verts, pairs):
+    """
+    Maps vertex pairs to mesh edge indices (order-insensitive).
+    Returns (edge_index, pair_mask) for the pairs that exist.
+    """
+    ev = np.asarray(edge_verts, dtype=np.int64).reshape(-1, 2)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    key_mesh = ev.min(axis=1) * n_verts + ev.max(axis=1)
+    key_req = pairs.min(axis=1) * n_verts + pairs.max(axis=1)
+    if not len(key_mesh):
+        return np.zeros(0, dtype=np.int64), np.zeros(len(key_req), dtype=bool)
+
+    order = np.argsort(key_mesh)
+    sorted_keys = key_mesh[order]
+    pos = np.minimum(np.searchsorted(sorted_keys, key_req), len(sorted_keys) - 1)
+    found = sorted_keys[pos] == key_req
+    return order[pos[found]], found
+
+
+def grid_quads(nx, ny):
+    """
+    (nx * ny, 4) quads over an (ny + 1) x (nx + 1) vertex lattice where vertex
+    (ix, iy) is at iy * (nx + 1) + ix. Wound CCW seen from +Z.
+    """
+    row = nx + 1
+    ix, iy = np.meshgrid(np.arange(nx), np.arange(ny))
+    a = (iy * row + ix).ravel()
+    return np.stack((a, a + 1, a + 1 + row, a + row), axis=-1)
+
+
+def grid_perimeter(nx, ny):
+    """(E, 2) vertex pairs of the outer boundary of the same lattice."""
+    idx = np.arange((nx + 1) * (ny + 1)).reshape(ny + 1, nx + 1)
+    lines = (idx[0], idx[-1], idx[:, 0], idx[:, -1])
+    return np.vstack([np.stack((ln[:-1], ln[1:]), axis=-1) for ln in lines])
+
+
+def _broadcast(value, count, dtype):
+    arr = np.asarray(value, dtype=dtype)
+    if arr.ndim == 0:
+        arr = np.full(count, arr, dtype=dtype)
+    return arr
+
+
+def fill_mesh(me, verts, faces, material_index=0, smooth=True, uvs=None,
+              edge_slots=None, seams=None, face_ints=None, uv_name="UVMap"):
+    """
+    Writes arrays into an EMPTY Mesh datablock with foreach_set (same layout
+    as emit). Used directly for objects that skip the BMesh pipeline.
+    """
+    verts = np.asarray(verts, dtype=np.float32).reshape(-1, 3)
+    loops, starts, sizes = _face_layout(faces)
+    n_v, n_f, n_l = len(verts), len(sizes), len(loops)
+
+    me.vertices.add(n_v)
+    me.vertices.foreach_set("co", verts.ravel())
+    me.loops.add(n_l)
+    me.loops.foreach_set("vertex_index", loops)
+    me.polygons.add(n_f)
+    me.polygons.foreach_set("loop_start", starts)
+    try:
+        me.polygons.foreach_set("loop_total", sizes)
+    except (AttributeError, TypeError, RuntimeError):
+        pass  # Read-only on newer builds (derived from loop_start)
+    me.polygons.foreach_set("material_index", _broadcast(material_index, n_f, np.int32))
+    me.polygons.foreach_set("use_smooth", _broadcast(smooth, n_f, bool))
+
+    if uvs is not None:
+        uv_layer = me.uv_layers.new(name=uv_name)
+        uv_layer.data.foreach_set("uv", np.asarray(uvs, dtype=np.float32).ravel())
+
+    for name, values in (face_ints or {}).items():
+        attr = me.attributes.new(name, "INT", "FACE")
+        attr.data.foreach_set("value", _broadcast(values, n_f, np.int32))
+
+    me.update(calc_edges=True)
+
+    if edge_slots is not None or seams is not None:
+        ev = np.empty(len(me.edges) * 2, dtype=np.int32)
+        me.edges.foreach_get("vertices", ev)
+
+        if edge_slots is not None and len(edge_slots):
+            rows = np.asarray(edge_slots, dtype=np.int64).reshape(-1, 3)
+            idx, found = _match_edges(ev, n_v, rows[:, :2])
+            values = np.zeros(len(me.edges), dtype=np.int32)
+            values[idx] = rows[found, 2]
+            attr = me.attributes.new("MASSA_EDGE_SLOTS", "INT", "EDGE")
+            attr.data.foreach_set("value", values)
+
+        if seams is not None and len(seams):
+            idx, _found = _match_edges(ev, n_v, seams)
+            flags = np.zeros(len(me.edges), dtype=bool)
+            flags[idx] = True
+            me.edges.foreach_set("use_seam", flags)
+
+    return n_v, n_f
+
+
+def emit(bm, verts, faces, material_index=0, smooth=True, uvs=None,
+         edge_slots=None, seams=None, face_ints=None, want_elements=False):
+    """
+    BULK MESH EMISSION
+    verts:          (N, 3) float array
+    faces:          (F, K) int array, or a list of blocks with different K
+    material_index: int or (F,) per face
+    smooth:         bool or (F,) per face
+    uvs:            (L, 2) per face corner, in face order
+    edge_slots:     (E, 3) rows of (vert_a, vert_b, slot) -> MASSA_EDGE_SLOTS
+    seams:          (S, 2) vertex pairs marked as UV seams
+    face_ints:      {layer_name: int or (F,)} face int layers (e.g. MAT_TAG)
+
+    Arrays are written into a scratch Mesh with foreach_set and appended to bm
+    in one from_mesh call. With want_elements=True returns (verts, faces) as
+    BMesh element lists in input order.
+    """
+    had_geometry = len(bm.verts) > 0
+    uv_active = bm.loops.layers.uv.active
+    uv_name = uv_active.name if uv_active else "UVMap"
+
+    me = bpy.data.meshes.new("Massa_Emit_Tmp")
+    try:
+        n_v, n_f = fill_mesh(
+            me, verts, faces,
+            material_index=material_index, smooth=smooth, uvs=uvs,
+            edge_slots=edge_slots, seams=seams, face_ints=face_ints, uv_name=uv_name,
+        )
+
+        if want_elements and had_geometry:
+            # Appended elements may land in recycled slots; tag them to find them
+            me.attributes.new(EMIT_VERT_MARKER, "INT", "POINT").data.foreach_set(
+                "value", np.arange(1, n_v + 1, dtype=np.int32))
+            me.attributes.new(EMIT_FACE_MARKER, "INT", "FACE").data.foreach_set(
+                "value", np.arange(1, n_f + 1, dtype=np.int32))
+
+        bm.from_mesh(me)
+    finally:
+        bpy.data.meshes.remove(me)
+
+    if not want_elements:
+        return None
+
+    if not had_geometry:
+        bm.verts.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+        return list(bm.verts), list(bm.faces)
+
+    return _collect(bm.verts, n_v, EMIT_VERT_MARKER), _collect(bm.faces, n_f, EMIT_FACE_MARKER)
+
+
+def _collect(seq, count, marker):
+    layer = seq.layers.int.get(marker)
+    out = [None] * count
+    for ele in seq:
+        k = ele[layer]
+        if k:
+            out[k - 1] = ele
+    seq.layers.int.remove(layer)
+    return out
@@ -1,9 +1,11 @@
 import bpy
 import bmesh
 from mathutils import Euler, Vector, Matrix
-from . import massa_polish, massa_surface, massa_sockets, seam_solvers, massa_nodes
+from . import massa_polish, massa_surface, massa_sockets, seam_solvers, massa_nodes, massa_constraints
+from . import massa_instances, massa_properties, massa_params, massa_inplace, massa_mesh_cache
 from ..utils import mat_utils
 import traceback
+import time
 
 
 def _verify_layer(bm, attr_name, internal_name):
@@ -69,12 +71,27 @@ def run_pipeline(op, context):
     
     meta = op._get_cartridge_meta()
     flags = meta.get("flags", {})
+
+    # [ARCHITECT NEW] Persistent mesh cache: identical settings reuse stored arrays
+    cache_key = massa_mesh_cache.key_for(op, flags)
+    cached = massa_mesh_cache.load(cache_key)
+    if cached is not None:
+        return _replay_cached(op, context, cache_key, cached)
+
+    started = time.perf_counter()
     bm = bmesh.new()
 
     # [ARCHITECT NEW] Phase 3: Socket Layer
     # This allows Cartridges to tag faces for socket generation using pure math.
     bm.faces.layers.int.get("MASSA_SOCKETS") or bm.faces.layers.int.new("MASSA_SOCKETS")
 
+    # [ARCHITECT NEW] Instanced Output: stamp_parts() records instead of realizing
+    massa_instances.begin(op)
+
+    # Everything the pipeline does to bm as a whole (scale, pivot, rotation),
+    # replayed onto instances so they land where realized copies would.
+    out_matrix = Matrix.Identity(4)
+
     try:
         op.build_shape(bm)
 
@@ -92,8 +109,14 @@ def run_pipeline(op, context):
 
         if abs(op.global_scale - 1.0) > 0.001:
             bmesh.ops.scale(bm, vec=(op.global_scale,) * 3, verts=bm.verts)
+            out_matrix = Matrix.Diagonal((op.global_scale,) * 3).to_4x4()
         if not flags.get("LOCK_PIVOT", False):
-            massa_polish.apply_transform_alignment(bm, op.pivot_mode)
+            # Recorded instances count too: chain/scaffolding may realize nothing
+            offset = massa_polish.apply_transform_alignment(
+                bm, op.pivot_mode, massa_instances.recorded_bounds(op, out_matrix)
+            )
+            if offset is not None:
+                out_matrix = Matrix.Translation(offset) @ out_matrix
 
         manifest, active_sockets = massa_surface.gather_manifest(op)
         massa_polish.apply_protection_mask(bm, manifest)
@@ -122,7 +145,15 @@ def run_pipeline(op, context):
         stats["global_mass"] = mass
 
         context.scene["massa_temp_stats"] = {str(k): v for k, v in stats.items()}
-        socket_data = massa_sockets.calculate_transforms(bm, active_sockets)
+
+        # [ARCHITECT NEW] One face scan shared by slot sockets and the MASSA_SOCKETS layer
+        face_data = None
+        layer_sockets = []
+        if active_sockets or getattr(op, "sock_enable", False):
+            face_data = massa_sockets.analyze_faces(bm)
+        socket_data = massa_sockets.calculate_transforms(bm, active_sockets, face_data=face_data)
+        if getattr(op, "sock_enable", False):
+            layer_sockets = massa_sockets.collect_layer_sockets(face_data)
 
         viz_mode = getattr(op, "viz_edge_mode", "NATIVE")
         if not op.draft_mode or viz_mode == "SLOTS":
@@ -170,49 +201,58 @@ def run_pipeline(op, context):
             massa_surface.generate_surface_maps(bm, op, cvx, cnv)
 
         if op.ui_use_rot:
+            rot_mat = Euler(op.rotation, "XYZ").to_matrix().to_4x4()
             bmesh.ops.transform(
                 bm,
-                matrix=Euler(op.rotation, "XYZ").to_matrix().to_4x4(),
+                matrix=rot_mat,
                 verts=bm.verts,
             )
-        _generate_output(op, context, bm, socket_data, manifest)
+            # Layer sockets were measured pre-rotation; carry them along
+            rot_3x3 = rot_mat.to_3x3()
+            out_matrix = rot_mat @ out_matrix
+            layer_sockets = [
+                (sid, rot_3x3 @ center, (rot_3x3 @ normal).normalized())
+                for sid, center, normal in layer_sockets
+            ]
+        cache_meta = None
+        if cache_key:
+            cache_meta = massa_mesh_cache.describe(
+                stats, socket_data, layer_sockets, time.perf_counter() - started
+            )
+        _generate_output(
+            op, context, bm, socket_data, manifest,
+            layer_sockets=layer_sockets, out_matrix=out_matrix,
+            cache_key=cache_key, cache_meta=cache_meta,
+        )
 
     except Exception as e:
         op.report({"ERROR"}, f"Pipeline Error: {e}")
         traceback.print_exc()
+        massa_inplace.abort(op)
         if bm:
             bm.free()
         return {"CANCELLED"}
     return {"FINISHED"}
 
 
-def _capture_operator_params(op):
-    """
-    Serializes all custom properties of the operator into a dictionary.
-    Excludes standard Blender properties and internal methods.
-    """
-    params = {}
-
-    # Iterate over all RNA properties defined in the operator
-    for prop in op.bl_rna.properties:
-        if prop.is_readonly:
-            continue
-        if prop.identifier in {"bl_idname", "bl_label", "bl_description", "bl_options", "rna_type"}:
-            continue
-
-        try:
-            val = getattr(op, prop.identifier)
-            # Convert mathutils types to lists/tuples for JSON compatibility
-            if hasattr(val, "to_tuple"):
-                val = val.to_tuple()
-            elif hasattr(val, "to_list"):
-                val = val.to_list()
-
-            params[prop.identifier] = val
-        except:
-            pass
-
-    return params
+def _replay_cached(op, context, cache_key, cached):
+    """Output from a mesh cache entry: skips the BMesh pipeline, replays the object stage."""
+    arrays, meta = cached
+    try:
+        massa_instances.begin(op)
+        manifest, _active = massa_surface.gather_manifest(op)
+        context.scene["massa_temp_stats"] = meta.get("stats", {})
+        _generate_output(
+            op, context, None, massa_mesh_cache.socket_data(meta), manifest,
+            layer_sockets=massa_mesh_cache.layer_sockets(meta), cached=cached,
+        )
+    except Exception as e:
+        op.report({"ERROR"}, f"Pipeline Error (cached mesh): {e}")
+        traceback.print_exc()
+        massa_inplace.abort(op)
+        massa_mesh_cache.discard(cache_key)
+        return {"CANCELLED"}
+    return {"FINISHED"}
 
 
 def _run_polish_stack(bm, op, flags, manifest):
@@ -273,9 +313,47 @@ def _run_polish_stack(bm, op, flags, manifest):
         )
 
 
-def _generate_output(op, context, bm, socket_data, manifest):
+def _merge_instances(op, bm, manifest, groups, out_matrix):
+    """
+    Builds the prototype BMesh, gives it the same edge/identity passes the
+    realized mesh got, and appends it (plus carrier points) to bm.
+    Returns the per-instance transform table.
+    """
+    uv_active = bm.loops.layers.uv.active
+    pbm = massa_instances.build_prototypes(groups, uv_active.name if uv_active else "UVMap")
+
+    if not pbm.edges.layers.int.get("MASSA_EDGE_SLOTS"):
+        pbm.edges.layers.int.new("MASSA_EDGE_SLOTS")
+    if getattr(op, "edge_auto_detect", True):
+        massa_surface.auto_detect_edge_slots(pbm)
+    process_edge_slots(pbm, op)
+    massa_surface.auto_detect_sharp_edges(pbm, op)
+    bmesh.ops.recalc_face_normals(pbm, faces=pbm.faces)
+    massa_surface.write_identity_layers(pbm, manifest, op)
+
+    return massa_instances.merge_into(bm, pbm, groups, out_matrix)
+
+
+def _generate_output(op, context, bm, socket_data, manifest, layer_sockets=None, out_matrix=None,
+                     cache_key=None, cache_meta=None, cached=None):
+    """
+    Mesh + object stage. With cached=(arrays, meta) from massa_mesh_cache
+    (bm is None) the mesh comes from the cache; otherwise cache_key/cache_meta
+    store the finished mesh for later runs.
+    """
+    # [ARCHITECT NEW] Instanced Output: prototypes + carrier points join the mesh
+    # BEFORE material assignment so their slots are created and remapped too.
+    instance_groups = massa_instances.take_groups(op)
+    instance_table = None
+    if instance_groups and cached is None:
+        instance_table = _merge_instances(
+            op, bm, manifest, instance_groups, out_matrix or Matrix.Identity(4)
+        )
+
     has_bevel = False
-    if bm.edges.layers.float.get("bevel_weight_edge") or bm.edges.layers.float.get(
+    if cached is not None:
+        has_bevel = cached[1].get("has_bevel", False)
+    elif bm.edges.layers.float.get("bevel_weight_edge") or bm.edges.layers.float.get(
         "bevel_weight"
     ):
         has_bevel = True
@@ -311,51 +389,61 @@ def _generate_output(op, context, bm, socket_data, manifest):
     #    except KeyError:
     #        pass
 
-    mesh = bpy.data.meshes.new("Massa_Obj")
-    obj = bpy.data.objects.new(op.bl_label, mesh)
+    # [ARCHITECT NEW] In-place resurrection: regenerate into the old object's Mesh
+    obj = massa_inplace.begin(op, op.bl_label)
+    reused = obj is not None
+    if reused:
+        mesh = obj.data
+        massa_inplace.prepare_modifiers(obj, [
+            name for name, wanted in (
+                ("Massa_Instances", instance_table is not None),
+                ("Massa_Bevel", has_bevel and viz_mode != "SLOTS"),
+                ("Massa_Fuse", op.pol_fuse_active),
+                ("Massa_Edge_Viz", viz_mode == "SLOTS"),
+            ) if wanted
+        ])
+    else:
+        mesh = bpy.data.meshes.new("Massa_Obj")
+        obj = bpy.data.objects.new(op.bl_label, mesh)
 
     # [ARCHITECT FIX] MATERIAL ASSIGNMENT (Moved up to support Slot Selection)
     # Must be done BEFORE bm.to_mesh() to preserve face material indices (0-9).
     # If slots are missing on the target mesh, to_mesh() clamps indices to 0.
     # [ARCHITECT FIX] Now returns a slot map for remapped indices
-    slot_map = massa_surface.assign_materials(obj, op, bm=bm)
+    if cached is not None:
+        slot_map = massa_surface.assign_materials(obj, op, used_slots=cached[1].get("slots", []))
+    else:
+        slot_map = massa_surface.assign_materials(obj, op, bm=bm)
 
-    # [ARCHITECT NEW] Phase 3 Protocol: Data Layers (Chaos / Soft Body)
-    massa_surface.bake_strain_map(bm, op)
-    massa_surface.bake_kinematic_anchors(obj, bm, op)
+        # [ARCHITECT NEW] Phase 3 Protocol: Data Layers (Chaos / Soft Body)
+        massa_surface.bake_strain_map(bm, op)
+        massa_surface.bake_kinematic_anchors(obj, bm, op)
 
-    # [ARCHITECT NEW] Phase 4: Socket Collection (BMesh Based)
+    # [ARCHITECT NEW] Phase 4: Socket Collection (shared face scan, see massa_sockets.analyze_faces)
     collected_sockets = []
-    if getattr(op, "sock_enable", False):
-        try:
-            sock_layer = bm.faces.layers.int.get("MASSA_SOCKETS")
-            if sock_layer:
-                socket_faces = {}
-                for f in bm.faces:
-                    sid = f[sock_layer]
-                    if sid > 0:
-                        socket_faces.setdefault(sid, []).append(f)
-
-                for sid, faces in socket_faces.items():
-                    center = Vector((0,0,0))
-                    normal = Vector((0,0,0))
-                    for f in faces:
-                        center += f.calc_center_median()
-                        normal += f.normal
-                    if len(faces) > 0:
-                        center /= len(faces)
-                        normal = normal.normalized()
-                    collected_sockets.append((sid, center, normal))
-        except Exception as e:
-            print(f"Socket Collection Error: {e}")
+    if getattr(op, "sock_enable", False) and layer_sockets:
+        collected_sockets = layer_sockets
 
-    bm.to_mesh(mesh)
-    bm.free()
+    if cached is not None:
+        massa_mesh_cache.restore_mesh(mesh, cached[0])
+    else:
+        bm.to_mesh(mesh)
+        bm.free()
 
     if mesh.uv_layers:
         mesh.uv_layers[0].name = "UVMap"
 
-    context.collection.objects.link(obj)
+    if not reused:
+        context.collection.objects.link(obj)
+
+    # [ARCHITECT NEW] Instance Set modifier goes first so the rest of the stack sees instances
+    if instance_table is not None:
+        try:
+            massa_instances.write_point_attributes(mesh, instance_table)
+            mod_inst = massa_inplace.modifier(obj, "Massa_Instances", "NODES")
+            mod_inst.node_group = massa_nodes.get_or_create_instance_tree(len(instance_groups))
+        except Exception as e:
+            print(f"Massa Instance Error: {e}")
 
     bpy.ops.object.select_all(action="DESELECT")
     context.view_layer.objects.active = obj
@@ -377,17 +465,18 @@ def _generate_output(op, context, bm, socket_data, manifest):
         
     obj["massa_op_id"] = op_id
 
-    # [ARCHITECT NEW] Save Parameters for Resurrection
+    # [ARCHITECT NEW] Save Parameters for Resurrection (sparse, versioned)
     try:
-        obj["MASSA_PARAMS"] = _capture_operator_params(op)
+        massa_params.write(obj, op)
     except Exception as e:
         print(f"Massa Save Error: {e}")
 
-    for p in mesh.polygons:
-        p.use_smooth = True
+    if cached is None:
+        for p in mesh.polygons:
+            p.use_smooth = True
 
     if has_bevel and viz_mode != "SLOTS":
-        mod = obj.modifiers.new("Massa_Bevel", "BEVEL")
+        mod = massa_inplace.modifier(obj, "Massa_Bevel", "BEVEL")
         mod.limit_method = "WEIGHT"
         mod.width = 0.01 * getattr(op, "global_scale", 1.0)
         mod.segments = 2
@@ -412,6 +501,10 @@ def _generate_output(op, context, bm, socket_data, manifest):
     if force_auto_unwrap:
         allow_unwrap = True
 
+    # Cached meshes already carry their final UVs
+    if cached is not None:
+        needs_unwrap = allow_unwrap = False
+
     # 1. Standard Per-Slot Unwrap (LSCM / Conformal)
     # We allow this to run naturally so we respect 'UNWRAP' vs 'BOX' vs 'SKIP'
     if needs_unwrap and allow_unwrap:
@@ -495,8 +588,18 @@ def _generate_output(op, context, bm, socket_data, manifest):
             print(f"Auto Pack Error: {e}")
         bpy.ops.object.mode_set(mode="OBJECT")
 
+    # [ARCHITECT NEW] Final mesh arrays go to the persistent cache (instanced
+    # output needs its prototype tables and is not cached)
+    if cache_key and cache_meta is not None and instance_table is None:
+        massa_mesh_cache.store(cache_key, mesh, dict(
+            cache_meta,
+            slots=[old for old, _new in sorted(slot_map.items(), key=lambda kv: kv[1])],
+            has_bevel=has_bevel,
+        ))
+
     massa_sockets.spawn_socket_objects(
-        obj, socket_data, manifest, op.global_scale, op.ui_use_rot, op.rotation
+        obj, socket_data, manifest, op.global_scale, op.ui_use_rot, op.rotation,
+        claim=lambda name, kind: massa_inplace.claim(op, name, kind),
     )
 
     if debug_mode == "SEAM":
@@ -509,7 +612,7 @@ def _generate_output(op, context, bm, socket_data, manifest):
 
     if op.pol_fuse_active:
         massa_polish.apply_sdf_fuse(obj, op)
-    should_apply = any(getattr(op, f"sep_{i}", False) for i in range(10))
+    should_apply = massa_properties.any_slot(op, "sep")
     if should_apply and op.pol_fuse_active:
         if not obj.select_get():
             obj.select_set(True)
@@ -529,7 +632,7 @@ def _generate_output(op, context, bm, socket_data, manifest):
             viz_tree = massa_nodes.get_or_create_viz_overlay_tree()
 
             # 2. Add Modifier (Always Last)
-            mod_viz = obj.modifiers.new("Massa_Edge_Viz", "NODES")
+            mod_viz = massa_inplace.modifier(obj, "Massa_Edge_Viz", "NODES")
             mod_viz.node_group = viz_tree
 
             # 3. Assign the 'Neutral/Clay' material to the GN 'Material' input
@@ -541,7 +644,11 @@ def _generate_output(op, context, bm, socket_data, manifest):
         except Exception as e:
             print(f"Massa Viz Error: {e}")
 
-    massa_polish.handle_separation(obj, op, manifest, context, slot_map=slot_map)
+    # Separation and UCX read the raw mesh, where prototypes sit at the origin
+    if instance_table is None:
+        massa_polish.handle_separation(obj, op, manifest, context, slot_map=slot_map)
+    elif massa_properties.any_slot(op, "sep") or getattr(op, "phys_gen_ucx", False):
+        print("Massa Instances: Slot separation / UCX need Realized output; skipped.")
 
     context.view_layer.objects.active = obj
     if is_debug_override:
@@ -566,11 +673,13 @@ def _generate_output(op, context, bm, socket_data, manifest):
             context.space_data.shading.type = "MATERIAL"
 
     # [ARCHITECT NEW] Phase 4 Protocol: Physics Volumes & Socket Forge
+    # All rigid-body constraints (auto-rig + sockets) are attached in one batched pass.
+    constraints = massa_constraints.ConstraintBatch(context)
     try:
-        if getattr(op, "phys_gen_ucx", False):
+        if getattr(op, "phys_gen_ucx", False) and instance_table is None:
             phys_gen_ucx(obj, op, manifest, slot_map)
         if getattr(op, "phys_auto_rig", False):
-            phys_auto_rig(obj, op, manifest)
+            phys_auto_rig(obj, op, manifest, constraints=constraints)
 
         # [ARCHITECT NEW] Phase 4: Socket Forge (Physical)
         if collected_sockets:
@@ -588,16 +697,17 @@ def _generate_output(op, context, bm, socket_data, manifest):
 
             for sid, center, normal in collected_sockets:
                 s_name = f"SOCKET_{obj.name}_{sid:02d}"
-                sock = bpy.data.objects.new(s_name, None)
+                sock = massa_inplace.claim(op, s_name, "EMPTY")
+                if sock is None:
+                    sock = bpy.data.objects.new(s_name, None)
+                    # Link
+                    if context.collection:
+                        context.collection.objects.link(sock)
+                    else:
+                        context.scene.collection.objects.link(sock)
                 sock.empty_display_type = 'ARROWS'
                 sock.empty_display_size = vis_size
 
-                # Link
-                if context.collection:
-                    context.collection.objects.link(sock)
-                else:
-                    context.scene.collection.objects.link(sock)
-
                 # Parent First (Establishes Local Space)
                 sock.parent = obj
 
@@ -615,36 +725,21 @@ def _generate_output(op, context, bm, socket_data, manifest):
                 sock.location = center
                 sock.rotation_euler = rot_mat.to_euler()
 
-                # Apply Constraints
+                # Queue Constraint (Object 1 is Main Object, Object 2 left blank for the Connecting Piece)
                 if con_type != 'NONE' and con_type in TYPE_MAP:
-                    b_type = TYPE_MAP[con_type]
-
-                    # Ensure selection for Operator
-                    bpy.ops.object.select_all(action='DESELECT')
-                    sock.select_set(True)
-                    context.view_layer.objects.active = sock
+                    constraints.add(
+                        sock, TYPE_MAP[con_type], object1=obj, breaking_threshold=break_force
+                    )
 
-                    try:
-                        # Add Rigid Body Constraint (Empty becomes a Constraint Object)
-                        bpy.ops.rigidbody.constraint_add(type=b_type)
-                        rbc = sock.rigid_body_constraint
-                        # Object 1 is Main Object (Parent)
-                        rbc.object1 = obj
-                        # Object 2 is left blank (Connecting Piece)
-                        rbc.use_breaking = True
-                        rbc.breaking_threshold = break_force
-                    except Exception as ce:
-                        print(f"Socket Constraint Error ({s_name}): {ce}")
-
-            # Restore Selection to Main Object
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
+        constraints.commit()
 
     except Exception as e:
         print(f"Phase 4 Physics/Socket Error: {e}")
         traceback.print_exc()
 
+    # Generated children this run did not update are stale now
+    massa_inplace.finish(op)
+
 
 def phys_gen_ucx(obj, op, manifest, slot_map):
     """
@@ -660,7 +755,9 @@ def phys_gen_ucx(obj, op, manifest, slot_map):
         target_slots = {0, 1, 2}  # Legacy Fallback
 
     # Identify all participating geometry (Main + Detached Children)
-    all_objs = [obj] + [c for c in obj.children if c.type == "MESH"]
+    all_objs = [obj] + [
+        c for c in obj.children if c.type == "MESH" and not massa_inplace.is_generated_child(c)
+    ]
 
     # Pre-fetch slot names from cartridge metadata
     slot_names = {}
@@ -682,7 +779,7 @@ def phys_gen_ucx(obj, op, manifest, slot_map):
             continue
 
         # 1. Determine Shape & Name
-        shape_type = getattr(op, f"collision_shape_{i}", "BOX")
+        shape_type = massa_properties.slot_value(op, i, "collision_shape", "BOX")
 
         slot_label = slot_names.get(i, f"{i:02d}")
         # Sanitize label
@@ -869,17 +966,25 @@ def phys_gen_ucx(obj, op, manifest, slot_map):
                 bmesh.ops.translate(bm_final, vec=center, verts=bm_final.verts)
 
             # 4. Finalize
-            mesh_ucx = bpy.data.meshes.new(f"Mesh_{ucx_name}")
-            bm_final.to_mesh(mesh_ucx)
-            bm_final.free()
+            # [ARCHITECT NEW] Resurrection: rewrite the existing UCX mesh in place
+            ucx_obj = massa_inplace.claim(op, ucx_name, "MESH")
+            if ucx_obj is not None and ucx_obj.data.users == 1:
+                bm_final.to_mesh(ucx_obj.data)
+                bm_final.free()
+            else:
+                if ucx_obj is not None:
+                    massa_inplace.remove_object(ucx_obj)
+                mesh_ucx = bpy.data.meshes.new(f"Mesh_{ucx_name}")
+                bm_final.to_mesh(mesh_ucx)
+                bm_final.free()
 
-            ucx_obj = bpy.data.objects.new(ucx_name, mesh_ucx)
+                ucx_obj = bpy.data.objects.new(ucx_name, mesh_ucx)
 
-            # Link
-            if obj.users_collection:
-                obj.users_collection[0].objects.link(ucx_obj)
-            else:
-                bpy.context.collection.objects.link(ucx_obj)
+                # Link
+                if obj.users_collection:
+                    obj.users_collection[0].objects.link(ucx_obj)
+                else:
+                    bpy.context.collection.objects.link(ucx_obj)
 
             ucx_obj.parent = obj
             # [ARCHITECT FIX] Set display type to WIRE for cleanliness
@@ -893,14 +998,18 @@ def phys_gen_ucx(obj, op, manifest, slot_map):
             traceback.print_exc()
 
 
-def phys_auto_rig(obj, op, manifest):
+def phys_auto_rig(obj, op, manifest, constraints=None):
     """
     PHASE 4: AUTO-RIGGER
     Detects detached parts and auto-rigs them with Hinge Constraints.
+    Constraints are queued on 'constraints' (a ConstraintBatch); if none is
+    given, a local batch is created and committed here.
     """
     # [ARCHITECT UPDATED] Strict Child Validation
     children = []
     for c in obj.children:
+        if massa_inplace.is_generated_child(c):
+            continue  # UCX proxies are not detached parts
         if c.type == "MESH" and c.data and len(c.data.vertices) > 0:
             # Ensure it's not a helper/empty
             children.append(c)
@@ -910,7 +1019,9 @@ def phys_auto_rig(obj, op, manifest):
 
     yield_strength = getattr(op, "phys_yield_strength", 10.0)
     break_force = yield_strength * 1000.0
-    
+
+    batch = constraints if constraints is not None else massa_constraints.ConstraintBatch(bpy.context)
+
     for child in children:
         try:
             # We assume any child mesh is a detached part from our system.
@@ -944,12 +1055,14 @@ def phys_auto_rig(obj, op, manifest):
             
             # Create Joint Empty
             joint_name = f"MASSA_JOINT_{child.name}"
-            empty = bpy.data.objects.new(joint_name, None)
-            
-            if obj.users_collection:
-                obj.users_collection[0].objects.link(empty)
-            else:
-                bpy.context.collection.objects.link(empty)
+            empty = massa_inplace.claim(op, joint_name, "EMPTY")
+            if empty is None:
+                empty = bpy.data.objects.new(joint_name, None)
+
+                if obj.users_collection:
+                    obj.users_collection[0].objects.link(empty)
+                else:
+                    bpy.context.collection.objects.link(empty)
 
             # Align Empty Matrix
             # [ARCHITECT FIX] Set location in local space AFTER parenting.
@@ -957,24 +1070,11 @@ def phys_auto_rig(obj, op, manifest):
             empty.parent = obj
             empty.location = pivot_local
             
-            # Create Rigid Body Constraint
-            # We add it to the scene collection but need to enable RB
-            bpy.ops.object.select_all(action="DESELECT")
-            empty.select_set(True)
-            bpy.context.view_layer.objects.active = empty
-
-            # Add Rigid Body Constraint via Operator (Safest)
-            # This ensures physics world is respected/created
-            try:
-                bpy.ops.rigidbody.constraint_add(type='HINGE')
-                rbc = empty.rigid_body_constraint
-                rbc.object1 = obj
-                rbc.object2 = child
-                rbc.use_breaking = True
-                rbc.breaking_threshold = break_force
-            except:
-                # Fallback if ops fail (e.g. no RB world)
-                pass
-                
+            # Queue Rigid Body Constraint (attached in one pass by the batch)
+            batch.add(empty, 'HINGE', object1=obj, object2=child, breaking_threshold=break_force)
+
         except Exception as e:
             print(f"Auto-Rig Error ({child.name}): {e}")
+
+    if constraints is None:
+        batch.commit()
@@ -0,0 +1,396 @@
+import os
+import json
+import random
+import hashlib
+import numpy as np
+
+# --- ARRAY HEIGHTFIELD ENGINE ---
+# mathutils.noise only evaluates one point per call, so large terrains spent
+# their time in a Python loop. This module evaluates the same Musgrave family
+# over whole coordinate arrays. Everything here is plain NumPy (no bpy), so it
+# also runs inside worker processes: `python massa_heightfield.py <jobs.json>`.
+
+# Slot IDs (see MASSA_OT_PrimLandscape.get_slot_meta)
+SLOT_GROUND = 0
+SLOT_CLIFF = 1
+SLOT_PEAK = 2
+SLOT_SHORE = 3
+SLOT_WATER = 8
+SHORE_BAND = 0.15
+
+
+def params_from_op(op):
+    """
+    Snapshots every property the height function reads into a plain dict
+    (picklable, hashable via sorted items).
+    """
+    rng = random.Random(op.random_seed)
+    seed_offset = (
+        rng.uniform(-1000, 1000) + op.noise_offset_x,
+        rng.uniform(-1000, 1000) + op.noise_offset_y,
+        rng.uniform(-1000, 1000) + op.noise_offset_z,
+    )
+    return {
+        "seed": op.random_seed,
+        "seed_offset": seed_offset,
+        "noise_type": op.noise_type,
+        "noise_size": max(0.001, op.noise_size),
+        "octaves": op.noise_detail,
+        "lacunarity": op.lacunarity,
+        "gain": op.gain,
+        "offset": op.offset,
+        "distortion": op.distortion,
+        "height": op.height,
+        "height_offset": op.height_offset,
+        "falloff_x": op.falloff_x,
+        "falloff_y": op.falloff_y,
+        "size_x": op.mesh_size_x,
+        "size_y": op.mesh_size_y,
+        "water_level": op.water_level,
+        "rock_slope": op.rock_slope,
+        "peak_factor": op.peak_factor,
+    }
+
+
+# ==============================================================================
+# PHASE 1: GRADIENT NOISE (Improved Perlin, Array Form)
+# ==============================================================================
+def permutation(seed):
+    """Seeded 512-entry permutation table (256 doubled to skip wrap checks)."""
+    perm = np.random.default_rng(seed & 0xFFFFFFFF).permutation(256)
+    return np.concatenate((perm, perm)).astype(np.int64)
+
+
+def _wrap(c):
+    return c.astype(np.int64) & 255
+
+
+def _fade(t):
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+def _grad(h, x, y, z):
+    h = h & 15
+    u = np.where(h < 8, x, y)
+    v = np.where(h < 4, y, np.where((h == 12) | (h == 14), x, z))
+    return np.where(h & 1, -u, u) + np.where(h & 2, -v, v)
+
+
+def perlin(perm, x, y, z):
+    """Signed gradient noise in roughly [-1, 1] for broadcastable x, y, z."""
+    x, y, z = np.broadcast_arrays(
+        np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), np.asarray(z, dtype=np.float64)
+    )
+    fx, fy, fz = np.floor(x), np.floor(y), np.floor(z)
+    xi, yi, zi = _wrap(fx), _wrap(fy), _wrap(fz)
+    x, y, z = x - fx, y - fy, z - fz
+    u, v, w = _fade(x), _fade(y), _fade(z)
+
+    a = perm[xi] + yi
+    aa, ab = perm[a] + zi, perm[a + 1] + zi
+    b = perm[xi + 1] + yi
+    ba, bb = perm[b] + zi, perm[b + 1] + zi
+
+    x1, y1, z1 = x - 1.0, y - 1.0, z - 1.0
+    g0 = _grad(perm[aa], x, y, z)
+    g1 = _grad(perm[ba], x1, y, z)
+    g2 = _grad(perm[ab], x, y1, z)
+    g3 = _grad(perm[bb], x1, y1, z)
+    g4 = _grad(perm[aa + 1], x, y, z1)
+    g5 = _grad(perm[ba + 1], x1, y, z1)
+    g6 = _grad(perm[ab + 1], x, y1, z1)
+    g7 = _grad(perm[bb + 1], x1, y1, z1)
+
+    l0 = g0 + u * (g1 - g0)
+    l1 = g2 + u * (g3 - g2)
+    l2 = g4 + u * (g5 - g4)
+    l3 = g6 + u * (g7 - g6)
+    m0 = l0 + v * (l1 - l0)
+    m1 = l2 + v * (l3 - l2)
+    return m0 + w * (m1 - m0)
+
+
+def voronoi_f1(perm, x, y, z):
+    """Distance to the nearest jittered feature point (one per unit cell)."""
+    x, y, z = np.broadcast_arrays(
+        np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), np.asarray(z, dtype=np.float64)
+    )
+    cx, cy, cz = np.floor(x), np.floor(y), np.floor(z)
+    best = np.full(x.shape, np.inf)
+    for ox in (-1.0, 0.0, 1.0):
+        for oy in (-1.0, 0.0, 1.0):
+            for oz in (-1.0, 0.0, 1.0):
+                gx, gy, gz = cx + ox, cy + oy, cz + oz
+                h = perm[perm[perm[_wrap(gx)] + _wrap(gy)] + _wrap(gz)]
+                px = gx + perm[h] / 255.0
+                py = gy + perm[(h + 85) & 511] / 255.0
+                pz = gz + perm[(h + 170) & 511] / 255.0
+                np.minimum(best, np.sqrt((x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2), out=best)
+    return best
+
+
+# ==============================================================================
+# PHASE 2: OCTAVE FORMULAS (Musgrave, as in Blender's noise library)
+# ==============================================================================
+def _fbm(noise, p, H, lac, octaves):
+    pw_hl = lac ** -H
+    pwr = 1.0
+    value = 0.0
+    for _i in range(int(octaves)):
+        value = value + noise(p) * pwr
+        pwr *= pw_hl
+        p = p * lac
+    return value
+
+
+def _hetero_terrain(noise, p, H, lac, octaves, offset):
+    pw_hl = lac ** -H
+    pwr = pw_hl
+    value = offset + noise(p)
+    p = p * lac
+    for _i in range(1, int(octaves)):
+        value = value + (noise(p) + offset) * pwr * value
+        pwr *= pw_hl
+        p = p * lac
+    return value
+
+
+def _hybrid_multi_fractal(noise, p, H, lac, octaves, offset, gain):
+    pw_hl = lac ** -H
+    pwr = pw_hl
+    result = noise(p) + offset
+    weight = gain * result
+    p = p * lac
+    for _i in range(1, int(octaves)):
+        live = weight > 0.001
+        if not np.any(live):
+            break
+        weight = np.minimum(weight, 1.0)
+        signal = (noise(p) + offset) * pwr
+        pwr *= pw_hl
+        result = np.where(live, result + weight * signal, result)
+        weight = np.where(live, weight * gain * signal, weight)
+        p = p * lac
+    return result
+
+
+def _ridged_multi_fractal(noise, p, H, lac, octaves, offset, gain):
+    pw_hl = lac ** -H
+    pwr = pw_hl
+    signal = offset - np.abs(noise(p))
+    signal = signal * signal
+    result = signal
+    for _i in range(1, int(octaves)):
+        p = p * lac
+        weight = np.clip(signal * gain, 0.0, 1.0)
+        signal = offset - np.abs(noise(p))
+        signal = signal * signal * weight
+        result = result + signal * pwr
+        pwr *= pw_hl
+    return result
+
+
+def _turbulence(noise, p, octaves):
+    amp = 1.0
+    total = 0.0
+    for i in range(int(octaves) + 1):
+        total = total + (noise(p * (2.0 ** i)) * 0.5 + 0.5) * amp
+        amp *= 0.5
+    return total * (1 << int(octaves)) / ((1 << (int(octaves) + 1)) - 1)
+
+
+def evaluate_noise(params, x, y, perm=None):
+    """Raw noise value at world-space grid coordinates x, y (any broadcastable shape)."""
+    if perm is None:
+        perm = permutation(params["seed"])
+    size = params["noise_size"]
+    ox, oy, oz = params["seed_offset"]
+    p = np.stack(np.broadcast_arrays((np.asarray(x) + ox) * size, (np.asarray(y) + oy) * size, np.full(1, oz * size)))
+
+    def noise(q):
+        return perlin(perm, q[0], q[1], q[2])
+
+    n_type = params["noise_type"]
+    H, lac, octaves = params["gain"], params["lacunarity"], params["octaves"]
+
+    if n_type == "hetero_terrain":
+        return _hetero_terrain(noise, p, H, lac, octaves, params["offset"])
+    if n_type == "fBm":
+        return _fbm(noise, p, H, lac, octaves)
+    if n_type == "hybrid_multi_fractal":
+        return _hybrid_multi_fractal(noise, p, H, lac, octaves, params["offset"], 1.0)
+    if n_type == "ridged_multi_fractal":
+        return _ridged_multi_fractal(noise, p, H, lac, octaves, params["offset"], 1.0)
+    if n_type == "vl_noise_turbulence":
+        return _turbulence(noise, p, octaves)
+    if n_type == "vl_noise_voronoi":
+        return voronoi_f1(perm, p[0], p[1], p[2])
+    return noise(p)  # Default single-octave noise
+
+
+# ==============================================================================
+# PHASE 3: HEIGHTS, FALLOFF, CLASSIFICATION
+# ==============================================================================
+def heights(params, x, y, perm=None):
+    """
+    Final Z for world-space coordinates. Falloff is measured against the
+    full terrain extent, so any sub-rectangle of the grid evaluates to the
+    same values as the whole.
+    """
+    z = evaluate_noise(params, x, y, perm) * params["distortion"]
+    z = z * params["height"] + params["height_offset"]
+
+    f_x, f_y = params["falloff_x"], params["falloff_y"]
+    if f_x > 0 or f_y > 0:
+        fx = np.maximum(0.0, 1.0 - np.abs(x) / (params["size_x"] / 2.0) * f_x) if f_x > 0 else 1.0
+        fy = np.maximum(0.0, 1.0 - np.abs(y) / (params["size_y"] / 2.0) * f_y) if f_y > 0 else 1.0
+        z = z * fx * fy
+    return z
+
+
+def classify(params, z, dx, dy):
+    """
+    Slot per grid quad from a (ny, nx) height array with spacing dx, dy.
+    Returns an (ny-1, nx-1) int32 array (Water > Cliffs > Peaks > Shore > Ground).
+    """
+    z00, z10 = z[:-1, :-1], z[:-1, 1:]
+    z01, z11 = z[1:, :-1], z[1:, 1:]
+    z_avg = (z00 + z10 + z01 + z11) * 0.25
+
+    # Quad normal = cross of its diagonals (same as BMesh for planar quads)
+    nx = dy * (z01 - z10 - z11 + z00)
+    ny = -dx * (z11 - z00 + z01 - z10)
+    nz = np.full(z_avg.shape, 2.0 * dx * dy)
+    angle = np.arccos(np.clip(nz / np.sqrt(nx * nx + ny * ny + nz * nz), -1.0, 1.0))
+
+    water = params["water_level"]
+    peak_z = params["height"] * params["peak_factor"] + params["height_offset"]
+
+    slot = np.full(z_avg.shape, SLOT_GROUND, dtype=np.int32)
+    slot[z_avg < water + SHORE_BAND] = SLOT_SHORE
+    slot[z_avg > peak_z] = SLOT_PEAK
+    slot[angle > params["rock_slope"]] = SLOT_CLIFF
+    slot[z_avg < water] = SLOT_WATER
+    return slot
+
+
+# ==============================================================================
+# PHASE 4: TILES (Seamless Borders, LOD, Disk Cache, Worker Entry)
+# ==============================================================================
+TILE_CACHE_VERSION = 1  # Bump when the .npz layout changes
+TILE_CACHE_LIMIT = 4096  # Files kept on disk (oldest pruned first)
+_SOURCE_DIGEST = None
+
+
+def source_digest():
+    """
+    sha1 of this file. Tile contents are computed entirely here, so editing
+    it retires every cached tile (like massa_mesh_cache.code_fingerprint).
+    """
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        with open(os.path.abspath(__file__), "rb") as fh:
+            _SOURCE_DIGEST = hashlib.sha1(fh.read()).hexdigest()
+    return _SOURCE_DIGEST
+
+
+def tile_key(params, layout, tx, ty, lod):
+    """Content address of one tile: every input that shapes it, nothing else."""
+    payload = json.dumps(
+        {"v": TILE_CACHE_VERSION, "src": source_digest(), "p": params, "l": layout, "t": [tx, ty, lod]},
+        sort_keys=True,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def compute_tile(params, layout, tx, ty, lod, perm=None):
+    """
+    One tile of a tiles_x * tiles_y terrain at LOD 'lod' (every 2^lod-th
+    lattice vertex). Coordinates come from global integer lattice indices,
+    so shared borders evaluate bit-identical heights on both sides. Normals
+    use central differences over a one-vertex apron sampled from the
+    neighbours, so shading matches across borders too.
+    Returns {"co": (N, 3), "normals": (N, 3), "slots": (F,)}.
+    """
+    res = layout["tile_res"]
+    step = 1 << lod
+    n = res // step
+
+    hx = params["size_x"] / (layout["tiles_x"] * res)
+    hy = params["size_y"] / (layout["tiles_y"] * res)
+    k = np.arange(-1, n + 2) * step  # Lattice offsets incl. apron
+    xs = -params["size_x"] / 2.0 + (tx * res + k) * hx
+    ys = -params["size_y"] / 2.0 + (ty * res + k) * hy
+    gx, gy = np.meshgrid(xs, ys)
+    z = heights(params, gx, gy, perm)
+
+    core = z[1:-1, 1:-1]
+    dzdx = (z[1:-1, 2:] - z[1:-1, :-2]) / (2.0 * hx * step)
+    dzdy = (z[2:, 1:-1] - z[:-2, 1:-1]) / (2.0 * hy * step)
+    normals = np.stack((-dzdx, -dzdy, np.ones(core.shape)), axis=-1)
+    normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+
+    co = np.stack((gx[1:-1, 1:-1], gy[1:-1, 1:-1], core), axis=-1)
+    return {
+        "co": co.reshape(-1, 3).astype(np.float32),
+        "normals": normals.reshape(-1, 3).astype(np.float32),
+        "slots": classify(params, core, hx * step, hy * step).ravel(),
+    }
+
+
+def tile_path(cache_dir, key):
+    return os.path.join(cache_dir, key[:2], key + ".npz")
+
+
+def load_tile(cache_dir, key):
+    path = tile_path(cache_dir, key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as data:
+            return {name: data[name] for name in ("co", "normals", "slots")}
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Massa Terrain: Dropping unreadable tile {key}: {e}")
+        return None
+
+
+def save_tile(cache_dir, key, tile):
+    path = tile_path(cache_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"  # Atomic publish (workers run concurrently)
+    with open(tmp, "wb") as fh:
+        np.savez(fh, **tile)
+    os.replace(tmp, path)
+
+
+def prune_cache(cache_dir, limit=TILE_CACHE_LIMIT):
+    """Drops the least recently written tiles beyond 'limit'."""
+    files = []
+    for root, _dirs, names in os.walk(cache_dir):
+        files.extend(os.path.join(root, n) for n in names if n.endswith(".npz"))
+    if len(files) <= limit:
+        return 0
+    files.sort(key=os.path.getmtime)
+    for path in files[: len(files) - limit]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return len(files) - limit
+
+
+def run_jobs(job_file):
+    """Worker entry: computes every tile listed in job_file into the disk cache."""
+    with open(job_file, "r", encoding="utf-8") as fh:
+        job = json.load(fh)
+    params, layout, cache_dir = job["params"], job["layout"], job["cache_dir"]
+    perm = permutation(params["seed"])
+    for tx, ty, lod in job["tiles"]:
+        key = tile_key(params, layout, tx, ty, lod)
+        save_tile(cache_dir, key, compute_tile(params, layout, tx, ty, lod, perm))
+
+
+if __name__ == "__main__":
+    import sys
+
+    run_jobs(sys.argv[1])
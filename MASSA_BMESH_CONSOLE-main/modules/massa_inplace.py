@@ -0,0 +1,139 @@
+import bpy
+
+# --- IN-PLACE RESURRECTION ---
+# Resurrection (rerun_mode / ReRun Active / Redo on either) regenerates into
+# the existing object instead of deleting it and building a new one:
+#   - bm.to_mesh() writes into the object's own Mesh datablock,
+#   - Massa_* modifiers are kept (and updated) while the wanted stack matches,
+#   - UCX children and socket / joint empties are claimed by name and
+#     updated; only the ones this run did not claim are removed.
+# Detached slot parts come from bpy.ops.mesh.separate and are rebuilt.
+# Flow: Massa_OT_Base.execute sets op._massa_reuse, the engine calls
+# begin() / claim() / modifier() and finish() (or abort() on failure).
+
+GENERATED_CHILD_PREFIXES = ("UCX_", "MASSA_JOINT_", "SOCKET_")
+MODIFIER_PREFIX = "Massa_"
+
+
+def can_regenerate_in_place(obj, allow_shared=False):
+    """
+    Only unshared, local meshes in Object Mode can be rewritten safely.
+    allow_shared: batch regeneration (massa_batch) rewrites a Mesh its
+    followers share on purpose.
+    """
+    if obj is None or obj.type != "MESH" or obj.mode != "OBJECT":
+        return False
+    mesh = obj.data
+    if mesh is None or mesh.library is not None:
+        return False
+    return allow_shared or mesh.users == 1
+
+
+def base_name(name):
+    """'SOCKET_Top_0.001' -> 'SOCKET_Top_0' (Blender's duplicate suffix)."""
+    head, sep, tail = name.rpartition(".")
+    return head if sep and tail.isdigit() else name
+
+
+def is_generated_child(obj):
+    return obj.name.startswith(GENERATED_CHILD_PREFIXES)
+
+
+def remove_object(obj):
+    """Removes obj and its mesh when nothing else uses it (no orphan data)."""
+    data = obj.data if obj.type == "MESH" else None
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if data is not None and data.users == 0:
+        bpy.data.meshes.remove(data)
+
+
+def begin(op, part_prefix):
+    """
+    Takes the reuse target off the operator. Returns the object to
+    regenerate into (None: build a new one). Detached parts (children named
+    '<part_prefix>_...') are dropped; generated children go to the claim pool.
+    """
+    target = getattr(op, "_massa_reuse", None)
+    op._massa_reuse = None
+    op._massa_reuse_children = None
+    if target is None:
+        return None
+    try:
+        if not can_regenerate_in_place(target, getattr(op, "batch_mode", False)):
+            return None
+    except ReferenceError:
+        return None  # Removed since execute picked it (undo)
+
+    pool = {}
+    for child in list(target.children):
+        if is_generated_child(child):
+            pool.setdefault(base_name(child.name), []).append(child)
+        elif child.type == "MESH" and base_name(child.name).startswith(part_prefix + "_"):
+            remove_object(child)
+    op._massa_reuse_children = pool
+
+    # Topology changes: old shape keys / vertex group names no longer apply
+    if target.data.shape_keys:
+        target.shape_key_clear()
+    target.vertex_groups.clear()
+    return target
+
+
+def claim(op, name, kind):
+    """
+    An existing generated child called name (same object type, 'MESH' or
+    'EMPTY') to update in place, or None when a new one must be created.
+    """
+    pool = getattr(op, "_massa_reuse_children", None)
+    if not pool:
+        return None
+    candidates = pool.get(base_name(name))
+    if not candidates:
+        return None
+    for child in candidates:
+        if child.type == kind:
+            candidates.remove(child)
+            return child
+    return None
+
+
+def prepare_modifiers(obj, wanted):
+    """
+    Keeps the Massa_* modifiers when they already form the wanted stack
+    (names, in order); otherwise clears them so they are rebuilt in order.
+    User modifiers are never touched.
+    """
+    current = [m for m in obj.modifiers if m.name.startswith(MODIFIER_PREFIX)]
+    if [m.name for m in current] == list(wanted):
+        return
+    for mod in current:
+        obj.modifiers.remove(mod)
+
+
+def modifier(obj, name, mod_type):
+    """Existing modifier called name (of mod_type) or a new one."""
+    mod = obj.modifiers.get(name)
+    if mod is not None and mod.type != mod_type:
+        obj.modifiers.remove(mod)
+        mod = None
+    if mod is None:
+        mod = obj.modifiers.new(name, mod_type)
+    return mod
+
+
+def finish(op):
+    """Removes generated children this run did not claim."""
+    pool = getattr(op, "_massa_reuse_children", None) or {}
+    op._massa_reuse_children = None
+    for children in pool.values():
+        for child in children:
+            try:
+                remove_object(child)
+            except ReferenceError:
+                pass
+
+
+def abort(op):
+    """Pipeline failed: drop the reuse state, keep whatever children remain."""
+    op._massa_reuse = None
+    op._massa_reuse_children = None
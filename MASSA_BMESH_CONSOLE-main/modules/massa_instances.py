@@ -0,0 +1,128 @@
+import bpy
+import bmesh
+import numpy as np
+
+# --- INSTANCED OUTPUT PROTOCOL ---
+# Prototypes and instance points travel inside the output mesh itself, so the
+# object stays a single datablock (Redo, Resurrection and deletion just work).
+# The 'Massa_Instances' GN modifier splits them apart at evaluation time.
+PROTO_LAYER = "massa_proto"  # FACE int: 0 = realized, k+1 = prototype k
+CARRIER_LAYER = "massa_carrier"  # POINT int: 0 = regular, k+1 = instance of prototype k
+INDEX_LAYER = "massa_inst"  # POINT int: row into the transform table
+ROT_ATTR = "massa_inst_rot"  # POINT float3: Euler XYZ
+SCALE_ATTR = "massa_inst_scale"  # POINT float3
+
+
+def wants_instances(op):
+    """Instancing is opt-in per cartridge (flag) and per run (output_mode)."""
+    flags = op._get_cartridge_meta().get("flags", {})
+    return flags.get("ALLOW_INSTANCES", False) and getattr(op, "output_mode", "REALIZED") == "INSTANCES"
+
+
+def begin(op):
+    """Arms (or disarms) stamp recording for this pipeline run."""
+    op._massa_instances = [] if wants_instances(op) else None
+
+
+def take_groups(op):
+    """
+    Returns recorded stamps grouped per unique template:
+    [(template, [matrices]), ...]. Clears the recording.
+    """
+    jobs = getattr(op, "_massa_instances", None) or []
+    op._massa_instances = None
+
+    groups = []
+    index = {}
+    for tpl, matrices in jobs:
+        k = index.get(id(tpl))
+        if k is None:
+            k = index[id(tpl)] = len(groups)
+            groups.append((tpl, []))
+        groups[k][1].extend(matrices)
+    return groups
+
+
+def recorded_bounds(op, matrix):
+    """
+    (min, max) corners of every stamp recorded so far, placed as
+    matrix @ stamp matrix (matrix: what the pipeline already applied to bm).
+    None when nothing is recorded. Lets pivot alignment see instanced parts.
+    """
+    lo, hi = [], []
+    for tpl, matrices in getattr(op, "_massa_instances", None) or []:
+        if not tpl.co or not matrices:
+            continue
+        co = np.asarray(tpl.co, dtype=np.float64)
+        mats = np.array([np.array(matrix @ m, dtype=np.float64) for m in matrices])
+        pts = np.einsum("nij,vj->nvi", mats[:, :3, :3], co) + mats[:, None, :3, 3]
+        pts = pts.reshape(-1, 3)
+        lo.append(pts.min(axis=0))
+        hi.append(pts.max(axis=0))
+    if not lo:
+        return None
+    return np.min(lo, axis=0), np.max(hi, axis=0)
+
+
+def build_prototypes(groups, uv_name="UVMap"):
+    """
+    One untransformed copy of every unique part in a fresh BMesh, faces
+    tagged with PROTO_LAYER. The caller runs edge/identity passes on it.
+    """
+    pbm = bmesh.new()
+    pbm.loops.layers.uv.new(uv_name)
+    proto = pbm.faces.layers.int.new(PROTO_LAYER)
+    for k, (tpl, _matrices) in enumerate(groups):
+        _verts, _edges, faces = tpl.materialize(pbm)
+        for f in faces:
+            f[proto] = k + 1
+    return pbm
+
+
+def merge_into(bm, pbm, groups, out_matrix):
+    """
+    Adds one carrier point per instance to pbm, appends pbm to bm and frees
+    it. out_matrix is the scale/pivot/rotation the pipeline applied to bm,
+    so instances land where realized copies would have.
+    Returns an (N, 6) float32 table of Euler rotation + scale per instance.
+    """
+    carrier = pbm.verts.layers.int.new(CARRIER_LAYER)
+    inst = pbm.verts.layers.int.new(INDEX_LAYER)
+
+    rows = []
+    for k, (_tpl, matrices) in enumerate(groups):
+        for m in matrices:
+            loc, rot, scale = (out_matrix @ m).decompose()
+            v = pbm.verts.new(loc)
+            v[carrier] = k + 1
+            v[inst] = len(rows)
+            rows.append((*rot.to_euler("XYZ"), *scale))
+
+    tmp = bpy.data.meshes.new("Massa_Proto_Tmp")
+    try:
+        pbm.to_mesh(tmp)
+        bm.from_mesh(tmp)  # Appends; layers are merged by name
+    finally:
+        bpy.data.meshes.remove(tmp)
+        pbm.free()
+
+    return np.array(rows, dtype=np.float32).reshape(-1, 6)
+
+
+def write_point_attributes(mesh, table):
+    """Scatters the transform table onto carrier points in one foreach_set per attribute."""
+    n_verts = len(mesh.vertices)
+    carrier = np.zeros(n_verts, dtype=np.int32)
+    index = np.zeros(n_verts, dtype=np.int32)
+    mesh.attributes[CARRIER_LAYER].data.foreach_get("value", carrier)
+    mesh.attributes[INDEX_LAYER].data.foreach_get("value", index)
+
+    rot = np.zeros((n_verts, 3), dtype=np.float32)
+    scale = np.ones((n_verts, 3), dtype=np.float32)
+    sel = carrier > 0
+    rot[sel] = table[index[sel], :3]
+    scale[sel] = table[index[sel], 3:]
+
+    for name, arr in ((ROT_ATTR, rot), (SCALE_ATTR, scale)):
+        attr = mesh.attributes.get(name) or mesh.attributes.new(name, "FLOAT_VECTOR", "POINT")
+        attr.data.foreach_set("vector", arr.ravel())
@@ -0,0 +1,164 @@
+import os
+import sys
+import ast
+import json
+import hashlib
+
+# --- CARTRIDGE MANIFEST ---
+# Everything the UI needs to list a cartridge (id, name, icon, category,
+# module, operator) is read from the source with ast, never by importing it.
+# The manifest is rebuilt whenever a listed cartridge file changes, so it
+# can not drift from the code it describes. Stdlib only: runs outside Blender.
+MANIFEST_VERSION = 1
+MANIFEST_FILE = "cartridge_manifest.json"
+META_KEYS = ("id", "name", "icon", "description")
+
+
+def category_of(cart_id):
+    """UI grouping, derived from the id prefix exactly like the panel/pie menus."""
+    if cart_id.startswith("prim_con"):
+        return "CONSTRUCTION"
+    if cart_id.startswith("prim_"):
+        return "PRIMITIVES"
+    if cart_id.startswith("arch_"):
+        return "ARCHITECTURE"
+    return "BUILDINGS"
+
+
+def _source_hash(path):
+    with open(path, "rb") as fh:
+        return hashlib.sha1(fh.read()).hexdigest()
+
+
+def scan_module(path, module):
+    """
+    Extracts one manifest entry from a cartridge file without importing it.
+    Returns None if the file has no literal CARTRIDGE_META or no operator.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        tree = ast.parse(fh.read(), filename=path)
+
+    meta = None
+    op_class = None
+    op_idname = None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "CARTRIDGE_META" for t in node.targets
+        ):
+            try:
+                meta = ast.literal_eval(node.value)
+            except ValueError:
+                meta = None
+        elif isinstance(node, ast.ClassDef) and op_class is None:
+            for stmt in node.body:
+                if (
+                    isinstance(stmt, ast.Assign)
+                    and any(isinstance(t, ast.Name) and t.id == "bl_idname" for t in stmt.targets)
+                    and isinstance(stmt.value, ast.Constant)
+                ):
+                    op_class, op_idname = node.name, stmt.value.value
+                    break
+
+    if not isinstance(meta, dict) or not meta.get("id") or op_class is None:
+        return None
+
+    entry = {k: meta[k] for k in META_KEYS if k in meta}
+    entry.setdefault("name", entry["id"])
+    entry.setdefault("icon", "MESH_CUBE")
+    entry["category"] = category_of(entry["id"])
+    entry["module"] = module
+    entry["class"] = op_class
+    entry["operator"] = op_idname
+    return entry
+
+
+def build_manifest(cart_dir, modules):
+    """Scans the listed cartridge modules (in order) into a manifest dict."""
+    entries = []
+    sources = {}
+    for module in modules:
+        path = os.path.join(cart_dir, module + ".py")
+        try:
+            entry = scan_module(path, module)
+            sources[module] = _source_hash(path)
+        except (OSError, SyntaxError) as e:
+            print(f"Massa Manifest: Could not scan {module}: {e}")
+            continue
+        if entry is None:
+            print(f"Massa Manifest: {module} has no literal CARTRIDGE_META/operator, skipped")
+            continue
+        entries.append(entry)
+    return {
+        "version": MANIFEST_VERSION,
+        "modules": list(modules),
+        "sources": sources,
+        "cartridges": entries,
+    }
+
+
+def is_current(manifest, cart_dir, modules):
+    if not manifest or manifest.get("version") != MANIFEST_VERSION:
+        return False
+    if manifest.get("modules") != list(modules):
+        return False
+    sources = manifest.get("sources", {})
+    for module in modules:
+        try:
+            if sources.get(module) != _source_hash(os.path.join(cart_dir, module + ".py")):
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def write_manifest(cart_dir, manifest):
+    path = os.path.join(cart_dir, MANIFEST_FILE)
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=1)
+            fh.write("\n")
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Massa Manifest: Could not write manifest ({e}), using in-memory copy")
+
+
+def load_manifest(cart_dir, modules):
+    """
+    Returns the manifest entries for the listed modules. The file on disk is
+    trusted only while every source hash matches; otherwise it is rebuilt
+    and rewritten (best effort: read-only installs keep the fresh copy in memory).
+    """
+    path = os.path.join(cart_dir, MANIFEST_FILE)
+    manifest = None
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError):
+        pass
+
+    if not is_current(manifest, cart_dir, modules):
+        manifest = build_manifest(cart_dir, modules)
+        write_manifest(cart_dir, manifest)
+    return manifest["cartridges"]
+
+
+def listed_modules(cart_dir):
+    """Reads CARTRIDGE_MODULES from the cartridges package without importing it (bpy)."""
+    with open(os.path.join(cart_dir, "__init__.py"), "r", encoding="utf-8") as fh:
+        tree = ast.parse(fh.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "CARTRIDGE_MODULES" for t in node.targets
+        ):
+            return tuple(ast.literal_eval(node.value))
+    return ()
+
+
+if __name__ == "__main__":
+    # Offline regeneration: python modules/massa_manifest.py [cartridges_dir]
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "cartridges")
+    mods = listed_modules(target)
+    result = build_manifest(target, mods)
+    write_manifest(target, result)
+    print(f"Massa Manifest: {len(result['cartridges'])} cartridges -> {os.path.join(target, MANIFEST_FILE)}")
@@ -0,0 +1,411 @@
+import bpy
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import tempfile
+import numpy as np
+from . import massa_params
+from . import massa_batch
+
+# --- PERSISTENT MESH CACHE ---
+# Final mesh arrays of a generation (positions, topology, UVs, attributes)
+# plus what the object stage needs (socket transforms, stats, used material
+# slots) stored on disk under a content key:
+#   cartridge + params digest + add-on / Blender version + pipeline code.
+# Every Blender session, background audit worker and batch export on the
+# machine shares the directory, so reopening a level or re-running CI reuses
+# earlier results instead of rebuilding identical geometry.
+# Captured after materials + unwrap/pack, before sockets / separation / UCX
+# (those object passes are replayed from the restored mesh).
+#
+# Environment:
+#   MASSA_MESH_CACHE_DIR  cache directory (default: Blender user datafiles)
+#   MASSA_MESH_CACHE_MB   size bound, least recently used entries go first
+#   MASSA_MESH_CACHE_OFF  set to 1 to disable
+
+ENV_DIR = "MASSA_MESH_CACHE_DIR"
+ENV_MB = "MASSA_MESH_CACHE_MB"
+ENV_OFF = "MASSA_MESH_CACHE_OFF"
+DEFAULT_MAX_MB = 1024
+# Faster builds are cheaper to redo than to write (Redo panel drags)
+MIN_BUILD_SECONDS = 0.05
+FORMAT_VERSION = 2
+EXTENSION = ".mmc"
+
+# Entry layout (little endian, memory-mappable):
+#   MAGIC | u64 header size | JSON header | arrays, each at an ALIGN offset
+# Header: {"meta": {...}, "arrays": [[name, dtype, count, offset], ...]},
+# offsets relative to the data block (first ALIGN boundary after the header).
+# Arrays are views straight into the mapping, ready for foreach_set: no
+# per-element Python objects, so loads are bound by disk bandwidth.
+MAGIC = b"MASSAMC2"
+ALIGN = 64
+_PREFIX = struct.Struct("<8sQ")
+
+# Attribute type -> (dtype, components, foreach key)
+ATTR_LAYOUT = {
+    "FLOAT": (np.float32, 1, "value"),
+    "INT": (np.int32, 1, "value"),
+    "INT8": (np.int32, 1, "value"),
+    "BOOLEAN": (np.bool_, 1, "value"),
+    "FLOAT2": (np.float32, 2, "vector"),
+    "FLOAT_VECTOR": (np.float32, 3, "vector"),
+    "FLOAT_COLOR": (np.float32, 4, "color"),
+    "BYTE_COLOR": (np.float32, 4, "color"),
+    "QUATERNION": (np.float32, 4, "value"),
+    "INT32_2D": (np.int32, 2, "value"),
+}
+# Written through the element API (or derived), never as generic attributes
+HANDLED_ATTRS = {"position", "material_index", "sharp_face", "sharp_edge"}
+
+_FILE_DIGESTS = {}  # path -> (mtime_ns, size, sha1)
+_DIR = None
+
+
+def enabled():
+    return os.environ.get(ENV_OFF, "") not in {"1", "true", "TRUE", "yes"}
+
+
+def cache_dir():
+    global _DIR
+    if _DIR is None:
+        path = os.environ.get(ENV_DIR)
+        if not path:
+            try:
+                path = bpy.utils.user_resource("DATAFILES", path="massa_mesh_cache", create=True)
+            except Exception:
+                path = None
+            if not isinstance(path, str) or not path:
+                path = os.path.join(tempfile.gettempdir(), "massa_mesh_cache")
+        os.makedirs(path, exist_ok=True)
+        _DIR = path
+    return _DIR
+
+
+def max_bytes():
+    try:
+        mb = float(os.environ.get(ENV_MB, DEFAULT_MAX_MB))
+    except ValueError:
+        mb = DEFAULT_MAX_MB
+    return int(mb * 1024 * 1024)
+
+
+# --- KEYS ---
+
+def _file_digest(path):
+    """sha1 of a source file, recomputed only when mtime/size change (hot reload)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ""
+    hit = _FILE_DIGESTS.get(path)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    _FILE_DIGESTS[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+# [ARCHITECT FIX] Every add-on folder whose code runs during a build. operators/
+# holds Massa_OT_Base (build pipeline, stamping, sockets); cartridges are keyed
+# one file each so editing one does not invalidate the others.
+PIPELINE_DIRS = ("", "operators", "modules", "utils")
+
+
+def code_fingerprint(cartridge_file=None):
+    """Digest of the pipeline sources (add-on root, operators/, modules/, utils/) plus the cartridge file."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = []
+    for sub in PIPELINE_DIRS:
+        folder = os.path.join(root, sub)
+        try:
+            paths += sorted(os.path.join(folder, n) for n in os.listdir(folder) if n.endswith(".py"))
+        except OSError:
+            pass
+    if cartridge_file:
+        paths.append(cartridge_file)
+    h = hashlib.sha1()
+    for path in paths:
+        h.update(os.path.relpath(path, root).encode("utf-8"))
+        h.update(_file_digest(path).encode("ascii"))
+    return h.hexdigest()
+
+
+def _addon_version():
+    root = sys.modules.get((__package__ or "").rpartition(".")[0])
+    return list(getattr(root, "bl_info", {}).get("version", ()))
+
+
+def key_for(op, flags=None):
+    """
+    Cache key of op's current settings, or None when this run must not be
+    cached (disabled, cartridge opted out, output that is not just a mesh).
+    """
+    if not enabled() or (flags or {}).get("NO_MESH_CACHE", False):
+        return None
+    if getattr(op, "phys_kinematic_pin", False):
+        return None  # Vertex group weights live outside the captured arrays
+    try:
+        params = massa_params.capture(op)
+    except Exception as e:
+        print(f"Massa Mesh Cache: Params not capturable ({e})")
+        return None
+    module = sys.modules.get(type(op).__module__)
+    source = {
+        "op": getattr(op, "bl_idname", type(op).__name__),
+        "params": massa_batch.params_digest(params),
+        "addon": _addon_version(),
+        "blender": list(getattr(bpy.app, "version", ())),
+        "code": code_fingerprint(getattr(module, "__file__", None)),
+        "format": FORMAT_VERSION,
+    }
+    return massa_params.digest(source)
+
+
+def entry_path(key):
+    return os.path.join(cache_dir(), key[:2], key + EXTENSION)
+
+
+# --- STORAGE ---
+
+def _aligned(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_entry(f, arrays, meta):
+    """Writes arrays (any numeric/bool dtype, flattened) + meta in the flat layout."""
+    flat = {name: np.ascontiguousarray(arr).ravel() for name, arr in arrays.items()}
+    table = []
+    offset = 0
+    for name, arr in flat.items():
+        table.append([name, arr.dtype.str, int(arr.size), offset])
+        offset = _aligned(offset + arr.nbytes)
+    header = json.dumps({"meta": meta, "arrays": table}).encode("utf-8")
+
+    f.write(_PREFIX.pack(MAGIC, len(header)))
+    f.write(header)
+    pos = _PREFIX.size + len(header)
+    base = _aligned(pos)
+    for (_name, _dtype, _count, rel), arr in zip(table, flat.values()):
+        f.write(b"\0" * (base + rel - pos))
+        f.write(memoryview(arr).cast("B"))
+        pos = base + rel + arr.nbytes
+
+
+def read_entry(buf):
+    """(arrays, meta) from a mapped entry; arrays are read-only views into buf."""
+    magic, size = _PREFIX.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError("not a Massa mesh cache entry")
+    header = json.loads(bytes(buf[_PREFIX.size:_PREFIX.size + size]).decode("utf-8"))
+    base = _aligned(_PREFIX.size + size)  # Array offsets are relative to the data block
+    arrays = {}
+    for name, dtype, count, rel in header["arrays"]:
+        dtype = np.dtype(dtype)
+        if base + rel + count * dtype.itemsize > len(buf):
+            raise ValueError(f"truncated array '{name}'")
+        arrays[name] = np.frombuffer(buf, dtype=dtype, count=count, offset=base + rel)
+    return arrays, header["meta"]
+
+
+def save(key, arrays, meta):
+    """Writes one entry atomically (temp file + rename), then enforces the size bound."""
+    path = entry_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write_entry(f, arrays, meta)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    evict()
+
+
+def load(key):
+    """
+    (arrays, meta) of a stored entry, or None. Arrays map the file (the
+    mapping lives as long as they do). A hit refreshes its LRU stamp.
+    """
+    if not key:
+        return None
+    path = entry_path(key)
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        entry = read_entry(buf)
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        print(f"Massa Mesh Cache: Unreadable entry {key[:12]} ({e}), discarded")
+        discard(key)
+        return None
+    return entry
+
+
+def discard(key):
+    try:
+        os.remove(entry_path(key))
+    except OSError:
+        pass
+
+
+def _entries(root):
+    for sub in os.scandir(root):
+        if not sub.is_dir():
+            continue
+        for entry in os.scandir(sub.path):
+            if entry.name.endswith(".tmp"):
+                continue  # Being written by some session
+            try:
+                st = entry.stat()
+            except OSError:
+                continue  # Evicted by another process
+            # Entries of older formats go first
+            stamp = st.st_mtime if entry.name.endswith(EXTENSION) else 0.0
+            yield entry.path, st.st_size, stamp
+
+
+def evict(limit=None):
+    """Removes least recently used entries until the directory fits limit. Returns bytes freed."""
+    limit = max_bytes() if limit is None else limit
+    entries = sorted(_entries(cache_dir()), key=lambda e: e[2])
+    total = sum(size for _path, size, _mtime in entries)
+    freed = 0
+    for path, size, _mtime in entries:
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        freed += size
+    return freed
+
+
+# --- MESH ARRAYS ---
+
+def _get(seq, attr, count, dtype, width=1):
+    buf = np.empty(count * width, dtype=dtype)
+    seq.foreach_get(attr, buf)
+    return buf
+
+
+def capture_mesh(mesh):
+    """Mesh -> {name: flat array} (topology, element flags, UV layers, generic attributes)."""
+    n_v, n_e, n_l, n_p = len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons)
+    arrays = {
+        "co": _get(mesh.vertices, "co", n_v, np.float32, 3),
+        "edge_verts": _get(mesh.edges, "vertices", n_e, np.int32, 2),
+        "edge_seam": _get(mesh.edges, "use_seam", n_e, np.bool_),
+        "edge_sharp": _get(mesh.edges, "use_edge_sharp", n_e, np.bool_),
+        "loop_vert": _get(mesh.loops, "vertex_index", n_l, np.int32),
+        "loop_edge": _get(mesh.loops, "edge_index", n_l, np.int32),
+        "poly_start": _get(mesh.polygons, "loop_start", n_p, np.int32),
+        "poly_mat": _get(mesh.polygons, "material_index", n_p, np.int32),
+        "poly_smooth": _get(mesh.polygons, "use_smooth", n_p, np.bool_),
+    }
+    uv_names = set()
+    for layer in mesh.uv_layers:
+        uv_names.add(layer.name)
+        arrays["uv:" + layer.name] = _get(layer.data, "uv", n_l, np.float32, 2)
+
+    sizes = {"POINT": n_v, "EDGE": n_e, "CORNER": n_l, "FACE": n_p}
+    for attr in mesh.attributes:
+        name = attr.name
+        if name.startswith(".") or name in HANDLED_ATTRS or name in uv_names:
+            continue
+        layout = ATTR_LAYOUT.get(attr.data_type)
+        count = sizes.get(attr.domain)
+        if layout is None or count is None:
+            continue
+        dtype, width, key = layout
+        arrays[f"attr:{attr.domain}:{attr.data_type}:{name}"] = _get(attr.data, key, count, dtype, width)
+    return arrays
+
+
+def restore_mesh(mesh, arrays):
+    """Rebuilds mesh geometry from capture_mesh() arrays (materials are left alone)."""
+    mesh.clear_geometry()
+    n_v = len(arrays["co"]) // 3
+    n_e = len(arrays["edge_verts"]) // 2
+    n_l = len(arrays["loop_vert"])
+    n_p = len(arrays["poly_start"])
+
+    mesh.vertices.add(n_v)
+    mesh.vertices.foreach_set("co", arrays["co"])
+    mesh.edges.add(n_e)
+    mesh.edges.foreach_set("vertices", arrays["edge_verts"])
+    mesh.loops.add(n_l)
+    mesh.loops.foreach_set("vertex_index", arrays["loop_vert"])
+    mesh.loops.foreach_set("edge_index", arrays["loop_edge"])
+    mesh.polygons.add(n_p)
+    mesh.polygons.foreach_set("loop_start", arrays["poly_start"])
+    try:
+        sizes = np.diff(np.append(arrays["poly_start"], n_l)).astype(np.int32)
+        mesh.polygons.foreach_set("loop_total", sizes)
+    except (AttributeError, TypeError, RuntimeError):
+        pass  # Read-only on newer builds (derived from loop_start)
+    mesh.polygons.foreach_set("material_index", arrays["poly_mat"])
+    mesh.polygons.foreach_set("use_smooth", arrays["poly_smooth"])
+    mesh.edges.foreach_set("use_seam", arrays["edge_seam"])
+    mesh.edges.foreach_set("use_edge_sharp", arrays["edge_sharp"])
+
+    for name, values in arrays.items():
+        if name.startswith("uv:"):
+            layer = mesh.uv_layers.get(name[3:]) or mesh.uv_layers.new(name=name[3:])
+            layer.data.foreach_set("uv", values)
+        elif name.startswith("attr:"):
+            _prefix, domain, data_type, attr_name = name.split(":", 3)
+            attr = mesh.attributes.get(attr_name)
+            if attr is None:
+                attr = mesh.attributes.new(attr_name, data_type, domain)
+            attr.data.foreach_set(ATTR_LAYOUT[data_type][2], values)
+
+    mesh.update()
+
+
+def store(key, mesh, meta):
+    """Caches mesh + meta under key. Failures only cost the cache entry."""
+    if meta.get("build_seconds", MIN_BUILD_SECONDS) < MIN_BUILD_SECONDS:
+        return
+    try:
+        save(key, capture_mesh(mesh), meta)
+    except Exception as e:
+        print(f"Massa Mesh Cache: Store failed ({e})")
+
+
+# --- OBJECT STAGE DATA ---
+
+def describe(stats, socket_data, layer_sockets, build_seconds=0.0):
+    """JSON form of the pipeline results the object stage needs."""
+    return {
+        "build_seconds": round(build_seconds, 4),
+        "stats": {str(k): v for k, v in stats.items()},
+        "sockets": {
+            str(slot): [[list(loc), [v for row in rot for v in row]] for loc, rot in items]
+            for slot, items in socket_data.items()
+        },
+        "layer_sockets": [[int(sid), list(c), list(n)] for sid, c, n in layer_sockets],
+    }
+
+
+def socket_data(meta):
+    from mathutils import Matrix, Vector
+    return {
+        int(slot): [(Vector(loc), Matrix((rot[0:3], rot[3:6], rot[6:9]))) for loc, rot in items]
+        for slot, items in meta.get("sockets", {}).items()
+    }
+
+
+def layer_sockets(meta):
+    from mathutils import Vector
+    return [(sid, Vector(c), Vector(n)) for sid, c, n in meta.get("layer_sockets", [])]
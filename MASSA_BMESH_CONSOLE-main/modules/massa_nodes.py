@@ -182,4 +182,101 @@ def get_or_create_viz_overlay_tree():
         except:
             pass
 
-    return nt
\ No newline at end of file
+    return nt
+
+def get_or_create_instance_tree(proto_count):
+    """
+    [ARCHITECT NEW] Instanced Output.
+    Splits the output mesh into realized geometry, prototypes (face attr
+    'massa_proto' = k) and carrier points (point attr 'massa_carrier' = k),
+    then instances prototype k on its carriers with per-point rotation/scale.
+    One tree per prototype count; shared by every object with that count.
+    """
+    tree_name = f"Massa_Instance_Set_{proto_count}"
+    if tree_name in bpy.data.node_groups:
+        return bpy.data.node_groups[tree_name]
+
+    nt = bpy.data.node_groups.new(tree_name, "GeometryNodeTree")
+
+    nt.interface.new_socket(
+        name="Geometry", in_out="INPUT", socket_type="NodeSocketGeometry"
+    )
+    nt.interface.new_socket(
+        name="Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry"
+    )
+
+    n_in = nt.nodes.new("NodeGroupInput")
+    n_in.location = (-1200, 0)
+    n_out = nt.nodes.new("NodeGroupOutput")
+    n_out.location = (800, 0)
+
+    def _read(name, data_type, y):
+        n = nt.nodes.new("GeometryNodeInputNamedAttribute")
+        n.data_type = data_type
+        n.inputs["Name"].default_value = name
+        n.location = (-1000, y)
+        return n
+
+    def _equals(attr_node, value, loc):
+        n = nt.nodes.new("FunctionNodeCompare")
+        n.data_type = "INT"
+        n.operation = "EQUAL"
+        n.inputs["B"].default_value = value
+        n.location = loc
+        nt.links.new(attr_node.outputs["Attribute"], n.inputs["A"])
+        return n
+
+    def _separate(geo_socket, domain, cmp_node, loc):
+        n = nt.nodes.new("GeometryNodeSeparateGeometry")
+        n.domain = domain
+        n.location = loc
+        nt.links.new(geo_socket, n.inputs["Geometry"])
+        nt.links.new(cmp_node.outputs["Result"], n.inputs["Selection"])
+        return n
+
+    try:
+        n_join = nt.nodes.new("GeometryNodeJoinGeometry")
+        n_join.location = (600, 0)
+
+        n_car = _read("massa_carrier", "INT", 400)
+        n_proto = _read("massa_proto", "INT", 200)
+        n_rot = _read("massa_inst_rot", "FLOAT_VECTOR", 0)
+        n_scale = _read("massa_inst_scale", "FLOAT_VECTOR", -200)
+
+        # 1. Carriers vs Mesh
+        n_split = _separate(
+            n_in.outputs["Geometry"], "POINT", _equals(n_car, 0, (-800, 400)), (-600, 400)
+        )
+        mesh_geo = n_split.outputs["Selection"]
+        carrier_geo = n_split.outputs["Inverted"]
+
+        # 2. Realized Geometry passes through
+        n_base = _separate(mesh_geo, "FACE", _equals(n_proto, 0, (-400, 600)), (-200, 600))
+        nt.links.new(n_base.outputs["Selection"], n_join.inputs["Geometry"])
+
+        # 3. One Instance-on-Points per prototype
+        y = 200
+        for k in range(1, proto_count + 1):
+            n_part = _separate(mesh_geo, "FACE", _equals(n_proto, k, (-400, y)), (-200, y))
+            n_pts = _separate(carrier_geo, "POINT", _equals(n_car, k, (-400, y - 150)), (-200, y - 150))
+
+            n_iop = nt.nodes.new("GeometryNodeInstanceOnPoints")
+            n_iop.location = (200, y)
+            nt.links.new(n_pts.outputs["Selection"], n_iop.inputs["Points"])
+            nt.links.new(n_part.outputs["Selection"], n_iop.inputs["Instance"])
+            nt.links.new(n_rot.outputs["Attribute"], n_iop.inputs["Rotation"])
+            nt.links.new(n_scale.outputs["Attribute"], n_iop.inputs["Scale"])
+            nt.links.new(n_iop.outputs["Instances"], n_join.inputs["Geometry"])
+            y -= 350
+
+        nt.links.new(n_join.outputs["Geometry"], n_out.inputs["Geometry"])
+
+    except Exception as e:
+        print(f"MASSA INSTANCE TREE ERROR: {e}")
+        try:
+            if not n_out.inputs["Geometry"].is_linked:
+                nt.links.new(n_in.outputs["Geometry"], n_out.inputs["Geometry"])
+        except:
+            pass
+
+    return nt
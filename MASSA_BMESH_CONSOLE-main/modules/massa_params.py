@@ -0,0 +1,200 @@
+import hashlib
+import json
+from . import massa_properties
+
+# --- SPARSE RESURRECTION PARAMETERS ---
+# obj["MASSA_PARAMS"] holds one JSON string:
+#   {"v": SCHEMA_VERSION, "params": {<only values that differ from the
+#    operator class defaults>, "slots": {field: {slot index: value}}}}
+# Restore expands it against the defaults of the class being restored.
+# Schema 1 (no "v"): the full IDProperty dict older versions wrote.
+
+SCHEMA_VERSION = 2
+PARAMS_KEY = "MASSA_PARAMS"
+
+# Never stored: Blender internals, runtime state, slots (own format)
+SKIP_PROPS = {
+    "bl_idname", "bl_label", "bl_description", "bl_options", "rna_type",
+    "slots", "console_rev", "rerun_mode", "target_delete_name", "batch_mode",
+}
+
+_CLASS_CACHE = {}  # operator class -> {identifier: default}
+_SLOT_DEFAULTS = {}
+
+
+def _plain(val):
+    """RNA value -> JSON friendly (Vectors/arrays to lists, enum flags to sorted lists)."""
+    if hasattr(val, "to_list"):
+        return val.to_list()
+    if hasattr(val, "to_tuple"):
+        return list(val.to_tuple())
+    if isinstance(val, (set, frozenset)):
+        return sorted(val)
+    if isinstance(val, (str, bytes)):
+        return val
+    if hasattr(val, "__len__"):
+        return [_plain(v) for v in val]
+    return val
+
+
+def _rna_default(prop):
+    if prop.type == "ENUM":
+        return set(prop.default_flag) if prop.is_enum_flag else prop.default
+    if getattr(prop, "is_array", False) and getattr(prop, "array_length", 0) > 0:
+        return list(prop.default_array)
+    return prop.default
+
+
+def class_defaults(cls):
+    """{identifier: default} of every storable property of cls, computed once per class."""
+    defaults = _CLASS_CACHE.get(cls)
+    if defaults is None:
+        defaults = {}
+        for prop in cls.bl_rna.properties:
+            if prop.is_readonly or prop.identifier in SKIP_PROPS:
+                continue
+            if prop.type in {"POINTER", "COLLECTION"}:
+                continue
+            try:
+                defaults[prop.identifier] = _rna_default(prop)
+            except (AttributeError, TypeError):
+                pass
+        _CLASS_CACHE[cls] = defaults
+    return defaults
+
+
+def slot_defaults():
+    if not _SLOT_DEFAULTS:
+        props = massa_properties.MASSA_PG_SlotConfig.bl_rna.properties
+        for name in massa_properties.SLOT_FIELDS:
+            _SLOT_DEFAULTS[name] = _rna_default(props[name])
+    return _SLOT_DEFAULTS
+
+
+def _same(a, b):
+    if isinstance(b, float) or isinstance(a, float):
+        try:
+            return abs(a - b) <= 1e-6 * max(1.0, abs(b))
+        except TypeError:
+            return False
+    return _plain(a) == _plain(b)
+
+
+def sparse_values(values, defaults):
+    """Entries of values that differ from defaults (unknown keys are kept)."""
+    out = {}
+    for key, val in values.items():
+        if key in defaults and _same(val, defaults[key]):
+            continue
+        out[key] = _plain(val)
+    return out
+
+
+def sparse_slots(columns, defaults):
+    """Columnar slot data -> {field: {"index": value}} without default entries."""
+    out = {}
+    for name, values in columns.items():
+        default = defaults.get(name)
+        diff = {str(i): _plain(v) for i, v in enumerate(values) if not _same(v, default)}
+        if diff:
+            out[name] = diff
+    return out
+
+
+def capture(op):
+    """Sparse params of an operator: non-default values plus non-default slot fields."""
+    defaults = class_defaults(type(op))
+    values = {}
+    for key in defaults:
+        try:
+            values[key] = getattr(op, key)
+        except AttributeError:
+            pass
+    params = sparse_values(values, defaults)
+    params["slots"] = sparse_slots(massa_properties.slots_to_params(op), slot_defaults())
+    return params
+
+
+def encode(params):
+    return json.dumps({"v": SCHEMA_VERSION, "params": params}, separators=(",", ":"))
+
+
+def decode(raw):
+    """
+    Stored value -> params dict (sparse for schema 2, full for schema 1).
+    Returns None when nothing usable is stored.
+    """
+    if raw is None:
+        return None
+    if isinstance(raw, str):
+        try:
+            blob = json.loads(raw)
+        except ValueError:
+            print("Massa Params: Corrupt MASSA_PARAMS blob, ignored")
+            return None
+        if blob.get("v", 0) > SCHEMA_VERSION:
+            print(f"Massa Params: Schema {blob.get('v')} is newer than supported ({SCHEMA_VERSION})")
+        return dict(blob.get("params", {}))
+    # Schema 1: IDProperty group written by older versions
+    if hasattr(raw, "to_dict"):
+        return raw.to_dict()
+    return dict(raw)
+
+
+def digest(params):
+    """Content hash of params: equal settings give equal digests (key order ignored)."""
+    blob = json.dumps(params, sort_keys=True, separators=(",", ":"), default=_plain_json)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+def _plain_json(val):
+    plain = _plain(val)
+    return str(plain) if plain is val else plain
+
+
+def read(obj):
+    """Decoded params stored on obj, or None."""
+    try:
+        raw = obj.get(PARAMS_KEY)
+    except (AttributeError, TypeError):
+        return None
+    return decode(raw)
+
+
+def write(obj, op):
+    obj[PARAMS_KEY] = encode(capture(op))
+
+
+def expand_slots(sparse, defaults):
+    """{field: {"index": value}} -> full columns ({field: [value per slot]})."""
+    count = massa_properties.SLOT_COUNT
+    columns = {}
+    for name in massa_properties.SLOT_FIELDS:
+        column = [defaults.get(name)] * count
+        for index, value in (sparse.get(name) or {}).items():
+            i = int(index)
+            if 0 <= i < count:
+                column[i] = value
+        columns[name] = column
+    return columns
+
+
+def with_defaults(cls, params):
+    """
+    Full params for cls: class defaults overlaid with the stored values.
+    Schema 2 slot diffs are expanded to full columns; legacy slot data
+    (columns or flat mat_0 ... keys) is passed through unchanged.
+    """
+    defaults = class_defaults(cls)
+    full = {}
+    for key, default in defaults.items():
+        full[key] = set(default) if isinstance(default, set) else default
+    for key, val in params.items():
+        if isinstance(defaults.get(key), set) and isinstance(val, (list, tuple)):
+            val = set(val)
+        full[key] = val
+
+    slots = params.get("slots")
+    if isinstance(slots, dict) and all(isinstance(v, dict) for v in slots.values()):
+        full["slots"] = expand_slots(slots, slot_defaults())
+    return full
@@ -0,0 +1,145 @@
+import bmesh
+from collections import OrderedDict
+
+# Templates survive Redo re-runs; keyed by (operator class object, cartridge key).
+# massa_reload and unregister clear it, since reloading a cartridge does not
+# reload this module.
+TEMPLATE_LIMIT = 64
+_template_cache = OrderedDict()
+
+
+class PartTemplate:
+    """
+    PART TEMPLATE: A repeated primitive (chain link, plank, post) built once
+    in a scratch BMesh and snapshotted as plain data. Stamping writes the
+    snapshot into the target once, then further copies come from C-level
+    duplicates of it, so tags, seams and UVs ride along for free.
+    """
+
+    __slots__ = (
+        "co", "faces", "loose_edges",
+        "face_int_names", "edge_int_names", "uv_names",
+    )
+
+    def __init__(self, src):
+        src.verts.index_update()
+
+        self.face_int_names = list(src.faces.layers.int.keys())
+        self.edge_int_names = list(src.edges.layers.int.keys())
+        self.uv_names = list(src.loops.layers.uv.keys())
+
+        face_int = [src.faces.layers.int[n] for n in self.face_int_names]
+        edge_int = [src.edges.layers.int[n] for n in self.edge_int_names]
+        uv = [src.loops.layers.uv[n] for n in self.uv_names]
+
+        def _edge_data(e):
+            return (e.seam, e.smooth, tuple(e[lay] for lay in edge_int))
+
+        self.co = [tuple(v.co) for v in src.verts]
+        self.faces = []
+        for f in src.faces:
+            loops = list(f.loops)
+            self.faces.append((
+                tuple(lp.vert.index for lp in loops),
+                f.material_index,
+                f.smooth,
+                tuple(f[lay] for lay in face_int),
+                tuple(tuple(tuple(lp[lay].uv) for lay in uv) for lp in loops),
+                tuple(_edge_data(lp.edge) for lp in loops),
+            ))
+        self.loose_edges = [
+            (e.verts[0].index, e.verts[1].index, _edge_data(e))
+            for e in src.edges if not e.link_faces
+        ]
+
+    def materialize(self, bm):
+        """Writes one untransformed copy into bm. Returns (verts, edges, faces)."""
+        face_int = [bm.faces.layers.int.get(n) or bm.faces.layers.int.new(n) for n in self.face_int_names]
+        edge_int = [bm.edges.layers.int.get(n) or bm.edges.layers.int.new(n) for n in self.edge_int_names]
+        uv = [bm.loops.layers.uv.get(n) or bm.loops.layers.uv.verify() for n in self.uv_names]
+
+        def _apply_edge(e, data):
+            e.seam, e.smooth = data[0], data[1]
+            for lay, val in zip(edge_int, data[2]):
+                e[lay] = val
+
+        verts = [bm.verts.new(co) for co in self.co]
+        faces = []
+        for v_idx, mat, smooth, ivals, uvs, edata in self.faces:
+            try:
+                f = bm.faces.new([verts[i] for i in v_idx])
+            except ValueError:
+                continue  # Degenerate/duplicate face in source
+            f.material_index = mat
+            f.smooth = smooth
+            for lay, val in zip(face_int, ivals):
+                f[lay] = val
+            for lp, l_uv, e_data in zip(f.loops, uvs, edata):
+                for lay, co in zip(uv, l_uv):
+                    lp[lay].uv = co
+                _apply_edge(lp.edge, e_data)
+            faces.append(f)
+
+        for a, b, e_data in self.loose_edges:
+            e = bm.edges.get((verts[a], verts[b])) or bm.edges.new((verts[a], verts[b]))
+            _apply_edge(e, e_data)
+
+        edges = list({e for v in verts for e in v.link_edges})
+        return verts, edges, faces
+
+
+def get_template(owner, key, builder):
+    """
+    Returns the cached template for (owner, key), calling builder(bm) on a
+    scratch BMesh only on a miss. The key must capture every parameter the
+    builder reads.
+    """
+    cache_key = (owner, key)
+    tpl = _template_cache.get(cache_key)
+    if tpl is not None:
+        _template_cache.move_to_end(cache_key)
+        return tpl
+
+    scratch = bmesh.new()
+    try:
+        builder(scratch)
+        tpl = PartTemplate(scratch)
+    finally:
+        scratch.free()
+
+    _template_cache[cache_key] = tpl
+    while len(_template_cache) > TEMPLATE_LIMIT:
+        _template_cache.popitem(last=False)
+    return tpl
+
+
+def stamp(bm, tpl, matrices):
+    """
+    Stamps one copy of tpl per matrix. The first copy is written from the
+    snapshot; the rest come from doubling duplicates (1 -> 2 -> 4 ...), so
+    N copies cost log2(N) duplicate calls. Every copy is built at identity
+    and moved into place last.
+    Returns [(verts, faces), ...] in matrix order.
+    """
+    matrices = list(matrices)
+    if not matrices:
+        return []
+
+    verts, edges, faces = tpl.materialize(bm)
+    copies = [(verts, edges, faces)]
+    while len(copies) < len(matrices):
+        batch = copies[:len(matrices) - len(copies)]
+        ret = bmesh.ops.duplicate(bm, geom=[ele for copy in batch for part in copy for ele in part])
+        v_map, e_map, f_map = ret["vert_map"], ret["edge_map"], ret["face_map"]
+        copies += [
+            ([v_map[v] for v in c_verts], [e_map[e] for e in c_edges], [f_map[f] for f in c_faces])
+            for c_verts, c_edges, c_faces in batch
+        ]
+
+    for (c_verts, _c_edges, _c_faces), mat in zip(copies, matrices):
+        bmesh.ops.transform(bm, matrix=mat, verts=c_verts)
+    return [(c_verts, c_faces) for c_verts, _c_edges, c_faces in copies]
+
+
+def clear_cache():
+    _template_cache.clear()
@@ -4,12 +4,18 @@ import math
 import random
 from mathutils import Vector, noise
 from . import massa_nodes
+from .massa_properties import slot_value, any_slot
 
 
 # --- TRANSFORMS ---
-def apply_transform_alignment(bm, mode):
-    if mode == "ORIGIN" or not bm.verts:
-        return
+def apply_transform_alignment(bm, mode, extra_bounds=None):
+    """
+    Moves the mesh to the pivot mode. Returns the applied offset (or None).
+    extra_bounds: (min, max) of geometry not in bm yet (recorded instances),
+    so the pivot matches what realized output would get.
+    """
+    if mode == "ORIGIN" or (not bm.verts and extra_bounds is None):
+        return None
     inf = float("inf")
     min_v, max_v = Vector((inf, inf, inf)), Vector((-inf, -inf, -inf))
     for v in bm.verts:
@@ -24,6 +30,10 @@ def apply_transform_alignment(bm, mode):
             max(max_v.y, co.y),
             max(max_v.z, co.z),
         )
+    if extra_bounds is not None:
+        lo, hi = extra_bounds
+        min_v = Vector([min(a, float(b)) for a, b in zip(min_v, lo)])
+        max_v = Vector([max(a, float(b)) for a, b in zip(max_v, hi)])
     center = (min_v + max_v) / 2
     offset = Vector((0, 0, 0))
     if mode == "Z_MIN":
@@ -34,12 +44,14 @@ def apply_transform_alignment(bm, mode):
         offset = Vector((-center.x, -center.y, -max_v.z))
     if offset.length_squared > 0.000001:
         bmesh.ops.translate(bm, vec=offset, verts=bm.verts)
+        return offset
+    return None
 
 
 def apply_slot_inflation(bm, op):
     offset_map = {}
     for i in range(10):
-        off = getattr(op, f"off_{i}", 0.0)
+        off = slot_value(op, i, "off", 0.0)
         if abs(off) > 0.00001:
             offset_map[i] = off * op.global_scale
     if not offset_map:
@@ -397,7 +409,7 @@ def handle_separation(obj, op, manifest, context, slot_map=None):
 
     # [ARCHITECT FIX] Ensure Fuse is baked before separation logic
     if op.pol_fuse_active and "Massa_Fuse" in obj.modifiers:
-         if any(getattr(op, f"sep_{i}", False) for i in range(10)):
+         if any_slot(op, "sep"):
              try:
                  context.view_layer.objects.active = obj
                  bpy.ops.object.modifier_apply(modifier="Massa_Fuse")
@@ -405,7 +417,7 @@ def handle_separation(obj, op, manifest, context, slot_map=None):
                  pass
 
     for i in range(10):
-        if not getattr(op, f"sep_{i}", False):
+        if not slot_value(op, i, "sep", False):
             continue
 
         # [ARCHITECT FIX] Determine Correct Target Index from Slot Map
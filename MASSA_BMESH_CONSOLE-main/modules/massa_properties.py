@@ -5,9 +5,63 @@ from bpy.props import (
     IntProperty,
     EnumProperty,
     FloatVectorProperty,
+    CollectionProperty,
 )
 from ..utils.mat_utils import get_material_items, get_phys_items, UV_MAP_ITEMS
 
+# --- SLOT CONFIGURATION (0-9) ---
+# [ARCHITECT NEW] One CollectionProperty of SLOT_COUNT items replaces the 14
+# flat per-slot properties (mat_0 ... phys_bond_9): every operator class now
+# registers one slot property instead of ~140, and console <-> operator copies
+# move whole columns with foreach_get/foreach_set.
+SLOT_COUNT = 10
+
+COLLISION_SHAPE_ITEMS = [
+    ("BOX", "Box", "Axis Aligned Box"),
+    ("HULL", "Convex Hull", "Convex Hull"),
+    ("SPHERE", "Sphere", "Bounding Sphere"),
+    ("CAPSULE", "Capsule", "Vertical Capsule"),
+    ("MESH", "Mesh", "Original Geometry (Slow)"),
+]
+
+
+class MASSA_PG_SlotConfig(bpy.types.PropertyGroup):
+    """Settings of one material slot. Lives in <owner>.slots[i]."""
+
+    expand: BoolProperty(default=False)
+    mat: EnumProperty(name="Mat", items=get_material_items)
+    phys_mat: EnumProperty(name="Phys", items=get_phys_items)
+    uv_mode: EnumProperty(name="UV", items=UV_MAP_ITEMS, default="SKIP")
+    uv_scale: FloatProperty(name="Scl", default=1.0, min=0.1)
+    sep: BoolProperty(name="Detach", default=False)
+    sock: BoolProperty(name="Socket", default=False)
+    off: FloatProperty(name="Offset", default=0.0)
+    prot: BoolProperty(name="Protect", default=False)
+
+    # [ARCHITECT NEW] Collision Properties
+    collision_shape: EnumProperty(name="Shape", items=COLLISION_SHAPE_ITEMS, default="MESH")
+    show_coll: BoolProperty(name="Show Collision", default=False)
+    phys_friction: FloatProperty(name="Friction", default=0.5, min=0.0, max=1.0)
+    phys_bounce: FloatProperty(name="Restitution", default=0.0, min=0.0, max=1.0)
+    phys_bond: FloatProperty(name="Bond Strength", default=1.0, min=0.0)
+
+
+# Columns copied with foreach_get/set vs. enums copied per item
+SLOT_NUMERIC_FIELDS = (
+    ("expand", bool),
+    ("uv_scale", float),
+    ("sep", bool),
+    ("sock", bool),
+    ("off", float),
+    ("prot", bool),
+    ("show_coll", bool),
+    ("phys_friction", float),
+    ("phys_bounce", float),
+    ("phys_bond", float),
+)
+SLOT_ENUM_FIELDS = ("mat", "phys_mat", "uv_mode", "collision_shape")
+SLOT_FIELDS = tuple(name for name, _kind in SLOT_NUMERIC_FIELDS) + SLOT_ENUM_FIELDS
+
 
 class MassaPropertiesMixin:
     """
@@ -18,6 +72,14 @@ class MassaPropertiesMixin:
     # --- GLOBAL ---
     global_scale: FloatProperty(name="Global Scale", default=1.0, min=0.01)
     draft_mode: BoolProperty(name="Draft Mode", default=False)
+    output_mode: EnumProperty(
+        name="Output",
+        items=[
+            ("REALIZED", "Realized", "Write every part into the mesh"),
+            ("INSTANCES", "Instances", "Emit repeated parts as Geometry Nodes instances (supported cartridges only)"),
+        ],
+        default="REALIZED",
+    )
 
     # --- TRANSFORM ---
     pivot_mode: EnumProperty(
@@ -451,49 +513,184 @@ class MassaPropertiesMixin:
     )
 
     # --- SLOT GENERATOR (0-9) ---
-    if not "__annotations__" in locals():
-        __annotations__ = {}
-
-    for i in range(10):
-        __annotations__[f"expand_{i}"] = BoolProperty(default=(i == 0))
-        __annotations__[f"mat_{i}"] = EnumProperty(
-            name=f"Mat {i}", items=get_material_items
-        )
-        __annotations__[f"phys_mat_{i}"] = EnumProperty(
-            name=f"Phys {i}", items=get_phys_items
-        )
-        __annotations__[f"uv_mode_{i}"] = EnumProperty(
-            name=f"UV {i}", items=UV_MAP_ITEMS, default="SKIP"
-        )
-        __annotations__[f"uv_scale_{i}"] = FloatProperty(
-            name=f"Scl {i}", default=1.0, min=0.1
-        )
-        __annotations__[f"sep_{i}"] = BoolProperty(name=f"Detach {i}", default=False)
-        __annotations__[f"sock_{i}"] = BoolProperty(name="Socket", default=False)
-        __annotations__[f"off_{i}"] = FloatProperty(name="Offset", default=0.0)
-        __annotations__[f"prot_{i}"] = BoolProperty(name="Protect", default=False)
-
-        # [ARCHITECT NEW] Collision Properties
-        __annotations__[f"collision_shape_{i}"] = EnumProperty(
-            name=f"Shape {i}",
-            items=[
-                ("BOX", "Box", "Axis Aligned Box"),
-                ("HULL", "Convex Hull", "Convex Hull"),
-                ("SPHERE", "Sphere", "Bounding Sphere"),
-                ("CAPSULE", "Capsule", "Vertical Capsule"),
-                ("MESH", "Mesh", "Original Geometry (Slow)"),
-            ],
-            default="MESH",
-        )
-        __annotations__[f"show_coll_{i}"] = BoolProperty(
-            name=f"Show Collision {i}", default=False
-        )
-        __annotations__[f"phys_friction_{i}"] = FloatProperty(
-            name=f"Friction {i}", default=0.5, min=0.0, max=1.0
-        )
-        __annotations__[f"phys_bounce_{i}"] = FloatProperty(
-            name=f"Restitution {i}", default=0.0, min=0.0, max=1.0
-        )
-        __annotations__[f"phys_bond_{i}"] = FloatProperty(
-            name=f"Bond Strength {i}", default=1.0, min=0.0
-        )
+    # Filled to SLOT_COUNT items by ensure_slots (see MASSA_PG_SlotConfig)
+    slots: CollectionProperty(type=MASSA_PG_SlotConfig, options={"HIDDEN"})
+
+
+# -------------------------------------------------------------------
+# SLOT ACCESS & BULK COPY
+# -------------------------------------------------------------------
+
+
+def get_slot(owner, i):
+    """Slot item i of an operator/console, or None if not populated."""
+    slots = getattr(owner, "slots", None)
+    if slots is None or i >= len(slots):
+        return None
+    return slots[i]
+
+
+def slot_value(owner, i, field, default=None):
+    item = get_slot(owner, i)
+    if item is None:
+        return default
+    return getattr(item, field, default)
+
+
+def any_slot(owner, field):
+    """True if a boolean slot field (e.g. 'sep') is set on any slot."""
+    slots = getattr(owner, "slots", None)
+    if not slots:
+        return False
+    buf = [False] * len(slots)
+    slots.foreach_get(field, buf)
+    return any(buf)
+
+
+def ensure_slots(owner):
+    """Grows owner.slots to SLOT_COUNT items (fresh operators start empty)."""
+    slots = owner.slots
+    while len(slots) < SLOT_COUNT:
+        i = len(slots)
+        item = slots.add()
+        item.expand = i == 0
+        _migrate_legacy_slot(owner, item, i)
+    return slots
+
+
+def copy_slots(src, dst):
+    """
+    Bulk copy of every slot field: one foreach pass per numeric column,
+    written only where it differs. Returns the number of changed fields.
+    """
+    src_slots = ensure_slots(src)
+    dst_slots = ensure_slots(dst)
+    changed = 0
+    for name, kind in SLOT_NUMERIC_FIELDS:
+        buf = [kind()] * len(src_slots)
+        src_slots.foreach_get(name, buf)
+        buf = buf[: len(dst_slots)]
+        cur = [kind()] * len(dst_slots)
+        dst_slots.foreach_get(name, cur)
+        if cur != buf:
+            dst_slots.foreach_set(name, buf)
+            changed += sum(1 for a, b in zip(cur, buf) if a != b)
+    for a, b in zip(src_slots, dst_slots):
+        for name in SLOT_ENUM_FIELDS:
+            value = getattr(a, name)
+            if getattr(b, name) != value:
+                try:
+                    setattr(b, name, value)
+                    changed += 1
+                except TypeError:
+                    pass  # Material vanished from the dynamic item list
+    return changed
+
+
+def copy_changed(src, dst, keys):
+    """
+    Copies src.key -> dst.key for keys whose values differ (arrays compared
+    by value). Returns the number of properties written.
+    """
+    changed = 0
+    for key in keys:
+        val = getattr(src, key)
+        cur = getattr(dst, key)
+        if hasattr(val, "__len__") and not isinstance(val, (str, set)):
+            if tuple(val) == tuple(cur):
+                continue
+        elif val == cur:
+            continue
+        try:
+            setattr(dst, key, val)
+            changed += 1
+        except (AttributeError, TypeError, ValueError):
+            pass
+    return changed
+
+
+def slots_to_params(owner):
+    """Columnar {field: [value per slot]} for MASSA_PARAMS (14 keys, not 140)."""
+    slots = getattr(owner, "slots", None) or []
+    out = {}
+    for name, kind in SLOT_NUMERIC_FIELDS:
+        buf = [kind()] * len(slots)
+        if slots:
+            slots.foreach_get(name, buf)
+        out[name] = buf
+    for name in SLOT_ENUM_FIELDS:
+        out[name] = [getattr(item, name) for item in slots]
+    return out
+
+
+def slot_dicts(owner):
+    """One dict per slot: the form bpy.ops accepts for a CollectionProperty kwarg."""
+    columns = slots_to_params(owner)
+    count = len(getattr(owner, "slots", None) or [])
+    return [{name: columns[name][i] for name in SLOT_FIELDS} for i in range(count)]
+
+
+def legacy_slot_params(params):
+    """
+    Converts flat legacy keys (mat_0 ... phys_bond_9) from old MASSA_PARAMS
+    into the columnar form. Returns (columns, keys_consumed).
+    """
+    columns = {}
+    used = []
+    for key, value in params.items():
+        field, _sep, index = key.rpartition("_")
+        if field in SLOT_FIELDS and index.isdigit() and int(index) < SLOT_COUNT:
+            column = columns.setdefault(field, [None] * SLOT_COUNT)
+            column[int(index)] = value
+            used.append(key)
+    return columns, used
+
+
+def apply_slot_params(owner, columns, skip=()):
+    """Writes columnar slot data (MASSA_PARAMS form) onto owner.slots."""
+    slots = ensure_slots(owner)
+    for name, values in columns.items():
+        if name not in SLOT_FIELDS or name in skip:
+            continue
+        for item, value in zip(slots, values):
+            if value is None:
+                continue
+            try:
+                setattr(item, name, value)
+            except (TypeError, ValueError):
+                pass
+
+
+def _migrate_legacy_slot(owner, item, i):
+    """
+    Pulls values stored under the old flat names (files saved before the
+    slot collection) into the new item, then drops the stale ID properties.
+    """
+    try:
+        keys = [f"{name}_{i}" for name in SLOT_FIELDS if owner.get(f"{name}_{i}") is not None]
+    except (AttributeError, TypeError):
+        return  # Operators keep no ID properties of their own
+    for key in keys:
+        name = key[: -len(str(i)) - 1]
+        raw = owner[key]
+        if name in SLOT_ENUM_FIELDS:
+            items = _enum_items(name)
+            if not isinstance(raw, int) or not 0 <= raw < len(items):
+                del owner[key]
+                continue
+            raw = items[raw][0]
+        try:
+            setattr(item, name, raw)
+        except (TypeError, ValueError):
+            pass
+        del owner[key]
+
+
+def _enum_items(name):
+    if name == "uv_mode":
+        return UV_MAP_ITEMS
+    if name == "collision_shape":
+        return COLLISION_SHAPE_ITEMS
+    if name == "mat":
+        return get_material_items(None, bpy.context)
+    return get_phys_items(None, bpy.context)
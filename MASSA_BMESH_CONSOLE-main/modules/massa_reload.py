@@ -0,0 +1,252 @@
+import os
+import sys
+import types
+import hashlib
+import importlib
+
+# --- SELECTIVE HOT RELOAD ---
+# Tracks (mtime, sha1) of every loaded add-on module. A reload touches only
+# modules whose file content really changed, plus the modules that depend
+# on them (anything holding one of their modules, classes or functions in
+# its globals), in dependency order.
+# Kept free of bpy so the planning half runs (and is tested) outside Blender.
+
+_STATE = {}  # module name -> (mtime_ns, sha1)
+
+# Modules whose state lives outside their own globals (scene PointerProperties,
+# the lazy cartridge registry, the mixin every operator inherits): a live
+# reload can not swap them safely, they need a full Reload Scripts.
+FULL_RELOAD_MODULES = (
+    "modules.massa_properties",
+    "modules.massa_console",
+    "modules.massa_cartridge_props",
+    "modules.cartridges",
+)
+CARTRIDGE_PACKAGE = "modules.cartridges"
+
+
+def _hash(path):
+    with open(path, "rb") as fh:
+        return hashlib.sha1(fh.read()).hexdigest()
+
+
+def package_modules(package):
+    """(name, module) of every loaded submodule of the add-on with a source file."""
+    prefix = package + "."
+    out = []
+    for name, mod in list(sys.modules.items()):
+        if mod is None or not name.startswith(prefix):
+            continue
+        path = getattr(mod, "__file__", None)
+        if path and path.endswith(".py"):
+            out.append((name, mod))
+    return out
+
+
+def track(package):
+    """Snapshots every loaded module of the add-on as the new clean state."""
+    for name, mod in package_modules(package):
+        try:
+            st = os.stat(mod.__file__)
+            _STATE[name] = (st.st_mtime_ns, _hash(mod.__file__))
+        except OSError:
+            _STATE.pop(name, None)
+
+
+def changed_modules(package):
+    """
+    Names of modules whose file changed since track(). mtime is only the
+    trigger; the hash decides (saving without edits reloads nothing).
+    Modules first seen now (lazily imported cartridges) are adopted as clean.
+    Does not update the snapshot: that happens after a successful reload.
+    """
+    changed = []
+    for name, mod in package_modules(package):
+        old = _STATE.get(name)
+        try:
+            st = os.stat(mod.__file__)
+            if old is None:
+                _STATE[name] = (st.st_mtime_ns, _hash(mod.__file__))
+                continue
+            if st.st_mtime_ns == old[0]:
+                continue
+            digest = _hash(mod.__file__)
+        except OSError:
+            continue  # Deleted file: nothing to reload from
+        if digest != old[1]:
+            changed.append(name)
+        else:
+            _STATE[name] = (st.st_mtime_ns, digest)
+    return changed
+
+
+def dependencies(mod, package):
+    """
+    In-package modules referenced from mod's globals (modules, classes, functions).
+    A package's own submodules are skipped: the import system sets them as
+    attributes, which is not a dependency (else every cartridge would drag
+    modules.cartridges, a full-reload module, into the reload).
+    """
+    prefix = package + "."
+    own = mod.__name__ + "."
+    deps = set()
+    for value in list(vars(mod).values()):
+        if isinstance(value, types.ModuleType):
+            name = value.__name__
+            if name.startswith(own):
+                continue
+        else:
+            name = getattr(value, "__module__", None)
+            if not isinstance(name, str) or not isinstance(value, (type, types.FunctionType)):
+                continue
+        if name != mod.__name__ and name.startswith(prefix):
+            deps.add(name)
+    return deps
+
+
+def reload_order(package, changed):
+    """
+    changed + every transitive dependent, ordered so each module comes
+    after the in-package modules it depends on (import order breaks cycles).
+    """
+    mods = dict(package_modules(package))
+    deps = {name: dependencies(mod, package) & mods.keys() for name, mod in mods.items()}
+
+    dependents = {name: set() for name in mods}
+    for name, ds in deps.items():
+        for d in ds:
+            dependents[d].add(name)
+
+    affected = set()
+    todo = [name for name in changed if name in mods]
+    while todo:
+        name = todo.pop()
+        if name in affected:
+            continue
+        affected.add(name)
+        todo.extend(dependents[name] - affected)
+
+    # Kahn over the affected subgraph, stable in sys.modules (import) order
+    rank = {name: i for i, name in enumerate(mods)}
+    pending = {name: deps[name] & affected for name in affected}
+    order = []
+    while pending:
+        ready = sorted((n for n, ds in pending.items() if not ds), key=rank.get)
+        if not ready:
+            ready = [min(pending, key=rank.get)]  # Cycle: fall back to import order
+        for name in ready:
+            order.append(name)
+            del pending[name]
+        for ds in pending.values():
+            ds.difference_update(ready)
+    return order
+
+
+def needs_full_reload(package, name):
+    rel = name[len(package) + 1:]
+    if rel in FULL_RELOAD_MODULES:
+        return True
+    if rel.startswith(CARTRIDGE_PACKAGE + "."):
+        return False  # Cartridge operators are re-registered individually
+    mod = sys.modules.get(name)
+    return callable(getattr(mod, "register", None))  # Own handlers/props to rebuild
+
+
+def _clear_part_templates(package):
+    # Cached part geometry was built by the old code; massa_parts itself is
+    # usually not among the reloaded modules, so drop it explicitly.
+    parts = sys.modules.get(f"{package}.modules.massa_parts")
+    if parts is not None:
+        parts.clear_cache()
+
+
+def reload_changed(package):
+    """
+    Reload Scripts path (classes are already unregistered by the add-on):
+    reloads changed modules and dependents only, then re-snapshots.
+    Returns the reloaded module names.
+    """
+    order = reload_order(package, changed_modules(package))
+    for name in order:
+        importlib.reload(sys.modules[name])
+    if order:
+        _clear_part_templates(package)
+    track(package)
+    return order
+
+
+def _registered_classes(order):
+    found = []
+    for name in order:
+        mod = sys.modules[name]
+        for attr, value in list(vars(mod).items()):
+            if isinstance(value, type) and value.__module__ == name and getattr(value, "is_registered", False):
+                found.append((name, attr, value))
+    return found
+
+
+def hot_reload(package):
+    """
+    LIVE SELECTIVE RELOAD (add-on stays enabled)
+    Unregisters the classes of affected modules, reloads them in dependency
+    order and registers the new classes. Loaded cartridges also get their
+    console PropertyGroup rebuilt. Returns a stats dict with status:
+      CLEAN    nothing changed
+      FULL     a changed/affected module needs Reload Scripts ('blocking')
+      RELOADED done
+      ERROR    reload failed ('error'); the previous classes are restored
+    """
+    import bpy
+
+    changed = changed_modules(package)
+    if not changed:
+        return {"status": "CLEAN", "changed": [], "reloaded": []}
+
+    order = reload_order(package, changed)
+    blocking = [name for name in order if needs_full_reload(package, name)]
+    if blocking:
+        return {"status": "FULL", "changed": changed, "reloaded": [], "blocking": blocking}
+
+    classes = _registered_classes(order)
+    for _name, _attr, cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
+
+    error = None
+    for name in order:
+        try:
+            importlib.reload(sys.modules[name])
+        except Exception as e:
+            error = f"{name}: {e}"
+            print(f"Massa Reload: {error}")
+            break
+
+    for name, attr, old_cls in classes:
+        cls = getattr(sys.modules[name], attr, None)
+        if not isinstance(cls, type):
+            cls = old_cls  # Removed or broken: keep the add-on usable
+        try:
+            bpy.utils.register_class(cls)
+        except (ValueError, RuntimeError) as e:
+            print(f"Massa Reload: Could not register {attr}: {e}")
+
+    _refresh_cartridge_props(package, set(order))
+    _clear_part_templates(package)
+
+    if error:
+        return {"status": "ERROR", "changed": changed, "reloaded": order, "error": error}
+    track(package)
+    return {"status": "RELOADED", "changed": changed, "reloaded": order, "classes": len(classes)}
+
+
+def _refresh_cartridge_props(package, reloaded):
+    cartridges = sys.modules.get(f"{package}.{CARTRIDGE_PACKAGE}")
+    props = sys.modules.get(f"{package}.modules.massa_cartridge_props")
+    if cartridges is None or props is None:
+        return
+    for entry in cartridges.entries():
+        if f"{cartridges.__name__}.{entry['module']}" in reloaded and cartridges.is_loaded(entry["id"]):
+            props.unregister_cartridge_props(entry["id"])
+            props.register_cartridge_props(entry["id"], cartridges.operator_class(entry["id"]))
@@ -0,0 +1,244 @@
+import bpy
+import math
+from mathutils.kdtree import KDTree
+from bpy.app.handlers import persistent
+
+SOCKET_PREFIX = "SOCKET_"
+
+# --- SCENE SOCKET INDEX ---
+# session_uid -> (name, position, normal, owner_uid, parent_uid)
+# Positions/normals are stored as plain float tuples in world space.
+_records = {}
+# parent session_uid -> set of socket session_uids (parent moves refresh children)
+_children = {}
+# owner session_uid -> set of socket session_uids (per-owner queries)
+_owned = {}
+
+_tree = None
+_tree_keys = []
+_tree_dirty = True
+_needs_scan = True
+_scene_uid = None
+
+
+def is_socket(obj):
+    return obj is not None and obj.type == "EMPTY" and obj.name.startswith(SOCKET_PREFIX)
+
+
+def socket_owner(obj):
+    """
+    Returns the Massa object a socket belongs to (first ancestor with a
+    massa_op_id), falling back to the top-most parent.
+    """
+    owner = obj
+    while owner.parent is not None:
+        owner = owner.parent
+        if "massa_op_id" in owner:
+            return owner
+    return owner
+
+
+def _make_record(obj):
+    mw = obj.matrix_world
+    pos = tuple(mw.translation)
+    z = mw.col[2]
+    length = math.sqrt(z[0] * z[0] + z[1] * z[1] + z[2] * z[2]) or 1.0
+    normal = (z[0] / length, z[1] / length, z[2] / length)
+    parent_uid = obj.parent.session_uid if obj.parent is not None else None
+    return (obj.name, pos, normal, socket_owner(obj).session_uid, parent_uid)
+
+
+def _unlink(index, key, uid):
+    members = index.get(key)
+    if members is not None:
+        members.discard(uid)
+        if not members:
+            del index[key]
+
+
+def _forget(uid):
+    rec = _records.pop(uid, None)
+    if rec is None:
+        return
+    _unlink(_owned, rec[3], uid)
+    if rec[4] is not None:
+        _unlink(_children, rec[4], uid)
+
+
+def track(obj):
+    """
+    Inserts or refreshes a single socket. Returns True if the index changed.
+    """
+    global _tree_dirty
+    uid = obj.session_uid
+    if not is_socket(obj):
+        if uid in _records:
+            _forget(uid)
+            _tree_dirty = True
+            return True
+        return False
+
+    rec = _make_record(obj)
+    old = _records.get(uid)
+    if old == rec:
+        return False
+    if old is not None and (old[3] != rec[3] or old[4] != rec[4]):
+        _forget(uid)
+    _records[uid] = rec
+    _owned.setdefault(rec[3], set()).add(uid)
+    if rec[4] is not None:
+        _children.setdefault(rec[4], set()).add(uid)
+    _tree_dirty = True
+    return True
+
+
+def _refresh_children(parent_uid):
+    global _needs_scan
+    for uid in list(_children.get(parent_uid, ())):
+        rec = _records.get(uid)
+        sock = bpy.data.objects.get(rec[0]) if rec else None
+        if sock is None or sock.session_uid != uid:
+            # Renamed or deleted; a rescan will pick it back up
+            _needs_scan = True
+            continue
+        track(sock)
+
+
+def rebuild(scene):
+    """
+    Full scan of the scene. Only needed on first use, scene switch,
+    file load, or when objects were added/removed.
+    """
+    global _needs_scan, _tree_dirty, _scene_uid
+    _records.clear()
+    _children.clear()
+    _owned.clear()
+    for obj in scene.objects:
+        if is_socket(obj):
+            track(obj)
+    _scene_uid = scene.session_uid
+    _needs_scan = False
+    _tree_dirty = True
+
+
+def _ensure(scene):
+    """
+    Brings the KD-tree up to date. Edits only mark the tree dirty, so the
+    O(n log n) balance runs at most once per batch of edits; every query
+    after that is O(log n).
+    """
+    global _tree, _tree_keys, _tree_dirty
+    if _needs_scan or _scene_uid != scene.session_uid:
+        rebuild(scene)
+    if not _tree_dirty and _tree is not None:
+        return _tree
+
+    keys = list(_records.keys())
+    tree = KDTree(len(keys))
+    for i, uid in enumerate(keys):
+        tree.insert(_records[uid][1], i)
+    tree.balance()
+
+    _tree = tree
+    _tree_keys = keys
+    _tree_dirty = False
+    return tree
+
+
+def sockets_of(scene, owner):
+    """Returns the record keys of every socket belonging to owner."""
+    _ensure(scene)
+    return list(_owned.get(owner.session_uid, ()))
+
+
+def _opposed(n_a, n_b, min_dot):
+    # Compatible sockets face each other: dot(a, b) close to -1
+    return -(n_a[0] * n_b[0] + n_a[1] * n_b[1] + n_a[2] * n_b[2]) >= min_dot
+
+
+def find_pairs(scene, owner, tolerance=0.5, angle_tolerance=math.radians(30.0)):
+    """
+    SOCKET SNAP QUERY
+    For every socket of owner, range-queries the index and returns compatible
+    partners on other objects as (distance, source_name, target_name) sorted
+    nearest first.
+    """
+    tree = _ensure(scene)
+    min_dot = math.cos(angle_tolerance)
+    owner_uid = owner.session_uid
+
+    pairs = []
+    for uid in _owned.get(owner_uid, ()):
+        rec = _records[uid]
+        for _co, idx, dist in tree.find_range(rec[1], tolerance):
+            other = _records[_tree_keys[idx]]
+            if other[3] == owner_uid:
+                continue
+            if not _opposed(rec[2], other[2], min_dot):
+                continue
+            pairs.append((dist, rec[0], other[0]))
+
+    pairs.sort(key=lambda p: p[0])
+    return pairs
+
+
+def get_record(name):
+    obj = bpy.data.objects.get(name)
+    if obj is None:
+        return None
+    return _records.get(obj.session_uid)
+
+
+@persistent
+def depsgraph_update_post(scene, depsgraph):
+    """
+    Incremental maintenance: only the objects the depsgraph reports are
+    re-read. Moving a Massa object refreshes its own sockets via the parent map.
+    """
+    global _needs_scan
+    if _needs_scan:
+        return  # A full scan is already pending; nothing to patch
+
+    for update in depsgraph.updates:
+        id_data = getattr(update.id, "original", update.id)
+        if isinstance(id_data, bpy.types.Collection):
+            # Objects were linked/unlinked; cheaper to rescan lazily than to diff
+            _needs_scan = True
+            return
+        if not isinstance(id_data, bpy.types.Object):
+            continue
+        track(id_data)
+        if id_data.session_uid in _children:
+            _refresh_children(id_data.session_uid)
+
+
+@persistent
+def load_post(_dummy):
+    clear()
+
+
+def clear():
+    global _tree, _tree_keys, _tree_dirty, _needs_scan, _scene_uid
+    _records.clear()
+    _children.clear()
+    _owned.clear()
+    _tree = None
+    _tree_keys = []
+    _tree_dirty = True
+    _needs_scan = True
+    _scene_uid = None
+
+
+def register():
+    if depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(depsgraph_update_post)
+    if load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(load_post)
+
+
+def unregister():
+    if depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
+    if load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(load_post)
+    clear()
@@ -1,97 +1,194 @@
 import bpy
 import bmesh
+import numpy as np
+from itertools import combinations
 from mathutils import Vector, Euler, Matrix
 
 
-def calculate_transforms(bm, target_slots):
+def analyze_faces(bm):
+    """
+    Single scan of the BMesh into flat arrays shared by both socket paths
+    (slot sockets + MASSA_SOCKETS layer). Areas, median centres and normals
+    come from segmented reductions over the loop arrays (Newell's method),
+    and islands are labeled once via union-find on the face adjacency pairs.
+    """
+    bm.verts.index_update()
+    bm.faces.index_update()
+
+    n_faces = len(bm.faces)
+    mat = np.empty(n_faces, dtype=np.int32)
+    sock = np.zeros(n_faces, dtype=np.int32)
+    sizes = np.empty(n_faces, dtype=np.int64)
+    loop_verts = []
+
+    sock_layer = bm.faces.layers.int.get("MASSA_SOCKETS")
+    for i, f in enumerate(bm.faces):
+        mat[i] = f.material_index
+        if sock_layer:
+            sock[i] = f[sock_layer]
+        f_verts = f.verts
+        sizes[i] = len(f_verts)
+        loop_verts.extend(v.index for v in f_verts)
+
+    data = {"mat": mat, "sock": sock}
+    if not n_faces:
+        data.update(
+            area=np.zeros(0), center=np.zeros((0, 3)), normal=np.zeros((0, 3)),
+            island=np.zeros(0, dtype=np.int64),
+        )
+        return data
+
+    # Face Adjacency (same material only -> islands never cross slots)
+    pairs = []
+    for e in bm.edges:
+        link = e.link_faces
+        if len(link) > 1:
+            pairs.extend(combinations([f.index for f in link], 2))
+    pairs = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+    if len(pairs):
+        pairs = pairs[mat[pairs[:, 0]] == mat[pairs[:, 1]]]
+
+    co = np.array([v.co[:] for v in bm.verts], dtype=np.float64).reshape(-1, 3)
+    loop_verts = np.array(loop_verts, dtype=np.int64)
+    starts = np.zeros(n_faces, dtype=np.int64)
+    np.cumsum(sizes[:-1], out=starts[1:])
+
+    pts = co[loop_verts]
+    nxt = np.arange(len(loop_verts)) + 1
+    nxt[starts + sizes - 1] = starts
+
+    newell = np.add.reduceat(np.cross(pts, pts[nxt]), starts, axis=0)
+    length = np.linalg.norm(newell, axis=1)
+
+    data["area"] = 0.5 * length
+    data["normal"] = newell / np.maximum(length, 1e-12)[:, None]
+    data["center"] = np.add.reduceat(pts, starts, axis=0) / sizes[:, None]
+    data["island"] = _label_islands(n_faces, pairs)
+    return data
+
+
+def _label_islands(count, pairs):
+    """
+    Union-find over an adjacency array: hook the larger root onto the smaller,
+    then compress paths by pointer jumping. Each label ends up as the lowest
+    face index of its island, so island order follows face order.
+    """
+    labels = np.arange(count, dtype=np.int64)
+    if not len(pairs):
+        return labels
+    a, b = pairs[:, 0], pairs[:, 1]
+    while True:
+        la, lb = labels[a], labels[b]
+        diff = la != lb
+        if not diff.any():
+            return labels
+        np.minimum.at(labels, np.maximum(la[diff], lb[diff]), np.minimum(la[diff], lb[diff]))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+def _socket_basis(vec_z):
+    # Tangent Y = Try to align with Global Z (Up), else Global Y
+    # This prevents the socket from rotating randomly around its normal
+    global_up = Vector((0, 0, 1))
+
+    # If normal is pointing roughly Up/Down, we can't use Up as tangent.
+    if abs(vec_z.dot(global_up)) > 0.95:
+        # Use Global Y as the reference "Up" for the socket
+        ref_vec = Vector((0, 1, 0))
+    else:
+        ref_vec = global_up
+
+    # Calculate X (Right)
+    vec_x = ref_vec.cross(vec_z).normalized()
+    # Recalculate Y (Up) to ensure orthogonality
+    vec_y = vec_z.cross(vec_x).normalized()
+
+    # Construct Rotation Matrix
+    return Matrix((vec_x, vec_y, vec_z)).transposed()  # 3x3 Rotation
+
+
+def calculate_transforms(bm, target_slots, face_data=None):
     """
     Scans the mesh for faces belonging to 'target_slots'.
     Groups them by island, finds the dominant face, and calculates a robust transform matrix.
+    Pass 'face_data' from analyze_faces() to reuse an existing scan.
     """
     sockets = {}
     if not target_slots:
         return sockets
-    bm.faces.ensure_lookup_table()
-
-    # 1. Group Faces by Connectivity (Islands)
-    visited = set()
-    islands = []
-    relevant = [f for f in bm.faces if f.material_index in target_slots]
-
-    for f in relevant:
-        if f in visited:
-            continue
-        stack = [f]
-        current_island = []
-        visited.add(f)
-        while stack:
-            curr = stack.pop()
-            current_island.append(curr)
-            for e in curr.edges:
-                for lf in e.link_faces:
-                    if lf.material_index == curr.material_index and lf not in visited:
-                        visited.add(lf)
-                        stack.append(lf)
-        if current_island:
-            islands.append(current_island)
-
-    # 2. Calculate Robust Transforms per Island
-    for island in islands:
-        if not island:
-            continue
-
-        mat_idx = island[0].material_index
-
-        # A. Find Dominant Face (Largest Area)
-        # We use this instead of averaging to prevent "Diagonal" normals on cubes
-        dominant_face = max(island, key=lambda f: f.calc_area())
-
-        # B. Calculate Center (Geometric Center of the Island)
-        center = Vector((0, 0, 0))
-        total_a = 0.0
-        for f in island:
-            a = f.calc_area()
-            center += f.calc_center_median() * a
-            total_a += a
-
-        if total_a < 0.0001:
-            final_center = dominant_face.calc_center_median()
+    if face_data is None:
+        face_data = analyze_faces(bm)
+
+    face_idx = np.flatnonzero(np.isin(face_data["mat"], list(target_slots)))
+    if not len(face_idx):
+        return sockets
+
+    # 1. Segment faces by island
+    _, inv = np.unique(face_data["island"][face_idx], return_inverse=True)
+    area = face_data["area"][face_idx]
+    center = face_data["center"][face_idx]
+
+    # 2. Segmented Reductions
+    # A. Dominant Face (Largest Area) per island
+    # We use this instead of averaging to prevent "Diagonal" normals on cubes
+    order = np.lexsort((-area, inv))
+    dominant = face_idx[order[np.r_[0, np.flatnonzero(np.diff(inv[order])) + 1]]]
+
+    # B. Area-weighted Centre per island
+    total_a = np.bincount(inv, weights=area)
+    weighted = np.stack([np.bincount(inv, weights=center[:, k] * area) for k in range(3)], axis=1)
+
+    # 3. Robust Transforms per Island
+    for k, dom in enumerate(dominant):
+        if total_a[k] < 0.0001:
+            final_center = Vector(face_data["center"][dom])
         else:
-            final_center = center / total_a
+            final_center = Vector(weighted[k] / total_a[k])
 
-        # C. Calculate Robust Orientation (Tangent aligned)
-        # Normal Z = Face Normal
-        vec_z = dominant_face.normal.normalized()
+        # Normal Z = Dominant Face Normal
+        vec_z = Vector(face_data["normal"][dom]).normalized()
+        rot_mat = _socket_basis(vec_z)
 
-        # Tangent Y = Try to align with Global Z (Up), else Global Y
-        # This prevents the socket from rotating randomly around its normal
-        global_up = Vector((0, 0, 1))
+        sockets.setdefault(int(face_data["mat"][dom]), []).append((final_center, rot_mat))
 
-        # If normal is pointing roughly Up/Down, we can't use Up as tangent.
-        if abs(vec_z.dot(global_up)) > 0.95:
-            # Use Global Y as the reference "Up" for the socket
-            ref_vec = Vector((0, 1, 0))
-        else:
-            ref_vec = global_up
+    return sockets
 
-        # Calculate X (Right)
-        vec_x = ref_vec.cross(vec_z).normalized()
-        # Recalculate Y (Up) to ensure orthogonality
-        vec_y = vec_z.cross(vec_x).normalized()
 
-        # Construct Rotation Matrix
-        rot_mat = Matrix((vec_x, vec_y, vec_z)).transposed()  # 3x3 Rotation
+def collect_layer_sockets(face_data):
+    """
+    Groups faces tagged in the 'MASSA_SOCKETS' layer (id > 0).
+    Returns [(socket_id, centre, normal)] with the median centre averaged
+    per socket and the normals summed then normalized.
+    """
+    sock = face_data["sock"]
+    face_idx = np.flatnonzero(sock > 0)
+    if not len(face_idx):
+        return []
 
-        sockets.setdefault(mat_idx, []).append((final_center, rot_mat))
+    ids, inv = np.unique(sock[face_idx], return_inverse=True)
+    counts = np.bincount(inv)
+    center_sum = np.stack([np.bincount(inv, weights=face_data["center"][face_idx, a]) for a in range(3)], axis=1)
+    normal_sum = np.stack([np.bincount(inv, weights=face_data["normal"][face_idx, a]) for a in range(3)], axis=1)
 
-    return sockets
+    collected = []
+    for k, sid in enumerate(ids):
+        c = Vector(center_sum[k] / counts[k])
+        n = Vector(normal_sum[k]).normalized()
+        collected.append((int(sid), c, n))
+    return collected
 
 
 def spawn_socket_objects(
-    parent_obj, socket_data, manifest, global_scale, use_rot, rotation
+    parent_obj, socket_data, manifest, global_scale, use_rot, rotation, claim=None
 ):
     """
     Spawns Empty objects based on the calculated matrices.
+    claim(name, 'EMPTY') may hand back an existing socket to update instead
+    (in-place resurrection, see massa_inplace).
     """
     for s_idx, data_list in socket_data.items():
         name = manifest[s_idx]["name"]
@@ -99,7 +196,12 @@ def spawn_socket_objects(
 
         for i, (loc, rot_mat) in enumerate(data_list):
             sock_name = f"SOCKET_{safe}_{i}"
-            sock = bpy.data.objects.new(sock_name, None)
+            sock = claim(sock_name, "EMPTY") if claim else None
+            is_new = sock is None
+            if is_new:
+                sock = bpy.data.objects.new(sock_name, None)
+            else:
+                sock.parent = None  # Placement below is computed unparented
 
             # Setup Visuals
             sock.empty_display_type = "SINGLE_ARROW"
@@ -125,5 +227,6 @@ def spawn_socket_objects(
                 sock.rotation_euler = (global_rot @ sock.matrix_world).to_euler()
 
             # Link and Parent
-            bpy.context.collection.objects.link(sock)
+            if is_new:
+                bpy.context.collection.objects.link(sock)
             sock.parent = parent_obj
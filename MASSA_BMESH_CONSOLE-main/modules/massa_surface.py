@@ -5,6 +5,7 @@ import bpy
 from mathutils import Vector, kdtree, noise
 from mathutils.bvhtree import BVHTree
 from ..utils import mat_utils
+from .massa_properties import slot_value
 
 
 def gather_manifest(op):
@@ -19,12 +20,12 @@ def gather_manifest(op):
     for i in range(10):
         manifest[i] = {
             "name": slot_names.get(i, f"Slot_{i}"),
-            "uv": getattr(op, f"uv_mode_{i}", "SKIP"),
-            "uv_scale": getattr(op, f"uv_scale_{i}", 1.0),
-            "phys": getattr(op, f"phys_mat_{i}", "GENERIC"),
-            "prot": getattr(op, f"prot_{i}", False),
+            "uv": slot_value(op, i, "uv_mode", "SKIP"),
+            "uv_scale": slot_value(op, i, "uv_scale", 1.0),
+            "phys": slot_value(op, i, "phys_mat", "GENERIC"),
+            "prot": slot_value(op, i, "prot", False),
         }
-        if getattr(op, f"sock_{i}", False):
+        if slot_value(op, i, "sock", False):
             active_sockets.append(i)
     return manifest, active_sockets
 
@@ -71,11 +72,12 @@ def calculate_physical_stats(bm, manifest):
     return vol, total_mass
 
 
-def assign_materials(obj, op, bm=None):
+def assign_materials(obj, op, bm=None, used_slots=None):
     """
     Assigns final or debug materials.
     [ARCHITECT FIX]: Now implements Smart Slotting.
     Only generates material slots that are actually used by the geometry.
+    used_slots: old indices already compacted in the mesh (mesh cache replay).
     Returns a mapping: {old_slot_index: new_slot_index}
     """
     debug_v = getattr(op, "debug_view", "NONE")
@@ -126,6 +128,10 @@ def assign_materials(obj, op, bm=None):
             else:
                 # Should not happen if we scanned correctly
                 f.material_index = 0
+    elif used_slots is not None:
+        for new_idx, old_idx in enumerate(used_slots):
+            slot_map[old_idx] = new_idx
+            slots_to_create.append(old_idx)
     else:
         # Fallback: Create all 10 slots (Old Behavior)
         slots_to_create = list(range(10))
@@ -145,7 +151,7 @@ def assign_materials(obj, op, bm=None):
             obj.data.materials.append(override_mat)
         else:
             # Final Mode: Load actual slot material or fallback to Debug Color
-            mat_name = getattr(op, f"mat_{old_i}", "NONE")
+            mat_name = slot_value(op, old_i, "mat", "NONE")
             mat = mat_utils.load_material_smart(mat_name)
             
             if not mat:
@@ -0,0 +1,215 @@
+import bpy
+import os
+import sys
+import json
+import tempfile
+import subprocess
+import numpy as np
+from . import massa_heightfield
+from . import massa_emit
+from . import massa_surface
+from . import massa_params
+
+# --- TILED TERRAIN ---
+# Each tile is its own object (plus a hidden LOD chain parented to LOD0), so
+# no single mesh ever holds the whole world. Tiles are content-addressed on
+# disk by massa_heightfield.tile_key; a re-run only rebuilds objects whose
+# key changed and only computes keys that are not cached yet.
+# LOD0 tiles carry massa_op_id / MASSA_PARAMS like any Massa object, so ReRun,
+# Resurrect and Regenerate All re-run the whole terrain from any tile.
+TILE_COLLECTION = "Massa_Terrain"
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "massa_terrain_cache")
+
+
+def tile_layout(op):
+    """Returns (layout, lod_levels). tile_res is rounded up so every LOD divides it."""
+    lods = max(1, op.tile_lod_levels)
+    unit = 1 << (lods - 1)
+    res = max(unit, -(-op.tile_res // unit) * unit)
+    return {"tiles_x": op.tiles_x, "tiles_y": op.tiles_y, "tile_res": res}, lods
+
+
+def _can_spawn_python():
+    # Blender >= 2.91 points sys.executable at its bundled Python; older builds
+    # point at the Blender binary, which must not be launched as a worker.
+    return os.path.basename(sys.executable).lower().startswith("python")
+
+
+def _compute_missing(params, layout, jobs, workers):
+    """
+    Fills the disk cache for jobs [(tx, ty, lod)]. Work is split across
+    worker processes running massa_heightfield as a script; whatever they
+    fail to deliver is computed in-process.
+    """
+    if workers > 1 and len(jobs) > 1 and _can_spawn_python():
+        job_files = []
+        procs = []
+        try:
+            for i in range(min(workers, len(jobs))):
+                fd, path = tempfile.mkstemp(prefix="massa_tiles_", suffix=".json")
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump({
+                        "params": params,
+                        "layout": layout,
+                        "cache_dir": CACHE_DIR,
+                        "tiles": jobs[i::workers],
+                    }, fh)
+                job_files.append(path)
+                procs.append(subprocess.Popen(
+                    [sys.executable, massa_heightfield.__file__, path],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                ))
+            for proc in procs:
+                _out, err = proc.communicate()
+                if proc.returncode != 0:
+                    tail = err.decode("utf-8", errors="replace")[-300:]
+                    print(f"Massa Terrain: Worker exited with {proc.returncode}: {tail}")
+        except OSError as e:
+            print(f"Massa Terrain: Could not start workers ({e}), generating in-process")
+        finally:
+            for path in job_files:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    perm = None
+    for tx, ty, lod in jobs:
+        key = massa_heightfield.tile_key(params, layout, tx, ty, lod)
+        if os.path.exists(massa_heightfield.tile_path(CACHE_DIR, key)):
+            continue
+        if perm is None:
+            perm = massa_heightfield.permutation(params["seed"])
+        tile = massa_heightfield.compute_tile(params, layout, tx, ty, lod, perm)
+        massa_heightfield.save_tile(CACHE_DIR, key, tile)
+
+
+def _outer_rim(layout, tx, ty, n):
+    """Edge pairs of the tile that lie on the outer terrain border (Slot 1)."""
+    idx = np.arange((n + 1) * (n + 1)).reshape(n + 1, n + 1)
+    lines = []
+    if ty == 0:
+        lines.append(idx[0])
+    if ty == layout["tiles_y"] - 1:
+        lines.append(idx[-1])
+    if tx == 0:
+        lines.append(idx[:, 0])
+    if tx == layout["tiles_x"] - 1:
+        lines.append(idx[:, -1])
+    if not lines:
+        return np.zeros((0, 3), dtype=np.int64)
+    pairs = np.vstack([np.stack((ln[:-1], ln[1:]), axis=-1) for ln in lines])
+    return np.column_stack((pairs, np.ones(len(pairs), dtype=np.int64)))
+
+
+def _tile_mesh(name, tile, layout, tx, ty, lod):
+    n = layout["tile_res"] >> lod
+    me = bpy.data.meshes.new(name)
+    massa_emit.fill_mesh(
+        me, tile["co"], massa_emit.grid_quads(n, n),
+        material_index=tile["slots"],
+        smooth=True,
+        face_ints={"MAT_TAG": tile["slots"]},
+        edge_slots=_outer_rim(layout, tx, ty, n),
+    )
+    # Apron normals keep shading continuous across tile borders
+    if hasattr(me, "use_auto_smooth"):
+        me.use_auto_smooth = True  # Required for custom normals before 4.1
+    me.normals_split_custom_set_from_vertices(tile["normals"])
+    return me
+
+
+def _get_collection(context):
+    coll = bpy.data.collections.get(TILE_COLLECTION)
+    if coll is None:
+        coll = bpy.data.collections.new(TILE_COLLECTION)
+    if coll.name not in context.scene.collection.children:
+        context.scene.collection.children.link(coll)
+    return coll
+
+
+def generate_tiles(op, context):
+    """
+    TILED TERRAIN PIPELINE
+    Builds/updates tiles_x * tiles_y tile objects with lod_levels meshes
+    each. Returns a stats dict (built, kept, computed, removed).
+    """
+    params = massa_heightfield.params_from_op(op)
+    layout, lods = tile_layout(op)
+    jobs = [
+        (tx, ty, lod)
+        for ty in range(layout["tiles_y"])
+        for tx in range(layout["tiles_x"])
+        for lod in range(lods)
+    ]
+    keys = {job: massa_heightfield.tile_key(params, layout, *job) for job in jobs}
+
+    coll = _get_collection(context)
+    stored = massa_params.encode(massa_params.capture(op))
+    existing = {}
+    removed = 0
+    for obj in list(coll.objects):
+        tag = obj.get("massa_tile")
+        if tag is None:
+            continue
+        job = tuple(tag)
+        if job in keys:
+            existing[job] = obj
+        else:
+            bpy.data.objects.remove(obj, do_unlink=True)  # Outside the new layout
+            removed += 1
+
+    dirty = {job for job in jobs if job not in existing or existing[job].get("massa_tile_key") != keys[job]}
+    missing = [
+        job for job in jobs
+        if job in dirty and not os.path.exists(massa_heightfield.tile_path(CACHE_DIR, keys[job]))
+    ]
+    _compute_missing(params, layout, missing, max(1, getattr(op, "tile_workers", 1)))
+
+    # New tiles line up with the kept ones; user-placed terrain is never moved
+    anchor = next(
+        (tuple(obj.location) for job, obj in existing.items() if job[2] == 0),
+        tuple(op.obj_location),
+    )
+
+    lod0 = {}
+    for job in jobs:
+        tx, ty, lod = job
+        obj = existing.get(job)
+        if job in dirty:
+            tile = massa_heightfield.load_tile(CACHE_DIR, keys[job])
+            if tile is None:
+                tile = massa_heightfield.compute_tile(params, layout, tx, ty, lod)
+            name = f"Massa_Tile_{tx}_{ty}_LOD{lod}"
+            me = _tile_mesh(name, tile, layout, tx, ty, lod)
+            if obj is None:
+                obj = bpy.data.objects.new(name, me)
+                coll.objects.link(obj)
+                if lod == 0:
+                    obj.location = anchor
+            else:
+                old = obj.data
+                obj.data = me
+                if old.users == 0:
+                    bpy.data.meshes.remove(old)
+            obj["massa_tile"] = list(job)
+            obj["massa_tile_key"] = keys[job]
+            massa_surface.assign_materials(obj, op)
+
+        if lod == 0:
+            lod0[(tx, ty)] = obj
+            obj["massa_op_id"] = op.bl_idname
+            obj[massa_params.PARAMS_KEY] = stored
+        else:
+            obj.parent = lod0[(tx, ty)]  # LOD0 comes first for every tile
+            obj.hide_viewport = True
+            obj.hide_render = True
+
+    massa_heightfield.prune_cache(CACHE_DIR)
+    return {
+        "built": len(dirty),
+        "kept": len(jobs) - len(dirty),
+        "computed": len(missing),
+        "removed": removed,
+    }
@@ -3,10 +3,83 @@ import sys
 from bpy.types import Operator
 from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, FloatVectorProperty, StringProperty
 from ..modules.massa_properties import MassaPropertiesMixin
+from ..modules import massa_properties
+from ..modules import massa_console
+from ..modules import massa_params
+from ..modules import massa_inplace
 from ..modules import massa_engine
+from ..modules import massa_parts
+from ..modules import massa_emit
+from ..modules import cartridges
 from ..utils import mat_utils
 
 
+# Flat (non-slot) settings shared by Console and Operator; built once.
+SYNC_KEYS = tuple(
+    dict.fromkeys(
+        [k for k in MassaPropertiesMixin.__annotations__.keys() if k != "slots"]
+        + [
+            "ui_tab",
+            "edge_slot_1_action",
+            "edge_slot_2_action",
+            "edge_slot_3_action",
+            "edge_slot_4_action",
+            "edge_slot_5_action",
+            "viz_edge_mode",
+            "debug_view",
+            "seam_from_edges",
+            "seam_use_peri",
+            "seam_use_cont",
+            "seam_use_guide",
+            "seam_use_detail",
+            "seam_use_fold",
+            "phys_gen_ucx",
+            "phys_bake_strain",
+            "phys_kinematic_pin",
+            "phys_auto_rig",
+            "phys_yield_strength",
+            "sock_enable",
+            "sock_constraint_type",
+            "sock_break_strength",
+            "sock_visual_size",
+        ]
+    )
+)
+
+_SYNC_KEY_CACHE = {}  # (operator class, console class) -> SYNC_KEYS both define
+
+
+def sync_keys(op_cls, console):
+    """SYNC_KEYS present on both sides, resolved once per operator class."""
+    cache_key = (op_cls, type(console))
+    keys = _SYNC_KEY_CACHE.get(cache_key)
+    if keys is None:
+        op_props = op_cls.bl_rna.properties
+        console_props = console.bl_rna.properties
+        keys = tuple(k for k in SYNC_KEYS if k in op_props and k in console_props)
+        _SYNC_KEY_CACHE[cache_key] = keys
+    return keys
+
+
+# Slot fields where the Console stays authoritative on resurrection
+RESTORE_SKIP_SLOT_FIELDS = {"mat", "phys_mat", "uv_mode", "uv_scale"}
+
+
+def _restore_slot_params(op, params, skip=RESTORE_SKIP_SLOT_FIELDS):
+    """
+    Pops slot data out of stored params (columnar 'slots', or the legacy
+    flat mat_0 ... keys of older files) and applies it to op.slots.
+    """
+    columns = params.pop("slots", None)
+    if columns is not None:
+        columns = columns.to_dict() if hasattr(columns, "to_dict") else dict(columns)
+    else:
+        columns, used = massa_properties.legacy_slot_params(params)
+        for k in used:
+            params.pop(k)
+    massa_properties.apply_slot_params(op, columns, skip=skip)
+
+
 class Massa_OT_Base(Operator, MassaPropertiesMixin):
     """
     THE MUSCLE: Executes the generation pipeline.
@@ -96,8 +169,24 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
     obj_rotation: FloatVectorProperty(name="Rotation", subtype="EULER")
 
     # [ARCHITECT NEW] Persistence for Deletion Target (Fixes Doubling on Redo)
+    # Regenerated in place when possible, deleted otherwise (see execute).
     target_delete_name: StringProperty(options={'HIDDEN'})
 
+    # [ARCHITECT NEW] Console revision these settings mirror (see _sync).
+    # Not SKIP_SAVE: remembered with the last-used values it describes.
+    console_rev: IntProperty(options={'HIDDEN'})
+
+    # [ARCHITECT NEW] Set by massa.regenerate_all: leaves the Console alone
+    # and may regenerate into a Mesh shared by the batch's followers.
+    batch_mode: BoolProperty(default=False, options={"HIDDEN", "SKIP_SAVE"})
+
+    # Stamp recording for INSTANCES output (armed by the engine per run)
+    _massa_instances = None
+
+    # In-place resurrection target (see massa_inplace), set per execute
+    _massa_reuse = None
+    _massa_reuse_children = None
+
     def _get_cartridge_meta(self):
         try:
             mod = sys.modules[self.__module__]
@@ -119,17 +208,16 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
             return
 
         meta_slots = self.get_slot_meta()
+        slots = massa_properties.ensure_slots(self)
 
         for i, data in meta_slots.items():
             # Check current property value
-            prop_name = f"mat_{i}"
-            if not hasattr(self, prop_name):
+            if not 0 <= i < len(slots):
                 continue
-
-            current_val = getattr(self, prop_name, "NONE")
+            item = slots[i]
 
             # Only override if the user/system hasn't set a specific material yet
-            if current_val == "NONE":
+            if item.mat == "NONE":
                 # 1. Get Physics ID Key (e.g. 'METAL_STEEL')
                 phys_id = data.get("phys", "GENERIC")
 
@@ -143,87 +231,96 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
                 # 3. Apply if valid
                 if vis_name != "NONE":
                     try:
-                        setattr(self, prop_name, vis_name)
+                        item.mat = vis_name
                     except Exception:
                         pass
 
-    def _sync(self, context, from_console=False):
-        if not hasattr(context.scene, "massa_console"):
-            return
-        console = context.scene.massa_console
-        all_keys = list(MassaPropertiesMixin.__annotations__.keys())
-        for i in range(10):
-            all_keys.extend(
-                [
-                    f"mat_{i}",
-                    f"sep_{i}",
-                    f"uv_mode_{i}",
-                    f"expand_{i}",
-                    f"phys_mat_{i}",
-                    f"uv_scale_{i}",
-                    f"sock_{i}",
-                    f"off_{i}",
-                    f"prot_{i}",
-                    f"collision_shape_{i}",
-                    f"show_coll_{i}",
-                    f"phys_friction_{i}",
-                    f"phys_bounce_{i}",
-                    f"phys_bond_{i}",
-                ]
-            )
-        all_keys.extend(
-            [
-                "ui_tab",
-                "edge_slot_1_action",
-                "edge_slot_2_action",
-                "edge_slot_3_action",
-                "edge_slot_4_action",
-                "edge_slot_5_action",
-                "viz_edge_mode",
-                "debug_view",
-                "seam_from_edges",
-                "seam_use_peri",
-                "seam_use_cont",
-                "seam_use_guide",
-                "seam_use_detail",
-                "seam_use_fold",
-                "phys_gen_ucx",
-                "phys_bake_strain",
-                "phys_kinematic_pin",
-                "phys_auto_rig",
-                "phys_yield_strength",
-                "sock_enable",
-                "sock_constraint_type",
-                "sock_break_strength",
-                "sock_visual_size",
-            ]
+    def get_slot_value(self, i, field, default=None):
+        """[ARCHITECT NEW] Slot settings live in self.slots[i] (e.g. field='uv_scale')."""
+        return massa_properties.slot_value(self, i, field, default)
+
+    # --- PART TEMPLATES (Repeated Primitives) ---
+    def part_template(self, key, builder):
+        """
+        [ARCHITECT NEW] Build-once part cache for cartridges.
+        builder(bm) draws ONE part at the origin into a scratch BMesh; the
+        result is cached per (cartridge class, key) across Redo re-runs. Keyed
+        by the class object, so a hot-reloaded cartridge never reuses parts
+        built by its previous code.
+        """
+        return massa_parts.get_template(type(self), key, builder)
+
+    def stamp_part(self, bm, template, matrix):
+        """Stamps a single transformed copy. Returns (verts, faces)."""
+        return massa_parts.stamp(bm, template, (matrix,))[0]
+
+    def stamp_parts(self, bm, template, matrices):
+        """
+        Stamps one copy per matrix via doubling duplicates. Returns [(verts, faces), ...].
+        In INSTANCES output the copies are recorded for the instance set instead
+        and nothing is returned, so only call this for parts that need no
+        per-copy edits afterwards.
+        """
+        if self._massa_instances is not None:
+            self._massa_instances.append((template, list(matrices)))
+            return []
+        return massa_parts.stamp(bm, template, matrices)
+
+    # --- ARRAY EMISSION (Grid / Ring Topology) ---
+    def emit_mesh(self, bm, verts, faces, material_index=0, smooth=True, uvs=None,
+                  edge_slots=None, seams=None, face_ints=None, want_elements=False):
+        """
+        [ARCHITECT NEW] Bulk path for regular topology. Takes NumPy arrays
+        (vertex coords, face index rows, per-corner UVs, edge slot rows) and
+        appends them to bm in one pass. See massa_emit.emit for the layout.
+        """
+        return massa_emit.emit(
+            bm, verts, faces,
+            material_index=material_index, smooth=smooth, uvs=uvs,
+            edge_slots=edge_slots, seams=seams, face_ints=face_ints,
+            want_elements=want_elements,
         )
 
-        for key in all_keys:
-            if not hasattr(console, key):
-                continue
-            try:
-                if from_console:
-                    val = getattr(console, key, None)
-                    if val is not None:
-                        setattr(self, key, val)
-                else:
-                    val = getattr(self, key, None)
-                    if val is not None:
-                        setattr(console, key, val)
-            except:
-                pass
+    def _sync(self, context, from_console=False):
+        """
+        Console <-> Operator mirror. Only differing values are written.
+        Console -> Operator is skipped outright while the scene's Console
+        revision still equals the one this operator last mirrored.
+        """
+        scene = context.scene
+        if not hasattr(scene, "massa_console"):
+            return
+        console = scene.massa_console
+        keys = sync_keys(type(self), console)
+        rev = massa_console.console_revision(scene)
+
+        if from_console:
+            if rev and self.console_rev == rev:
+                return
+            massa_properties.copy_changed(console, self, keys)
+            # [ARCHITECT NEW] Slot settings move as whole columns
+            massa_properties.copy_slots(console, self)
+        else:
+            changed = massa_properties.copy_changed(self, console, keys)
+            changed += massa_properties.copy_slots(self, console)
+            if changed or not rev:
+                rev = massa_console.bump_console_revision(scene)
+        self.console_rev = rev
 
     def invoke(self, context, event):
         # 1. Sync from Console (Persistent Settings)
         self._sync(context, from_console=True)
 
+        # A remembered target from the last resurrection must not leak into a fresh run
+        self.target_delete_name = ""
+
         # [ARCHITECT NEW] Resurrection Mode Logic
         # If activated via UI, we pull params directly from the object
         # instead of relying on a wrapper operator.
         if self.rerun_mode:
             obj = context.active_object
-            if obj and "MASSA_PARAMS" in obj:
+            stored = massa_params.read(obj) if obj else None
+            if stored is not None:
                 try:
                     # 1. Capture Transform (Loc/Rot only, as requested)
                     # We store these in properties so they persist across Redo steps
@@ -231,17 +328,13 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
                     self.obj_rotation = obj.rotation_euler
 
                     # 2. Restore Parameters
-                    # [ARCHITECT FIX] Use safe dict conversion for IDProperty
-                    params = dict(obj["MASSA_PARAMS"].items())
+                    # [ARCHITECT NEW] Stored values are sparse: unset keys take class defaults
+                    params = massa_params.with_defaults(type(self), stored)
+                    # Slot materials & UVs are skipped to allow Console override
+                    _restore_slot_params(self, params)
                     for k, v in params.items():
-                        # Skip materials to allow Console override
-                        if k.startswith("mat_") or k.startswith("phys_mat_"):
-                            continue
-
                         # [ARCHITECT FIX] Skip UV/Seam properties to allow Console override
                         # This ensures global UV settings (N-Panel) take precedence over stored object params.
-                        if k.startswith("uv_mode_") or k.startswith("uv_scale_"):
-                            continue
                         if k in {"auto_unwrap", "auto_unwrap_margin"}:
                             continue
                         if k.startswith("seam_"):
@@ -267,10 +360,11 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
         # [LEGACY/FALLBACK] Check for Resurrection Payload from Wrapper
         elif "MASSA_TEMP_RESTORE" in context.scene:
             try:
-                restore_data = context.scene["MASSA_TEMP_RESTORE"]
+                restore_data = massa_params.with_defaults(
+                    type(self), massa_params.decode(context.scene["MASSA_TEMP_RESTORE"]) or {}
+                )
+                _restore_slot_params(self, restore_data, skip={"mat", "phys_mat"})
                 for k, v in restore_data.items():
-                    if k.startswith("mat_") or k.startswith("phys_mat_"):
-                        continue
                     if hasattr(self, k):
                         try:
                             setattr(self, k, v)
@@ -296,10 +390,14 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
 
     def execute(self, context):
         # [ARCHITECT FIX] Handle Deletion here to support Redo
+        self._massa_reuse = None
         if self.target_delete_name:
             # We look up by name because the pointer might be stale or lost in undo
             old_obj = context.scene.objects.get(self.target_delete_name)
-            if old_obj:
+            if old_obj and massa_inplace.can_regenerate_in_place(old_obj, self.batch_mode):
+                # [ARCHITECT NEW] Regenerate into its Mesh; modifiers & children are reconciled
+                self._massa_reuse = old_obj
+            elif old_obj:
                 try:
                     # [ARCHITECT FIX] Recursive Deletion for Detached Parts
                     # If we detached rail guards, they are children of old_obj.
@@ -314,6 +412,9 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
                 except Exception as e:
                     print(f"Massa Deletion Error: {e}")
 
+        # Fresh operators (EXEC_DEFAULT, headless) start with an empty slot collection
+        massa_properties.ensure_slots(self)
+
         # [ARCHITECT FIX] Ensure Library Exists BEFORE Injection (Headless safety)
         mat_utils.ensure_default_library()
 
@@ -325,7 +426,7 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
         # Garbage collection for existing active object's children (UCX/Joints)
         # This prevents infinite duplication during Redo Panel updates.
         try:
-            clean_obj = context.active_object
+            clean_obj = context.active_object if self._massa_reuse is None else None
             if clean_obj:
                 # Loop safely over a copy of children
                 for child in list(clean_obj.children):
@@ -348,8 +449,9 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
             obj.rotation_euler = self.obj_rotation
             # Note: Scale is intentionally NOT restored.
 
-        # Sync back to Console
-        self._sync(context, from_console=False)
+        # Sync back to Console (batch runs are not the user's current settings)
+        if not self.batch_mode:
+            self._sync(context, from_console=False)
 
         return result
 
@@ -375,6 +477,8 @@ class Massa_OT_Base(Operator, MassaPropertiesMixin):
             row.prop(self, "ui_use_rot", text="Rotate", toggle=True)
             if self.ui_use_rot:
                 col.prop(self, "rotation", text="")
+            if self._get_cartridge_meta().get("flags", {}).get("ALLOW_INSTANCES", False):
+                col.prop(self, "output_mode", expand=True)
         elif self.ui_tab == "EDGES":
             ui_shared.draw_edge_slots_tab(col, self)
         elif self.ui_tab == "POLISH":
@@ -406,23 +510,23 @@ class MASSA_OT_ReRun_Active(Operator):
         saved_matrix = obj.matrix_world.copy()
 
         # [ARCHITECT NEW] Capture parameters before deletion
-        massa_params = None
-        if "MASSA_PARAMS" in obj:
-            try:
-                massa_params = dict(obj["MASSA_PARAMS"].items())
-            except:
-                pass
+        stored = massa_params.read(obj)
+        in_place = stored is not None and massa_inplace.can_regenerate_in_place(obj)
 
-        if massa_params:
+        if stored is not None:
             # [ARCHITECT FIX] Inject current transform so the operator property matches the visual location
             # This ensures the Redo Panel starts with the correct values instead of jumping to 0,0,0
-            massa_params["obj_location"] = obj.location[:]
-            massa_params["obj_rotation"] = obj.rotation_euler[:]
-            context.scene["MASSA_TEMP_RESTORE"] = massa_params
-
-        if not obj.select_get():
-            obj.select_set(True)
-        bpy.ops.object.delete()
+            stored["obj_location"] = list(obj.location[:])
+            stored["obj_rotation"] = list(obj.rotation_euler[:])
+            if in_place:
+                # [ARCHITECT NEW] The operator regenerates into this object instead
+                stored["target_delete_name"] = obj.name
+            context.scene["MASSA_TEMP_RESTORE"] = massa_params.encode(stored)
+
+        if not in_place:
+            if not obj.select_get():
+                obj.select_set(True)
+            bpy.ops.object.delete()
         op_category, op_name = "", ""
         if "." in op_id:
             op_category, op_name = op_id.split(".")
@@ -432,6 +536,7 @@ class MASSA_OT_ReRun_Active(Operator):
             op_name = parts[1]
         else:
             return {"CANCELLED"}
+        cartridges.ensure_operator(op_id)  # Lazy registry: may not be loaded yet
         try:
             op_module = getattr(bpy.ops, op_category)
             op_func = getattr(op_module, op_name)
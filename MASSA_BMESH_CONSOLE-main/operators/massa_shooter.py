@@ -1,4 +1,5 @@
 import bpy
+from ..modules import cartridges
 
 class MASSA_OT_ShootDispatcher(bpy.types.Operator):
     bl_idname = "massa.shoot_dispatcher"
@@ -37,6 +38,9 @@ class MASSA_OT_ShootDispatcher(bpy.types.Operator):
         # We construct the operator name dynamically: massa.gen_{cart_id}
         op_id = f"gen_{cart_id}"
 
+        # [ARCHITECT NEW] Registry is lazy: make sure the staged cartridge is loaded
+        cartridges.load(cart_id)
+
         try:
             if hasattr(bpy.ops.massa, op_id):
                 # [ARCHITECT NEW] Parameter Injection Logic
@@ -63,8 +67,10 @@ class MASSA_OT_ShootDispatcher(bpy.types.Operator):
                              kwargs[k] = val
 
                 # B. Inject Global Parameters (MassaPropertiesMixin)
-                from ..modules.massa_properties import MassaPropertiesMixin
-                for k in MassaPropertiesMixin.__annotations__.keys():
+                from ..modules import massa_properties
+                for k in massa_properties.MassaPropertiesMixin.__annotations__.keys():
+                     if k == "slots":
+                         continue
                      val = getattr(console, k)
                      if hasattr(val, "to_tuple"):
                          val = val.to_tuple()
@@ -72,19 +78,9 @@ class MASSA_OT_ShootDispatcher(bpy.types.Operator):
                          val = val.to_list()
                      kwargs[k] = val
 
-                # C. Inject Slot Properties (0-9)
-                slot_props = [
-                    "mat_", "phys_mat_", "uv_mode_", "uv_scale_", "sep_",
-                    "sock_", "off_", "prot_", "expand_",
-                    "collision_shape_", "show_coll_", "phys_friction_", "phys_bounce_", "phys_bond_"
-                ]
-                for i in range(10):
-                    for p in slot_props:
-                        key = f"{p}{i}"
-                        if hasattr(console, key):
-                             val = getattr(console, key)
-                             if hasattr(val, "to_tuple"): val = val.to_tuple()
-                             kwargs[key] = val
+                # C. Inject Slot Properties (one dict per slot item)
+                massa_properties.ensure_slots(console)
+                kwargs["slots"] = massa_properties.slot_dicts(console)
 
                 # Inject Transform Override (Fixes 0,0,0 Issue)
                 kwargs["obj_location"] = target_loc
@@ -1,4 +1,12 @@
 import bpy
+import math
+from mathutils import Matrix, Vector
+from bpy.props import StringProperty, BoolProperty, EnumProperty
+from ..modules import massa_socket_index
+from ..modules import cartridges
+from ..modules import massa_reload
+from ..modules import massa_params
+from ..modules import massa_batch
 
 class MASSA_OT_Condemn(bpy.types.Operator):
     """
@@ -72,6 +80,9 @@ class MASSA_OT_Resurrect_Wrapper(bpy.types.Operator):
 
             category, name = parts
 
+            # [ARCHITECT NEW] Cartridges register lazily; load the one we need
+            cartridges.ensure_operator(op_id)
+
             if not hasattr(bpy.ops, category):
                 self.report({'ERROR'}, f"Operator category '{category}' not found")
                 return {'CANCELLED'}
@@ -99,3 +110,243 @@ class MASSA_OT_Resurrect_Wrapper(bpy.types.Operator):
         except Exception as e:
             self.report({'ERROR'}, f"Resurrection failed: {e}")
             return {'CANCELLED'}
+
+
+class MASSA_OT_Launch_Cartridge(bpy.types.Operator):
+    """
+    Proxy button for a cartridge that is not loaded yet.
+    Imports + registers it from the manifest, then invokes the real operator
+    (which, being called from a non-UNDO operator, owns the Redo panel).
+    """
+    bl_idname = "massa.launch_cartridge"
+    bl_label = "Launch Cartridge"
+    bl_description = "Load this cartridge and run it"
+    bl_options = {'INTERNAL'}
+
+    cart_id: StringProperty(options={'HIDDEN'})
+    launch: BoolProperty(default=True, options={'HIDDEN'})
+
+    @classmethod
+    def description(cls, context, properties):
+        entry = cartridges.get_entry(properties.cart_id)
+        if entry:
+            return entry.get("description") or entry["name"]
+        return cls.bl_description
+
+    def execute(self, context):
+        if cartridges.load(self.cart_id) is None:
+            self.report({'ERROR'}, f"Could not load cartridge '{self.cart_id}'")
+            return {'CANCELLED'}
+
+        if not self.launch:
+            return {'FINISHED'}
+
+        category, name = cartridges.get_entry(self.cart_id)["operator"].split(".")
+        try:
+            getattr(getattr(bpy.ops, category), name)('INVOKE_DEFAULT')
+        except Exception as e:
+            self.report({'ERROR'}, f"Launch failed: {e}")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+
+class MASSA_OT_Hot_Reload(bpy.types.Operator):
+    """
+    Developer loop: reloads only the add-on modules whose source changed
+    (plus their dependents) and re-registers just the affected classes.
+    Falls back to Reload Scripts when a core module is involved.
+    """
+    bl_idname = "massa.hot_reload"
+    bl_label = "Massa Hot Reload"
+    bl_description = "Reload changed Massa modules (cartridges, engine, UI) without restarting"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        package = __package__.rpartition(".")[0]  # Add-on root (also as an extension)
+        result = massa_reload.hot_reload(package)
+        status = result["status"]
+
+        if status == "CLEAN":
+            self.report({'INFO'}, "Massa: Nothing changed")
+        elif status == "FULL":
+            short = ", ".join(name.rpartition(".")[2] for name in result["blocking"][:3])
+            self.report({'WARNING'}, f"Massa: {short} changed, running Reload Scripts")
+            bpy.ops.script.reload()
+        elif status == "ERROR":
+            self.report({'ERROR'}, f"Massa Reload: {result['error']}")
+            return {'CANCELLED'}
+        else:
+            self.report({'INFO'}, f"Massa: Reloaded {len(result['reloaded'])} modules, {result['classes']} classes")
+        return {'FINISHED'}
+
+
+class MASSA_OT_Regenerate_All(bpy.types.Operator):
+    """
+    Regenerates every Massa object in scope with the current cartridge code.
+    Objects with identical settings are generated once and share the result
+    as linked Mesh data (see massa_batch); transforms are kept.
+    """
+    bl_idname = "massa.regenerate_all"
+    bl_label = "Regenerate All"
+    bl_description = "Rebuild all Massa objects, generating each unique configuration once"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: EnumProperty(
+        name="Scope",
+        items=[
+            ("SCENE", "Scene", "Every Massa object in the scene"),
+            ("COLLECTION", "Collection", "Massa objects in the active collection"),
+            ("SELECTED", "Selected", "Selected Massa objects"),
+        ],
+        default="SCENE",
+    )
+
+    def _targets(self, context):
+        if self.scope == "SELECTED":
+            return list(context.selected_objects)
+        if self.scope == "COLLECTION":
+            return list(context.collection.all_objects)
+        return list(context.scene.objects)
+
+    def _generate(self, context, op_id, cls, stored, obj):
+        """One headless run into obj (in place). Returns the output object or None."""
+        full = massa_params.with_defaults(cls, stored)
+        kwargs = massa_batch.operator_kwargs(cls, full)
+        kwargs.update(
+            target_delete_name=obj.name,
+            obj_location=tuple(obj.location),
+            obj_rotation=tuple(obj.rotation_euler),
+            batch_mode=True,
+        )
+        category, name = op_id.split(".")
+        try:
+            result = getattr(getattr(bpy.ops, category), name)('EXEC_DEFAULT', **kwargs)
+        except (AttributeError, TypeError, RuntimeError) as e:
+            print(f"Massa Batch: {op_id} failed for {obj.name}: {e}")
+            return None
+        if 'FINISHED' not in result:
+            return None
+        return context.active_object
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            self.report({'ERROR'}, "Massa: Regenerate All needs Object Mode")
+            return {'CANCELLED'}
+
+        groups = massa_batch.group_objects(self._targets(context))
+        if not groups:
+            self.report({'INFO'}, "Massa: No Massa objects in scope")
+            return {'CANCELLED'}
+
+        selected = [o.name for o in context.selected_objects]
+        active = context.active_object.name if context.active_object else None
+
+        runs = objects = failed = 0
+        for (op_id, _digest), group in groups.items():
+            cls = cartridges.class_for_operator(op_id)
+            if cls is None:
+                print(f"Massa Batch: Unknown operator {op_id}, {len(group)} objects skipped")
+                failed += len(group)
+                continue
+
+            stored = massa_params.read(group[0])
+            full = massa_params.with_defaults(cls, stored)
+            if massa_batch.is_tiled(full):
+                # The terrain run updates every tile of the group by itself
+                runs += 1
+                if self._generate(context, op_id, cls, stored, group[0]) is None:
+                    failed += len(group)
+                else:
+                    objects += len(group)
+            elif massa_batch.is_shareable(full):
+                # One generation, linked to the rest of the group
+                leader = group[0]
+                massa_batch.isolate_mesh(leader, group)
+                leader = self._generate(context, op_id, cls, stored, leader)
+                runs += 1
+                if leader is None:
+                    failed += len(group)
+                    continue
+                for obj in group[1:]:
+                    massa_batch.link_follower(leader, obj)
+                objects += len(group)
+            else:
+                # Per-object children / links: regenerate each one
+                for obj in group:
+                    runs += 1
+                    if self._generate(context, op_id, cls, stored, obj) is None:
+                        failed += 1
+                    else:
+                        objects += 1
+
+        # Generation changes selection; put the user's back
+        bpy.ops.object.select_all(action='DESELECT')
+        for name in selected:
+            obj = context.scene.objects.get(name)
+            if obj:
+                obj.select_set(True)
+        if active and context.scene.objects.get(active):
+            context.view_layer.objects.active = context.scene.objects[active]
+
+        level = {'WARNING'} if failed else {'INFO'}
+        self.report(level, f"Massa: {objects} objects from {runs} generations ({len(groups)} configurations), {failed} failed")
+        return {'FINISHED'}
+
+
+class MASSA_OT_SnapSockets(bpy.types.Operator):
+    """
+    Snaps the active Massa object onto the nearest compatible socket of
+    another object. Uses the scene socket index (KD-tree), so the query cost
+    does not grow with the number of sockets in the scene.
+    """
+    bl_idname = "massa.snap_sockets"
+    bl_label = "Snap to Socket"
+    bl_description = "Move the active object so its closest socket meets a facing socket on another object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    tolerance: bpy.props.FloatProperty(
+        name="Search Radius", default=0.5, min=0.0001, unit='LENGTH'
+    )
+    angle_tolerance: bpy.props.FloatProperty(
+        name="Angle Tolerance", default=math.radians(30.0), min=0.0, max=math.pi, subtype='ANGLE'
+    )
+    align_rotation: bpy.props.BoolProperty(
+        name="Align Rotation", default=True,
+        description="Rotate the object so the socket normals face each other"
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.mode == 'OBJECT'
+
+    def execute(self, context):
+        obj = context.active_object
+        # Clicking a socket snaps the object that owns it
+        if massa_socket_index.is_socket(obj):
+            obj = massa_socket_index.socket_owner(obj)
+
+        pairs = massa_socket_index.find_pairs(
+            context.scene, obj, self.tolerance, self.angle_tolerance
+        )
+        if not pairs:
+            self.report({'WARNING'}, "No compatible socket within range")
+            return {'CANCELLED'}
+
+        dist, src_name, tgt_name = pairs[0]
+        src = massa_socket_index.get_record(src_name)
+        tgt = massa_socket_index.get_record(tgt_name)
+        if src is None or tgt is None:
+            self.report({'ERROR'}, "Socket index is stale, try again")
+            return {'CANCELLED'}
+
+        src_pos, tgt_pos = Vector(src[1]), Vector(tgt[1])
+
+        # Pivot around the source socket: rotate normals to face, then translate onto target
+        pivot = Matrix.Translation(tgt_pos)
+        if self.align_rotation:
+            rot = Vector(src[2]).rotation_difference(-Vector(tgt[2]))
+            pivot = pivot @ rot.to_matrix().to_4x4()
+        obj.matrix_world = pivot @ Matrix.Translation(-src_pos) @ obj.matrix_world
+
+        self.report({'INFO'}, f"Snapped {src_name} -> {tgt_name} ({dist:.4f})")
+        return {'FINISHED'}
@@ -1,5 +1,5 @@
 import bpy
-from ..modules.cartridges import MODULES
+from ..modules import cartridges
 # We import ui_shared locally inside draw to avoid circular dependencies during registration
 
 
@@ -16,14 +16,16 @@ class MASSA_PT_Main(bpy.types.Panel):
         obj = context.active_object
         
         # Helper to draw buttons safely
-        def draw_safe_button(col_layout, mod_data):
-            meta = mod_data.CARTRIDGE_META
-            op_name = f"massa.gen_{meta['id']}"
+        def draw_safe_button(col_layout, meta):
+            # [ARCHITECT NEW] Listed from the manifest; unloaded cartridges go through
+            # the launcher proxy, which imports + registers them on first click.
+            loaded = cartridges.is_loaded(meta["id"])
+            op_name = meta["operator"] if loaded else "massa.launch_cartridge"
             icon_name = meta.get("icon", "MESH_CUBE")
 
             try:
                 # Attempt to draw with the requested icon
-                col_layout.operator(
+                props = col_layout.operator(
                     op_name,
                     text=meta["name"],
                     icon=icon_name,
@@ -31,12 +33,15 @@ class MASSA_PT_Main(bpy.types.Panel):
             except TypeError:
                 # Fallback if icon is invalid (prevents UI crash)
                 print(f"MASSA WARNING: Invalid icon '{icon_name}' in {meta['id']}")
-                col_layout.operator(
+                props = col_layout.operator(
                     op_name,
                     text=f"{meta['name']} (Icon Error)",
                     icon="QUESTION",
                 )
 
+            if not loaded:
+                props.cart_id = meta["id"]
+
         # --- MODE TOGGLE ---
         row = layout.row()
         row.prop(console, "massa_op_mode", expand=True)
@@ -53,12 +58,10 @@ class MASSA_PT_Main(bpy.types.Panel):
                 # [ARCHITECT] align=False decouples buttons so they don't share borders (prevents glitching)
                 col = box.column(align=False)
                 col.scale_y = 1.4  # Good height for clicking
-                for mod in MODULES:
-                    meta = mod.CARTRIDGE_META
-                    if meta["id"].startswith("prim_") and not meta["id"].startswith("prim_con"):
-                        draw_safe_button(col, mod)
-                        # [ARCHITECT] Non-destructive bottom padding between buttons
-                        col.separator(factor=0.1)
+                for meta in cartridges.entries("PRIMITIVES"):
+                    draw_safe_button(col, meta)
+                    # [ARCHITECT] Non-destructive bottom padding between buttons
+                    col.separator(factor=0.1)
 
             layout.separator()
 
@@ -77,11 +80,9 @@ class MASSA_PT_Main(bpy.types.Panel):
             if console.ui_expand_prim_con:
                 col = box.column(align=False)
                 col.scale_y = 1.4
-                for mod in MODULES:
-                    meta = mod.CARTRIDGE_META
-                    if meta["id"].startswith("prim_con"):
-                        draw_safe_button(col, mod)
-                        col.separator(factor=0.1)
+                for meta in cartridges.entries("CONSTRUCTION"):
+                    draw_safe_button(col, meta)
+                    col.separator(factor=0.1)
 
             layout.separator()
 
@@ -96,10 +97,8 @@ class MASSA_PT_Main(bpy.types.Panel):
             if console.ui_expand_arch:
                 col = box.column(align=False)
                 col.scale_y = 1.4
-                for mod in MODULES:
-                    meta = mod.CARTRIDGE_META
-                    if meta["id"].startswith("arch_"):
-                        draw_safe_button(col, mod)
+                for meta in cartridges.entries("ARCHITECTURE"):
+                    draw_safe_button(col, meta)
                 col.separator(factor=0.1)
 
             layout.separator()
@@ -119,14 +118,10 @@ class MASSA_PT_Main(bpy.types.Panel):
             if console.ui_expand_builds:
                 col = box.column(align=False)
                 col.scale_y = 1.4
-                for mod in MODULES:
-                    meta = mod.CARTRIDGE_META
-                    # Logic: Anything that is NOT prim_ and NOT arch_
-                    if not meta["id"].startswith("prim_") and not meta["id"].startswith(
-                        "arch_"
-                    ):
-                        draw_safe_button(col, mod)
-                        col.separator(factor=0.1)
+                for meta in cartridges.entries("BUILDINGS"):
+                    # Logic: Anything that is NOT prim_ and NOT arch_ (see massa_manifest.category_of)
+                    draw_safe_button(col, meta)
+                    col.separator(factor=0.1)
 
             layout.separator()
 
@@ -155,6 +150,12 @@ class MASSA_PT_Main(bpy.types.Panel):
                     # [ARCHITECT UPDATE] Condemn (Finalize) Button
                     col.separator(factor=0.5)
                     col.operator("massa.condemn", text="Condemn (Finalize)", icon="CHECKMARK")
+
+                    # [ARCHITECT NEW] Snap-Assembly via Scene Socket Index
+                    col.operator("massa.snap_sockets", text="Snap to Socket", icon="SNAP_ON")
+
+                    # [ARCHITECT NEW] Rebuild every Massa object (identical settings generated once)
+                    col.operator("massa.regenerate_all", text="Regenerate All", icon="FILE_REFRESH")
                 except Exception:
                     col.label(text="Unknown Operator", icon="ERROR")
 
@@ -211,29 +212,25 @@ class MASSA_PT_Main(bpy.types.Panel):
                      prop_name = f"props_{safe_id}"
                      pg = getattr(console, prop_name, None)
 
-                     if pg:
-                         found_mod = None
-                         for mod in MODULES:
-                              if mod.CARTRIDGE_META["id"] == cart_id:
-                                  found_mod = mod
-                                  break
-
-                         if found_mod:
-                             col.separator()
-                             col.label(text=found_mod.CARTRIDGE_META.get("name", "Parameters"), icon="MODIFIER")
-
-                             from ..operators.massa_base import Massa_OT_Base
-                             op_class = None
-                             for name, obj in found_mod.__dict__.items():
-                                if isinstance(obj, type) and issubclass(obj, Massa_OT_Base) and obj != Massa_OT_Base:
-                                    op_class = obj
-                                    break
-
-                             if op_class and hasattr(op_class, "draw_shape_ui"):
-                                 try:
-                                     op_class.draw_shape_ui(pg, col)
-                                 except Exception as e:
-                                     col.label(text=f"UI Error: {e}", icon="ERROR")
+                     entry = cartridges.get_entry(cart_id)
+                     op_class = cartridges.operator_class(cart_id)
+
+                     if entry and (pg is None or op_class is None):
+                         # Staged before this session loaded it (e.g. from a saved file)
+                         col.separator()
+                         props = col.operator("massa.launch_cartridge", text=f"Load {entry['name']}", icon="IMPORT")
+                         props.cart_id = cart_id
+                         props.launch = False
+
+                     elif entry:
+                         col.separator()
+                         col.label(text=entry.get("name", "Parameters"), icon="MODIFIER")
+
+                         if hasattr(op_class, "draw_shape_ui"):
+                             try:
+                                 op_class.draw_shape_ui(pg, col)
+                             except Exception as e:
+                                 col.label(text=f"UI Error: {e}", icon="ERROR")
 
         elif console.ui_tab == "POLISH":
             ui_shared.draw_polish_tab(col, console)
@@ -1,27 +1,32 @@
 import bpy
-from ..modules.cartridges import MODULES
+from ..modules import cartridges
 
 
-def draw_safe_button(layout, mod_data):
-    meta = mod_data.CARTRIDGE_META
-    op_name = f"massa.gen_{meta['id']}"
+def draw_safe_button(layout, meta):
+    # [ARCHITECT NEW] Listed from the manifest; unloaded cartridges go through
+    # the launcher proxy, which imports + registers them on first click.
+    loaded = cartridges.is_loaded(meta["id"])
+    op_name = meta["operator"] if loaded else "massa.launch_cartridge"
     icon_name = meta.get("icon", "MESH_CUBE")
 
     try:
         # Attempt to draw with the requested icon
-        layout.operator(
+        props = layout.operator(
             op_name,
             text=meta["name"],
             icon=icon_name,
         )
     except TypeError:
         # Fallback if icon is invalid (prevents UI crash)
-        layout.operator(
+        props = layout.operator(
             op_name,
             text=f"{meta['name']} (Icon Error)",
             icon="QUESTION",
         )
 
+    if not loaded:
+        props.cart_id = meta["id"]
+
 
 class MASSA_MT_category_primitives(bpy.types.Menu):
     bl_label = "Primitives"
@@ -29,10 +34,8 @@ class MASSA_MT_category_primitives(bpy.types.Menu):
 
     def draw(self, context):
         layout = self.layout
-        for mod in MODULES:
-            meta = mod.CARTRIDGE_META
-            if meta["id"].startswith("prim_") and not meta["id"].startswith("prim_con"):
-                draw_safe_button(layout, mod)
+        for meta in cartridges.entries("PRIMITIVES"):
+            draw_safe_button(layout, meta)
 
 
 class MASSA_MT_category_construction(bpy.types.Menu):
@@ -41,10 +44,8 @@ class MASSA_MT_category_construction(bpy.types.Menu):
 
     def draw(self, context):
         layout = self.layout
-        for mod in MODULES:
-            meta = mod.CARTRIDGE_META
-            if meta["id"].startswith("prim_con"):
-                draw_safe_button(layout, mod)
+        for meta in cartridges.entries("CONSTRUCTION"):
+            draw_safe_button(layout, meta)
 
 
 class MASSA_MT_category_architecture(bpy.types.Menu):
@@ -53,10 +54,8 @@ class MASSA_MT_category_architecture(bpy.types.Menu):
 
     def draw(self, context):
         layout = self.layout
-        for mod in MODULES:
-            meta = mod.CARTRIDGE_META
-            if meta["id"].startswith("arch_"):
-                draw_safe_button(layout, mod)
+        for meta in cartridges.entries("ARCHITECTURE"):
+            draw_safe_button(layout, meta)
 
 
 class MASSA_MT_category_buildings(bpy.types.Menu):
@@ -65,11 +64,9 @@ class MASSA_MT_category_buildings(bpy.types.Menu):
 
     def draw(self, context):
         layout = self.layout
-        for mod in MODULES:
-            meta = mod.CARTRIDGE_META
-            # Logic: Anything that is NOT prim_ and NOT arch_
-            if not meta["id"].startswith("prim_") and not meta["id"].startswith("arch_"):
-                draw_safe_button(layout, mod)
+        for meta in cartridges.entries("BUILDINGS"):
+            # Logic: Anything that is NOT prim_ and NOT arch_ (see massa_manifest.category_of)
+            draw_safe_button(layout, meta)
 
 
 class MASSA_MT_pie_add(bpy.types.Menu):
@@ -502,8 +502,8 @@ def draw_uvs_tab(layout, owner, slot_names, stats):
     # --- 4. SLOT PROJECTION (The Per-Material Override) ---
     layout.label(text="Slot Projection", icon="UV")
 
-    for i in range(10):
-        if not getattr(owner, f"expand_{i}", False):
+    for i, item in enumerate(owner.slots):
+        if not item.expand:
             continue
 
         box = layout.box()
@@ -525,13 +525,13 @@ def draw_uvs_tab(layout, owner, slot_names, stats):
 
         # Internal Controls
         col = box.column(align=True)
-        col.prop(owner, f"uv_mode_{i}", text="Mode")
+        col.prop(item, "uv_mode", text="Mode")
 
         # Only show scale if not Skip/Unwrap/Fit (Fit has no scale)
-        if getattr(owner, f"uv_mode_{i}") not in {"SKIP", "UNWRAP", "FIT"}:
-            col.prop(owner, f"uv_scale_{i}", text="Scale")
+        if item.uv_mode not in {"SKIP", "UNWRAP", "FIT"}:
+            col.prop(item, "uv_scale", text="Scale")
 
-        col.prop(owner, f"off_{i}", text="Inflate", icon="MOD_THICKNESS")
+        col.prop(item, "off", text="Inflate", icon="MOD_THICKNESS")
 
 
 def draw_slots_tab(layout, owner, slot_names, stats):
@@ -539,23 +539,23 @@ def draw_slots_tab(layout, owner, slot_names, stats):
     [ARCHITECT RESTORED] The missing Slots Tab logic.
     """
     layout.label(text="Material Slots", icon="MATERIAL")
-    for i in range(10):
+    for i, item in enumerate(owner.slots):
         box = layout.box()
         row = box.row()
-        is_expanded = getattr(owner, f"expand_{i}", False)
+        is_expanded = item.expand
         icon = "TRIA_DOWN" if is_expanded else "TRIA_RIGHT"
-        row.prop(owner, f"expand_{i}", icon=icon, text="", emboss=False)
+        row.prop(item, "expand", icon=icon, text="", emboss=False)
         row.label(text=f"{i}: {slot_names.get(i, f'Slot {i}')}")
 
         sub = row.row(align=True)
-        sub.prop(owner, f"sep_{i}", text="", icon="UNLINKED", toggle=True)
+        sub.prop(item, "sep", text="", icon="UNLINKED", toggle=True)
         # [ARCHITECT MOVED] Socket button moved to Sockets Tab
-        sub.prop(owner, f"prot_{i}", text="", icon="LOCKED", toggle=True)
+        sub.prop(item, "prot", text="", icon="LOCKED", toggle=True)
 
         if is_expanded:
             col = box.column(align=True)
-            col.prop(owner, f"mat_{i}", text="Visual")
-            col.prop(owner, f"phys_mat_{i}", text="Physics")
+            col.prop(item, "mat", text="Visual")
+            col.prop(item, "phys_mat", text="Physics")
 
 
 def draw_collision_tab(layout, owner, slot_names):
@@ -586,37 +586,36 @@ def draw_collision_tab(layout, owner, slot_names):
     layout.separator()
     layout.label(text="Per-Slot Collision", icon="MATERIAL")
 
-    for i in range(10):
+    for i, item in enumerate(owner.slots):
         box = layout.box()
         row = box.row()
 
-        is_expanded = getattr(owner, f"expand_{i}", False)
+        is_expanded = item.expand
         icon = "TRIA_DOWN" if is_expanded else "TRIA_RIGHT"
-        row.prop(owner, f"expand_{i}", icon=icon, text="", emboss=False)
+        row.prop(item, "expand", icon=icon, text="", emboss=False)
 
         s_name = slot_names.get(i, f"Slot {i}")
         row.label(text=f"{i}: {s_name}", icon="MATERIAL")
 
         # Wireframe Toggle on Header
         sub = row.row(align=True)
-        if getattr(owner, f"show_coll_{i}", False):
-            sub.prop(
-                owner, f"show_coll_{i}", text="", icon="SHADING_WIRE", toggle=True
+        if item.show_coll:
+            sub.prop(item, "show_coll", text="", icon="SHADING_WIRE", toggle=True
             )
         else:
-            sub.prop(owner, f"show_coll_{i}", text="", icon="X", toggle=True)
+            sub.prop(item, "show_coll", text="", icon="X", toggle=True)
 
         if is_expanded:
             col = box.column(align=True)
 
             # Shape
-            col.prop(owner, f"collision_shape_{i}", text="Shape")
+            col.prop(item, "collision_shape", text="Shape")
             col.separator()
 
             # Physics Props
-            col.prop(owner, f"phys_friction_{i}", text="Friction")
-            col.prop(owner, f"phys_bounce_{i}", text="Restitution")
-            col.prop(owner, f"phys_bond_{i}", text="Attachment Strength")
+            col.prop(item, "phys_friction", text="Friction")
+            col.prop(item, "phys_bounce", text="Restitution")
+            col.prop(item, "phys_bond", text="Attachment Strength")
 
 def draw_sockets_ui(layout, owner, slot_names):
     """
@@ -647,23 +646,23 @@ def draw_sockets_ui(layout, owner, slot_names):
         layout.separator()
         layout.label(text="Per-Slot Configuration", icon="MATERIAL")
 
-        for i in range(10):
+        for i, item in enumerate(owner.slots):
             box = layout.box()
             row = box.row()
 
-            is_expanded = getattr(owner, f"expand_{i}", False)
+            is_expanded = item.expand
             icon = "TRIA_DOWN" if is_expanded else "TRIA_RIGHT"
-            row.prop(owner, f"expand_{i}", icon=icon, text="", emboss=False)
+            row.prop(item, "expand", icon=icon, text="", emboss=False)
 
             s_name = slot_names.get(i, f"Slot {i}")
             row.label(text=f"{i}: {s_name}", icon="MATERIAL")
 
             # Header Controls
             sub = row.row(align=True)
-            if getattr(owner, f"sock_{i}", False):
-                sub.prop(owner, f"sock_{i}", text="Enabled", icon="CHECKMARK", toggle=True)
+            if item.sock:
+                sub.prop(item, "sock", text="Enabled", icon="CHECKMARK", toggle=True)
             else:
-                sub.prop(owner, f"sock_{i}", text="Enable", icon="EMPTY_AXIS", toggle=True)
+                sub.prop(item, "sock", text="Enable", icon="EMPTY_AXIS", toggle=True)
 
             if is_expanded:
                 col = box.column(align=True)
@@ -20,7 +20,7 @@ def verify():
     # Create sheet with Sockets Enabled for Slot 0
     bpy.ops.massa.gen_prim_03_sheet(
         sock_enable=True,
-        sock_0=True,  # Enable socket for Slot 0 (Surface)
+        slots=[{"sock": True}],  # Enable socket for Slot 0 (Surface)
         sock_visual_size=0.5
     )
 
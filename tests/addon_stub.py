@@ -0,0 +1,32 @@
+import os
+import sys
+import types
+from unittest.mock import MagicMock
+
+# --- SHARED TEST SCAFFOLDING ---
+# Modules that import ..utils (massa_properties and everything built on it)
+# need the add-on root importable as a package, but its __init__ registers
+# the whole add-on. mount_addon() mounts the root as a bare package instead.
+
+ADDON_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "MASSA_BMESH_CONSOLE-main"))
+
+# Field defaults of MASSA_PG_SlotConfig (modules/massa_properties.py)
+SLOT_DEFAULTS = {
+    "expand": False, "mat": "NONE", "phys_mat": "GENERIC", "uv_mode": "SKIP",
+    "uv_scale": 1.0, "sep": False, "sock": False, "off": 0.0, "prot": False,
+    "collision_shape": "MESH", "show_coll": False,
+    "phys_friction": 0.5, "phys_bounce": 0.0, "phys_bond": 100.0,
+}
+
+
+def mount_addon(name):
+    """
+    Mocks bpy and mounts the add-on root as the bare package 'name'.
+    Each test file passes its own name so it imports fresh module copies.
+    """
+    sys.modules['bpy'] = MagicMock()
+    sys.modules['bpy.props'] = MagicMock()
+    pkg = types.ModuleType(name)
+    pkg.__path__ = [ADDON_ROOT]
+    sys.modules[name] = pkg
+    return pkg
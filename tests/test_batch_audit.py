@@ -0,0 +1,76 @@
+import unittest
+import os
+import xml.etree.ElementTree as ET
+import importlib.util
+
+# batch_audit is host-side Python; load it by path (the debugging_system
+# package __init__ pulls in config, which needs a Blender install)
+_PATH = os.path.abspath("./MASSA_BMESH_CONSOLE-main/modules/debugging_system/batch_audit.py")
+_spec = importlib.util.spec_from_file_location("massa_batch_audit", _PATH)
+batch_audit = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(batch_audit)
+
+
+class StubPool:
+    size = 3
+    restarts = 0
+
+    def __init__(self, results):
+        self.results = results
+        self.jobs = None
+
+    def map(self, jobs):
+        self.jobs = list(jobs)
+        return [self.results.get(j["payload"]["cart_id"], {"status": "PASS"}) for j in self.jobs]
+
+
+class TestBatchAudit(unittest.TestCase):
+
+    def test_discover_uses_manifest(self):
+        entries = batch_audit.discover()
+        ids = [e["id"] for e in entries]
+        self.assertGreater(len(ids), 10)
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertTrue(all(e["module"] for e in entries))
+
+        prim = batch_audit.discover(only=["prim_"])
+        self.assertTrue(prim)
+        self.assertTrue(all(e["id"].startswith("prim_") for e in prim))
+
+    def _report(self):
+        entries = [
+            {"id": "a_ok", "module": "cart_a", "category": "Prims"},
+            {"id": "b_fail", "module": "cart_b", "category": "Prims"},
+            {"id": "c_crash", "module": "cart_c", "category": ""},
+        ]
+        pool = StubPool({
+            "a_ok": {"status": "PASS", "gen_ms": 12.0, "audit_ms": 3.0},
+            "b_fail": {"status": "FAIL", "errors": ["Non-manifold edges: 4"]},
+            "c_crash": {"status": "SYSTEM_FAILURE", "message": "Worker failed: exited", "log": "trace"},
+        })
+        return batch_audit.run_batch(entries, pool), pool
+
+    def test_run_batch_aggregates(self):
+        report, pool = self._report()
+        self.assertEqual([j["mode"] for j in pool.jobs], ["CARTRIDGE"] * 3)
+        self.assertEqual(pool.jobs[1]["payload"], {"cart_id": "b_fail"})
+
+        summary = report["summary"]
+        self.assertEqual((summary["total"], summary["passed"], summary["failed"], summary["errors"]), (3, 1, 1, 1))
+        self.assertEqual(summary["workers"], 3)
+        self.assertEqual(report["results"][2]["errors"], ["Worker failed: exited"])
+        self.assertAlmostEqual(summary["cpu_s"], 0.015)
+
+    def test_junit(self):
+        report, _ = self._report()
+        suite = ET.fromstring(batch_audit.junit_xml(report))
+        self.assertEqual(suite.get("tests"), "3")
+        cases = {c.get("name"): c for c in suite.findall("testcase")}
+        self.assertIsNone(cases["a_ok"].find("failure"))
+        self.assertEqual(cases["b_fail"].find("failure").get("message"), "Non-manifold edges: 4")
+        self.assertIn("trace", cases["c_crash"].find("error").text)
+        self.assertEqual(cases["c_crash"].get("classname"), "massa.cartridges.other")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import os
+import tempfile
+import importlib.util
+
+# bench and profiler are plain Python; load them by path (the debugging_system
+# package __init__ pulls in config, which needs a Blender install)
+_DIR = os.path.abspath("./MASSA_BMESH_CONSOLE-main/modules/debugging_system")
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(f"massa_{name}", os.path.join(_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bench = _load("bench")
+profiler = _load("profiler")
+
+
+def _prop(identifier, type_="BOOLEAN", default=False, soft_max=1):
+    return {"identifier": identifier, "type": type_, "default": default, "soft_max": soft_max}
+
+
+def _run(total=100.0, build=60.0, faces=500, peak=2048.0):
+    return {"total_ms": total, "stages": {"build_shape": build}, "peak_kb": peak,
+            "verts": 400, "edges": 900, "faces": faces, "objects": 1}
+
+
+class TestPresets(unittest.TestCase):
+
+    def setUp(self):
+        self.props = [
+            _prop("segments", "INT", 8, 2 ** 31 - 1),
+            _prop("ring_count", "INT", 4, 16),
+            _prop("width", "FLOAT", 1.0, 10.0),
+            _prop("sides", "INT", 128, 256),  # Already above the cap
+            _prop("pol_fuse_active"), _prop("pol_noise_active"), _prop("draft_mode"),
+            _prop("wear_active"), _prop("seam_active"),
+        ]
+
+    def test_default_and_max_res(self):
+        self.assertEqual(bench.preset_overrides("default", self.props), {})
+        self.assertEqual(bench.preset_overrides("max_res", self.props),
+                         {"segments": bench.RES_CAP, "ring_count": 16})
+
+    def test_flag_presets_only_use_existing_props(self):
+        polish = bench.preset_overrides("polish", self.props)
+        self.assertEqual(polish, {"pol_fuse_active": True, "pol_noise_active": True, "draft_mode": False})
+        surface = bench.preset_overrides("surface", self.props)
+        self.assertEqual(surface, {"wear_active": True, "seam_active": True, "draft_mode": False})
+        with self.assertRaises(ValueError):
+            bench.preset_overrides("bogus", self.props)
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_regressions_and_improvements(self):
+        baseline = {"a": {"default": _run()}, "b": {"default": _run()}}
+        results = {
+            "a": {"default": _run(total=320.0, build=61.0)},  # 3.2x slower
+            "b": {"default": _run(total=40.0, build=20.0, faces=520)},
+            "c": {"default": _run()},
+        }
+        findings = bench.compare(results, baseline)
+        got = {(f["cartridge"], f["metric"], f["status"]) for f in findings}
+        self.assertIn(("a", "total_ms", "REGRESSION"), got)
+        self.assertNotIn(("a", "stage:build_shape", "REGRESSION"), got)
+        self.assertIn(("b", "total_ms", "IMPROVED"), got)
+        self.assertIn(("b", "faces", "REGRESSION"), got)  # Counts must match exactly
+        self.assertIn(("c", "*", "NEW"), got)
+        self.assertEqual(len(bench.regressions(findings)), 2)
+
+    def test_tolerances_and_noise_floor(self):
+        baseline = {"a": {"default": _run(total=100.0, build=1.0, faces=500)}}
+        results = {"a": {"default": _run(total=180.0, build=4.0, faces=505)}}
+        self.assertEqual(bench.regressions(bench.compare(results, baseline, {"time": 2.0, "counts": 0.05})), [])
+        strict = bench.regressions(bench.compare(results, baseline))
+        self.assertEqual({f["metric"] for f in strict}, {"total_ms", "faces"})
+
+    def test_errors_and_missing_presets(self):
+        baseline = {"a": {"default": _run(), "polish": _run()}}
+        findings = bench.compare({"a": {"default": {"error": "boom"}}}, baseline)
+        got = {(f["preset"], f["status"]) for f in findings}
+        self.assertEqual(got, {("default", "REGRESSION"), ("polish", "MISSING")})
+
+    def test_baseline_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            self.assertEqual(bench.load_baseline(path), {})
+            bench.save_baseline({"a": {"default": _run()}}, path)
+            bench.save_baseline({"b": {"default": _run(total=5.0)}}, path)
+            self.assertEqual(set(bench.load_baseline(path)), {"a", "b"})
+
+    def test_checked_in_baseline_loads(self):
+        self.assertIsInstance(bench.load_baseline(), dict)
+
+
+class TestTimedCalls(unittest.TestCase):
+
+    def test_wraps_and_restores(self):
+        class Base:
+            def build_shape(self, bm):
+                return bm * 2
+
+        class Cart(Base):
+            pass
+
+        holder = type("Module", (), {})()
+        holder.stage = lambda x: x + 1
+        original_stage = holder.stage
+
+        totals = {}
+        targets = [("build", Cart, "build_shape"), ("stage", holder, "stage"), ("missing", holder, "nope")]
+        with profiler.timed_calls(targets, totals):
+            self.assertEqual(Cart().build_shape(3), 6)
+            self.assertEqual(holder.stage(1), 2)
+            holder.stage(2)
+        self.assertEqual(set(totals), {"build", "stage"})
+        self.assertNotIn("build_shape", vars(Cart))  # Inherited: shadow removed
+        self.assertIs(holder.stage, original_stage)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_manifest
+
+CART_DIR = os.path.join("MASSA_BMESH_CONSOLE-main", "modules", "cartridges")
+
+SAMPLE = '''
+import bpy
+from ...operators.massa_base import Massa_OT_Base
+
+CARTRIDGE_META = {
+    "name": "Sample",
+    "id": "prim_sample",
+    "icon": "MESH_CUBE",
+    "flags": {"ALLOW_SOLIDIFY": True},
+}
+
+class MASSA_OT_Sample(Massa_OT_Base):
+    bl_idname = "massa.gen_prim_sample"
+    bl_label = "Sample"
+'''
+
+
+class TestCartridgeManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        with open(os.path.join(self.tmp, "cart_sample.py"), "w") as fh:
+            fh.write(SAMPLE)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_scan_without_import(self):
+        entry = massa_manifest.scan_module(os.path.join(self.tmp, "cart_sample.py"), "cart_sample")
+        self.assertEqual(entry["id"], "prim_sample")
+        self.assertEqual(entry["category"], "PRIMITIVES")
+        self.assertEqual(entry["class"], "MASSA_OT_Sample")
+        self.assertEqual(entry["operator"], "massa.gen_prim_sample")
+        self.assertNotIn("flags", entry)
+
+    def test_categories(self):
+        self.assertEqual(massa_manifest.category_of("prim_con_board"), "CONSTRUCTION")
+        self.assertEqual(massa_manifest.category_of("arch_stairs"), "ARCHITECTURE")
+        self.assertEqual(massa_manifest.category_of("asm_tower"), "BUILDINGS")
+
+    def test_rebuilt_when_source_changes(self):
+        mods = ("cart_sample",)
+        first = massa_manifest.load_manifest(self.tmp, mods)
+        self.assertEqual(first[0]["name"], "Sample")
+        self.assertTrue(os.path.exists(os.path.join(self.tmp, massa_manifest.MANIFEST_FILE)))
+
+        with open(os.path.join(self.tmp, "cart_sample.py"), "w") as fh:
+            fh.write(SAMPLE.replace('"Sample"', '"Renamed"', 1))
+        second = massa_manifest.load_manifest(self.tmp, mods)
+        self.assertEqual(second[0]["name"], "Renamed")
+
+    def test_shipped_manifest_is_current(self):
+        mods = massa_manifest.listed_modules(CART_DIR)
+        self.assertTrue(mods)
+        with open(os.path.join(CART_DIR, massa_manifest.MANIFEST_FILE)) as fh:
+            manifest = json.load(fh)
+        self.assertTrue(massa_manifest.is_current(manifest, CART_DIR, mods))
+        self.assertEqual(len(manifest["cartridges"]), len(mods))
+
+
+if __name__ == '__main__':
+    unittest.main()
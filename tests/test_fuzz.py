@@ -0,0 +1,165 @@
+import unittest
+import os
+import sys
+import itertools
+import importlib.util
+from unittest.mock import MagicMock, patch
+
+# fuzz is plain Python; load it by path (the debugging_system package
+# __init__ pulls in config, which needs a Blender install)
+_PATH = os.path.abspath("./MASSA_BMESH_CONSOLE-main/modules/debugging_system/fuzz.py")
+_spec = importlib.util.spec_from_file_location("massa_fuzz", _PATH)
+fuzz = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fuzz)
+
+PROPS = [
+    {"identifier": "segments", "type": "INT", "own": True, "default": 8,
+     "soft_min": 3, "soft_max": 2 ** 31 - 1, "hard_min": 3, "hard_max": 2 ** 31 - 1},
+    {"identifier": "radius", "type": "FLOAT", "own": True, "default": 1.0,
+     "soft_min": 0.0, "soft_max": 10.0, "hard_min": 0.0, "hard_max": 3.4e38},
+    {"identifier": "cap", "type": "BOOLEAN", "own": True, "default": True},
+    {"identifier": "profile", "type": "ENUM", "own": True, "default": "ROUND", "items": ["ROUND", "SQUARE", "HEX"]},
+    {"identifier": "ui_tab", "type": "ENUM", "own": True, "default": "A", "items": ["A", "B"]},
+    {"identifier": "pol_noise_active", "type": "BOOLEAN", "own": False, "default": False},
+]
+
+
+def fake_cartridge(params):
+    """Fails for radius 0 with a square profile; slow for many segments."""
+    full = {"segments": 8, "radius": 1.0, "cap": True, "profile": "ROUND", **params}
+    lines = [1, 2, 3 + (full["profile"] == "HEX")]
+    if full["radius"] == 0.0 and full["profile"] == "SQUARE":
+        return {"status": "CRASH", "error": f"Pipeline Error: division by zero at {full['segments']}", "ms": 1.0, "lines": lines + [99]}
+    return {"status": "OK", "ms": 10.0 * full["segments"], "faces": full["segments"] * 4, "lines": lines}
+
+
+class FakePool:
+    size = 2
+
+    def __init__(self):
+        self.jobs = 0
+
+    def run(self, job):
+        self.jobs += 1
+        payload = job["payload"]
+        reply = {"status": "SUCCESS", "results": [fake_cartridge(c) for c in payload["cases"]]}
+        if payload["describe"]:
+            reply["props"] = PROPS
+        return reply
+
+    def map(self, jobs):
+        return [self.run(j) for j in jobs]
+
+
+class TestDomains(unittest.TestCase):
+
+    def test_boundary_values(self):
+        by_name = {p["identifier"]: p for p in PROPS}
+        self.assertEqual(fuzz.boundary_values(by_name["segments"]), [8, 3, 4, fuzz.INT_CAP - 1, fuzz.INT_CAP])
+        radius = fuzz.boundary_values(by_name["radius"])
+        self.assertEqual(radius[0], 1.0)
+        self.assertIn(0.0, radius)
+        self.assertIn(10.0, radius)
+        self.assertEqual(fuzz.boundary_values(by_name["profile"]), ["ROUND", "SQUARE", "HEX"])
+
+    def test_param_space_skips_ui_and_base(self):
+        domains, defaults = fuzz.param_space(PROPS)
+        self.assertEqual(set(domains), {"segments", "radius", "cap", "profile"})
+        self.assertEqual(defaults["cap"], True)
+        domains, _ = fuzz.param_space(PROPS, include_base=True)
+        self.assertIn("pol_noise_active", domains)
+
+    def test_pairwise_covers_all_pairs(self):
+        domains, _ = fuzz.param_space(PROPS)
+        cases = fuzz.pairwise(domains)
+        for a, b in itertools.combinations(domains, 2):
+            seen = {(c[a], c[b]) for c in cases}
+            self.assertEqual(len(seen), len(domains[a]) * len(domains[b]), (a, b))
+        exhaustive = 1
+        for values in domains.values():
+            exhaustive *= len(values)
+        self.assertLess(len(cases), exhaustive / 4)
+
+
+class TestSearch(unittest.TestCase):
+
+    def test_failures_boost_their_params(self):
+        domains, defaults = fuzz.param_space(PROPS)
+        fuzzer = fuzz.Fuzzer(domains, defaults)
+        fuzzer.queue.clear()
+        case = {"radius": 0.0, "profile": "SQUARE"}
+        self.assertTrue(fuzzer.record(case, fake_cartridge(case)))
+        self.assertGreater(fuzzer.weights["radius"], fuzzer.weights["cap"])
+        self.assertEqual(len(fuzzer.queue), fuzz.MUTATIONS_PER_HIT)
+        # Known lines, plain result: not a seed
+        self.assertFalse(fuzzer.record({}, fake_cartridge({})))
+
+    def test_shrink_to_minimal_case(self):
+        _, defaults = fuzz.param_space(PROPS)
+        failing = {"segments": 100, "radius": 0.0, "cap": False, "profile": "SQUARE"}
+        signature = fuzz.failure_signature(fake_cartridge(failing))
+        small, runs = fuzz.shrink(
+            failing, defaults, lambda c: fuzz.failure_signature(fake_cartridge(c)) == signature
+        )
+        self.assertEqual(small, {"radius": 0.0, "profile": "SQUARE"})
+        self.assertLessEqual(runs, 64)
+
+    def test_fuzz_cartridge_reports(self):
+        pool = FakePool()
+        report = fuzz.fuzz_cartridge(pool, "prim_fake", budget=60, log=lambda *_: None)
+        self.assertEqual(report["status"], "FAIL")
+        self.assertEqual(len(report["failures"]), 1)  # Same bug, numbers stripped
+        self.assertEqual(report["failures"][0]["params"], {"radius": 0.0, "profile": "SQUARE"})
+        self.assertEqual(report["slowest"][0]["params"].get("segments"), fuzz.INT_CAP)
+        self.assertLessEqual(report["cases"], 60)
+        self.assertIn("minimal:", fuzz.format_report(report))
+
+    def test_batch_crash_is_split(self):
+        class CrashPool(FakePool):
+            def run(self, job):
+                if any(c.get("cap") is False for c in job["payload"]["cases"]):
+                    return {"status": "SYSTEM_FAILURE", "message": "Worker failed: no reply within 120s"}
+                return super().run(job)
+
+        results = fuzz._run_cases(CrashPool(), "prim_fake", [[{}, {"cap": False}, {"segments": 3}]])
+        statuses = {fuzz.case_key(c): r["status"] for c, r in results}
+        self.assertEqual(statuses[fuzz.case_key({"cap": False})], "HANG")
+        self.assertEqual(statuses[fuzz.case_key({})], "OK")
+
+
+class TestRunCase(unittest.TestCase):
+
+    def setUp(self):
+        # runner_fuzz runs inside Blender; mock bpy just for loading it
+        path = os.path.join(os.path.dirname(_PATH), "runner_fuzz.py")
+        with patch.dict(sys.modules, {"bpy": MagicMock()}):
+            spec = importlib.util.spec_from_file_location("massa_runner_fuzz", path)
+            self.runner_fuzz = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(self.runner_fuzz)
+        self.runner_fuzz.runner_bench.clear_outputs = lambda: None
+        self.runner_fuzz._check_output = lambda: None
+
+    def test_timed_run_is_not_traced(self):
+        calls = []
+
+        def op_call(_ctx, **params):
+            calls.append(sys.gettrace())
+            return {"FINISHED"}
+
+        # Pretend the operator's own frames belong to the add-on
+        tracer = self.runner_fuzz.LineCoverage
+        with patch.object(self.runner_fuzz, "LineCoverage", lambda: tracer(root="")):
+            result = self.runner_fuzz.run_case(op_call, {"segments": 3})
+        self.assertEqual(result["status"], "OK")
+        self.assertTrue(result["lines"])
+        self.assertEqual(len(calls), 2)
+        self.assertIsNotNone(calls[0])  # Coverage run
+        self.assertIsNone(calls[1])     # Timed run
+
+        calls.clear()
+        result = self.runner_fuzz.run_case(op_call, {}, coverage=False)
+        self.assertEqual((calls, result["lines"]), ([None], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from types import SimpleNamespace
+
+# --- MOCK BLENDER ENVIRONMENT ---
+from addon_stub import mount_addon
+
+mount_addon("massa_batch_addon")
+from massa_batch_addon.modules import massa_batch, massa_params, massa_properties
+
+
+def _obj(name, params, op_id="massa.gen_fence", kind="MESH"):
+    props = {"massa_op_id": op_id}
+    if params is not None:
+        props["MASSA_PARAMS"] = massa_params.encode(params)
+    return SimpleNamespace(name=name, type=kind, get=props.get)
+
+
+class TestBatchGrouping(unittest.TestCase):
+
+    def test_digest_ignores_order_and_transform(self):
+        a = {"width": 2.0, "axes": {"X", "Z"}, "obj_location": [1.0, 0.0, 0.0]}
+        b = {"axes": {"Z", "X"}, "obj_location": [9.0, 9.0, 0.0], "width": 2.0}
+        self.assertEqual(massa_batch.params_digest(a), massa_batch.params_digest(b))
+        self.assertNotEqual(massa_batch.params_digest(a), massa_batch.params_digest({"width": 2.5}))
+
+    def test_group_objects(self):
+        objs = [
+            _obj("Fence", {"height": 2.0, "obj_location": [0.0, 0.0, 0.0]}),
+            _obj("Fence.001", {"height": 2.0, "obj_location": [4.0, 0.0, 0.0]}),
+            _obj("Fence.002", {"height": 3.0}),
+            _obj("Box", {"height": 2.0}, op_id="massa.gen_box"),
+            _obj("Lamp", {}, kind="LIGHT"),
+            _obj("Broken", None),
+        ]
+        groups = massa_batch.group_objects(objs)
+        self.assertEqual(len(groups), 3)
+        sizes = sorted(len(g) for g in groups.values())
+        self.assertEqual(sizes, [1, 1, 2])
+        shared = next(g for g in groups.values() if len(g) == 2)
+        self.assertEqual([o.name for o in shared], ["Fence", "Fence.001"])
+
+    def test_group_ignores_ui_state(self):
+        # Same fence left on different Redo tabs / with different slots folded open
+        objs = [
+            _obj("Fence", {"height": 2.0, "ui_tab": "SHAPE", "slots": {"expand": {"0": True}}}),
+            _obj("Fence.001", {"height": 2.0, "ui_tab": "POLISH", "slots": {"expand": {"4": True}}}),
+            _obj("Fence.002", {"height": 2.0, "expand_0": True}),  # Legacy flat slot keys
+            _obj("Fence.003", {"height": 2.0, "ui_use_rot": True}),
+        ]
+        groups = massa_batch.group_objects(objs)
+        self.assertEqual(sorted(len(g) for g in groups.values()), [1, 3])
+        alone = next(g for g in groups.values() if len(g) == 1)
+        self.assertEqual(alone[0].name, "Fence.003")
+
+    def test_shareable(self):
+        columns = {"sep": [False] * massa_properties.SLOT_COUNT}
+        self.assertTrue(massa_batch.is_shareable({"slots": columns}))
+        self.assertFalse(massa_batch.is_shareable({"slots": columns, "phys_auto_rig": True}))
+        self.assertFalse(massa_batch.is_shareable(
+            {"slots": columns, "sock_enable": True, "sock_constraint_type": "FIXED"}))
+        self.assertFalse(massa_batch.is_shareable({"sep_2": True}))
+
+    def test_tiled(self):
+        self.assertTrue(massa_batch.is_tiled({"use_tiles": True}))
+        self.assertFalse(massa_batch.is_tiled({"use_tiles": False}))
+        self.assertFalse(massa_batch.is_tiled({}))
+
+    def test_operator_kwargs(self):
+        cls = type("FakeOp", (), {})
+        massa_params._CLASS_CACHE[cls] = {"height": 1.0}
+        columns = {name: [None] * massa_properties.SLOT_COUNT for name in ("mat", "sep")}
+        columns["mat"][1] = "Steel"
+        kwargs = massa_batch.operator_kwargs(cls, {"height": 2.0, "legacy_key": 1, "slots": columns})
+        self.assertEqual(kwargs["height"], 2.0)
+        self.assertNotIn("legacy_key", kwargs)
+        self.assertEqual(kwargs["slots"][1], {"mat": "Steel"})
+        self.assertEqual(kwargs["slots"][0], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+import sys
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+sys.modules['bpy.app'] = MagicMock()
+sys.modules['bpy.app.handlers'] = MagicMock()
+sys.modules['bpy.app.handlers'].persistent = lambda func: func
+sys.modules['bmesh'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['mathutils'] = MagicMock()
+
+import bpy
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_collision
+
+
+class FakeCollection(list):
+    """Minimal stand-in for a bpy_prop_collection supporting foreach_get."""
+
+    def __init__(self, items, field):
+        super().__init__(items)
+        self.field = field
+
+    def foreach_get(self, attr, out):
+        out[:] = np.asarray(self.field[attr], dtype=out.dtype).ravel()
+
+
+class FakeMesh:
+    def __init__(self, uid):
+        self.session_uid = uid
+        # Two quads sharing an edge: face 0 is slot 0, face 1 is slot 2
+        co = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0), (2, 1, 0)]
+        edges = [(0, 1), (1, 2), (2, 3), (3, 0), (1, 4), (4, 5), (5, 2)]
+        loop_verts = [0, 1, 2, 3, 1, 4, 5, 2]
+        loop_edges = [0, 1, 2, 3, 4, 5, 6, 1]
+        self.vertices = FakeCollection(co, {"co": co})
+        self.edges = FakeCollection(edges, {"vertices": edges})
+        self.loops = FakeCollection(loop_verts, {"vertex_index": loop_verts, "edge_index": loop_edges})
+        self.polygons = FakeCollection([0, 1], {"loop_total": [4, 4]})
+
+        part_attr = MagicMock()
+        part_attr.domain = "FACE"
+        part_attr.data = FakeCollection([0, 1], {"value": [0, 2]})
+        self.attributes = {"massa_part_id": part_attr}
+
+
+class FakeObject:
+    def __init__(self, uid, mesh):
+        self.session_uid = uid
+        self.data = mesh
+        self.type = "MESH"
+
+
+class TestCollisionCache(unittest.TestCase):
+
+    def setUp(self):
+        massa_collision._collision_cache.clear()
+        massa_collision._mesh_revisions.clear()
+
+    def test_single_scan_serves_all_slots(self):
+        """One bulk scan splits points per massa_part_id."""
+        slots = massa_collision._scan_slots(FakeMesh(1))
+        self.assertEqual(set(slots.keys()), {0, 2})
+        self.assertEqual(len(slots[0][0]), 4)
+        # Slot 0 owns 4 edges -> 8 segment endpoints
+        self.assertEqual(len(slots[0][1]), 8)
+
+    def test_box_lines(self):
+        obj = FakeObject(10, FakeMesh(1))
+        lines = massa_collision.get_slot_geometry_lines(obj, 2, "BOX")
+        self.assertEqual(lines.shape, (24, 3))
+        np.testing.assert_allclose(lines.min(axis=0), (1, 0, 0))
+        np.testing.assert_allclose(lines.max(axis=0), (2, 1, 0))
+        # Missing slot yields nothing
+        self.assertEqual(len(massa_collision.get_slot_geometry_lines(obj, 5, "BOX")), 0)
+
+    def test_cache_survives_rename_and_reuses_scan(self):
+        obj = FakeObject(10, FakeMesh(1))
+        first = massa_collision.get_slot_geometry_lines(obj, 0, "SPHERE")
+        obj.name = "Renamed"
+        second = massa_collision.get_slot_geometry_lines(obj, 0, "SPHERE")
+        self.assertIs(first, second)
+        self.assertEqual(len(massa_collision._collision_cache), 1)
+
+    def test_geometry_update_invalidates(self):
+        mesh = FakeMesh(1)
+        obj = FakeObject(10, mesh)
+        first = massa_collision.get_slot_geometry_lines(obj, 0, "CAPSULE")
+
+        class _Mesh:
+            pass
+
+        bpy.types.Object = type("Object", (), {})
+        bpy.types.Mesh = _Mesh
+        mesh.__class__ = type("FakeMeshRNA", (FakeMesh, _Mesh), {})
+
+        update = MagicMock()
+        update.is_updated_geometry = True
+        update.id = mesh
+        depsgraph = MagicMock()
+        depsgraph.updates = [update]
+        massa_collision.depsgraph_update_post(None, depsgraph)
+
+        self.assertEqual(len(massa_collision._collision_cache), 0)
+        second = massa_collision.get_slot_geometry_lines(obj, 0, "CAPSULE")
+        self.assertIsNot(first, second)
+
+    def test_lru_cap(self):
+        for uid in range(massa_collision.CACHE_LIMIT + 5):
+            obj = FakeObject(uid, FakeMesh(1000 + uid))
+            massa_collision.get_slot_geometry_lines(obj, 0, "BOX")
+        self.assertEqual(len(massa_collision._collision_cache), massa_collision.CACHE_LIMIT)
+        # Oldest entries were evicted first
+        self.assertNotIn((0, 1000, 0), massa_collision._collision_cache)
+
+    def test_revisions_pruned_with_cache(self):
+        class _Mesh:
+            pass
+
+        bpy.types.Object = type("Object", (), {})
+        bpy.types.Mesh = _Mesh
+        rna = type("FakeMeshRNA", (FakeMesh, _Mesh), {})
+
+        kept = FakeObject(1, rna(1))
+        massa_collision.get_slot_geometry_lines(kept, 0, "BOX")
+        edited = [kept.data] + [rna(2000 + i) for i in range(massa_collision.CACHE_LIMIT * 3)]
+        for mesh in edited:
+            update = MagicMock()
+            update.is_updated_geometry = True
+            update.id = mesh
+            depsgraph = MagicMock()
+            depsgraph.updates = [update]
+            massa_collision.depsgraph_update_post(None, depsgraph)
+            if mesh is kept.data:
+                massa_collision.get_slot_geometry_lines(kept, 0, "BOX")
+
+        self.assertLessEqual(len(massa_collision._mesh_revisions), massa_collision.CACHE_LIMIT)
+        # Still cached under its bumped revision
+        self.assertIn((1, 1, 1), massa_collision._collision_cache)
+        self.assertEqual(massa_collision._mesh_revisions.get(1), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
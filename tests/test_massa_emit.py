@@ -0,0 +1,46 @@
+import unittest
+import sys
+import numpy as np
+from unittest.mock import MagicMock
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_emit
+
+
+class TestMassaEmit(unittest.TestCase):
+
+    def test_face_layout_mixed_blocks(self):
+        quads = np.array([[0, 1, 2, 3], [3, 2, 4, 5]])
+        tris = np.array([[6, 0, 1]])
+        loops, starts, sizes = massa_emit._face_layout([quads, tris])
+        self.assertEqual(sizes.tolist(), [4, 4, 3])
+        self.assertEqual(starts.tolist(), [0, 4, 8])
+        self.assertEqual(loops.tolist(), [0, 1, 2, 3, 3, 2, 4, 5, 6, 0, 1])
+
+    def test_face_layout_empty(self):
+        loops, starts, sizes = massa_emit._face_layout([])
+        self.assertEqual((len(loops), len(starts), len(sizes)), (0, 0, 0))
+
+    def test_match_edges_ignores_order_and_missing(self):
+        edges = [(0, 1), (1, 2), (2, 0), (2, 3)]
+        idx, found = massa_emit._match_edges(np.ravel(edges), 4, [(2, 1), (3, 2), (0, 3)])
+        self.assertEqual(found.tolist(), [True, True, False])
+        self.assertEqual(idx.tolist(), [1, 3])
+
+    def test_match_edges_no_mesh_edges(self):
+        idx, found = massa_emit._match_edges([], 4, [(0, 1)])
+        self.assertEqual(len(idx), 0)
+        self.assertEqual(found.tolist(), [False])
+
+    def test_grid_helpers(self):
+        quads = massa_emit.grid_quads(2, 1)
+        self.assertEqual(quads.tolist(), [[0, 1, 4, 3], [1, 2, 5, 4]])
+        rim = {tuple(sorted(e)) for e in massa_emit.grid_perimeter(2, 1).tolist()}
+        self.assertEqual(rim, {(0, 1), (1, 2), (3, 4), (4, 5), (0, 3), (2, 5)})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import subprocess
+import numpy as np
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_heightfield
+
+
+def make_params(**over):
+    params = {
+        "seed": 3,
+        "seed_offset": (12.5, -40.0, 7.0),
+        "noise_type": "hetero_terrain",
+        "noise_size": 1.0,
+        "octaves": 4,
+        "lacunarity": 2.0,
+        "gain": 1.0,
+        "offset": 1.0,
+        "distortion": 1.0,
+        "height": 1.5,
+        "height_offset": 0.0,
+        "falloff_x": 0.5,
+        "falloff_y": 0.5,
+        "size_x": 2.0,
+        "size_y": 2.0,
+        "water_level": 0.05,
+        "rock_slope": 0.7,
+        "peak_factor": 0.8,
+    }
+    params.update(over)
+    return params
+
+
+class TestHeightfield(unittest.TestCase):
+
+    def test_sub_rectangle_matches_full_grid(self):
+        params = make_params()
+        gx, gy = np.meshgrid(np.linspace(-1, 1, 65), np.linspace(-1, 1, 65))
+        full = massa_heightfield.heights(params, gx, gy)
+        part = massa_heightfield.heights(params, gx[10:30, 40:60], gy[10:30, 40:60])
+        np.testing.assert_array_equal(full[10:30, 40:60], part)
+
+    def test_all_noise_types_are_finite(self):
+        gx, gy = np.meshgrid(np.linspace(-1, 1, 9), np.linspace(-1, 1, 9))
+        for n_type in ("hetero_terrain", "fBm", "hybrid_multi_fractal", "ridged_multi_fractal",
+                       "vl_noise_turbulence", "vl_noise_voronoi", "marble"):
+            z = massa_heightfield.heights(make_params(noise_type=n_type), gx, gy)
+            self.assertEqual(z.shape, (9, 9))
+            self.assertTrue(np.isfinite(z).all(), n_type)
+
+    def test_perlin_is_zero_on_lattice(self):
+        perm = massa_heightfield.permutation(0)
+        pts = np.arange(5, dtype=float)
+        np.testing.assert_allclose(massa_heightfield.perlin(perm, pts, pts, pts), 0.0)
+
+    def test_classify_priorities(self):
+        params = make_params(height=1.0, peak_factor=0.8)
+        z = np.array([
+            [-1.0, -1.0, 0.1, 0.1, 0.5, 0.5, 0.9, 0.9],
+            [-1.0, -1.0, 0.1, 0.1, 0.5, 0.5, 0.9, 0.9],
+        ])
+        slots = massa_heightfield.classify(params, z, 0.1, 0.1)[0]
+        self.assertEqual(slots[0], massa_heightfield.SLOT_WATER)
+        self.assertEqual(slots[2], massa_heightfield.SLOT_SHORE)
+        self.assertEqual(slots[4], massa_heightfield.SLOT_GROUND)
+        self.assertEqual(slots[6], massa_heightfield.SLOT_PEAK)
+        # Steep step between columns reads as cliff
+        self.assertEqual(slots[3], massa_heightfield.SLOT_CLIFF)
+
+
+class TestTiles(unittest.TestCase):
+
+    LAYOUT = {"tiles_x": 2, "tiles_y": 2, "tile_res": 8}
+
+    def test_shared_border_matches(self):
+        params = make_params()
+        left = massa_heightfield.compute_tile(params, self.LAYOUT, 0, 0, 0)
+        right = massa_heightfield.compute_tile(params, self.LAYOUT, 1, 0, 0)
+        n = self.LAYOUT["tile_res"] + 1
+        co_l, co_r = left["co"].reshape(n, n, 3), right["co"].reshape(n, n, 3)
+        nr_l, nr_r = left["normals"].reshape(n, n, 3), right["normals"].reshape(n, n, 3)
+        np.testing.assert_array_equal(co_l[:, -1], co_r[:, 0])
+        np.testing.assert_allclose(nr_l[:, -1], nr_r[:, 0], atol=1e-6)
+
+    def test_lod_is_subset_of_lod0(self):
+        params = make_params()
+        fine = massa_heightfield.compute_tile(params, self.LAYOUT, 1, 1, 0)
+        coarse = massa_heightfield.compute_tile(params, self.LAYOUT, 1, 1, 1)
+        fine_co = fine["co"].reshape(9, 9, 3)[::2, ::2]
+        np.testing.assert_array_equal(fine_co.reshape(-1, 3), coarse["co"])
+        self.assertEqual(len(coarse["slots"]), 16)
+
+    def test_key_tracks_inputs(self):
+        params = make_params()
+        key = massa_heightfield.tile_key(params, self.LAYOUT, 0, 0, 0)
+        self.assertEqual(key, massa_heightfield.tile_key(make_params(), dict(self.LAYOUT), 0, 0, 0))
+        self.assertNotEqual(key, massa_heightfield.tile_key(params, self.LAYOUT, 1, 0, 0))
+        self.assertNotEqual(key, massa_heightfield.tile_key(make_params(seed=4), self.LAYOUT, 0, 0, 0))
+
+    def test_key_tracks_source(self):
+        params = make_params()
+        key = massa_heightfield.tile_key(params, self.LAYOUT, 0, 0, 0)
+        saved = massa_heightfield.source_digest()
+        try:
+            massa_heightfield._SOURCE_DIGEST = "edited"
+            self.assertNotEqual(key, massa_heightfield.tile_key(params, self.LAYOUT, 0, 0, 0))
+        finally:
+            massa_heightfield._SOURCE_DIGEST = saved
+
+    def test_cache_roundtrip_and_prune(self):
+        params = make_params()
+        with tempfile.TemporaryDirectory() as cache:
+            tile = massa_heightfield.compute_tile(params, self.LAYOUT, 0, 1, 0)
+            massa_heightfield.save_tile(cache, "ab12", tile)
+            loaded = massa_heightfield.load_tile(cache, "ab12")
+            np.testing.assert_array_equal(loaded["co"], tile["co"])
+            self.assertIsNone(massa_heightfield.load_tile(cache, "cd34"))
+
+            massa_heightfield.save_tile(cache, "ab13", tile)
+            self.assertEqual(massa_heightfield.prune_cache(cache, limit=1), 1)
+
+    def test_worker_entry(self):
+        params = make_params()
+        with tempfile.TemporaryDirectory() as cache:
+            job_file = os.path.join(cache, "job.json")
+            with open(job_file, "w") as fh:
+                json.dump({"params": params, "layout": self.LAYOUT, "cache_dir": cache, "tiles": [[1, 1, 0]]}, fh)
+            subprocess.run([sys.executable, massa_heightfield.__file__, job_file], check=True)
+
+            key = massa_heightfield.tile_key(params, self.LAYOUT, 1, 1, 0)
+            loaded = massa_heightfield.load_tile(cache, key)
+            expected = massa_heightfield.compute_tile(params, self.LAYOUT, 1, 1, 0)
+            np.testing.assert_array_equal(loaded["co"], expected["co"])
+
+
+if __name__ == '__main__':
+    unittest.main()
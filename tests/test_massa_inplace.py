@@ -0,0 +1,103 @@
+import unittest
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+
+import bpy
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_inplace
+
+
+class FakeModifiers(list):
+    def get(self, name):
+        return next((m for m in self if m.name == name), None)
+
+    def new(self, name, mod_type):
+        mod = SimpleNamespace(name=name, type=mod_type)
+        self.append(mod)
+        return mod
+
+
+def _child(name, kind="EMPTY"):
+    return SimpleNamespace(name=name, type=kind, data=None)
+
+
+def _target(children=()):
+    mesh = SimpleNamespace(users=1, library=None, shape_keys=None)
+    return SimpleNamespace(
+        type="MESH", mode="OBJECT", data=mesh, children=list(children),
+        vertex_groups=MagicMock(), modifiers=FakeModifiers(),
+    )
+
+
+class TestInPlaceResurrection(unittest.TestCase):
+
+    def setUp(self):
+        bpy.data.objects.remove.reset_mock()
+
+    def test_reusable(self):
+        obj = _target()
+        self.assertTrue(massa_inplace.can_regenerate_in_place(obj))
+        obj.data.users = 2
+        self.assertFalse(massa_inplace.can_regenerate_in_place(obj))
+        self.assertTrue(massa_inplace.can_regenerate_in_place(obj, allow_shared=True))
+        obj.data.users = 1
+        obj.mode = "EDIT"
+        self.assertFalse(massa_inplace.can_regenerate_in_place(obj))
+
+    def test_base_name(self):
+        self.assertEqual(massa_inplace.base_name("SOCKET_Top_0.001"), "SOCKET_Top_0")
+        self.assertEqual(massa_inplace.base_name("UCX_Box_Main"), "UCX_Box_Main")
+        self.assertEqual(massa_inplace.base_name("Box.v2"), "Box.v2")
+
+    def test_claim_and_finish(self):
+        ucx = _child("UCX_Box_Main", "MESH")
+        sock = _child("SOCKET_Top_0.001")
+        stale = _child("MASSA_JOINT_Box_Lid")
+        part = _child("Box_Lid", "MESH")
+        user = _child("Lamp", "MESH")
+        op = SimpleNamespace(_massa_reuse=_target([ucx, sock, stale, part, user]))
+
+        obj = massa_inplace.begin(op, "Box")
+        self.assertIsNotNone(obj)
+        self.assertIsNone(op._massa_reuse)
+        # Detached part rebuilt, user child untouched
+        removed = [c.args[0] for c in bpy.data.objects.remove.call_args_list]
+        self.assertEqual(removed, [part])
+
+        self.assertIs(massa_inplace.claim(op, "UCX_Box_Main", "MESH"), ucx)
+        self.assertIsNone(massa_inplace.claim(op, "UCX_Box_Main", "MESH"))
+        self.assertIsNone(massa_inplace.claim(op, "SOCKET_Top_0", "MESH"))
+        self.assertIs(massa_inplace.claim(op, "SOCKET_Top_0", "EMPTY"), sock)
+
+        bpy.data.objects.remove.reset_mock()
+        massa_inplace.finish(op)
+        removed = [c.args[0] for c in bpy.data.objects.remove.call_args_list]
+        self.assertEqual(removed, [stale])
+        self.assertIsNone(op._massa_reuse_children)
+
+    def test_no_target(self):
+        op = SimpleNamespace(_massa_reuse=None)
+        self.assertIsNone(massa_inplace.begin(op, "Box"))
+        self.assertIsNone(massa_inplace.claim(op, "UCX_Box_Main", "MESH"))
+        massa_inplace.finish(op)
+
+    def test_modifier_stack(self):
+        obj = _target()
+        user = obj.modifiers.new("Weld", "WELD")
+        bevel = obj.modifiers.new("Massa_Bevel", "BEVEL")
+
+        massa_inplace.prepare_modifiers(obj, ["Massa_Bevel"])
+        self.assertIs(massa_inplace.modifier(obj, "Massa_Bevel", "BEVEL"), bevel)
+
+        massa_inplace.prepare_modifiers(obj, ["Massa_Instances", "Massa_Bevel"])
+        self.assertEqual(list(obj.modifiers), [user])
+        self.assertIsNot(massa_inplace.modifier(obj, "Massa_Bevel", "BEVEL"), bevel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import sys
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+sys.modules['bmesh'] = MagicMock()
+sys.modules['mathutils'] = MagicMock()
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_instances
+
+
+class FakeOp:
+    def __init__(self, flags, output_mode):
+        self._flags = flags
+        self.output_mode = output_mode
+        self._massa_instances = None
+
+    def _get_cartridge_meta(self):
+        return {"flags": self._flags}
+
+
+class FakeAttr:
+    def __init__(self, values):
+        self.data = self
+        self.values = np.asarray(values)
+        self.written = None
+
+    def foreach_get(self, _key, out):
+        out[:] = self.values
+
+    def foreach_set(self, _key, seq):
+        self.written = np.asarray(seq)
+
+
+class FakeAttributes(dict):
+    def new(self, name, _type, _domain):
+        self[name] = FakeAttr([])
+        return self[name]
+
+
+class FakeMesh:
+    def __init__(self, carrier, index):
+        self.vertices = [None] * len(carrier)
+        self.attributes = FakeAttributes({
+            massa_instances.CARRIER_LAYER: FakeAttr(carrier),
+            massa_instances.INDEX_LAYER: FakeAttr(index),
+        })
+
+
+class TestInstancedOutput(unittest.TestCase):
+
+    def test_opt_in(self):
+        op = FakeOp({"ALLOW_INSTANCES": True}, "INSTANCES")
+        massa_instances.begin(op)
+        self.assertEqual(op._massa_instances, [])
+
+        op = FakeOp({}, "INSTANCES")
+        massa_instances.begin(op)
+        self.assertIsNone(op._massa_instances)
+
+    def test_groups_merge_per_template(self):
+        op = FakeOp({"ALLOW_INSTANCES": True}, "INSTANCES")
+        link, plank = object(), object()
+        op._massa_instances = [(link, ["a", "b"]), (plank, ["c"]), (link, ["d"])]
+
+        groups = massa_instances.take_groups(op)
+        self.assertEqual([(g[0], g[1]) for g in groups], [(link, ["a", "b", "d"]), (plank, ["c"])])
+        self.assertIsNone(op._massa_instances)
+
+    def test_point_attributes_scatter(self):
+        # Vertices 0-1 are regular geometry, 2-3 are carriers for rows 1 and 0
+        mesh = FakeMesh([0, 0, 1, 2], [0, 0, 1, 0])
+        table = np.array([[0.1, 0.2, 0.3, 2, 2, 2], [0.4, 0.5, 0.6, 3, 3, 3]], dtype=np.float32)
+        massa_instances.write_point_attributes(mesh, table)
+
+        rot = mesh.attributes[massa_instances.ROT_ATTR].written.reshape(-1, 3)
+        scale = mesh.attributes[massa_instances.SCALE_ATTR].written.reshape(-1, 3)
+        np.testing.assert_allclose(rot[2], [0.4, 0.5, 0.6])
+        np.testing.assert_allclose(rot[3], [0.1, 0.2, 0.3])
+        np.testing.assert_allclose(scale[0], [1, 1, 1])
+        np.testing.assert_allclose(scale[3], [2, 2, 2])
+
+
+    def test_recorded_bounds_follow_stamps(self):
+        op = FakeOp({"ALLOW_INSTANCES": True}, "INSTANCES")
+        self.assertIsNone(massa_instances.recorded_bounds(op, np.eye(4)))
+
+        tpl = type("Tpl", (), {"co": [(0, 0, 0), (1, 1, 1)]})()
+        up = np.eye(4)
+        up[:3, 3] = (0, 0, 5)
+        turned = np.diag([-1.0, 1.0, 1.0, 1.0])  # Mirror X
+        op._massa_instances = [(tpl, [up, turned])]
+        lo, hi = massa_instances.recorded_bounds(op, np.diag([2.0, 2.0, 2.0, 1.0]))
+        np.testing.assert_allclose(lo, (-2, 0, 0))
+        np.testing.assert_allclose(hi, (2, 2, 12))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import unittest
+import os
+import time
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+# --- MOCK BLENDER ENVIRONMENT ---
+from addon_stub import mount_addon, SLOT_DEFAULTS
+
+mount_addon("massa_cache_addon")
+from massa_cache_addon.modules import massa_mesh_cache as mc
+from massa_cache_addon.modules import massa_params
+
+
+def _prop(identifier, default):
+    return SimpleNamespace(
+        identifier=identifier, type="FLOAT", default=default, is_readonly=False,
+        is_array=False, array_length=0, is_enum_flag=False,
+    )
+
+
+class FakeOp:
+    bl_idname = "massa.gen_fake"
+    bl_rna = SimpleNamespace(properties=[
+        _prop("width", 1.0), _prop("obj_location", 0.0), _prop("ui_tab", "SHAPE"), _prop("ui_use_rot", False),
+    ])
+
+    def __init__(self, width=1.0, location=0.0, tab="SHAPE", use_rot=False):
+        self.width = width
+        self.obj_location = location
+        self.ui_tab = tab
+        self.ui_use_rot = use_rot
+        self.slots = []
+
+
+class TestMeshCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = dict(os.environ)
+        os.environ[mc.ENV_DIR] = self.tmp.name
+        os.environ.pop(mc.ENV_OFF, None)
+        mc._DIR = None
+        massa_params._SLOT_DEFAULTS.clear()
+        massa_params._SLOT_DEFAULTS.update(SLOT_DEFAULTS)
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.env)
+        mc._DIR = None
+        self.tmp.cleanup()
+
+    def _arrays(self, n=8):
+        return {"co": np.arange(n * 3, dtype=np.float32), "poly_start": np.arange(n, dtype=np.int32)}
+
+    def test_round_trip(self):
+        meta = mc.describe({0: 0.5, "global_vol": 2.0}, {}, [], build_seconds=1.0)
+        mc.save("ab" * 20, self._arrays(), meta)
+        arrays, loaded = mc.load("ab" * 20)
+        np.testing.assert_array_equal(arrays["co"], self._arrays()["co"])
+        self.assertEqual(arrays["poly_start"].dtype, np.int32)
+        self.assertEqual(loaded["stats"], {"0": 0.5, "global_vol": 2.0})
+        self.assertIsNone(mc.load("cd" * 20))
+
+    def test_entries_are_mapped_and_aligned(self):
+        arrays = dict(self._arrays(5), seam=np.array([True, False, True]), empty=np.zeros(0, np.int32))
+        mc.save("9f" * 20, arrays, {"slots": [0, 3]})
+        loaded, meta = mc.load("9f" * 20)
+        self.assertEqual(meta, {"slots": [0, 3]})
+        for name, arr in arrays.items():
+            np.testing.assert_array_equal(loaded[name], arr)
+            self.assertEqual(loaded[name].dtype, arr.dtype)
+            self.assertFalse(loaded[name].flags.writeable)  # View into the mapping
+            self.assertEqual(loaded[name].ctypes.data % mc.ALIGN, 0)
+
+    def test_truncated_entry_discarded(self):
+        mc.save("7e" * 20, self._arrays(100), {})
+        path = mc.entry_path("7e" * 20)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 16)
+        self.assertIsNone(mc.load("7e" * 20))
+        self.assertFalse(os.path.exists(path))
+
+    def test_lru_eviction(self):
+        for i, key in enumerate(("a1" * 20, "b2" * 20, "c3" * 20)):
+            mc.save(key, self._arrays(1000), {})
+            stamp = time.time() - 100 + i
+            os.utime(mc.entry_path(key), (stamp, stamp))
+        # Touch the oldest: it becomes the most recently used
+        mc.load("a1" * 20)
+        size = os.path.getsize(mc.entry_path("a1" * 20))
+        mc.evict(limit=2 * size)
+        self.assertIsNotNone(mc.load("a1" * 20))
+        self.assertIsNone(mc.load("b2" * 20))
+        self.assertIsNotNone(mc.load("c3" * 20))
+
+    def test_corrupt_entry_discarded(self):
+        path = mc.entry_path("ef" * 20)
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as f:
+            f.write(b"not an archive")
+        self.assertIsNone(mc.load("ef" * 20))
+        self.assertFalse(os.path.exists(path))
+
+    def test_key_ignores_transform(self):
+        with patch.object(massa_params.massa_properties, "slots_to_params", return_value={}):
+            base = mc.key_for(FakeOp())
+            moved = mc.key_for(FakeOp(location=5.0))
+            wider = mc.key_for(FakeOp(width=2.0))
+        self.assertEqual(base, moved)
+        self.assertNotEqual(base, wider)
+        self.assertIsNone(mc.key_for(FakeOp(), flags={"NO_MESH_CACHE": True}))
+        os.environ[mc.ENV_OFF] = "1"
+        self.assertIsNone(mc.key_for(FakeOp()))
+
+    def test_key_ignores_ui_state(self):
+        def slots(expanded):
+            return {"expand": [i == expanded for i in range(10)], "mat": ["NONE"] * 10}
+
+        with patch.object(massa_params.massa_properties, "slots_to_params", return_value=slots(0)):
+            base = mc.key_for(FakeOp())
+            tab = mc.key_for(FakeOp(tab="EDGES"))
+            rotated = mc.key_for(FakeOp(use_rot=True))
+        with patch.object(massa_params.massa_properties, "slots_to_params", return_value=slots(3)):
+            folded = mc.key_for(FakeOp())
+        self.assertEqual(base, tab)
+        self.assertEqual(base, folded)
+        self.assertNotEqual(base, rotated)  # Rotate gates a build pass
+
+    def test_fingerprint_covers_operators(self):
+        real = mc._file_digest
+        base = mc.code_fingerprint()
+
+        def edited(path):
+            if path.endswith(os.path.join("operators", "massa_base.py")):
+                return "edited"
+            return real(path)
+
+        with patch.object(mc, "_file_digest", side_effect=edited):
+            self.assertNotEqual(mc.code_fingerprint(), base)
+
+
+if __name__ == '__main__':
+    unittest.main()
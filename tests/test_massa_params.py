@@ -0,0 +1,108 @@
+import unittest
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# --- MOCK BLENDER ENVIRONMENT ---
+from addon_stub import mount_addon, SLOT_DEFAULTS
+
+mount_addon("massa_params_addon")
+from massa_params_addon.modules import massa_params, massa_properties
+
+
+def _prop(identifier, ptype, default, **kw):
+    return SimpleNamespace(
+        identifier=identifier, type=ptype, default=default, is_readonly=kw.get("readonly", False),
+        is_array=kw.get("array", False), array_length=len(default) if kw.get("array") else 0,
+        default_array=default, is_enum_flag=kw.get("flag", False), default_flag=default,
+    )
+
+
+class FakeSlots(list):
+    def foreach_get(self, attr, buf):
+        for i, item in enumerate(self):
+            buf[i] = getattr(item, attr)
+
+
+class FakeOp:
+    bl_rna = SimpleNamespace(properties=[
+        _prop("rna_type", "POINTER", None, readonly=True),
+        _prop("width", "FLOAT", 1.0),
+        _prop("segments", "INT", 8),
+        _prop("style", "ENUM", "A"),
+        _prop("axes", "ENUM", {"X"}, flag=True),
+        _prop("offset", "FLOAT", [0.0, 0.0, 0.0], array=True),
+        _prop("rerun_mode", "BOOLEAN", False),
+        _prop("slots", "COLLECTION", None),
+    ])
+
+    def __init__(self):
+        self.width = 1.0
+        self.segments = 8
+        self.style = "A"
+        self.axes = {"X"}
+        self.offset = (0.0, 0.0, 0.0)
+        self.rerun_mode = True
+        self.slots = FakeSlots(SimpleNamespace(**SLOT_DEFAULTS) for _ in range(massa_properties.SLOT_COUNT))
+
+
+class TestSparseParams(unittest.TestCase):
+
+    def setUp(self):
+        massa_params._CLASS_CACHE.clear()
+        massa_params._SLOT_DEFAULTS.clear()
+        massa_params._SLOT_DEFAULTS.update(SLOT_DEFAULTS)
+
+    def test_defaults_cached_per_class(self):
+        defaults = massa_params.class_defaults(FakeOp)
+        self.assertIs(massa_params.class_defaults(FakeOp), defaults)
+        self.assertEqual(set(defaults), {"width", "segments", "style", "axes", "offset"})
+
+    def test_capture_keeps_only_changes(self):
+        op = FakeOp()
+        self.assertEqual(massa_params.capture(op), {"slots": {}})
+
+        op.width = 2.5
+        op.axes = {"X", "Z"}
+        op.offset = (0.0, 1.0, 0.0)
+        op.slots[3].sep = True
+        params = massa_params.capture(op)
+        self.assertEqual(params["width"], 2.5)
+        self.assertEqual(params["axes"], ["X", "Z"])
+        self.assertEqual(params["offset"], [0.0, 1.0, 0.0])
+        self.assertNotIn("segments", params)
+        self.assertNotIn("rerun_mode", params)
+        self.assertEqual(params["slots"], {"sep": {"3": True}})
+
+    def test_round_trip_fills_defaults(self):
+        op = FakeOp()
+        op.segments = 12
+        op.axes = {"Y"}
+        op.slots[1].mat = "Steel"
+        blob = massa_params.encode(massa_params.capture(op))
+        self.assertEqual(json.loads(blob)["v"], massa_params.SCHEMA_VERSION)
+
+        full = massa_params.with_defaults(FakeOp, massa_params.decode(blob))
+        self.assertEqual(full["segments"], 12)
+        self.assertEqual(full["width"], 1.0)
+        self.assertEqual(full["axes"], {"Y"})
+        self.assertEqual(full["slots"]["mat"][1], "Steel")
+        self.assertEqual(full["slots"]["mat"][0], "NONE")
+        self.assertEqual(len(full["slots"]["sep"]), massa_properties.SLOT_COUNT)
+
+    def test_legacy_dict(self):
+        legacy = MagicMock()
+        legacy.to_dict.return_value = {"width": 3.0, "mat_0": "Steel"}
+        params = massa_params.decode(legacy)
+        full = massa_params.with_defaults(FakeOp, params)
+        self.assertEqual(full["width"], 3.0)
+        self.assertEqual(full["mat_0"], "Steel")
+        self.assertNotIn("slots", full)
+
+    def test_corrupt_blob(self):
+        self.assertIsNone(massa_params.decode("{not json"))
+        self.assertIsNone(massa_params.decode(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import unittest
+import sys
+from unittest.mock import MagicMock
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+sys.modules['bmesh'] = MagicMock()
+sys.modules['mathutils'] = MagicMock()
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_parts
+
+
+class FakeVert:
+    def __init__(self, co):
+        self.co = co
+        self.index = -1
+
+
+class FakeEdge(dict):
+    def __init__(self, verts, faces):
+        super().__init__(SLOTS=0)
+        self.verts = verts
+        self.link_faces = faces
+        self.seam = False
+        self.smooth = True
+
+
+class FakeLoop(dict):
+    def __init__(self, vert, edge):
+        super().__init__()
+        self.vert = vert
+        self.edge = edge
+
+
+class FakeFace(dict):
+    def __init__(self, loops):
+        super().__init__()
+        self.loops = loops
+        self.material_index = 3
+        self.smooth = True
+
+
+class FakeLayers(dict):
+    def keys(self):
+        return list(super().keys())
+
+
+class FakeSeq(list):
+    def __init__(self, items=()):
+        super().__init__(items)
+        self.layers = MagicMock()
+        self.layers.int = FakeLayers()
+        self.layers.uv = FakeLayers()
+
+    def index_update(self):
+        for i, item in enumerate(self):
+            item.index = i
+
+
+class FakeBMesh:
+    """A single triangle with one edge slot and one UV layer."""
+
+    def __init__(self):
+        v = [FakeVert((0, 0, 0)), FakeVert((1, 0, 0)), FakeVert((0, 1, 0))]
+        face = FakeFace([])
+        edges = [FakeEdge((v[i], v[(i + 1) % 3]), [face]) for i in range(3)]
+        edges[0]["SLOTS"] = 2
+        edges[0].seam = True
+        face.loops = [FakeLoop(v[i], edges[i]) for i in range(3)]
+        for i, lp in enumerate(face.loops):
+            lp["UV"] = MagicMock(uv=(i * 0.5, 0.0))
+        face["SOCK"] = 7
+
+        self.verts = FakeSeq(v)
+        self.edges = FakeSeq(edges)
+        self.edges.layers.int["MASSA_EDGE_SLOTS"] = "SLOTS"
+        self.faces = FakeSeq([face])
+        self.faces.layers.int["MASSA_SOCKETS"] = "SOCK"
+        self.loops = FakeSeq()
+        self.loops.layers.uv["UVMap"] = "UV"
+
+    def free(self):
+        pass
+
+
+class TestPartTemplates(unittest.TestCase):
+
+    def setUp(self):
+        massa_parts.clear_cache()
+
+    def tearDown(self):
+        massa_parts.bmesh.new.side_effect = None
+
+    def test_snapshot(self):
+        tpl = massa_parts.PartTemplate(FakeBMesh())
+        self.assertEqual(tpl.co, [(0, 0, 0), (1, 0, 0), (0, 1, 0)])
+        self.assertEqual(tpl.face_int_names, ["MASSA_SOCKETS"])
+        v_idx, mat, smooth, ivals, uvs, edata = tpl.faces[0]
+        self.assertEqual(v_idx, (0, 1, 2))
+        self.assertEqual(mat, 3)
+        self.assertEqual(ivals, (7,))
+        self.assertEqual(uvs[1], ((0.5, 0.0),))
+        self.assertEqual(edata[0], (True, True, (2,)))
+        self.assertEqual(tpl.loose_edges, [])
+
+    def test_builder_runs_once_per_key(self):
+        calls = []
+        massa_parts.bmesh.new.side_effect = FakeBMesh
+
+        def builder(bm):
+            calls.append(bm)
+
+        first = massa_parts.get_template("Chain", ("link", 0.1), builder)
+        again = massa_parts.get_template("Chain", ("link", 0.1), builder)
+        other = massa_parts.get_template("Chain", ("link", 0.2), builder)
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+        self.assertEqual(len(calls), 2)
+
+    def test_cache_limit(self):
+        massa_parts.bmesh.new.side_effect = FakeBMesh
+        for i in range(massa_parts.TEMPLATE_LIMIT + 3):
+            massa_parts.get_template("Box", i, lambda bm: None)
+        self.assertEqual(len(massa_parts._template_cache), massa_parts.TEMPLATE_LIMIT)
+        self.assertNotIn(("Box", 0), massa_parts._template_cache)
+
+    def test_stamp_doubles_duplicates(self):
+        ops = massa_parts.bmesh.ops
+        ops.reset_mock()
+        counter = iter(range(1000))
+
+        def duplicate(bm, geom):
+            maps = {name: {ele: (name, next(counter)) for ele in geom} for name in ("vert_map", "edge_map", "face_map")}
+            return maps
+
+        ops.duplicate.side_effect = duplicate
+        tpl = MagicMock()
+        tpl.materialize.return_value = (["v0", "v1"], ["e0"], ["f0"])
+        matrices = [f"M{i}" for i in range(11)]
+        try:
+            results = massa_parts.stamp(None, tpl, matrices)
+        finally:
+            ops.duplicate.side_effect = None
+
+        # 1 -> 2 -> 4 -> 8 -> 11
+        self.assertEqual(ops.duplicate.call_count, 4)
+        self.assertEqual(len(results), 11)
+        self.assertEqual(results[0], (["v0", "v1"], ["f0"]))
+        moved = [c.kwargs["verts"] for c in ops.transform.call_args_list]
+        self.assertEqual([c.kwargs["matrix"] for c in ops.transform.call_args_list], matrices)
+        self.assertEqual(moved, [r[0] for r in results])
+        self.assertEqual(len({v for r in results for v in r[0]}), 22)
+
+    def test_reloaded_class_does_not_share_parts(self):
+        # Same class name, new class object (what a hot reload produces)
+        massa_parts.bmesh.new.side_effect = FakeBMesh
+        old_cls = type("MASSA_OT_Chain", (), {})
+        new_cls = type("MASSA_OT_Chain", (), {})
+        first = massa_parts.get_template(old_cls, ("link", 0.1), lambda bm: None)
+        second = massa_parts.get_template(new_cls, ("link", 0.1), lambda bm: None)
+        self.assertIsNot(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+import sys
+import os
+import time
+import shutil
+import tempfile
+import importlib
+import types
+from unittest.mock import MagicMock
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_reload
+
+PKG = "massa_reload_fixture"
+SOURCES = {
+    "__init__.py": "",
+    "base.py": "VALUE = 1\n\nclass Base:\n    pass\n",
+    "mid.py": "from .base import Base\n\nclass Mid(Base):\n    pass\n",
+    "top.py": "from . import mid\n",
+    "lone.py": "X = 0\n",
+}
+
+
+class TestSelectiveReload(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.tick = 0
+        os.makedirs(os.path.join(self.root, PKG))
+        for name, src in SOURCES.items():
+            self._write(name, src)
+        sys.path.insert(0, self.root)
+        for name in ("base", "mid", "top", "lone"):
+            importlib.import_module(f"{PKG}.{name}")
+        massa_reload._STATE.clear()
+        massa_reload.track(PKG)
+
+    def tearDown(self):
+        sys.path.remove(self.root)
+        for name in [n for n in sys.modules if n == PKG or n.startswith(PKG + ".")]:
+            del sys.modules[name]
+        massa_reload._STATE.clear()
+        shutil.rmtree(self.root)
+
+    def _write(self, name, src):
+        path = os.path.join(self.root, PKG, name)
+        with open(path, "w") as fh:
+            fh.write(src)
+        # Coarse filesystem clocks: force a distinct mtime per write
+        self.tick += 1
+        stamp = time.time() + self.tick
+        os.utime(path, (stamp, stamp))
+
+    def test_nothing_changed(self):
+        self.assertEqual(massa_reload.changed_modules(PKG), [])
+
+    def test_touch_without_edit_is_ignored(self):
+        self._write("lone.py", SOURCES["lone.py"])
+        self.assertEqual(massa_reload.changed_modules(PKG), [])
+
+    def test_dependents_in_order(self):
+        self._write("base.py", SOURCES["base.py"].replace("VALUE = 1", "VALUE = 2"))
+        changed = massa_reload.changed_modules(PKG)
+        self.assertEqual(changed, [f"{PKG}.base"])
+        order = massa_reload.reload_order(PKG, changed)
+        self.assertEqual(order, [f"{PKG}.base", f"{PKG}.mid", f"{PKG}.top"])
+
+    def test_reload_changed(self):
+        self._write("base.py", SOURCES["base.py"].replace("VALUE = 1", "VALUE = 2"))
+        old_mid = sys.modules[f"{PKG}.mid"].Mid
+        reloaded = massa_reload.reload_changed(PKG)
+
+        self.assertNotIn(f"{PKG}.lone", reloaded)
+        self.assertEqual(sys.modules[f"{PKG}.base"].VALUE, 2)
+        new_mid = sys.modules[f"{PKG}.mid"].Mid
+        self.assertIsNot(new_mid, old_mid)
+        self.assertIs(new_mid.__bases__[0], sys.modules[f"{PKG}.base"].Base)
+        self.assertEqual(massa_reload.changed_modules(PKG), [])
+
+
+NESTED = "massa_reload_nested"
+NESTED_SOURCES = {
+    "__init__.py": "",
+    "modules/__init__.py": "",
+    "modules/engine.py": "def run():\n    return 1\n",
+    "modules/cartridges/__init__.py": "def register():\n    pass\n",
+    "modules/cartridges/cart_a.py": "from .. import engine\n\nSIZE = 1\n",
+}
+
+
+class TestNestedPackages(unittest.TestCase):
+    """Package globals hold their submodules; that must not count as a dependency."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.tick = 0
+        for name, src in NESTED_SOURCES.items():
+            os.makedirs(os.path.dirname(os.path.join(self.root, NESTED, name)), exist_ok=True)
+            self._write(name, src)
+        sys.path.insert(0, self.root)
+        importlib.import_module(f"{NESTED}.modules.cartridges.cart_a")
+        massa_reload._STATE.clear()
+        massa_reload.track(NESTED)
+
+    def tearDown(self):
+        sys.path.remove(self.root)
+        for name in [n for n in sys.modules if n == NESTED or n.startswith(NESTED + ".")]:
+            del sys.modules[name]
+        massa_reload._STATE.clear()
+        shutil.rmtree(self.root)
+
+    def _write(self, name, src):
+        path = os.path.join(self.root, NESTED, name)
+        with open(path, "w") as fh:
+            fh.write(src)
+        self.tick += 1
+        stamp = time.time() + self.tick
+        os.utime(path, (stamp, stamp))
+
+    def _plan(self):
+        order = massa_reload.reload_order(NESTED, massa_reload.changed_modules(NESTED))
+        return order, [n for n in order if massa_reload.needs_full_reload(NESTED, n)]
+
+    def test_cartridge_edit_stays_live(self):
+        self._write("modules/cartridges/cart_a.py", NESTED_SOURCES["modules/cartridges/cart_a.py"].replace("1", "2"))
+        order, blocking = self._plan()
+        self.assertEqual(order, [f"{NESTED}.modules.cartridges.cart_a"])
+        self.assertEqual(blocking, [])
+
+    def test_engine_edit_reloads_cartridge_only(self):
+        self._write("modules/engine.py", "def run():\n    return 2\n")
+        order, blocking = self._plan()
+        self.assertEqual(order, [f"{NESTED}.modules.engine", f"{NESTED}.modules.cartridges.cart_a"])
+        self.assertEqual(blocking, [])
+
+    def test_reload_clears_part_templates(self):
+        # Cached parts were built by the old cartridge code
+        parts = types.SimpleNamespace(clear_cache=MagicMock())
+        sys.modules[f"{NESTED}.modules.massa_parts"] = parts
+        self.assertEqual(massa_reload.reload_changed(NESTED), [])
+        parts.clear_cache.assert_not_called()
+
+        self._write("modules/cartridges/cart_a.py", NESTED_SOURCES["modules/cartridges/cart_a.py"].replace("1", "2"))
+        massa_reload.reload_changed(NESTED)
+        parts.clear_cache.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+
+# --- MOCK BLENDER ENVIRONMENT ---
+from addon_stub import mount_addon, SLOT_DEFAULTS
+
+mount_addon("massa_slots_addon")
+from massa_slots_addon.modules import massa_properties as mp
+
+
+class FakeSlot:
+    def __init__(self):
+        self.__dict__.update(SLOT_DEFAULTS)
+
+
+class FakeSlots(list):
+    """Mimics bpy_prop_collection: add() and flat foreach_get/foreach_set."""
+
+    def add(self):
+        self.append(FakeSlot())
+        return self[-1]
+
+    def foreach_get(self, attr, buf):
+        assert len(buf) == len(self)
+        for i, item in enumerate(self):
+            buf[i] = getattr(item, attr)
+
+    def foreach_set(self, attr, buf):
+        assert len(buf) == len(self)
+        for item, value in zip(self, buf):
+            setattr(item, attr, value)
+
+
+class FakeOwner:
+    def __init__(self):
+        self.slots = FakeSlots()
+
+
+class TestSlotCollection(unittest.TestCase):
+
+    def test_ensure_slots(self):
+        owner = FakeOwner()
+        mp.ensure_slots(owner)
+        self.assertEqual(len(owner.slots), mp.SLOT_COUNT)
+        self.assertTrue(owner.slots[0].expand)
+        self.assertFalse(owner.slots[1].expand)
+        # Idempotent
+        mp.ensure_slots(owner)
+        self.assertEqual(len(owner.slots), mp.SLOT_COUNT)
+
+    def test_params_round_trip(self):
+        src = FakeOwner()
+        mp.ensure_slots(src)
+        src.slots[2].sep = True
+        src.slots[3].uv_scale = 2.5
+        src.slots[4].collision_shape = "BOX"
+
+        columns = mp.slots_to_params(src)
+        self.assertEqual(set(columns), set(mp.SLOT_FIELDS))
+        self.assertEqual(len(columns["sep"]), mp.SLOT_COUNT)
+
+        dst = FakeOwner()
+        mp.apply_slot_params(dst, columns, skip={"uv_scale"})
+        self.assertTrue(dst.slots[2].sep)
+        self.assertEqual(dst.slots[3].uv_scale, 1.0)
+        self.assertEqual(dst.slots[4].collision_shape, "BOX")
+        self.assertTrue(mp.any_slot(dst, "sep"))
+        self.assertFalse(mp.any_slot(dst, "sock"))
+
+    def test_copy_slots(self):
+        src, dst = FakeOwner(), FakeOwner()
+        mp.ensure_slots(src)
+        src.slots[1].off = 0.25
+        src.slots[1].mat = "Steel"
+        mp.copy_slots(src, dst)
+        self.assertEqual(dst.slots[1].off, 0.25)
+        self.assertEqual(dst.slots[1].mat, "Steel")
+        self.assertEqual(mp.slot_value(dst, 1, "off"), 0.25)
+        self.assertEqual(mp.slot_value(dst, 99, "off", -1), -1)
+
+    def test_copy_slots_reports_changes(self):
+        src, dst = FakeOwner(), FakeOwner()
+        mp.ensure_slots(src)
+        mp.ensure_slots(dst)
+        self.assertEqual(mp.copy_slots(src, dst), 0)
+        src.slots[5].sep = True
+        src.slots[6].uv_mode = "BOX"
+        self.assertEqual(mp.copy_slots(src, dst), 2)
+        self.assertEqual(mp.copy_slots(src, dst), 0)
+
+    def test_copy_changed_writes_only_diffs(self):
+        class Recorder:
+            def __init__(self, **values):
+                object.__setattr__(self, "writes", [])
+                self.__dict__.update(values)
+
+            def __setattr__(self, key, value):
+                self.writes.append(key)
+                object.__setattr__(self, key, value)
+
+        src = Recorder(a=1.0, b="X", c=[1.0, 2.0, 3.0])
+        dst = Recorder(a=1.0, b="Y", c=(1.0, 2.0, 3.0))
+        self.assertEqual(mp.copy_changed(src, dst, ("a", "b", "c")), 1)
+        self.assertEqual(dst.writes, ["b"])
+        self.assertEqual(dst.b, "X")
+
+    def test_legacy_params(self):
+        params = {"mat_0": "Steel", "sep_3": True, "phys_bond_9": 5.0, "mat_count": 2, "width": 1.0}
+        columns, used = mp.legacy_slot_params(params)
+        self.assertEqual(sorted(used), ["mat_0", "phys_bond_9", "sep_3"])
+        self.assertEqual(columns["mat"][0], "Steel")
+        self.assertIsNone(columns["mat"][1])
+
+        owner = FakeOwner()
+        mp.apply_slot_params(owner, columns)
+        self.assertEqual(owner.slots[0].mat, "Steel")
+        self.assertEqual(owner.slots[1].mat, "NONE")
+        self.assertTrue(owner.slots[3].sep)
+        self.assertEqual(owner.slots[9].phys_bond, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import sys
+import math
+from unittest.mock import MagicMock
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+sys.modules['bpy.app'] = MagicMock()
+sys.modules['bpy.app.handlers'] = MagicMock()
+sys.modules['bpy.app.handlers'].persistent = lambda func: func
+sys.modules['mathutils'] = MagicMock()
+sys.modules['mathutils.kdtree'] = MagicMock()
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_socket_index
+
+
+class FakeKDTree:
+    """Brute-force stand-in for mathutils.kdtree.KDTree."""
+
+    def __init__(self, size):
+        self.points = []
+        self.balanced = False
+
+    def insert(self, co, index):
+        self.points.append((co, index))
+
+    def balance(self):
+        self.balanced = True
+
+    def find_range(self, co, radius):
+        assert self.balanced
+        hits = []
+        for p, idx in self.points:
+            d = math.dist(p, co)
+            if d <= radius:
+                hits.append((p, idx, d))
+        return hits
+
+
+class FakeMatrix:
+    def __init__(self, loc, z):
+        self.translation = loc
+        self.col = [None, None, z]
+
+
+class FakeObject(dict):
+    _uid = 0
+
+    def __init__(self, name, loc=(0, 0, 0), z=(0, 0, 1), parent=None, kind="EMPTY"):
+        super().__init__()
+        FakeObject._uid += 1
+        self.session_uid = FakeObject._uid
+        self.name = name
+        self.type = kind
+        self.parent = parent
+        self.matrix_world = FakeMatrix(loc, z)
+
+
+class FakeScene:
+    session_uid = 999
+
+    def __init__(self, objects):
+        self.objects = objects
+
+
+class TestSocketIndex(unittest.TestCase):
+
+    def setUp(self):
+        massa_socket_index.KDTree = FakeKDTree
+        massa_socket_index.clear()
+
+        self.wall_a = FakeObject("Wall_A", kind="MESH")
+        self.wall_a["massa_op_id"] = "massa.gen_wall"
+        self.wall_b = FakeObject("Wall_B", kind="MESH")
+        self.wall_b["massa_op_id"] = "massa.gen_wall"
+        self.sock_a = FakeObject("SOCKET_Wall_A_01", (1.0, 0, 0), (1, 0, 0), self.wall_a)
+        self.sock_b = FakeObject("SOCKET_Wall_B_01", (1.1, 0, 0), (-1, 0, 0), self.wall_b)
+        # Same spot, same facing: not a valid mate
+        self.sock_c = FakeObject("SOCKET_Wall_B_02", (1.05, 0, 0), (1, 0, 0), self.wall_b)
+        self.scene = FakeScene([self.wall_a, self.wall_b, self.sock_a, self.sock_b, self.sock_c])
+
+    def test_finds_facing_pair_only(self):
+        pairs = massa_socket_index.find_pairs(self.scene, self.wall_a, tolerance=0.5)
+        self.assertEqual([p[1:] for p in pairs], [("SOCKET_Wall_A_01", "SOCKET_Wall_B_01")])
+        self.assertAlmostEqual(pairs[0][0], 0.1)
+
+    def test_tolerance(self):
+        pairs = massa_socket_index.find_pairs(self.scene, self.wall_a, tolerance=0.05)
+        self.assertEqual(pairs, [])
+
+    def test_incremental_track_dirties_tree_once(self):
+        first = massa_socket_index._ensure(self.scene)
+        self.assertIs(massa_socket_index._ensure(self.scene), first)
+
+        self.sock_b.matrix_world = FakeMatrix((5.0, 0, 0), (-1, 0, 0))
+        self.assertTrue(massa_socket_index.track(self.sock_b))
+        self.assertFalse(massa_socket_index.track(self.sock_b))
+        self.assertIsNot(massa_socket_index._ensure(self.scene), first)
+        self.assertEqual(massa_socket_index.find_pairs(self.scene, self.wall_a), [])
+
+    def test_owner_resolution(self):
+        massa_socket_index._ensure(self.scene)
+        self.assertIs(massa_socket_index.socket_owner(self.sock_a), self.wall_a)
+        self.assertEqual(len(massa_socket_index.sockets_of(self.scene, self.wall_b)), 2)
+
+    def test_owner_index_follows_edits(self):
+        massa_socket_index._ensure(self.scene)
+        # Reparent B_02 onto Wall_A, then drop the socket prefix from B_01
+        self.sock_c.parent = self.wall_a
+        massa_socket_index.track(self.sock_c)
+        self.sock_b.name = "Plain_Empty"
+        massa_socket_index.track(self.sock_b)
+
+        uid = lambda o: o.session_uid
+        self.assertEqual(sorted(massa_socket_index.sockets_of(self.scene, self.wall_a)),
+                         sorted([uid(self.sock_a), uid(self.sock_c)]))
+        self.assertEqual(massa_socket_index.sockets_of(self.scene, self.wall_b), [])
+        self.assertNotIn(uid(self.wall_b), massa_socket_index._owned)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import sys
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+sys.modules['bmesh'] = MagicMock()
+sys.modules['mathutils'] = MagicMock()
+
+sys.path.append("./MASSA_BMESH_CONSOLE-main")
+from modules import massa_sockets
+
+
+class FakeVert:
+    def __init__(self, co):
+        self.co = co
+        self.index = -1
+
+
+class FakeFace(dict):
+    def __init__(self, verts, mat, sock=0):
+        super().__init__()
+        self.verts = verts
+        self.material_index = mat
+        self.index = -1
+        self["SOCK"] = sock
+
+
+class FakeEdge:
+    def __init__(self, faces):
+        self.link_faces = faces
+
+
+class FakeSeq(list):
+    def index_update(self):
+        for i, item in enumerate(self):
+            item.index = i
+
+
+class FakeBMesh:
+    """Strip of three unit quads along X. Faces 0-1 are slot 0, face 2 is slot 1."""
+
+    def __init__(self):
+        self.verts = FakeSeq(FakeVert((x, y, 0.0)) for x in range(4) for y in range(2))
+        v = self.verts
+        quads = [(v[0], v[2], v[3], v[1]), (v[2], v[4], v[5], v[3]), (v[4], v[6], v[7], v[5])]
+        self.faces = FakeSeq([FakeFace(quads[0], 0, 3), FakeFace(quads[1], 0, 3), FakeFace(quads[2], 1)])
+        self.edges = [FakeEdge([self.faces[0], self.faces[1]]), FakeEdge([self.faces[1], self.faces[2]])]
+        self.faces.layers = MagicMock()
+        self.faces.layers.int.get.return_value = "SOCK"
+
+
+class TestSocketAnalysis(unittest.TestCase):
+
+    def test_label_islands(self):
+        """Union-find labels each island by its lowest face index."""
+        pairs = np.array([[4, 5], [1, 2], [5, 6], [0, 1]])
+        labels = massa_sockets._label_islands(8, pairs)
+        self.assertEqual(labels.tolist(), [0, 0, 0, 3, 4, 4, 4, 7])
+
+    def test_label_islands_long_chain(self):
+        n = 200
+        pairs = np.stack([np.arange(n - 1, 0, -1), np.arange(n - 2, -1, -1)], axis=1)
+        labels = massa_sockets._label_islands(n, pairs)
+        self.assertTrue((labels == 0).all())
+
+    def test_analyze_faces(self):
+        data = massa_sockets.analyze_faces(FakeBMesh())
+        np.testing.assert_allclose(data["area"], [1.0, 1.0, 1.0])
+        np.testing.assert_allclose(data["center"][1], [1.5, 0.5, 0.0])
+        np.testing.assert_allclose(np.abs(data["normal"][:, 2]), [1.0, 1.0, 1.0])
+        # Faces 0-1 share a slot and an edge; face 2 is a different slot
+        self.assertEqual(data["island"].tolist(), [0, 0, 2])
+        self.assertEqual(data["sock"].tolist(), [3, 3, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+import importlib.util
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# --- MOCK BLENDER ENVIRONMENT ---
+sys.modules['bpy'] = MagicMock()
+sys.modules['bmesh'] = MagicMock()
+sys.modules['mathutils'] = MagicMock()
+
+# Mount the auditors folder as a package by path (the debugging_system
+# package __init__ pulls in config, which needs a Blender install)
+_DIR = os.path.abspath("./MASSA_BMESH_CONSOLE-main/modules/debugging_system/auditors")
+_spec = importlib.util.spec_from_file_location(
+    "massa_test_auditors", os.path.join(_DIR, "__init__.py"), submodule_search_locations=[_DIR]
+)
+auditors = importlib.util.module_from_spec(_spec)
+sys.modules["massa_test_auditors"] = auditors
+_spec.loader.exec_module(auditors)
+from massa_test_auditors import mesh_snapshot
+
+
+class FakeCollection:
+    def __init__(self, count, **attrs):
+        self.count = count
+        self.attrs = attrs
+
+    def __len__(self):
+        return self.count
+
+    def foreach_get(self, attr, arr):
+        arr[:] = np.asarray(self.attrs[attr], dtype=arr.dtype).ravel()
+
+
+def fake_mesh():
+    """Two quads sharing edge 1, a wire edge (6-7) and a loose vertex (8)."""
+    co = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0), (2, 1, 0), (5, 5, 5), (6, 5, 5), (9, 9, 9)]
+    edges = [(0, 1), (1, 2), (2, 3), (3, 0), (1, 4), (4, 5), (5, 2), (6, 7)]
+    loop_verts = [0, 1, 2, 3, 1, 4, 5, 2]
+    loop_edges = [0, 1, 2, 3, 4, 5, 6, 1]
+    uvs = [(0, 0), (1, 0), (1, 1), (0, 1)] + [(0.5, 0.5)] * 4  # Second face collapsed in UV
+    uv_layer = SimpleNamespace(data=FakeCollection(8, uv=uvs))
+    return SimpleNamespace(
+        vertices=FakeCollection(len(co), co=co),
+        edges=FakeCollection(len(edges), vertices=edges),
+        polygons=FakeCollection(
+            2, area=[1.0, 1.0], normal=[(0, 0, 1)] * 2, center=[(0.5, 0.5, 0), (1.5, 0.5, 0)],
+            loop_start=[0, 4], loop_total=[4, 4],
+        ),
+        loops=FakeCollection(8, vertex_index=loop_verts, edge_index=loop_edges),
+        uv_layers=SimpleNamespace(active=uv_layer),
+    )
+
+
+def fake_obj():
+    return SimpleNamespace(type='MESH', data=fake_mesh(), name="Fake")
+
+
+class TestMeshSnapshot(unittest.TestCase):
+
+    def test_arrays(self):
+        snap = mesh_snapshot.MeshSnapshot(fake_obj())
+        self.assertEqual(snap.co.shape, (9, 3))
+        np.testing.assert_array_equal(snap.loop_next, [1, 2, 3, 0, 5, 6, 7, 4])
+        np.testing.assert_array_equal(snap.edge_face_count, [1, 2, 1, 1, 1, 1, 1, 0])
+        self.assertEqual(int(snap.vert_edge_count[8]), 0)
+        np.testing.assert_allclose(snap.uv_areas, [1.0, 0.0])
+        self.assertAlmostEqual(float(snap.edge_lengths[7]), 1.0)
+
+    def test_no_uv_layer_reads_as_zero(self):
+        obj = fake_obj()
+        obj.data.uv_layers.active = None
+        snap = mesh_snapshot.MeshSnapshot(obj)
+        self.assertFalse(snap.has_uvs)
+        np.testing.assert_allclose(snap.uv_areas, [0.0, 0.0])
+
+    def test_bmesh_built_once_and_freed(self):
+        bmesh = mesh_snapshot.bmesh
+        bmesh.new.reset_mock()
+        with mesh_snapshot.MeshSnapshot(fake_obj()) as snap:
+            bm = snap.bm
+            self.assertIs(snap.bm, bm)
+        bmesh.new.assert_called_once()
+        bm.free.assert_called_once()
+
+
+class TestRunAllAuditors(unittest.TestCase):
+
+    def setUp(self):
+        auditors._AUDITORS = None
+
+    def test_discovery_is_cached(self):
+        with patch.object(auditors.pkgutil, "iter_modules", wraps=auditors.pkgutil.iter_modules) as scan:
+            auditors.run_all_auditors(fake_obj())
+            auditors.run_all_auditors(fake_obj())
+        self.assertEqual(scan.call_count, 1)
+        names = [entry[0] for entry in auditors.discover_auditors()]
+        self.assertIn("massa_topology_extra", names)
+        self.assertNotIn("mesh_snapshot", names)
+
+    def test_shared_snapshot(self):
+        snap = mesh_snapshot.MeshSnapshot(fake_obj())
+        snap.free = MagicMock()
+        errors = auditors.run_all_auditors(snap.obj, snapshot=snap)
+        self.assertIn("CRITICAL_LOOSE_VERTS_1", errors)
+        self.assertIn("CRITICAL_WIRE_EDGES_1", errors)
+        snap.free.assert_not_called()  # Caller owns it
+
+    def test_surface_auditor_uses_snapshot(self):
+        from massa_test_auditors import massa_surface_auditor
+        snap = mesh_snapshot.MeshSnapshot(fake_obj())
+        auditor = massa_surface_auditor.Massa_Surface_Auditor(snap)
+        auditor._check_collapsed_uvs()
+        auditor._check_degenerate_faces()
+        self.assertEqual(auditor.report["flags"], ["CRITICAL_COLLAPSED_UVS_1"])
+
+
+class TestRunnerFallback(unittest.TestCase):
+
+    def test_basic_checks_without_auditors_package(self):
+        # A broken auditors package must not take the built-in checks with it
+        path = os.path.join(os.path.dirname(_DIR), "runner.py")
+        with patch.dict(sys.modules, {"auditors": None}):
+            spec = importlib.util.spec_from_file_location("massa_test_runner", path)
+            runner = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(runner)
+            errors = runner.run_checks(fake_obj())
+        self.assertEqual(errors, ["Found 1 Pinched UV Faces."])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import tempfile
+import textwrap
+import importlib.util
+
+# worker_pool is plain Python; load it by path (the debugging_system package
+# __init__ pulls in config, which needs a Blender install)
+_PATH = os.path.abspath("./MASSA_BMESH_CONSOLE-main/modules/debugging_system/worker_pool.py")
+_spec = importlib.util.spec_from_file_location("massa_worker_pool", _PATH)
+worker_pool = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(worker_pool)
+
+# Stands in for `blender --background --python worker.py` (same protocol)
+FAKE_WORKER = textwrap.dedent('''
+    import sys, os, json
+    print("noise before ready")
+    print("MASSA_WORKER_READY", flush=True)
+    for line in sys.stdin:
+        job = json.loads(line)
+        if job.get("mode") == "SHUTDOWN":
+            break
+        if job.get("mode") == "CRASH":
+            print("segfault-ish", flush=True)
+            os._exit(3)
+        print("cartridge print", flush=True)
+        result = {"status": "PASS", "cartridge": job.get("cartridge"), "pid": os.getpid()}
+        print("MASSA_WORKER_RESULT " + json.dumps({"id": job["id"], "result": result}), flush=True)
+''')
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.script = os.path.join(cls.tmp.name, "fake_worker.py")
+        with open(cls.script, "w") as f:
+            f.write(FAKE_WORKER)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def _pool(self, **kw):
+        return worker_pool.WorkerPool(command=[sys.executable, self.script], timeout=20, **kw)
+
+    def test_workers_stay_warm(self):
+        with self._pool(size=1) as pool:
+            a = pool.run({"cartridge": "a.py", "mode": "AUDIT"})
+            b = pool.run({"cartridge": "b.py", "mode": "AUDIT"})
+        self.assertEqual(a["status"], "PASS")
+        self.assertEqual(b["cartridge"], "b.py")
+        self.assertEqual(a["pid"], b["pid"])
+
+    def test_crash_restarts_worker(self):
+        with self._pool(size=1) as pool:
+            first = pool.run({"cartridge": "a.py"})
+            crash = pool.run({"mode": "CRASH"})
+            after = pool.run({"cartridge": "b.py"})
+        self.assertEqual(crash["status"], "SYSTEM_FAILURE")
+        self.assertIn("segfault-ish", crash["log"])
+        self.assertEqual(after["status"], "PASS")
+        self.assertNotEqual(first["pid"], after["pid"])
+        self.assertEqual(pool.restarts, 1)
+
+    def test_map_keeps_order(self):
+        jobs = [{"cartridge": f"c{i}.py"} for i in range(6)]
+        with self._pool(size=3) as pool:
+            results = pool.map(jobs)
+        self.assertEqual([r["cartridge"] for r in results], [j["cartridge"] for j in jobs])
+        self.assertLessEqual(len({r["pid"] for r in results}), 3)
+
+    def test_recycle_after_max_jobs(self):
+        with self._pool(size=1, max_jobs=2) as pool:
+            pids = [pool.run({"cartridge": "x.py"})["pid"] for _ in range(3)]
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+
+    def test_missing_binary(self):
+        pool = worker_pool.WorkerPool(command=[os.path.join(self.tmp.name, "no_blender")])
+        result = pool.run({"cartridge": "a.py"})
+        self.assertEqual(result["status"], "SYSTEM_FAILURE")
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()